@@ -0,0 +1,66 @@
+"""
+Medición del tiempo de arranque (imports de main.py)
+
+Cada medición corre en un proceso nuevo para que no haya módulos en caché:
+- "arranque": lo que importa main.py antes de abrir la ventana
+- "arranque + juegos": lo mismo cargando además todos los plugins de juegos
+  (equivalente al registro anterior, que importaba los juegos al inicio)
+
+Uso: python benchmark_startup.py [repeticiones]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+HEAVY_MODULES = ("pygame", "numpy", "pandas", "matplotlib", "seaborn", "openpyxl")
+
+_MEASURE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+from managers.components.game_registry import GameRegistry
+registry = GameRegistry()
+if {load_games}:
+    for game_id in registry.get_available_games():
+        registry.get_game_class(game_id)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed,
+                  "heavy": [m for m in {heavy!r} if m in sys.modules],
+                  "modules": len(sys.modules)}}))
+"""
+
+
+def measure(load_games: bool) -> dict:
+    """Importar main.py en un proceso limpio y reportar tiempo y módulos cargados"""
+    code = _MEASURE.format(load_games=load_games, heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent,
+                            capture_output=True, text=True,
+                            env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"})
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "error")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print("⏱️ Tiempo de arranque (imports de main.py)")
+    print("=" * 60)
+    for label, load_games in (("arranque", False), ("arranque + juegos", True)):
+        try:
+            runs = [measure(load_games) for _ in range(repetitions)]
+        except RuntimeError as e:
+            print(f"❌ {label}: {e}")
+            continue
+        seconds = [run["seconds"] for run in runs]
+        print(f"{label:20s} mediana {statistics.median(seconds) * 1000:7.1f} ms | "
+              f"mín {min(seconds) * 1000:7.1f} ms | módulos {runs[-1]['modules']}")
+        print(f"{'':20s} pesados cargados: {', '.join(runs[-1]['heavy']) or 'ninguno'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,34 @@
 """
 Visualizador de datos especializado para gráficos matplotlib de analytics
+
+Recibe event frames (DataFrame columnar de LogParser) y pasa columnas
+completas a matplotlib en lugar de listas construidas evento a evento.
+
+Las series temporales largas se reducen con LTTB + envolvente min/max por
+encima de point_budget puntos (ver downsampling.py); el zoom recupera el detalle.
 """
 
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, Optional
+
+from .downsampling import DEFAULT_POINT_BUDGET, plot_downsampled, scatter_downsampled
 
 
 class DataVisualizer:
     """Especialista en visualizaciones matplotlib para análisis de juegos"""
     
-    def __init__(self):
+    def __init__(self, point_budget: int = DEFAULT_POINT_BUDGET):
+        self.point_budget = point_budget
         self.color_schemes = {
             "primary": {"INFO": "blue", "WARNING": "orange", "ERROR": "red"},
             "pastel": {"INFO": "#a8e6cf", "WARNING": "#ffd3a5", "ERROR": "#fd9ada"},
             "dark": {"INFO": "#2c3e50", "WARNING": "#f39c12", "ERROR": "#e74c3c"}
         }
     
-    def show_performance_dashboard(self, games_data: Dict[str, List[Dict]], game_name: Optional[str] = None):
+    def show_performance_dashboard(self, games_data: Dict[str, pd.DataFrame], game_name: Optional[str] = None):
         """Mostrar dashboard completo de rendimiento"""
         if not games_data:
             print("❌ No hay datos de logs disponibles")
@@ -53,9 +62,9 @@ class DataVisualizer:
         plt.tight_layout()
         plt.show()
     
-    def show_detailed_game_analysis(self, game_name: str, events: List[Dict]):
+    def show_detailed_game_analysis(self, game_name: str, events: pd.DataFrame):
         """Análisis detallado de un juego específico"""
-        if not events:
+        if events is None or events.empty:
             print(f"❌ No hay datos para el juego: {game_name}")
             return
 
@@ -77,42 +86,39 @@ class DataVisualizer:
         plt.tight_layout()
         plt.show()
     
-    def plot_events_timeline(self, events: List[Dict], ax, title: str):
+    def plot_events_timeline(self, events: pd.DataFrame, ax, title: str):
         """Gráfico de timeline de eventos"""
-        if not events:
+        if events.empty:
             self._show_no_data_message(ax, title)
             return
 
-        # Separar eventos por tipo
-        timestamps = [e["timestamp"] for e in events]
-        event_types = [e["event_type"] for e in events]
-        levels = [e["level"] for e in events]
-
-        # Crear colores por nivel
-        colors = [self.color_schemes["primary"].get(level, "gray") for level in levels]
+        # Colores por nivel: se mapean las categorías, no cada evento
+        colors = events["level"].map(self.color_schemes["primary"]).astype(object).fillna("gray")
 
-        # Convertir tipos de evento a números para scatter plot
-        unique_types = list(set(event_types))
-        type_to_num = {t: i for i, t in enumerate(unique_types)}
-        y_positions = [type_to_num[et] for et in event_types]
+        # Los códigos categóricos ya son la posición Y de cada tipo de evento
+        event_types = events["event_type"].cat.remove_unused_categories()
+        unique_types = list(event_types.cat.categories)
+        y_positions = event_types.cat.codes
 
-        ax.scatter(timestamps, y_positions, c=colors, alpha=0.6, s=30)
+        scatter_downsampled(ax, events["timestamp"], y_positions, keys=y_positions,
+                            colors=colors.to_numpy(), budget=self.point_budget, alpha=0.6, s=30)
         ax.set_yticks(range(len(unique_types)))
         ax.set_yticklabels(unique_types, fontsize=8)
         ax.set_title(title, fontsize=10)
         ax.set_xlabel("Tiempo")
 
         # Formatear eje x
-        if timestamps:
+        if len(events):
             ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M:%S"))
-            ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=1))
+            # Minutos en sesiones cortas, horas/días en timelines largas
+            ax.xaxis.set_major_locator(mdates.AutoDateLocator(minticks=3, maxticks=12))
             plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
     
-    def plot_error_distribution(self, events: List[Dict], ax, title: str):
+    def plot_error_distribution(self, events: pd.DataFrame, ax, title: str):
         """Gráfico de distribución de errores por tipo"""
-        error_events = [e for e in events if e["level"] == "ERROR"]
+        error_events = events[events["level"] == "ERROR"]
 
-        if not error_events:
+        if error_events.empty:
             ax.text(0.5, 0.5, "No hay errores registrados\n✅ ¡Excelente!",
                    ha="center", va="center", transform=ax.transAxes,
                    fontsize=12, color="green")
@@ -120,8 +126,8 @@ class DataVisualizer:
             return
 
         # Contar errores por tipo
-        error_types = [e["event_type"] for e in error_events]
-        error_counts = pd.Series(error_types).value_counts()
+        error_counts = error_events["event_type"].value_counts()
+        error_counts = error_counts[error_counts > 0]
 
         # Gráfico de barras
         bars = ax.bar(range(len(error_counts)), error_counts.values, 
@@ -136,30 +142,29 @@ class DataVisualizer:
             ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1,
                    str(count), ha="center", va="bottom")
     
-    def plot_performance_trends(self, events: List[Dict], ax, title: str):
+    def plot_performance_trends(self, events: pd.DataFrame, ax, title: str):
         """Gráfico de tendencias de rendimiento"""
         # Extraer eventos con score
-        score_events = [e for e in events if "score" in e]
-        death_events = [e for e in events if e.get("is_death", False)]
+        score_events = events[events["score"].notna()]
+        death_times = events.loc[events["is_death"], "timestamp"]
 
-        if not score_events and not death_events:
+        if score_events.empty and death_times.empty:
             self._show_no_data_message(ax, title, "No hay datos de rendimiento")
             return
 
         # Línea de scores a lo largo del tiempo
-        if score_events:
-            score_times = [e["timestamp"] for e in score_events]
-            scores = [e["score"] for e in score_events]
-            ax.plot(score_times, scores, "b-", linewidth=2, label="Score",
-                   marker="o", markersize=4)
+        if not score_events.empty:
+            plot_downsampled(ax, score_events["timestamp"], score_events["score"].to_numpy(dtype=float),
+                             budget=self.point_budget, color="b", linestyle="-", linewidth=2,
+                             label="Score", marker="o", markersize=4)
 
         # Marcar muertes
-        if death_events:
-            death_times = [e["timestamp"] for e in death_events]
-            max_score = max([e.get("score", 0) for e in events]) if score_events else 10
-            death_y = [max_score * 1.1] * len(death_times)
-            ax.scatter(death_times, death_y, c="red", s=100, marker="X",
-                      label="Game Over", zorder=5)
+        if not death_times.empty:
+            max_score = max(0, score_events["score"].max()) if not score_events.empty else 10
+            death_y = np.full(len(death_times), max_score * 1.1)
+            scatter_downsampled(ax, death_times, death_y, keys=np.zeros(len(death_times)),
+                                budget=self.point_budget, c="red", s=100, marker="X",
+                                label="Game Over", zorder=5)
 
         ax.set_title(title, fontsize=10)
         ax.set_xlabel("Tiempo")
@@ -168,21 +173,16 @@ class DataVisualizer:
         ax.grid(True, alpha=0.3)
 
         # Formatear eje x
-        self._format_time_axis(ax, score_events, death_events)
+        self._format_time_axis(ax, score_events["timestamp"], death_times)
     
-    def plot_activity_heatmap(self, events: List[Dict], ax, title: str):
+    def plot_activity_heatmap(self, events: pd.DataFrame, ax, title: str):
         """Heatmap de actividad por hora"""
-        if not events:
+        if events.empty:
             self._show_no_data_message(ax, title)
             return
 
-        # Crear matriz de horas (24h) x días
-        hours = [e["timestamp"].hour for e in events]
-        activity_by_hour = pd.Series(hours).value_counts().sort_index()
-
-        # Rellenar horas faltantes con 0
-        all_hours = pd.Series(0, index=range(24))
-        all_hours.update(activity_by_hour)
+        # Eventos por hora (24h), horas faltantes en 0
+        all_hours = events["timestamp"].dt.hour.value_counts().reindex(range(24), fill_value=0)
 
         # Crear heatmap simple
         ax.bar(range(24), all_hours.values, color="skyblue", alpha=0.7)
@@ -193,16 +193,14 @@ class DataVisualizer:
         ax.set_ylabel("Número de Eventos")
         ax.grid(True, alpha=0.3)
     
-    def plot_session_durations(self, events: List[Dict], ax, title: str):
+    def plot_session_durations(self, events: pd.DataFrame, ax, title: str):
         """Duración de sesiones de juego"""
-        duration_events = [e for e in events if "game_duration" in e]
+        durations = events["game_duration"].dropna().to_numpy()
 
-        if not duration_events:
+        if not len(durations):
             self._show_no_data_message(ax, title, "No hay datos de duración")
             return
 
-        durations = [e["game_duration"] for e in duration_events]
-
         ax.hist(durations, bins=10, color="lightgreen", alpha=0.7, edgecolor="black")
         ax.set_title(title, fontsize=10)
         ax.set_xlabel("Duración (segundos)")
@@ -215,16 +213,16 @@ class DataVisualizer:
                   label=f"Promedio: {avg_duration:.1f}s")
         ax.legend()
     
-    def plot_speed_performance(self, events: List[Dict], ax, title: str):
+    def plot_speed_performance(self, events: pd.DataFrame, ax, title: str):
         """Relación entre velocidad y rendimiento"""
-        speed_events = [e for e in events if "speed" in e and "score" in e]
+        speed_events = events[events["speed"].notna() & events["score"].notna()]
 
-        if not speed_events:
+        if speed_events.empty:
             self._show_no_data_message(ax, title, "No hay datos de velocidad")
             return
 
-        speeds = [e["speed"] for e in speed_events]
-        scores = [e["score"] for e in speed_events]
+        speeds = speed_events["speed"].to_numpy()
+        scores = speed_events["score"].to_numpy(dtype=float)
 
         ax.scatter(speeds, scores, alpha=0.6, color="purple")
         ax.set_title(title, fontsize=10)
@@ -239,22 +237,22 @@ class DataVisualizer:
             ax.plot(speeds, p(speeds), "r--", alpha=0.8, label="Tendencia")
             ax.legend()
     
-    def plot_skill_progression(self, events: List[Dict], ax, title: str):
+    def plot_skill_progression(self, events: pd.DataFrame, ax, title: str):
         """Progresión de habilidad a lo largo del tiempo"""
-        death_events = [e for e in events if e.get("is_death", False) and "score" in e]
+        death_events = events[events["is_death"] & events["score"].notna()]
 
-        if not death_events:
+        if death_events.empty:
             self._show_no_data_message(ax, title, "No hay datos de progresión")
             return
 
         # Ordenar por tiempo
-        death_events.sort(key=lambda x: x["timestamp"])
+        death_events = death_events.sort_values("timestamp", kind="stable")
 
-        times = [e["timestamp"] for e in death_events]
-        final_scores = [e["score"] for e in death_events]
+        times = death_events["timestamp"]
+        final_scores = death_events["score"].to_numpy(dtype=float)
 
-        ax.plot(times, final_scores, "o-", color="darkblue", 
-               linewidth=2, markersize=6)
+        plot_downsampled(ax, times, final_scores, budget=self.point_budget, marker="o",
+                         color="darkblue", linewidth=2, markersize=6)
         ax.set_title(title, fontsize=10)
         ax.set_xlabel("Tiempo")
         ax.set_ylabel("Score Final por Partida")
@@ -268,8 +266,9 @@ class DataVisualizer:
         if len(final_scores) > 2:
             z = np.polyfit(range(len(final_scores)), final_scores, 1)
             trend_line = np.poly1d(z)
-            ax.plot(times, trend_line(range(len(final_scores))), "r--",
-                   alpha=0.8, label="Tendencia")
+            plot_downsampled(ax, times, trend_line(np.arange(len(final_scores))),
+                             budget=self.point_budget, envelope=False, marker=None,
+                             color="r", linestyle="--", alpha=0.8, label="Tendencia")
             ax.legend()
     
     def _show_no_data_message(self, ax, title: str, message: str = "No hay datos"):
@@ -278,18 +277,13 @@ class DataVisualizer:
                transform=ax.transAxes)
         ax.set_title(title)
     
-    def _format_time_axis(self, ax, *event_lists):
+    def _format_time_axis(self, ax, *time_series):
         """Formatear eje de tiempo"""
-        all_times = []
-        for events in event_lists:
-            if events:
-                all_times.extend([e["timestamp"] for e in events])
-        
-        if all_times:
+        if any(len(times) for times in time_series):
             ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M:%S"))
             plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
     
-    def create_custom_plot(self, events: List[Dict], plot_type: str, **kwargs):
+    def create_custom_plot(self, events: pd.DataFrame, plot_type: str, **kwargs):
         """Crear gráfico personalizado según tipo"""
         plot_methods = {
             "timeline": self.plot_events_timeline,
@@ -0,0 +1,233 @@
+"""
+Reducción de puntos para gráficas largas (compartido por analytics y cognitivo)
+
+- LTTB (Largest-Triangle-Three-Buckets): conserva la forma de la serie con
+  un número fijo de puntos.
+- Envolvente min/max por bucket: los picos que LTTB descarta siguen visibles
+  como banda sombreada.
+- Al hacer zoom se recalcula con los datos originales del rango visible, así
+  que con pocos puntos en pantalla se ve la resolución completa.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import matplotlib.dates as mdates
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba_array
+import pandas as pd
+
+
+DEFAULT_POINT_BUDGET = 2000  # Puntos máximos por serie antes de reducir
+
+
+def _as_float_x(x) -> Tuple[np.ndarray, bool]:
+    """Eje X numérico (fechas -> números de matplotlib) y si era de fechas"""
+    values = np.asarray(x)
+    if np.issubdtype(values.dtype, np.datetime64) or (
+            values.dtype == object and len(values) and hasattr(values[0], "year")):
+        return mdates.date2num(pd.to_datetime(values).to_pydatetime()), True
+    return values.astype(float), False
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Índices elegidos por LTTB (siempre incluye primero y último)"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Buckets interiores (el primer y último punto van fijos)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+
+    for i in range(threshold - 2):
+        start, stop = edges[i], max(edges[i] + 1, edges[i + 1])
+        # Promedio del bucket siguiente como tercer vértice del triángulo
+        next_start, next_stop = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        next_stop = max(next_start + 1, next_stop)
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+
+        px, py = x[previous], y[previous]
+        areas = np.abs((px - avg_x) * (y[start:stop] - py) - (px - x[start:stop]) * (avg_y - py))
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+
+    return selected
+
+
+def minmax_envelope(x: np.ndarray, y: np.ndarray, buckets: int
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Mínimo y máximo de y por bucket (x = centro del bucket)"""
+    edges = np.linspace(0, len(x), buckets + 1).astype(int)
+    edges = np.unique(edges)
+    starts = edges[:-1]
+    centers = (x[starts] + x[edges[1:] - 1]) / 2
+    return centers, np.minimum.reduceat(y, starts), np.maximum.reduceat(y, starts)
+
+
+def envelope_polygon(x: np.ndarray, y: np.ndarray, buckets: int) -> np.ndarray:
+    """Polígono cerrado de la banda min/max (ida por máximos, vuelta por mínimos)"""
+    centers, low, high = minmax_envelope(x, y, buckets)
+    return np.concatenate([np.column_stack([centers, high]),
+                           np.column_stack([centers[::-1], low[::-1]])])
+
+
+def representative_indices(x: np.ndarray, keys: np.ndarray, budget: int) -> np.ndarray:
+    """Para scatter categórico: primer punto de cada (bucket de tiempo, clave)
+
+    Conserva la presencia de cada tipo de evento en cada tramo del eje.
+    """
+    n = len(x)
+    if n <= budget:
+        return np.arange(n)
+
+    categories, codes = np.unique(keys, return_inverse=True)
+    buckets = max(1, budget // max(1, len(categories)))
+    span = x[-1] - x[0] if n > 1 else 0
+    if span <= 0:
+        bucket_ids = np.zeros(n, dtype=np.int64)
+    else:
+        bucket_ids = np.minimum(((x - x[0]) / span * buckets).astype(np.int64), buckets - 1)
+    combined = bucket_ids * len(categories) + codes
+    _, first = np.unique(combined, return_index=True)
+    return np.sort(first)
+
+
+class DownsampledLine:
+    """Serie reducida a un presupuesto de puntos que se recalcula al hacer zoom"""
+
+    def __init__(self, ax, x, y, budget: int = DEFAULT_POINT_BUDGET,
+                 envelope: bool = True, marker: Optional[str] = "o", **plot_kwargs):
+        self.ax = ax
+        self.x, self.is_date = _as_float_x(x)
+        self.y = np.asarray(y, dtype=float)
+        order = np.argsort(self.x, kind="stable")
+        self.x, self.y = self.x[order], self.y[order]
+
+        self.budget = budget
+        self.marker = marker
+        self._updating = False
+
+        x_view, y_view, reduced = self._visible_points(None)
+        (self.line,) = ax.plot(x_view, y_view, marker="None" if reduced else (marker or "None"),
+                              **plot_kwargs)
+
+        # Banda única que se actualiza en sitio: crear/quitar artistas al hacer
+        # zoom vuelve a pedir autoescalado y re-dispara xlim_changed
+        self.envelope_artist = None
+        if envelope:
+            self.envelope_artist = PolyCollection([], facecolors=self.line.get_color(),
+                                                  alpha=0.2, linewidths=0)
+            ax.add_collection(self.envelope_artist, autolim=False)
+            if len(self.y):
+                ax.update_datalim([(self.x[0], self.y.min()), (self.x[-1], self.y.max())])
+            self._draw_envelope(None, reduced)
+
+        if self.is_date:
+            ax.xaxis_date()
+        # Lambda (no método ligado): el registro de callbacks guarda referencia fuerte
+        ax.callbacks.connect("xlim_changed", lambda changed: self._on_xlim_changed(changed))
+
+    def _slice(self, xlim) -> slice:
+        if xlim is None:
+            return slice(0, len(self.x))
+        lo, hi = sorted(xlim)
+        start = max(0, np.searchsorted(self.x, lo, side="left") - 1)
+        stop = min(len(self.x), np.searchsorted(self.x, hi, side="right") + 1)
+        return slice(start, stop)
+
+    def _visible_points(self, xlim):
+        window = self._slice(xlim)
+        x, y = self.x[window], self.y[window]
+        if len(x) <= self.budget:
+            return x, y, False
+        keep = lttb_indices(x, y, self.budget)
+        return x[keep], y[keep], True
+
+    def _draw_envelope(self, xlim, reduced: bool):
+        if self.envelope_artist is None:
+            return
+        if not reduced:
+            self.envelope_artist.set_verts([])
+            return
+        window = self._slice(xlim)
+        self.envelope_artist.set_verts([envelope_polygon(self.x[window], self.y[window],
+                                                         self.budget // 2)])
+
+    def _on_xlim_changed(self, ax):
+        # get_xlim puede disparar autoescalado y volver a emitir el evento
+        if self._updating:
+            return
+        self._updating = True
+        try:
+            xlim = ax.get_xlim()
+            x_view, y_view, reduced = self._visible_points(xlim)
+            self.line.set_data(x_view, y_view)
+            self.line.set_marker("None" if reduced else (self.marker or "None"))
+            self._draw_envelope(xlim, reduced)
+        finally:
+            self._updating = False
+
+
+class DownsampledScatter:
+    """Scatter con un representante por (tramo de tiempo, categoría); recalcula al hacer zoom"""
+
+    def __init__(self, ax, x, y, keys: Sequence, colors: Optional[Sequence] = None,
+                 budget: int = DEFAULT_POINT_BUDGET, **scatter_kwargs):
+        self.ax = ax
+        self.x, self.is_date = _as_float_x(x)
+        order = np.argsort(self.x, kind="stable")
+        self.x = self.x[order]
+        self.y = np.asarray(y, dtype=float)[order]
+        self.keys = np.asarray(keys)[order]
+        self.colors = None if colors is None else np.asarray(colors, dtype=object)[order]
+        self.budget = budget
+        self._updating = False
+
+        keep = self._visible_indices(None)
+        kwargs = dict(scatter_kwargs)
+        if self.colors is not None:
+            kwargs["c"] = list(self.colors[keep])
+        self.artist = ax.scatter(self.x[keep], self.y[keep], **kwargs)
+
+        if self.is_date:
+            ax.xaxis_date()
+        # Lambda (no método ligado): el registro de callbacks guarda referencia fuerte
+        ax.callbacks.connect("xlim_changed", lambda changed: self._on_xlim_changed(changed))
+
+    def _visible_indices(self, xlim) -> np.ndarray:
+        if xlim is None:
+            start, stop = 0, len(self.x)
+        else:
+            lo, hi = sorted(xlim)
+            start = np.searchsorted(self.x, lo, side="left")
+            stop = np.searchsorted(self.x, hi, side="right")
+        return start + representative_indices(self.x[start:stop], self.keys[start:stop], self.budget)
+
+    def _on_xlim_changed(self, ax):
+        if self._updating:
+            return
+        self._updating = True
+        try:
+            keep = self._visible_indices(ax.get_xlim())
+            self.artist.set_offsets(np.column_stack([self.x[keep], self.y[keep]]))
+            if self.colors is not None:
+                self.artist.set_facecolors(to_rgba_array(list(self.colors[keep])))
+        finally:
+            self._updating = False
+
+
+def plot_downsampled(ax, x, y, budget: int = DEFAULT_POINT_BUDGET, envelope: bool = True,
+                     marker: Optional[str] = "o", **plot_kwargs) -> DownsampledLine:
+    """ax.plot con LTTB + envolvente min/max por encima de budget puntos"""
+    return DownsampledLine(ax, x, y, budget=budget, envelope=envelope, marker=marker, **plot_kwargs)
+
+
+def scatter_downsampled(ax, x, y, keys: Sequence, colors: Optional[Sequence] = None,
+                        budget: int = DEFAULT_POINT_BUDGET, **scatter_kwargs) -> DownsampledScatter:
+    """ax.scatter con un punto representativo por tramo y categoría"""
+    return DownsampledScatter(ax, x, y, keys, colors=colors, budget=budget, **scatter_kwargs)
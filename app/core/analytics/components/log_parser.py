@@ -1,165 +1,738 @@
 """
 Parser especializado para carga y procesamiento de logs de juegos
+
+Carga incremental: cada archivo guarda un checkpoint (offset en bytes + firma del
+inicio del archivo) y una caché en disco de eventos ya parseados, de modo que
+una recarga solo parsea las líneas añadidas desde la última vez.
+
+Los bytes pendientes de todos los logs se reparten en trozos alineados a fin de
+línea y se parsean en un pool de procesos cuando el volumen lo justifica.
+
+Los eventos de cada juego se guardan como un DataFrame columnar ("event frame"):
+event_type/level categóricos, campos numéricos tipados y marcas booleanas.
+
+Vía rápida: si GameLogger escribió <juego>.jsonl (campos tipados), se lee ese
+archivo con json en lugar de aplicar regex; del .log solo se parsea la parte
+anterior a la creación del sink (log_offset de la cabecera).
+
+Segmentos rotados: GameLogger archiva los segmentos cerrados (gzip) en
+segments/<juego>/ con un index.json de rangos de tiempo; con una ventana
+start/end solo se descomprimen los segmentos que la solapan.
 """
 
+import gzip
+import hashlib
+import json
 import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+CACHE_DIR_NAME = ".parsed"
+CACHE_VERSION = 2
+SIGNATURE_BYTES = 256  # Bytes iniciales que identifican el archivo (detecta rotación/truncado)
+CHUNK_SIZE = 8 * 1024 * 1024  # Bytes por trozo enviado a cada worker
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024  # Por debajo, el arranque del pool no compensa
+LOG_SUFFIX = ".log"
+JSONL_SUFFIX = ".jsonl"
+SEGMENTS_DIR_NAME = "segments"  # Mismo layout que GameLogger
+SEGMENT_INDEX_NAME = "index.json"
+
+# Columnas de los eventos parseados (las opcionales quedan en None si no aparecen)
+EVENT_COLUMNS = (
+    "timestamp", "level", "event_type", "message", "line_number",
+    "score", "x_pos", "y_pos", "speed", "game_duration",
+    "is_death", "is_success", "is_pause", "is_game_start",
+)
+CATEGORY_COLUMNS = ("level", "event_type")
+INTEGER_COLUMNS = ("score", "x_pos", "y_pos")  # Enteros con nulos (Int64)
+FLOAT_COLUMNS = ("speed", "game_duration")
+FLAG_COLUMNS = ("is_death", "is_success", "is_pause", "is_game_start")
+
+# Patrón: 2025-05-25 22:57:24 | INFO | [EVENT_TYPE] message
+_LINE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) \| (\w+) \| \[([A-Z_]+)\] (.+)")
+
+# Un único barrido del mensaje extrae score, posición, velocidad, duración y marcas
+_FIELDS_PATTERN = re.compile(
+    r"Score:?\s*(?P<score>\d+)"
+    r"|\((?P<x_pos>\d+),\s*(?P<y_pos>\d+)\)"
+    r"|Speed:?\s*(?P<speed>[\d.]+)s?"
+    r"|Duration:?\s*(?P<game_duration>[\d.]+)s"
+    r"|(?P<flag>PLAYER DEATH|GAME OVER|GOLPE EXITOSO|esquivado|PAUSADO|PAUSED"
+    r"|JUEGO INICIADO|GAME STARTED)"
+)
+
+_SPECIAL_FLAGS = {
+    "PLAYER DEATH": "is_death",
+    "GAME OVER": "is_death",
+    "GOLPE EXITOSO": "is_success",
+    "esquivado": "is_success",
+    "PAUSADO": "is_pause",
+    "PAUSED": "is_pause",
+    "JUEGO INICIADO": "is_game_start",
+    "GAME STARTED": "is_game_start",
+}
+
+
+def parse_log_line(line: str, line_num: int) -> Optional[Dict]:
+    """Parsear una línea individual del log (None si no tiene el formato esperado)"""
+    match = _LINE_PATTERN.match(line)
+    if not match:
+        return None
+
+    timestamp_str, level, event_type, message = match.groups()
+    event = {
+        "timestamp": datetime.fromisoformat(timestamp_str),
+        "level": level,
+        "event_type": event_type,
+        "message": message,
+        "line_number": line_num,
+    }
+
+    # Extraer información específica según el tipo de evento
+    extract_specific_data(event, message)
+    return event
+
+
+def extract_specific_data(event: Dict, message: str):
+    """Extraer datos del mensaje en una sola pasada (primera aparición de cada campo)"""
+    for match in _FIELDS_PATTERN.finditer(message):
+        group = match.lastgroup
+        if group == "flag":
+            event[_SPECIAL_FLAGS[match.group("flag")]] = True
+        elif group == "y_pos":
+            if "x_pos" not in event:
+                event["x_pos"] = int(match.group("x_pos"))
+                event["y_pos"] = int(match.group("y_pos"))
+        elif group not in event:
+            value = match.group(group)
+            if group == "score":
+                event[group] = int(value)
+            else:
+                try:
+                    event[group] = float(value)
+                except ValueError:
+                    continue
+
+
+def parse_log_bytes(data: bytes, first_line: int = 1) -> List[Dict]:
+    """Parsear un bloque de líneas completas del log"""
+    events = []
+    text = data.decode("utf-8", errors="replace")
+
+    for line_num, line in enumerate(text.splitlines(), first_line):
+        try:
+            event = parse_log_line(line.strip(), line_num)
+            if event:
+                events.append(event)
+        except Exception as e:
+            print(f"⚠️ Error parseando línea {line_num}: {e}")
+
+    return events
+
+
+def events_to_columns(events: List[Dict]) -> Dict[str, list]:
+    """Pasar eventos a columnas (payload compacto entre procesos)"""
+    return {column: [event.get(column) for event in events] for column in EVENT_COLUMNS}
+
+
+def columns_to_frame(columns: Dict[str, list]) -> pd.DataFrame:
+    """Construir event frame tipado desde columnas"""
+    data = {
+        "timestamp": pd.to_datetime(pd.Series(columns["timestamp"], dtype="datetime64[ns]")),
+        "message": pd.Series(columns["message"], dtype=object),
+        "line_number": np.asarray(columns["line_number"], dtype=np.int64),
+    }
+    for column in CATEGORY_COLUMNS:
+        data[column] = pd.Categorical(columns[column])
+    for column in INTEGER_COLUMNS:
+        data[column] = pd.array(columns[column], dtype="Int64")
+    for column in FLOAT_COLUMNS:
+        data[column] = np.asarray(columns[column], dtype=np.float64)
+    for column in FLAG_COLUMNS:
+        data[column] = np.fromiter((value is True for value in columns[column]),
+                                   dtype=bool, count=len(columns[column]))
+    return pd.DataFrame(data, columns=list(EVENT_COLUMNS))
+
+
+def empty_event_frame() -> pd.DataFrame:
+    """Event frame sin filas (mismas columnas y tipos)"""
+    return columns_to_frame({column: [] for column in EVENT_COLUMNS})
+
+
+def concat_event_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Unir event frames conservando columnas categóricas"""
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return empty_event_frame()
+    if len(frames) == 1:
+        return frames[0]
+
+    frame = pd.concat(frames, ignore_index=True)
+    for column in CATEGORY_COLUMNS:
+        if not isinstance(frame[column].dtype, pd.CategoricalDtype):
+            frame[column] = frame[column].astype("category")
+    return frame
+
+
+def frame_to_events(frame: pd.DataFrame) -> List[Dict]:
+    """Event frame -> lista de dicts (solo para código que aún itera eventos)"""
+    events = []
+    for record in frame.to_dict("records"):
+        events.append({key: value for key, value in record.items()
+                       if not (value is pd.NA or value is None or value is False
+                               or (isinstance(value, float) and np.isnan(value)))})
+    return events
+
+
+def parse_log_range(log_path: str, start: int, end: int) -> Tuple[Dict[str, list], int]:
+    """Worker: parsear bytes [start, end) de un log - retorna (columnas, líneas leídas)
+
+    Los números de línea son relativos al trozo; quien une los trozos los desplaza.
+    """
+    with open(log_path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return events_to_columns(parse_log_bytes(data, 1)), data.count(b"\n")
+
+
+def parse_jsonl_range(log_path: str, start: int, end: int) -> Tuple[Dict[str, list], int]:
+    """Worker: leer bytes [start, end) de un sink JSON-lines - retorna (columnas, líneas)"""
+    with open(log_path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return parse_jsonl_bytes(data, os.path.basename(log_path))
+
+
+def parse_jsonl_bytes(data: bytes, source: str = "") -> Tuple[Dict[str, list], int]:
+    """Leer un bloque de líneas JSON completas - retorna (columnas, líneas)"""
+    numbered = [(line_num, line) for line_num, line in enumerate(data.splitlines(), 1)
+                if line.strip()]
+    try:
+        # Un solo json.loads para todo el trozo (mucho menos overhead que línea a línea)
+        decoded = json.loads(b"[" + b",".join(line for _, line in numbered) + b"]")
+    except ValueError:
+        decoded = []
+        for line_num, line in numbered:
+            try:
+                decoded.append(json.loads(line))
+            except ValueError:
+                decoded.append(None)
+                print(f"⚠️ Línea JSON inválida {line_num} en {source}")
+
+    records = []
+    line_numbers = []
+    for (line_num, _), record in zip(numbered, decoded):
+        if isinstance(record, dict) and "_header" not in record:
+            records.append(record)
+            line_numbers.append(line_num)
+
+    columns = {column: [record.get(column) for record in records] for column in EVENT_COLUMNS}
+    columns["line_number"] = line_numbers
+    return columns, data.count(b"\n")
+
+
+def read_jsonl_header(jsonl_path: str) -> Dict:
+    """Cabecera del sink JSON-lines ({} si no tiene)"""
+    try:
+        with open(jsonl_path, "rb") as file:
+            header = json.loads(file.readline() or b"{}")
+        return header.get("_header", {}) if isinstance(header, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def read_segment_index(log_dir: str, stem: str) -> List[Dict]:
+    """Segmentos archivados de un juego según su index.json ([] si no hay)"""
+    index_path = os.path.join(log_dir, SEGMENTS_DIR_NAME, stem, SEGMENT_INDEX_NAME)
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f).get("segments", [])
+    except (OSError, ValueError):
+        return []
+
+
+def _segment_overlaps(segment: Dict, start: Optional[datetime], end: Optional[datetime]) -> bool:
+    """¿El rango [start, end] del segmento solapa la ventana? (None = abierto)"""
+    seg_start = datetime.fromisoformat(segment["start"]) if segment.get("start") else None
+    seg_end = datetime.fromisoformat(segment["end"]) if segment.get("end") else None
+    if end is not None and seg_start is not None and seg_start > end:
+        return False
+    if start is not None and seg_end is not None and seg_end < start:
+        return False
+    return True
+
+
+def split_log_range(log_path: str, start: int, end: int,
+                    chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Dividir [start, end) en trozos que empiezan y terminan en fin de línea"""
+    ranges = []
+    with open(log_path, "rb") as file:
+        position = start
+        while position < end:
+            boundary = position + chunk_size
+            if boundary >= end:
+                ranges.append((position, end))
+                break
+            # Avanzar hasta después del siguiente salto de línea
+            file.seek(boundary)
+            file.readline()
+            boundary = min(file.tell(), end)
+            ranges.append((position, boundary))
+            position = boundary
+    return ranges
+
+
+def _file_signature(log_path: str, length: int) -> str:
+    """Hash de los primeros bytes del archivo"""
+    with open(log_path, "rb") as file:
+        return hashlib.sha1(file.read(length)).hexdigest()
 
 
 class LogParser:
     """Especialista en carga y parseo de archivos de log de juegos"""
-    
-    def __init__(self, log_dir: str = "app/data"):
+
+    def __init__(self, log_dir: str = "app/data", use_cache: bool = True,
+                 max_workers: Optional[int] = None):
         self.log_dir = log_dir
-        self.games_data: Dict[str, List[Dict]] = {}
-    
-    def load_all_logs(self) -> Dict[str, List[Dict]]:
-        """Cargar todos los archivos de log disponibles"""
+        self.use_cache = use_cache
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_dir = os.path.join(log_dir, CACHE_DIR_NAME)
+        self.games_data: Dict[str, pd.DataFrame] = {}
+
+        # Checkpoints en memoria por ruta: offset, líneas, firma y event frame acumulado
+        self._checkpoints: Dict[str, Dict] = {}
+        self._segment_frames: Dict[str, pd.DataFrame] = {}
+
+    def load_all_logs(self, start: Optional[datetime] = None,
+                      end: Optional[datetime] = None) -> Dict[str, pd.DataFrame]:
+        """Cargar todos los logs disponibles (solo líneas nuevas, en paralelo)
+
+        start/end: ventana de tiempo; los segmentos archivados fuera de ella no se abren.
+        """
         if not os.path.exists(self.log_dir):
             print(f"❌ Directorio de logs no encontrado: {self.log_dir}")
             return {}
 
-        log_files = [f for f in os.listdir(self.log_dir) if f.endswith(".log")]
+        # Planificar: checkpoint y trozos pendientes de cada archivo vivo
+        plans = {}
+        sources = self._discover_sources()
+        for game_name, (_, live_sources) in sources.items():
+            for log_path, limit, parse_range in live_sources:
+                try:
+                    checkpoint, stop = self._prepare_checkpoint(log_path, limit)
+                    ranges = split_log_range(log_path, checkpoint["offset"], stop)
+                    plans[log_path] = (game_name, checkpoint, ranges, parse_range)
+                except Exception as e:
+                    print(f"❌ Error cargando {os.path.basename(log_path)}: {e}")
 
-        for log_file in log_files:
-            game_name = self._extract_game_name(log_file)
-            log_path = os.path.join(self.log_dir, log_file)
+        results = self._parse_ranges(plans)
 
+        live_frames: Dict[str, List[pd.DataFrame]] = {}
+        for log_path, (game_name, checkpoint, ranges, _) in plans.items():
             try:
-                self.games_data[game_name] = self.parse_log_file(log_path)
-                print(f"✅ Log cargado: {game_name} ({len(self.games_data[game_name])} eventos)")
+                new_frame, lines = self._merge_chunks(checkpoint, results[log_path])
+                self._commit_checkpoint(log_path, checkpoint, ranges, new_frame, lines)
+                live_frames.setdefault(game_name, []).append(checkpoint["frame"])
             except Exception as e:
-                print(f"❌ Error cargando {log_file}: {e}")
+                print(f"❌ Error cargando {os.path.basename(log_path)}: {e}")
+
+        self.games_data = {}
+        for game_name, (stem, _) in sources.items():
+            # Segmentos archivados (en orden) + archivos vivos
+            frames = self._load_segments(stem, start, end) + live_frames.get(game_name, [])
+            frame = concat_event_frames(frames)
+            if start is not None or end is not None:
+                frame = self._filter_window(frame, start, end)
+            self.games_data[game_name] = frame
+            print(f"✅ Log cargado: {game_name} ({len(frame)} eventos)")
 
         return self.games_data
-    
+
+    def _discover_sources(self) -> Dict[str, Tuple[str, List[Tuple[str, Optional[int], object]]]]:
+        """Por juego: (stem, archivos vivos como (ruta, límite en bytes, función de parseo))
+
+        Con sink JSON-lines, el .log solo aporta lo escrito antes de crearlo.
+        """
+        files = set(os.listdir(self.log_dir))
+        stems = {os.path.splitext(name)[0] for name in files
+                 if name.endswith(LOG_SUFFIX) or name.endswith(JSONL_SUFFIX)}
+        segments_dir = os.path.join(self.log_dir, SEGMENTS_DIR_NAME)
+        if os.path.isdir(segments_dir):
+            stems.update(os.listdir(segments_dir))
+
+        sources = {}
+        for stem in sorted(stems):
+            log_path = os.path.join(self.log_dir, stem + LOG_SUFFIX)
+            jsonl_path = os.path.join(self.log_dir, stem + JSONL_SUFFIX)
+            game_sources = []
+
+            if stem + JSONL_SUFFIX in files:
+                log_offset = int(read_jsonl_header(jsonl_path).get("log_offset", 0))
+                if stem + LOG_SUFFIX in files and log_offset > 0:
+                    game_sources.append((log_path, log_offset, parse_log_range))
+                game_sources.append((jsonl_path, None, parse_jsonl_range))
+            elif stem + LOG_SUFFIX in files:
+                game_sources.append((log_path, None, parse_log_range))
+
+            sources[self._extract_game_name(stem + LOG_SUFFIX)] = (stem, game_sources)
+        return sources
+
+    # ===== SEGMENTOS ARCHIVADOS =====
+
+    def get_segments(self, game_name: str) -> List[Dict]:
+        """Índice de segmentos archivados de un juego (rango, eventos, score máximo)"""
+        stem = game_name.lower().replace(" ", "_")
+        return read_segment_index(self.log_dir, stem)
+
+    def _window_segments(self, stem: str, start: Optional[datetime],
+                         end: Optional[datetime]) -> List[Tuple[str, Dict]]:
+        """(ruta, entrada del índice) de los segmentos que solapan la ventana, en orden"""
+        segments = [segment for segment in read_segment_index(self.log_dir, stem)
+                    if segment.get("kind") == "events" or segment.get("legacy_bytes")]
+        # La historia previa al sink (legacy) va antes que cualquier segmento de eventos
+        segments.sort(key=lambda segment: (segment.get("kind") == "events", segment.get("start") or ""))
+        return [(os.path.join(self.log_dir, SEGMENTS_DIR_NAME, stem, segment["file"]), segment)
+                for segment in segments if _segment_overlaps(segment, start, end)]
+
+    def _load_segments(self, stem: str, start: Optional[datetime],
+                       end: Optional[datetime]) -> List[pd.DataFrame]:
+        """Frames de los segmentos que solapan la ventana (inmutables: caché por archivo)"""
+        frames = []
+        for path, segment in self._window_segments(stem, start, end):
+            try:
+                frames.append(self._load_segment(path, segment))
+            except (OSError, EOFError, ValueError) as e:
+                print(f"⚠️ No se pudo leer segmento {segment['file']}: {e}")
+        return frames
+
+    def _load_segment(self, path: str, segment: Dict) -> pd.DataFrame:
+        frame = self._segment_frames.get(path)
+        if frame is not None:
+            return frame
+
+        cache_path = os.path.join(self.cache_dir, os.path.basename(path) + ".frames.pkl")
+        if self.use_cache and os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    frame = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                frame = None
+
+        if frame is None:
+            frame = self._read_segment(path, segment)
+
+            if self.use_cache:
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    with open(cache_path, "wb") as f:
+                        pickle.dump(frame, f, protocol=pickle.HIGHEST_PROTOCOL)
+                except OSError as e:
+                    print(f"⚠️ No se pudo guardar caché de {path}: {e}")
+
+        self._segment_frames[path] = frame
+        return frame
+
+    def _read_segment(self, path: str, segment: Dict) -> pd.DataFrame:
+        """Parsear un segmento archivado (sin caché)"""
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            data = f.read()
+        if segment.get("kind") == "events":
+            columns, _ = parse_jsonl_bytes(data, os.path.basename(path))
+        else:
+            columns = events_to_columns(parse_log_bytes(data[:segment["legacy_bytes"]]))
+        return columns_to_frame(columns)
+
+    # ===== EXPORTACIÓN POR TROZOS =====
+
+    def event_chunk_loaders(self, game_name: str, start: Optional[datetime] = None,
+                            end: Optional[datetime] = None) -> List:
+        """Loaders de trozos de eventos de un juego, leídos directamente de disco
+
+        Un loader por segmento archivado y por rango de bytes de los archivos
+        vivos: exportar no necesita el juego entero en memoria.
+        """
+        if not os.path.exists(self.log_dir):
+            return []
+        sources = self._discover_sources()
+        if game_name not in sources:
+            return []
+
+        stem, live_sources = sources[game_name]
+        loaders = [partial(self._segment_chunk, path, segment, start, end)
+                   for path, segment in self._window_segments(stem, start, end)]
+
+        for log_path, limit, parse_range in live_sources:
+            # Tamaño fijado al planificar: lo que se escriba después no entra
+            stop = limit if limit is not None else os.path.getsize(log_path)
+            loaders.extend(partial(self._range_chunk, log_path, parse_range, range_start, range_end,
+                                   start, end)
+                           for range_start, range_end in split_log_range(log_path, 0, stop))
+        return loaders
+
+    def _segment_chunk(self, path: str, segment: Dict, start: Optional[datetime],
+                       end: Optional[datetime]) -> pd.DataFrame:
+        frame = self._segment_frames.get(path)
+        if frame is None:
+            frame = self._read_segment(path, segment)
+        return self._filter_window(frame, start, end) if start or end else frame
+
+    def _range_chunk(self, log_path: str, parse_range, range_start: int, range_end: int,
+                     start: Optional[datetime], end: Optional[datetime]) -> pd.DataFrame:
+        columns, _ = parse_range(log_path, range_start, range_end)
+        frame = columns_to_frame(columns)
+        return self._filter_window(frame, start, end) if start or end else frame
+
+    def _filter_window(self, frame: pd.DataFrame, start: Optional[datetime],
+                       end: Optional[datetime]) -> pd.DataFrame:
+        mask = np.ones(len(frame), dtype=bool)
+        if start is not None:
+            mask &= (frame["timestamp"] >= start).to_numpy()
+        if end is not None:
+            mask &= (frame["timestamp"] <= end).to_numpy()
+        return frame[mask].reset_index(drop=True)
+
+    def _parse_ranges(self, plans: Dict) -> Dict[str, List]:
+        """Parsear todos los trozos pendientes (pool de procesos si hay volumen)"""
+        jobs = [(log_path, parse_range, start, end)
+                for log_path, (_, _, ranges, parse_range) in plans.items()
+                for start, end in ranges]
+        pending_bytes = sum(end - start for _, _, start, end in jobs)
+        results: Dict[str, List] = {log_path: [] for log_path in plans}
+
+        if self.max_workers > 1 and len(jobs) > 1 and pending_bytes >= PARALLEL_MIN_BYTES:
+            try:
+                workers = min(self.max_workers, len(jobs))
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [(log_path, pool.submit(parse_range, log_path, start, end))
+                               for log_path, parse_range, start, end in jobs]
+                    for log_path, future in futures:
+                        results[log_path].append(future.result())
+                print(f"⚡ {len(jobs)} trozos de log parseados con {workers} procesos")
+                return results
+            except Exception as e:
+                print(f"⚠️ Pool de procesos no disponible, parseando en serie: {e}")
+                results = {log_path: [] for log_path in plans}
+
+        for log_path, parse_range, start, end in jobs:
+            results[log_path].append(parse_range(log_path, start, end))
+        return results
+
+    def _merge_chunks(self, checkpoint: Dict, chunks: List) -> Tuple[pd.DataFrame, int]:
+        """Unir trozos en orden, desplazando números de línea - retorna (frame, líneas)"""
+        frames = []
+        first_line = checkpoint["lines"]
+        for columns, line_count in chunks:
+            frame = columns_to_frame(columns)
+            frame["line_number"] += first_line
+            frames.append(frame)
+            first_line += line_count
+        return concat_event_frames(frames), first_line - checkpoint["lines"]
+
     def _extract_game_name(self, log_file: str) -> str:
         """Extraer nombre del juego desde el archivo de log"""
-        return log_file.replace(".log", "").replace("_", " ").title()
-    
-    def parse_log_file(self, log_path: str) -> List[Dict]:
-        """Parsear archivo de log y extraer eventos estructurados"""
-        events = []
-
-        with open(log_path, "r", encoding="utf-8") as file:
-            for line_num, line in enumerate(file, 1):
-                try:
-                    event = self._parse_log_line(line.strip(), line_num)
-                    if event:
-                        events.append(event)
-                except Exception as e:
-                    print(f"⚠️ Error parseando línea {line_num}: {e}")
-                    continue
+        return os.path.splitext(log_file)[0].replace("_", " ").title()
 
-        return events
-    
-    def _parse_log_line(self, line: str, line_num: int) -> Dict:
-        """Parsear una línea individual del log"""
-        # Patrón: 2025-05-25 22:57:24 | INFO | [EVENT_TYPE] message
-        pattern = r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) \| (\w+) \| \[([A-Z_]+)\] (.+)"
-        match = re.match(pattern, line)
+    def parse_log_file(self, log_path: str) -> pd.DataFrame:
+        """Parsear archivo de log completo como event frame"""
+        with open(log_path, "rb") as file:
+            return columns_to_frame(events_to_columns(parse_log_bytes(file.read())))
+
+    def load_log_file(self, log_path: str) -> pd.DataFrame:
+        """Cargar un log (.log o .jsonl) de forma incremental: frame en caché + líneas añadidas"""
+        parse_range = parse_jsonl_range if log_path.endswith(JSONL_SUFFIX) else parse_log_range
+        checkpoint, end = self._prepare_checkpoint(log_path)
+        ranges = split_log_range(log_path, checkpoint["offset"], end)
+        chunks = [parse_range(log_path, start, stop) for start, stop in ranges]
+        new_frame, lines = self._merge_chunks(checkpoint, chunks)
+        self._commit_checkpoint(log_path, checkpoint, ranges, new_frame, lines)
+        return checkpoint["frame"]
+
+    def _prepare_checkpoint(self, log_path: str, limit: Optional[int] = None) -> Tuple[Dict, int]:
+        """Checkpoint vigente del archivo y fin de la última línea completa (hasta limit)"""
+        size = os.path.getsize(log_path)
+        checkpoint = self._checkpoints.get(log_path)
+        if checkpoint is None and self.use_cache:
+            checkpoint = self._read_cache(log_path)
+
+        if checkpoint is None or not self._checkpoint_valid(log_path, checkpoint, size):
+            checkpoint = {"offset": 0, "lines": 0, "signature": "", "signature_len": 0,
+                          "frame": empty_event_frame(), "cache_size": 0}
+
+        # Una línea a medio escribir se deja para la próxima recarga
+        end = checkpoint["offset"]
+        if size > end:
+            with open(log_path, "rb") as file:
+                file.seek(max(end, size - 65536))
+                tail = file.read()
+            last_newline = tail.rfind(b"\n")
+            if last_newline >= 0:
+                end = size - len(tail) + last_newline + 1
+            elif size - end > 65536:
+                end = self._find_last_newline(log_path, end, size)
+        if limit is not None:
+            end = max(checkpoint["offset"], min(end, limit))
+        return checkpoint, end
+
+    def _checkpoint_valid(self, log_path: str, checkpoint: Dict, size: int) -> bool:
+        """El archivo solo creció: mismo inicio y no más corto que el offset"""
+        if size < checkpoint["offset"]:
+            return False
+        if not checkpoint["signature_len"]:
+            return checkpoint["offset"] == 0
+        return _file_signature(log_path, checkpoint["signature_len"]) == checkpoint["signature"]
+
+    def _find_last_newline(self, log_path: str, start: int, size: int) -> int:
+        """Buscar hacia atrás el último salto de línea (líneas muy largas)"""
+        with open(log_path, "rb") as file:
+            file.seek(start)
+            data = file.read(size - start)
+        return start + data.rfind(b"\n") + 1
+
+    def _commit_checkpoint(self, log_path: str, checkpoint: Dict,
+                           ranges: List[Tuple[int, int]], new_frame: pd.DataFrame, lines: int):
+        """Avanzar checkpoint tras parsear los trozos y persistir la caché"""
+        if ranges:
+            checkpoint["offset"] = ranges[-1][1]
+            checkpoint["lines"] += lines
 
-        if not match:
+            if checkpoint["signature_len"] < SIGNATURE_BYTES:
+                checkpoint["signature_len"] = min(SIGNATURE_BYTES, checkpoint["offset"])
+                checkpoint["signature"] = _file_signature(log_path, checkpoint["signature_len"])
+
+            checkpoint["frame"] = concat_event_frames([checkpoint["frame"], new_frame])
+            if self.use_cache:
+                self._write_cache(log_path, checkpoint, new_frame)
+
+        self._checkpoints[log_path] = checkpoint
+
+    # ===== CACHÉ EN DISCO =====
+
+    def _cache_paths(self, log_path: str):
+        """Rutas de la caché de eventos y su checkpoint"""
+        base = os.path.join(self.cache_dir, os.path.basename(log_path))
+        return base + ".frames.pkl", base + ".checkpoint.json"
+
+    def _read_cache(self, log_path: str) -> Optional[Dict]:
+        """Reconstruir checkpoint y eventos desde la caché en disco"""
+        events_path, checkpoint_path = self._cache_paths(log_path)
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            if checkpoint.get("version") != CACHE_VERSION:
+                return None
+
+            # Lotes (frames) añadidos con pickle; se ignora lo escrito tras el checkpoint
+            frames = []
+            with open(events_path, "rb") as f:
+                while f.tell() < checkpoint["cache_size"]:
+                    frames.append(pickle.load(f))
+            checkpoint["frame"] = concat_event_frames(frames)
+            return checkpoint
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError, KeyError):
             return None
 
-        timestamp_str, level, event_type, message = match.groups()
-        timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-
-        event = {
-            "timestamp": timestamp,
-            "level": level,
-            "event_type": event_type,
-            "message": message,
-            "line_number": line_num,
-        }
-
-        # Extraer información específica según el tipo de evento
-        self._extract_specific_data(event)
-        return event
-    
+    def _write_cache(self, log_path: str, checkpoint: Dict, new_frame: pd.DataFrame):
+        """Añadir eventos nuevos a la caché y guardar checkpoint de forma atómica"""
+        events_path, checkpoint_path = self._cache_paths(log_path)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # Si la caché no coincide con el checkpoint (o se reinició), reescribir entera
+            rewrite = (checkpoint["cache_size"] == 0 or not os.path.exists(events_path) or
+                       os.path.getsize(events_path) < checkpoint["cache_size"])
+            with open(events_path, "wb" if rewrite else "r+b") as f:
+                if rewrite:
+                    batch = checkpoint["frame"]
+                else:
+                    f.truncate(checkpoint["cache_size"])
+                    f.seek(checkpoint["cache_size"])
+                    batch = new_frame
+                pickle.dump(batch, f, protocol=pickle.HIGHEST_PROTOCOL)
+                checkpoint["cache_size"] = f.tell()
+
+            state = {key: value for key, value in checkpoint.items() if key != "frame"}
+            state["version"] = CACHE_VERSION
+            tmp_path = checkpoint_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, checkpoint_path)
+        except OSError as e:
+            print(f"⚠️ No se pudo guardar caché de {log_path}: {e}")
+
+    def clear_cache(self):
+        """Olvidar checkpoints y borrar la caché en disco (fuerza reparseo completo)"""
+        self._checkpoints.clear()
+        self._segment_frames.clear()
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    # ===== COMPATIBILIDAD =====
+
+    def _parse_log_line(self, line: str, line_num: int) -> Dict:
+        """Parsear una línea individual del log"""
+        return parse_log_line(line, line_num)
+
     def _extract_specific_data(self, event: Dict):
         """Extraer datos específicos según el tipo de evento"""
-        message = event["message"]
-
-        # Extraer scores usando regex
-        score_match = re.search(r"Score:?\s*(\d+)", message)
-        if score_match:
-            event["score"] = int(score_match.group(1))
-
-        # Extraer posiciones de pelota/jugador
-        pos_match = re.search(r"\((\d+),\s*(\d+)\)", message)
-        if pos_match:
-            event["x_pos"] = int(pos_match.group(1))
-            event["y_pos"] = int(pos_match.group(2))
-
-        # Extraer velocidad
-        speed_match = re.search(r"Speed:?\s*([\d.]+)s?", message)
-        if speed_match:
-            event["speed"] = float(speed_match.group(1))
-
-        # Extraer duración de juego
-        duration_match = re.search(r"Duration:?\s*([\d.]+)s", message)
-        if duration_match:
-            event["game_duration"] = float(duration_match.group(1))
-
-        # Detectar eventos especiales
-        self._detect_special_events(event, message)
-    
-    def _detect_special_events(self, event: Dict, message: str):
-        """Detectar eventos especiales como muertes, hits exitosos, etc."""
-        # Detectar muertes/game over
-        if "PLAYER DEATH" in message or "GAME OVER" in message:
-            event["is_death"] = True
-
-        # Detectar hits exitosos
-        if "GOLPE EXITOSO" in message or "esquivado" in message:
-            event["is_success"] = True
-
-        # Detectar pausas
-        if "PAUSADO" in message or "PAUSED" in message:
-            event["is_pause"] = True
-
-        # Detectar inicios de juego
-        if "JUEGO INICIADO" in message or "GAME STARTED" in message:
-            event["is_game_start"] = True
-    
-    def get_games_data(self) -> Dict[str, List[Dict]]:
+        extract_specific_data(event, event["message"])
+
+    # ===== CONSULTAS =====
+
+    def get_games_data(self) -> Dict[str, pd.DataFrame]:
         """Obtener datos de juegos cargados"""
         return self.games_data
-    
-    def get_game_data(self, game_name: str) -> List[Dict]:
+
+    def get_game_data(self, game_name: str) -> pd.DataFrame:
         """Obtener datos de un juego específico"""
-        return self.games_data.get(game_name, [])
-    
+        frame = self.games_data.get(game_name)
+        return frame if frame is not None else empty_event_frame()
+
     def list_available_games(self) -> List[str]:
         """Listar juegos disponibles"""
         return list(self.games_data.keys())
-    
-    def get_events_by_type(self, game_name: str, event_type: str) -> List[Dict]:
+
+    def get_events_by_type(self, game_name: str, event_type: str) -> pd.DataFrame:
         """Filtrar eventos por tipo específico"""
-        game_data = self.get_game_data(game_name)
-        return [e for e in game_data if e["event_type"] == event_type]
-    
-    def get_events_by_level(self, game_name: str, level: str) -> List[Dict]:
+        frame = self.get_game_data(game_name)
+        return frame[frame["event_type"] == event_type]
+
+    def get_events_by_level(self, game_name: str, level: str) -> pd.DataFrame:
         """Filtrar eventos por nivel (INFO, WARNING, ERROR)"""
-        game_data = self.get_game_data(game_name)
-        return [e for e in game_data if e["level"] == level]
-    
+        frame = self.get_game_data(game_name)
+        return frame[frame["level"] == level]
+
     def get_game_summary(self, game_name: str) -> Dict:
-        """Obtener resumen rápido de un juego"""
-        events = self.get_game_data(game_name)
-        
-        if not events:
+        """Obtener resumen rápido de un juego (operaciones vectorizadas)"""
+        frame = self.get_game_data(game_name)
+
+        if frame.empty:
             return {}
 
-        return {
-            "total_events": len(events),
-            "errors": len([e for e in events if e["level"] == "ERROR"]),
-            "deaths": len([e for e in events if e.get("is_death", False)]),
-            "max_score": max([e.get("score", 0) for e in events]),
-            "total_duration": sum([e.get("game_duration", 0) for e in events]),
-            "first_event": events[0]["timestamp"] if events else None,
-            "last_event": events[-1]["timestamp"] if events else None,
-        } 
\ No newline at end of file
+        return summarize_event_frame(frame)
+
+
+def summarize_event_frame(frame: pd.DataFrame) -> Dict:
+    """Resumen vectorizado de un event frame"""
+    levels = frame["level"].value_counts()
+    max_score = frame["score"].max()
+    return {
+        "total_events": len(frame),
+        "errors": int(levels.get("ERROR", 0)),
+        "warnings": int(levels.get("WARNING", 0)),
+        "deaths": int(frame["is_death"].sum()),
+        "successes": int(frame["is_success"].sum()),
+        "max_score": 0 if pd.isna(max_score) else int(max_score),
+        "total_duration": float(frame["game_duration"].sum()),
+        "first_event": frame["timestamp"].iloc[0],
+        "last_event": frame["timestamp"].iloc[-1],
+    }
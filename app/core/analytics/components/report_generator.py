@@ -1,11 +1,44 @@
 """
 Generador de reportes especializado para análisis de juegos
+
+Trabaja sobre event frames (DataFrame columnar de LogParser): conteos y
+agregados son operaciones vectorizadas, sin recorrer eventos en Python.
+
+Las exportaciones aceptan un event frame o una lista de loaders de trozos
+(LogParser.event_chunk_loaders) y escriben trozo a trozo (streaming_export).
 """
 
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 
+from .streaming_export import ProgressCallback, frame_chunk_loaders, stream_to_csv, stream_to_excel
+
+
+# Columnas exportadas (los campos ausentes quedan vacíos en el CSV)
+CSV_EXPORT_COLUMNS = [
+    "timestamp", "level", "event_type", "message",
+    "score", "x_pos", "y_pos", "speed", "game_duration",
+    "is_death", "is_success", "is_pause", "is_game_start",
+]
+EXCEL_EXPORT_COLUMNS = CSV_EXPORT_COLUMNS[:-2]
+
+
+def _is_empty(events: pd.DataFrame) -> bool:
+    return events is None or events.empty
+
+
+def _chunk_loaders(events: Union[pd.DataFrame, List, None]) -> List:
+    """Normalizar un event frame o una lista de loaders a lista de loaders"""
+    if isinstance(events, pd.DataFrame):
+        return frame_chunk_loaders(events)
+    return list(events or [])
+
+
+def _skipped_note(skipped: int, total: int) -> str:
+    """Aviso para el mensaje de resultado si hubo trozos que no se pudieron leer"""
+    return f" (⚠️ {skipped} de {total} trozos omitidos por error de lectura)" if skipped else ""
+
 
 class ReportGenerator:
     """Especialista en generación de reportes textuales y exportación de datos"""
@@ -18,17 +51,17 @@ class ReportGenerator:
             "errors": self._generate_error_report,
         }
 
-    def generate_performance_report(self, game_name: str, events: List[Dict]) -> str:
+    def generate_performance_report(self, game_name: str, events: pd.DataFrame) -> str:
         """Generar reporte textual de rendimiento completo"""
-        if not events:
+        if _is_empty(events):
             return f"❌ No hay datos para el juego: {game_name}"
 
         # Estadísticas básicas
         total_events = len(events)
-        error_events = [e for e in events if e["level"] == "ERROR"]
-        death_events = [e for e in events if e.get("is_death", False)]
-        score_events = [e for e in events if "score" in e]
-        duration_events = [e for e in events if "game_duration" in e]
+        error_events = events[events["level"] == "ERROR"]
+        death_count = int(events["is_death"].sum())
+        scores = events["score"].dropna()
+        durations = events["game_duration"].dropna()
 
         report = f"""🎮 REPORTE DE RENDIMIENTO: {game_name.upper()}
 {"=" * 60}
@@ -36,50 +69,44 @@ class ReportGenerator:
 📊 ESTADÍSTICAS GENERALES:
 • Total de eventos registrados: {total_events}
 • Errores totales: {len(error_events)}
-• Partidas completadas: {len(death_events)}
-• Eventos con score: {len(score_events)}
+• Partidas completadas: {death_count}
+• Eventos con score: {len(scores)}
 """
 
         # Sección de puntuaciones
-        if score_events:
-            report += self._add_scores_section(score_events)
+        if len(scores):
+            report += self._add_scores_section(scores)
 
         # Sección de duraciones
-        if duration_events:
-            report += self._add_durations_section(duration_events)
+        if len(durations):
+            report += self._add_durations_section(durations)
 
         # Análisis de errores
-        if error_events:
+        if len(error_events):
             report += self._add_errors_section(error_events)
 
         # Recomendaciones
         report += self._add_recommendations_section(
-            events, error_events, duration_events, score_events
+            events, len(error_events), durations, scores
         )
 
         return report
 
-    def _add_scores_section(self, score_events: List[Dict]) -> str:
+    def _add_scores_section(self, scores: pd.Series) -> str:
         """Agregar sección de puntuaciones al reporte"""
-        scores = [e["score"] for e in score_events]
-        max_score = max(scores)
-        avg_score = sum(scores) / len(scores)
-        min_score = min(scores)
-
         return f"""
 🎯 PUNTUACIONES:
-• Score máximo alcanzado: {max_score}
-• Score promedio: {avg_score:.1f}
-• Score mínimo: {min_score}
+• Score máximo alcanzado: {scores.max()}
+• Score promedio: {scores.mean():.1f}
+• Score mínimo: {scores.min()}
 • Total de puntuaciones registradas: {len(scores)}
 """
 
-    def _add_durations_section(self, duration_events: List[Dict]) -> str:
+    def _add_durations_section(self, durations: pd.Series) -> str:
         """Agregar sección de duraciones al reporte"""
-        durations = [e["game_duration"] for e in duration_events]
-        max_duration = max(durations)
-        avg_duration = sum(durations) / len(durations)
-        total_time = sum(durations)
+        max_duration = durations.max()
+        avg_duration = durations.mean()
+        total_time = durations.sum()
 
         return f"""
 ⏱️ TIEMPO DE JUEGO:
@@ -89,15 +116,16 @@ class ReportGenerator:
 • Número de sesiones: {len(durations)}
 """
 
-    def _add_errors_section(self, error_events: List[Dict]) -> str:
-        """Agregar sección de análisis de errores"""
-        error_types = {}
-        for e in error_events:
-            et = e["event_type"]
-            error_types[et] = error_types.get(et, 0) + 1
+    def _count_by_type(self, events: pd.DataFrame) -> pd.Series:
+        """Conteo de eventos por tipo (en orden de primera aparición)"""
+        counts = events["event_type"].value_counts(sort=False)
+        order = pd.unique(events["event_type"].astype(object))
+        return counts.reindex(order)
 
+    def _add_errors_section(self, error_events: pd.DataFrame) -> str:
+        """Agregar sección de análisis de errores"""
         error_section = "\n❌ ANÁLISIS DE ERRORES:\n"
-        for error_type, count in error_types.items():
+        for error_type, count in self._count_by_type(error_events).items():
             percentage = (count / len(error_events)) * 100
             error_section += f"• {error_type}: {count} veces ({percentage:.1f}%)\n"
 
@@ -105,16 +133,16 @@ class ReportGenerator:
 
     def _add_recommendations_section(
         self,
-        all_events: List[Dict],
-        error_events: List[Dict],
-        duration_events: List[Dict],
-        score_events: List[Dict],
+        all_events: pd.DataFrame,
+        error_count: int,
+        durations: pd.Series,
+        scores: pd.Series,
     ) -> str:
         """Agregar sección de recomendaciones inteligentes"""
         recommendations = "\n💡 RECOMENDACIONES:\n"
 
         # Análisis de tasa de errores
-        error_rate = len(error_events) / len(all_events)
+        error_rate = error_count / len(all_events)
         if error_rate > 0.1:
             recommendations += "• Alta tasa de errores (>10%): practica más para mejorar la precisión\n"
         elif error_rate < 0.05:
@@ -123,19 +151,16 @@ class ReportGenerator:
             recommendations += "• Tasa de errores moderada: hay espacio para mejorar\n"
 
         # Análisis de duración de sesiones
-        if duration_events:
-            avg_duration = sum([e["game_duration"] for e in duration_events]) / len(
-                duration_events
-            )
+        if len(durations):
+            avg_duration = durations.mean()
             if avg_duration < 30:
                 recommendations += "• Sesiones cortas (<30s): intenta jugar por más tiempo para mejorar\n"
             elif avg_duration > 120:
                 recommendations += "• Excelente resistencia (>2min): sesiones largas indican buen compromiso\n"
 
         # Análisis de consistencia en scores
-        if score_events and len(score_events) > 3:
-            scores = [e["score"] for e in score_events]
-            score_variance = len(set(scores)) / len(scores)
+        if len(scores) > 3:
+            score_variance = scores.nunique() / len(scores)
             if score_variance > 0.7:
                 recommendations += (
                     "• Scores muy variables: trabaja en la consistencia\n"
@@ -145,9 +170,9 @@ class ReportGenerator:
 
         # Análisis temporal
         if len(all_events) > 10:
-            timestamps = [e["timestamp"] for e in all_events]
+            timestamps = all_events["timestamp"]
             time_span = (
-                max(timestamps) - min(timestamps)
+                timestamps.max() - timestamps.min()
             ).total_seconds() / 3600  # horas
             if time_span > 1:
                 recommendations += (
@@ -156,7 +181,7 @@ class ReportGenerator:
 
         return recommendations
 
-    def generate_summary_report(self, games_data: Dict[str, List[Dict]]) -> str:
+    def generate_summary_report(self, games_data: Dict[str, pd.DataFrame]) -> str:
         """Generar reporte resumen de todos los juegos"""
         if not games_data:
             return "❌ No hay datos de juegos disponibles"
@@ -172,65 +197,50 @@ class ReportGenerator:
             report += f"\n🔹 {game_name}:\n"
             report += f"   • Eventos totales: {len(events)}\n"
 
-            error_count = len([e for e in events if e["level"] == "ERROR"])
+            error_count = int((events["level"] == "ERROR").sum())
             report += f"   • Errores: {error_count}\n"
 
-            scores = [e.get("score", 0) for e in events if "score" in e]
-            if scores:
-                report += f"   • Score máximo: {max(scores)}\n"
+            scores = events["score"].dropna()
+            if len(scores):
+                report += f"   • Score máximo: {scores.max()}\n"
 
-            durations = [
-                e.get("game_duration", 0) for e in events if "game_duration" in e
-            ]
-            if durations:
-                total_time = sum(durations)
+            durations = events["game_duration"].dropna()
+            if len(durations):
+                total_time = durations.sum()
                 report += f"   • Tiempo total: {total_time / 60:.1f} minutos\n"
 
         return report
 
     def export_data_to_csv(
-        self, game_name: str, events: List[Dict], output_path: str = None
+        self, game_name: str, events: Union[pd.DataFrame, List], output_path: str = None,
+        compression: Optional[str] = None, progress: Optional[ProgressCallback] = None
     ) -> str:
-        """Exportar datos a CSV para análisis externo"""
-        if not events:
-            return f"❌ No hay datos para el juego: {game_name}"
+        """Exportar datos a CSV para análisis externo (por trozos)
 
-        # Convertir a DataFrame
-        df_data = []
-        for e in events:
-            row = {
-                "timestamp": e["timestamp"],
-                "level": e["level"],
-                "event_type": e["event_type"],
-                "message": e["message"],
-                "score": e.get("score", ""),
-                "x_pos": e.get("x_pos", ""),
-                "y_pos": e.get("y_pos", ""),
-                "speed": e.get("speed", ""),
-                "game_duration": e.get("game_duration", ""),
-                "is_death": e.get("is_death", False),
-                "is_success": e.get("is_success", False),
-                "is_pause": e.get("is_pause", False),
-                "is_game_start": e.get("is_game_start", False),
-            }
-            df_data.append(row)
-
-        df = pd.DataFrame(df_data)
+        compression: "gzip", "bz2" o "xz"; progress(trozos hechos, total).
+        """
+        loaders = _chunk_loaders(events)
+        if not loaders:
+            return f"❌ No hay datos para el juego: {game_name}"
 
         if output_path is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = f"{game_name.lower().replace(' ', '_')}_{timestamp}.csv"
 
         try:
-            df.to_csv(output_path, index=False)
-            return f"✅ Datos exportados a: {output_path}"
+            output_path, rows, skipped = stream_to_csv(loaders, output_path, CSV_EXPORT_COLUMNS,
+                                                       compression, progress)
+            if not rows:
+                return f"❌ No hay datos para el juego: {game_name}"
+            return f"✅ Datos exportados a: {output_path}{_skipped_note(skipped, len(loaders))}"
         except Exception as e:
             return f"❌ Error exportando datos: {e}"
 
     def export_multiple_games_to_excel(
-        self, games_data: Dict[str, List[Dict]], output_path: str = None
+        self, games_data: Dict[str, Union[pd.DataFrame, List]], output_path: str = None,
+        progress: Optional[ProgressCallback] = None
     ) -> str:
-        """Exportar múltiples juegos a un archivo Excel con hojas separadas"""
+        """Exportar múltiples juegos a un archivo Excel con hojas separadas (por trozos)"""
         if not games_data:
             return "❌ No hay datos de juegos para exportar"
 
@@ -239,39 +249,21 @@ class ReportGenerator:
             output_path = f"game_analytics_export_{timestamp}.xlsx"
 
         try:
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                for game_name, events in games_data.items():
-                    if events:
-                        # Convertir eventos a DataFrame
-                        df_data = []
-                        for e in events:
-                            row = {
-                                "timestamp": e["timestamp"],
-                                "level": e["level"],
-                                "event_type": e["event_type"],
-                                "message": e["message"],
-                                "score": e.get("score", ""),
-                                "x_pos": e.get("x_pos", ""),
-                                "y_pos": e.get("y_pos", ""),
-                                "speed": e.get("speed", ""),
-                                "game_duration": e.get("game_duration", ""),
-                                "is_death": e.get("is_death", False),
-                                "is_success": e.get("is_success", False),
-                            }
-                            df_data.append(row)
-
-                        df = pd.DataFrame(df_data)
-                        # Limpiar nombre de hoja para Excel
-                        sheet_name = game_name.replace(" ", "_")[:31]  # Excel limit
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-            return f"✅ Datos de {len(games_data)} juegos exportados a: {output_path}"
+            sheets = {game_name: _chunk_loaders(events) for game_name, events in games_data.items()}
+            output_path, written, skipped = stream_to_excel(sheets, output_path, EXCEL_EXPORT_COLUMNS,
+                                                            progress)
+            if not written:
+                return "❌ No hay datos de juegos para exportar"
+
+            total = sum(len(loaders) for loaders in sheets.values())
+            return (f"✅ Datos de {len(written)} juegos exportados a: {output_path}"
+                    f"{_skipped_note(skipped, total)}")
 
         except Exception as e:
             return f"❌ Error exportando a Excel: {e}"
 
     def generate_custom_report(
-        self, game_name: str, events: List[Dict], report_type: str = "basic", **kwargs
+        self, game_name: str, events: pd.DataFrame, report_type: str = "basic", **kwargs
     ) -> str:
         """Generar reporte personalizado según tipo"""
         if report_type in self.report_templates:
@@ -280,48 +272,43 @@ class ReportGenerator:
             return f"❌ Tipo de reporte no soportado: {report_type}"
 
     def _generate_basic_report(
-        self, game_name: str, events: List[Dict], **kwargs
+        self, game_name: str, events: pd.DataFrame, **kwargs
     ) -> str:
         """Generar reporte básico"""
-        if not events:
+        if _is_empty(events):
             return f"❌ No hay datos para {game_name}"
 
         total_events = len(events)
-        error_count = len([e for e in events if e["level"] == "ERROR"])
+        error_count = int((events["level"] == "ERROR").sum())
 
         return f"""📋 REPORTE BÁSICO: {game_name}
 • Total eventos: {total_events}
 • Errores: {error_count}
-• Primera actividad: {events[0]["timestamp"]}
-• Última actividad: {events[-1]["timestamp"]}
+• Primera actividad: {events["timestamp"].iloc[0]}
+• Última actividad: {events["timestamp"].iloc[-1]}
 """
 
     def _generate_detailed_report(
-        self, game_name: str, events: List[Dict], **kwargs
+        self, game_name: str, events: pd.DataFrame, **kwargs
     ) -> str:
         """Generar reporte detallado"""
         return self.generate_performance_report(game_name, events)
 
     def _generate_error_report(
-        self, game_name: str, events: List[Dict], **kwargs
+        self, game_name: str, events: pd.DataFrame, **kwargs
     ) -> str:
         """Generar reporte enfocado en errores"""
-        error_events = [e for e in events if e["level"] == "ERROR"]
+        error_events = events[events["level"] == "ERROR"]
 
-        if not error_events:
+        if error_events.empty:
             return f"✅ {game_name}: No se encontraron errores"
 
-        error_types = {}
-        for e in error_events:
-            et = e["event_type"]
-            error_types[et] = error_types.get(et, 0) + 1
-
         report = f"""❌ REPORTE DE ERRORES: {game_name}
 Total de errores: {len(error_events)}
 
 DISTRIBUCIÓN POR TIPO:
 """
-        for error_type, count in error_types.items():
+        for error_type, count in self._count_by_type(error_events).items():
             report += f"• {error_type}: {count} veces\n"
 
         return report
@@ -0,0 +1,179 @@
+"""
+Exportación por trozos (CSV / Excel) con memoria acotada
+
+Las fuentes se pasan como una lista de *loaders*: funciones sin argumentos
+que devuelven un DataFrame (un archivo de sesión, un segmento de log, un
+rango de bytes...). Solo hay un trozo en memoria a la vez y, como la lista
+tiene longitud conocida, el progreso se reporta como (trozos hechos, total).
+
+- CSV: compresión opcional gzip / bz2 / xz (se infiere también del sufijo).
+- Excel: openpyxl en modo write-only (las filas no se acumulan en memoria);
+  una hoja que supera el límite de filas continúa en "<hoja>_2", ...
+
+Un trozo que falla al cargarse se omite (el resto se exporta) y se cuenta:
+ambas funciones retornan cuántos se omitieron para que el llamador lo avise.
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+ChunkLoader = Callable[[], Optional[pd.DataFrame]]
+ProgressCallback = Callable[[int, int], None]
+
+EXPORT_CHUNK_ROWS = 50_000  # Filas por trozo al partir un DataFrame ya cargado
+EXCEL_MAX_ROWS = 1_048_576  # Límite de Excel (incluye la cabecera)
+EXCEL_SHEET_NAME_MAX = 31
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+_COMPRESSION_OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+
+def frame_chunk_loaders(frame: pd.DataFrame, rows: int = EXPORT_CHUNK_ROWS) -> List[ChunkLoader]:
+    """Loaders sobre un DataFrame ya en memoria (cortes sin copiar todo el frame)"""
+    if frame is None or frame.empty:
+        return []
+    return [lambda start=start: frame.iloc[start:start + rows]
+            for start in range(0, len(frame), rows)]
+
+
+def resolve_compression(output_path: str, compression: Optional[str]) -> Tuple[str, Optional[str]]:
+    """Ruta final y compresión efectiva (explícita o inferida del sufijo)"""
+    if compression is None:
+        for name, suffix in COMPRESSION_SUFFIXES.items():
+            if output_path.endswith(suffix):
+                return output_path, name
+        return output_path, None
+
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Compresión no soportada: {compression}")
+    suffix = COMPRESSION_SUFFIXES[compression]
+    if not output_path.endswith(suffix):
+        output_path += suffix
+    return output_path, compression
+
+
+def _iter_chunks(loaders: Sequence[ChunkLoader], progress: Optional[ProgressCallback],
+                 done: int, total: int, skipped: List[str]) -> Iterable[pd.DataFrame]:
+    """Cargar cada trozo en orden, reportando progreso tras procesarlo
+
+    Los errores de carga se anotan en skipped (un mensaje por trozo omitido).
+    """
+    for loader in loaders:
+        try:
+            chunk = loader()
+        except Exception as e:
+            print(f"⚠️ Trozo omitido en exportación: {e}")
+            skipped.append(str(e))
+            chunk = None
+        if chunk is not None and len(chunk):
+            yield chunk
+        done += 1
+        if progress:
+            progress(done, total)
+
+
+def _select_columns(chunk: pd.DataFrame, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    if columns is None:
+        return chunk
+    # Columnas ausentes en un trozo quedan vacías (mismo encabezado en todo el archivo)
+    return chunk.reindex(columns=list(columns))
+
+
+def stream_to_csv(loaders: Sequence[ChunkLoader], output_path: str,
+                  columns: Optional[Sequence[str]] = None, compression: Optional[str] = None,
+                  progress: Optional[ProgressCallback] = None) -> Tuple[str, int, int]:
+    """Escribir trozos a un CSV (comprimido opcionalmente) - retorna (ruta, filas, trozos omitidos)
+
+    Si ningún trozo tiene filas no se deja archivo.
+    """
+    output_path, compression = resolve_compression(output_path, compression)
+    opener = _COMPRESSION_OPENERS.get(compression, open)
+    temp_path = f"{output_path}.partial"
+
+    rows = 0
+    skipped: List[str] = []
+    header_columns = list(columns) if columns is not None else None
+    try:
+        with opener(temp_path, "wt", encoding="utf-8", newline="") as handle:
+            for chunk in _iter_chunks(loaders, progress, 0, len(loaders), skipped):
+                if header_columns is None:
+                    header_columns = list(chunk.columns)
+                chunk = _select_columns(chunk, header_columns)
+                chunk.to_csv(handle, index=False, header=rows == 0)
+                rows += len(chunk)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if rows == 0:
+        os.remove(temp_path)
+    else:
+        os.replace(temp_path, output_path)
+    return output_path, rows, len(skipped)
+
+
+def _excel_rows(chunk: pd.DataFrame) -> Iterable[tuple]:
+    """Filas listas para openpyxl (NaN/NaT/pd.NA -> celda vacía)"""
+    values = chunk.astype(object).where(chunk.notna(), None)
+    return values.itertuples(index=False, name=None)
+
+
+def stream_to_excel(sheets: Dict[str, Sequence[ChunkLoader]], output_path: str,
+                    columns: Optional[Sequence[str]] = None,
+                    progress: Optional[ProgressCallback] = None) -> Tuple[str, Dict[str, int], int]:
+    """Escribir {hoja: loaders} a un .xlsx en modo write-only
+
+    Retorna (ruta, filas por hoja, trozos omitidos).
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    total = sum(len(loaders) for loaders in sheets.values())
+    done = 0
+    written: Dict[str, int] = {}
+    skipped: List[str] = []
+
+    for sheet_name, loaders in sheets.items():
+        base_name = sheet_name.replace(" ", "_")[:EXCEL_SHEET_NAME_MAX]
+        worksheet, sheet_rows, part = None, 0, 1
+        header_columns = list(columns) if columns is not None else None
+        rows = 0
+
+        for chunk in _iter_chunks(loaders, progress, done, total, skipped):
+            if header_columns is None:
+                header_columns = list(chunk.columns)
+            chunk = _select_columns(chunk, header_columns)
+
+            for row in _excel_rows(chunk):
+                if worksheet is None or sheet_rows >= EXCEL_MAX_ROWS:
+                    # Hoja nueva (o continuación al llegar al límite de filas)
+                    suffix = "" if part == 1 else f"_{part}"
+                    worksheet = workbook.create_sheet(base_name[:EXCEL_SHEET_NAME_MAX - len(suffix)] + suffix)
+                    worksheet.append(header_columns)
+                    sheet_rows, part = 1, part + 1
+                worksheet.append(row)
+                sheet_rows += 1
+                rows += 1
+
+        done += len(loaders)
+        if rows:
+            written[sheet_name] = rows
+
+    if not written:
+        return output_path, written, len(skipped)
+
+    temp_path = f"{output_path}.partial"
+    try:
+        workbook.save(temp_path)
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return output_path, written, len(skipped)
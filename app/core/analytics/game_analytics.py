@@ -5,6 +5,8 @@ ANTES: 628 líneas mezclando parseo, visualización, reportes y coordinación
 DESPUÉS: ~100 líneas de pura coordinación entre componentes especializados
 """
 
+import pandas as pd
+from datetime import datetime
 from typing import Dict, List, Optional
 from .components import LogParser, DataVisualizer, ReportGenerator
 
@@ -19,14 +21,16 @@ class GameAnalytics:
     - ReportGenerator: Reportes y exportación
     """
 
-    def __init__(self, log_dir: str = "app/data"):
-        # Inicializar componentes especializados
-        self.log_parser = LogParser(log_dir)
+    def __init__(self, log_dir: str = "app/data", max_workers: Optional[int] = None,
+                 start: Optional[datetime] = None, end: Optional[datetime] = None):
+        # Inicializar componentes especializados (max_workers: procesos para parsear logs)
+        self.log_parser = LogParser(log_dir, max_workers=max_workers)
         self.data_visualizer = DataVisualizer()
         self.report_generator = ReportGenerator()
         
-        # Cargar datos usando el parser
-        self.games_data = self.log_parser.load_all_logs()
+        # Cargar datos usando el parser (start/end: solo segmentos de esa ventana)
+        self.start, self.end = start, end
+        self.games_data = self.log_parser.load_all_logs(start, end)
 
     # ===== MÉTODOS DE ACCESO A DATOS =====
     
@@ -38,7 +42,7 @@ class GameAnalytics:
         """Obtener resumen rápido de un juego"""
         return self.log_parser.get_game_summary(game_name)
     
-    def get_game_data(self, game_name: str) -> List[Dict]:
+    def get_game_data(self, game_name: str) -> pd.DataFrame:
         """Obtener datos de un juego específico"""
         return self.log_parser.get_game_data(game_name)
 
@@ -76,22 +80,26 @@ class GameAnalytics:
 
     # ===== MÉTODOS DE EXPORTACIÓN =====
     
-    def export_data_to_csv(self, game_name: str, output_path: str = None) -> str:
-        """Exportar datos a CSV"""
-        events = self.get_game_data(game_name)
-        return self.report_generator.export_data_to_csv(game_name, events, output_path)
+    def export_data_to_csv(self, game_name: str, output_path: str = None,
+                           compression: Optional[str] = None, progress=None) -> str:
+        """Exportar datos a CSV leyendo los logs por trozos (memoria acotada)"""
+        loaders = self.log_parser.event_chunk_loaders(game_name, self.start, self.end)
+        return self.report_generator.export_data_to_csv(game_name, loaders, output_path,
+                                                        compression, progress)
     
-    def export_all_games_to_excel(self, output_path: str = None) -> str:
-        """Exportar todos los juegos a Excel"""
-        return self.report_generator.export_multiple_games_to_excel(self.games_data, output_path)
+    def export_all_games_to_excel(self, output_path: str = None, progress=None) -> str:
+        """Exportar todos los juegos a Excel leyendo los logs por trozos"""
+        games = {game_name: self.log_parser.event_chunk_loaders(game_name, self.start, self.end)
+                 for game_name in self.list_available_games()}
+        return self.report_generator.export_multiple_games_to_excel(games, output_path, progress)
 
     # ===== MÉTODOS DE FILTRADO Y BÚSQUEDA =====
     
-    def get_events_by_type(self, game_name: str, event_type: str) -> List[Dict]:
+    def get_events_by_type(self, game_name: str, event_type: str) -> pd.DataFrame:
         """Filtrar eventos por tipo específico"""
         return self.log_parser.get_events_by_type(game_name, event_type)
     
-    def get_events_by_level(self, game_name: str, level: str) -> List[Dict]:
+    def get_events_by_level(self, game_name: str, level: str) -> pd.DataFrame:
         """Filtrar eventos por nivel (INFO, WARNING, ERROR)"""
         return self.log_parser.get_events_by_level(game_name, level)
 
@@ -106,23 +114,25 @@ class GameAnalytics:
         """Obtener estadísticas rápidas de un juego"""
         events = self.get_game_data(game_name)
         
-        if not events:
+        if events.empty:
             return {"error": f"No hay datos para {game_name}"}
         
+        summary = self.log_parser.get_game_summary(game_name)
         return {
-            "total_events": len(events),
-            "errors": len([e for e in events if e["level"] == "ERROR"]),
-            "warnings": len([e for e in events if e["level"] == "WARNING"]),
-            "deaths": len([e for e in events if e.get("is_death", False)]),
-            "successes": len([e for e in events if e.get("is_success", False)]),
-            "max_score": max([e.get("score", 0) for e in events]),
-            "time_span": (events[-1]["timestamp"] - events[0]["timestamp"]).total_seconds()
+            "total_events": summary["total_events"],
+            "errors": summary["errors"],
+            "warnings": summary["warnings"],
+            "deaths": summary["deaths"],
+            "successes": summary["successes"],
+            "max_score": summary["max_score"],
+            "time_span": (summary["last_event"] - summary["first_event"]).total_seconds()
         }
     
-    def reload_logs(self):
-        """Recargar logs desde el directorio"""
+    def reload_logs(self, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        """Recargar logs desde el directorio (opcionalmente solo una ventana de tiempo)"""
         print("🔄 Recargando logs...")
-        self.games_data = self.log_parser.load_all_logs()
+        self.start, self.end = start, end
+        self.games_data = self.log_parser.load_all_logs(start, end)
         print(f"✅ {len(self.games_data)} juegos cargados")
 
 
@@ -0,0 +1,212 @@
+"""
+Servicio de conexión Arduino en segundo plano
+
+- Enumeración de puertos, sondeo y conexión fuera del hilo de Tk
+- Sondeo concurrente: todos los candidatos hacen el handshake Firmata a la vez
+  y el primero que responde se queda abierto para conectar (sin otro reset)
+- Vigilancia de hot-plug: si el puerto desaparece o se cierra, se marca la
+  conexión como perdida y se reintenta cuando vuelve, restaurando los pines
+  configurados (ArduinoManager.reconnect)
+
+Los callbacks (on_done, on_state) se entregan con `post`, normalmente
+`widget.after(0, ...)`, para ejecutarse en el hilo de Tk.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple
+
+from core.arduino_manager import (
+    HANDSHAKE_TIMEOUT,
+    ArduinoManager,
+    FirmataBoard,
+    is_arduino_like,
+    list_serial_ports,
+    open_firmata_serial,
+)
+
+WATCH_INTERVAL = 1.0         # Segundos entre comprobaciones de hot-plug
+RECONNECT_MAX_BACKOFF = 8.0  # Espera máxima entre reintentos de reconexión
+
+# Estados reportados a on_state
+STATE_LOST = "lost"
+STATE_RECONNECTED = "reconnected"
+
+
+def probe_ports(ports: List[Tuple[str, str]], timeout: float = HANDSHAKE_TIMEOUT):
+    """Handshake Firmata en todos los puertos a la vez
+
+    Retorna (port, (serial, versión)) del primero que responde, con el serial
+    abierto, o None. Los demás puertos se cierran.
+    """
+    if not ports:
+        return None
+
+    # Los que parecen Arduino primero (solo importa si terminan a la vez)
+    ordered = sorted(ports, key=lambda item: not is_arduino_like(item[1]))
+    pool = ThreadPoolExecutor(max_workers=len(ordered), thread_name_prefix="arduino-probe")
+    futures = {pool.submit(open_firmata_serial, device, timeout): device for device, _ in ordered}
+    winner, winner_future = None, None
+    try:
+        for future in as_completed(futures):
+            try:
+                handshake = future.result()
+            except Exception:
+                continue
+            winner, winner_future = (futures[future], handshake), future
+            break
+    finally:
+        # No esperar a los puertos mudos: se cierran solos al terminar su handshake
+        for future in futures:
+            if future is not winner_future:
+                future.add_done_callback(_close_handshake)
+        pool.shutdown(wait=False)
+    return winner
+
+
+def _close_handshake(future):
+    if not future.cancelled() and future.exception() is None:
+        future.result()[0].close()
+
+
+class ArduinoConnectionService:
+    """Conexión, descubrimiento y reconexión automática del Arduino"""
+
+    def __init__(self, arduino: ArduinoManager, post: Optional[Callable[[Callable], None]] = None,
+                 on_state: Optional[Callable[[str, str], None]] = None):
+        self.arduino = arduino
+        self._post_callback = post
+        self.on_state = on_state
+        # Un hilo para operaciones de conexión: nunca dos conexiones a la vez
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arduino-connection")
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watch = threading.Event()
+
+    def _post(self, callback: Callable):
+        if self._post_callback is None:
+            callback()
+            return
+        try:
+            self._post_callback(callback)
+        except Exception as e:
+            print(f"⚠️ No se pudo notificar a la interfaz: {e}")
+
+    def _run(self, job: Callable, on_done: Optional[Callable]):
+        """Ejecutar job en el hilo de conexión y entregar su resultado con post"""
+        def run():
+            try:
+                result = job()
+            except Exception as e:
+                print(f"❌ Error en conexión Arduino: {e}")
+                result = None
+            if on_done:
+                self._post(lambda: on_done(result))
+
+        return self._executor.submit(run)
+
+    # ===== OPERACIONES =====
+
+    def list_ports_async(self, on_done: Callable[[Optional[List[Tuple[str, str]]]], None]):
+        """Enumerar puertos (device, description)"""
+        return self._run(list_serial_ports, on_done)
+
+    def discover_async(self, on_done: Callable[[Optional[str]], None]):
+        """Buscar el puerto del Arduino: por descripción y, si no, por handshake"""
+        def job():
+            ports = list_serial_ports()
+            port = self.arduino.find_arduino_port(ports)
+            if port:
+                return port
+            found = probe_ports(ports)
+            if not found:
+                return None
+            found[1][0].close()
+            return found[0]
+
+        return self._run(job, on_done)
+
+    def connect_async(self, port: Optional[str], on_done: Callable[[Optional[str]], None]):
+        """Conectar al puerto dado (o al primero que responda) - on_done(port o None)"""
+        def job():
+            if port:
+                print(f"🔌 Conectando a Arduino en {port}...")
+                board = FirmataBoard(port)
+            else:
+                print("🔍 Buscando Arduino en todos los puertos...")
+                found = probe_ports(list_serial_ports())
+                if not found:
+                    return None
+                board = FirmataBoard(found[0], handshake=found[1])
+            self.arduino.attach_board(board)
+            self.start_watching()
+            return self.arduino.port
+
+        return self._run(job, on_done)
+
+    def disconnect_async(self, on_done: Optional[Callable[[Optional[bool]], None]] = None,
+                         before: Optional[Callable[[], None]] = None):
+        """Desconectar (before: p. ej. detener el juego actual antes de cerrar el puerto)"""
+        def job():
+            self.stop_watching()
+            if before:
+                before()
+            self.arduino.disconnect()
+            return True
+
+        return self._run(job, on_done)
+
+    # ===== HOT-PLUG =====
+
+    def start_watching(self):
+        """Vigilar el puerto y reconectar si se pierde"""
+        if self._watcher and self._watcher.is_alive():
+            return
+        self._stop_watch.clear()
+        self._watcher = threading.Thread(target=self._watch_loop, name="arduino-watch", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop_watch.set()
+        watcher = self._watcher
+        if watcher and watcher is not threading.current_thread():
+            watcher.join(timeout=WATCH_INTERVAL * 2)
+
+    def _port_alive(self) -> bool:
+        board = self.arduino.board
+        if board is None or not getattr(board.sp, "is_open", False):
+            return False
+        return any(device == self.arduino.port for device, _ in list_serial_ports())
+
+    def _notify(self, state: str, message: str):
+        print(f"🔌 {message}")
+        if self.on_state:
+            self._post(lambda: self.on_state(state, message))
+
+    def _watch_loop(self):
+        backoff = WATCH_INTERVAL
+        while not self._stop_watch.wait(backoff):
+            if not self.arduino.should_reconnect:
+                break
+            try:
+                if self.arduino.connected:
+                    backoff = WATCH_INTERVAL
+                    if self._port_alive():
+                        continue
+                    self.arduino.connection_lost()
+                    self._notify(STATE_LOST, f"Conexión perdida en {self.arduino.port}, esperando al Arduino...")
+                    continue
+
+                # Desconectado por pérdida: reintentar cuando el puerto vuelva a existir
+                if any(device == self.arduino.port for device, _ in list_serial_ports()):
+                    if self.arduino.reconnect():
+                        backoff = WATCH_INTERVAL
+                        self._notify(STATE_RECONNECTED, f"Reconectado a {self.arduino.port}")
+                        continue
+                    backoff = min(backoff * 2, RECONNECT_MAX_BACKOFF)
+            except Exception as e:
+                print(f"⚠️ Error vigilando conexión Arduino: {e}")
+
+    def shutdown(self):
+        """Detener vigilancia e hilo de conexión (al cerrar la app)"""
+        self.stop_watching()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,7 +1,9 @@
 import pyfirmata
+import threading
 import time
 from pyfirmata import util
-from typing import Optional
+from typing import List, Optional, Tuple
+import serial
 import serial.tools.list_ports
 
 import inspect
@@ -9,6 +11,86 @@ if not hasattr(inspect, 'getargspec'):
     inspect.getargspec = inspect.getfullargspec
 
 
+FIRMATA_BAUDRATE = 57600
+HANDSHAKE_TIMEOUT = 6.0        # Bootloader + arranque de StandardFirmata
+HANDSHAKE_QUIET_SECONDS = 1.5  # No escribir mientras corre el bootloader tras el auto-reset
+HANDSHAKE_QUERY_INTERVAL = 0.25
+ARDUINO_PORT_KEYWORDS = ['ARDUINO', 'CH340', 'CH341', 'CP210', 'FTDI']
+
+
+def wait_for_firmata(sp, timeout: float = HANDSHAKE_TIMEOUT) -> Tuple[int, int]:
+    """Esperar el REPORT_VERSION (0xF9 major minor) de StandardFirmata
+
+    Firmata lo envía solo al arrancar; si la placa no se reinició al abrir el
+    puerto (p. ej. Leonardo) se pide explícitamente pasado el periodo de silencio.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    next_query = start + HANDSHAKE_QUIET_SECONDS
+    buffer = bytearray()
+
+    while time.monotonic() < deadline:
+        now = time.monotonic()
+        if now >= next_query:
+            sp.write(bytearray([pyfirmata.REPORT_VERSION]))
+            next_query = now + HANDSHAKE_QUERY_INTERVAL
+
+        chunk = sp.read(max(1, sp.in_waiting))
+        if not chunk:
+            continue
+        buffer += chunk
+
+        index = buffer.find(pyfirmata.REPORT_VERSION)
+        while index != -1 and index + 2 < len(buffer):
+            major, minor = buffer[index + 1], buffer[index + 2]
+            if major < 0x80 and minor < 0x80:
+                return major, minor
+            index = buffer.find(pyfirmata.REPORT_VERSION, index + 1)
+        # Conservar solo la cola (puede contener un reporte a medio llegar)
+        del buffer[:-2]
+
+    raise TimeoutError(f"Sin respuesta Firmata en {sp.port} tras {timeout:.0f}s")
+
+
+def open_firmata_serial(port: str, timeout: float = HANDSHAKE_TIMEOUT):
+    """Abrir el puerto y esperar a Firmata - retorna (serial, (major, minor))"""
+    # Lecturas con timeout corto solo durante el handshake
+    sp = serial.Serial(port, FIRMATA_BAUDRATE, timeout=0.05)
+    try:
+        return sp, wait_for_firmata(sp, timeout)
+    except Exception:
+        sp.close()
+        raise
+
+
+class FirmataBoard(pyfirmata.Arduino):
+    """pyfirmata.Arduino que detecta la placa lista por handshake (no por sleep fijo)
+
+    handshake: (serial, versión) de open_firmata_serial si ya se hizo al sondear puertos.
+    """
+
+    def __init__(self, port: str, handshake_timeout: float = HANDSHAKE_TIMEOUT, handshake=None):
+        self.sp, self.firmata_version = handshake or open_firmata_serial(port, handshake_timeout)
+        self.name = port
+        self._layout = pyfirmata.BOARDS['arduino']
+
+        # pyfirmata lee los mensajes con lecturas bloqueantes
+        self.sp.timeout = None
+        self.setup_layout(self._layout)
+        while self.bytes_available():
+            self.iterate()
+
+
+def list_serial_ports() -> List[Tuple[str, str]]:
+    """Puertos serie disponibles como (device, description) - una sola enumeración"""
+    return [(port.device, port.description or "") for port in serial.tools.list_ports.comports()]
+
+
+def is_arduino_like(description: str) -> bool:
+    """Descripción de puerto típica de un Arduino o adaptador USB-serie"""
+    return any(keyword in description.upper() for keyword in ARDUINO_PORT_KEYWORDS)
+
+
 class ArduinoManager:
     """Gestor singleton del Arduino con Firmata"""
 
@@ -29,39 +111,107 @@ class ArduinoManager:
         self.port = None
         self.pins = {}  # Cache de pines configurados
         self.iterator = None
+        self.should_reconnect = False  # Conexión pedida por el usuario (reconectar si se pierde)
+        self._lock = threading.RLock()
         self.initialized = True
 
     def connect(self, port: str) -> bool:
         """Conectar al Arduino"""
         try:
             print(f"🔌 Conectando a Arduino en {port}...")
-            self.board = pyfirmata.Arduino(port)
+            self.attach_board(FirmataBoard(port))
+            return True
+
+        except Exception as e:
+            print(f"❌ Error conectando: {e}")
+            self.connected = False
+            return False
+
+    def attach_board(self, board: FirmataBoard):
+        """Usar una placa ya abierta y lista (handshake hecho)"""
+        with self._lock:
+            self.board = board
+            self.pins.clear()
 
             # Inicializar iterator
             self.iterator = util.Iterator(self.board)
             self.iterator.start()
-            time.sleep(3)  # Tiempo para estabilización
 
             self.connected = True
-            self.port = port
-            print("✅ Arduino conectado con StandardFirmata")
+            self.should_reconnect = True
+            self.port = board.sp.port
+            major, minor = board.firmata_version
+            print(f"✅ Arduino conectado con StandardFirmata {major}.{minor}")
+
+    def reconnect(self) -> bool:
+        """Reabrir el último puerto y restaurar los pines configurados
+
+        Los objetos Pin que ya tienen los juegos se reasignan a la placa nueva,
+        así que siguen funcionando sin volver a pedirlos.
+        """
+        with self._lock:
+            if not self.port:
+                return False
+            try:
+                board = FirmataBoard(self.port)
+            except Exception as e:
+                print(f"⚠️ Reconexión fallida en {self.port}: {e}")
+                return False
+            if not self.should_reconnect:
+                # El usuario desconectó mientras se esperaba el handshake
+                board.exit()
+                return False
+
+            for pin_spec, old_pin in self.pins.items():
+                try:
+                    self._rebind_pin(board, old_pin, board.get_pin(pin_spec))
+                except Exception as e:
+                    print(f"⚠️ No se pudo restaurar pin {pin_spec}: {e}")
+
+            self.board = board
+            self.iterator = util.Iterator(board)
+            self.iterator.start()
+            self.connected = True
+            print(f"✅ Arduino reconectado en {self.port} ({len(self.pins)} pines restaurados)")
             return True
 
-        except Exception as e:
-            print(f"❌ Error conectando: {e}")
+    @staticmethod
+    def _rebind_pin(board, old_pin, new_pin):
+        """Pasar el estado del pin nuevo al objeto viejo y ponerlo en su lugar en la placa"""
+        old_pin.__dict__.update(new_pin.__dict__)
+        containers = [board.digital, board.analog] + [port.pins for port in board.digital_ports]
+        for container in containers:
+            for i, candidate in enumerate(container):
+                if candidate is new_pin:
+                    container[i] = old_pin
+
+    def connection_lost(self):
+        """Marcar la conexión como perdida (conserva pines para reconectar)"""
+        with self._lock:
+            if not self.connected:
+                return
             self.connected = False
-            return False
+            self._close_board()
+            print(f"🔌 Conexión con Arduino perdida en {self.port}")
+
+    def _close_board(self):
+        """Cerrar la placa deteniendo antes el iterator (si no, falla leyendo un puerto cerrado)"""
+        if self.iterator:
+            self.iterator.board = None
+        try:
+            self.board.exit()
+        except Exception:
+            pass
 
     def disconnect(self):
         """Desconectar Arduino"""
-        if self.board and self.connected:
-            try:
-                self.board.exit()
+        self.should_reconnect = False
+        with self._lock:
+            if self.board and self.connected:
+                self._close_board()
                 self.connected = False
-                self.pins.clear()
                 print("🔌 Arduino desconectado")
-            except Exception as e:
-                print(f"❌ Error al desconectar: {e}")
+            self.pins.clear()
 
     def get_pin(self, pin_spec: str):
         """Obtener pin (con cache)"""
@@ -73,13 +223,11 @@ class ArduinoManager:
 
         return self.pins[pin_spec]
 
-    def find_arduino_port(self) -> Optional[str]:
-        """Buscar puerto Arduino automáticamente"""
-        ports = serial.tools.list_ports.comports()
-        for port in ports:
-            if any(keyword in port.description.upper() for keyword in
-                ['ARDUINO', 'CH340', 'CH341', 'CP210', 'FTDI']):
-                return port.device
+    def find_arduino_port(self, ports: Optional[List[Tuple[str, str]]] = None) -> Optional[str]:
+        """Buscar puerto Arduino automáticamente (por descripción)"""
+        for device, description in ports if ports is not None else list_serial_ports():
+            if is_arduino_like(description):
+                return device
         return None
 
     def read_button(self) -> Optional[str]:
@@ -100,7 +248,7 @@ class ArduinoManager:
         except serial.SerialException as se:
             print(f"🔌 SerialException while reading button: {se}. Arduino might be disconnected.")
             # Consider the connection lost if a serial exception occurs during read
-            self.disconnect() # Attempt to clean up
+            self.connection_lost()  # El servicio de conexión reintenta
             return None
         except Exception as e:
             print(f"❌ Error reading button: {e}")
@@ -1,21 +1,18 @@
 import pygame
 import numpy as np
 
+from core.pygame_runtime import get_pygame_runtime
+
 class AudioEngine:
     """Motor de audio para generar sonidos"""
 
     def __init__(self):
-        self.sample_rate = 44100
         self.volume = 0.3
 
-        # Inicializar pygame audio
-        pygame.mixer.pre_init(
-            frequency=self.sample_rate,
-            size=-16,
-            channels=2,
-            buffer=512
-        )
-        pygame.mixer.init()
+        # Mixer compartido de la plataforma
+        runtime = get_pygame_runtime()
+        runtime.acquire_audio(self)
+        self.sample_rate = runtime.sample_rate
 
     def generate_tone(self, frequency: float, duration: float) -> np.ndarray:
         """Generar tono senoidal"""
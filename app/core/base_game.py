@@ -31,3 +31,10 @@ class BaseGame(ABC):
     def get_game_status(self) -> Dict[str, Any]:
         """Obtener estado del juego"""
         pass
+
+    def prewarm(self):
+        """Pre-cargar recursos sin hardware (fuentes, sonidos) antes de start_game
+
+        Se llama en segundo plano desde el pool de juegos pre-calentados.
+        """
+        pass
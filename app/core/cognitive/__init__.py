@@ -7,18 +7,65 @@ Componentes simples:
 - SessionManager: Manejo simple de sesiones
 - CognitiveVisualAnalyzer: Visualización de gráficas
 - CognitiveDataCleaner: Limpieza y manejo de archivos
+- EventLogWriter: Log binario compacto (.cglog) con exportación CSV
+- PatientRegistry: Registro único de pacientes (SQLite) para todos los juegos
+- SessionIndex: Índice de sesiones con métricas resumen y consultas paginadas
+- SyncAgent: Envío al hub central de las sesiones nuevas o modificadas
+- HubIngester: Recepción en el hub, índice central y rollups diarios
+
+Los componentes se importan al primer acceso: el logging que usan los juegos
+(CognitiveLogger, SessionManager, índice, registro) solo depende de la
+librería estándar, y pandas/matplotlib se cargan únicamente al pedir
+MetricsCalculator o CognitiveVisualAnalyzer.
 """
 
-from .cognitive_logger import CognitiveLogger
-from .metrics_calculator import MetricsCalculator  
-from .session_manager import SessionManager
-from .visual_analyzer import CognitiveVisualAnalyzer
-from .data_cleaner import CognitiveDataCleaner
-
-__all__ = [
-    "CognitiveLogger",
-    "MetricsCalculator",
-    "SessionManager",
-    "CognitiveVisualAnalyzer",
-    "CognitiveDataCleaner"
-] 
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING
+
+# Nombre público -> submódulo que lo define
+_LAZY_ATTRS = {
+    "CognitiveLogger": "cognitive_logger",
+    "MetricsCalculator": "metrics_calculator",
+    "SessionManager": "session_manager",
+    "CognitiveVisualAnalyzer": "visual_analyzer",
+    "CognitiveDataCleaner": "data_cleaner",
+    "EventLogWriter": "event_log",
+    "export_event_log_to_csv": "event_log",
+    "PatientRegistry": "patient_registry",
+    "get_patient_registry": "patient_registry",
+    "SessionIndex": "session_index",
+    "get_session_index": "session_index",
+    "SyncAgent": "session_sync",
+    "LocalHub": "session_sync",
+    "HttpHubClient": "session_sync",
+    "HubIngester": "hub_ingester",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .cognitive_logger import CognitiveLogger
+    from .metrics_calculator import MetricsCalculator
+    from .session_manager import SessionManager
+    from .visual_analyzer import CognitiveVisualAnalyzer
+    from .data_cleaner import CognitiveDataCleaner
+    from .event_log import EventLogWriter, export_event_log_to_csv
+    from .patient_registry import PatientRegistry, get_patient_registry
+    from .session_index import SessionIndex, get_session_index
+    from .session_sync import SyncAgent, LocalHub, HttpHubClient
+    from .hub_ingester import HubIngester
+
+
+def __getattr__(name: str):
+    """Importar el submódulo del componente pedido y cachearlo en el paquete"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,31 +5,88 @@ Registra eventos cognitivos con estructura de carpetas organizada por juego
 
 import csv
 import os
-from datetime import datetime
+import time
 from typing import Dict, Any, Optional
 
+from .event_log import (
+    CSV_COLUMNS,
+    EVENT_LOG_EXTENSION,
+    EventLogWriter,
+    format_csv_row,
+    schema_for_game,
+)
+from .session_index import SessionSummary, get_session_index
+from .session_journal import SessionJournal
+
+# En modo multi-estación cada proceso define su estación: evita choques de
+# nombre cuando dos estaciones inician el mismo juego en el mismo segundo
+STATION_ENV_VAR = "ARDUINO_STATION_ID"
+
 
 class CognitiveLogger:
     """Logger súper simple para eventos cognitivos - ORGANIZADO POR JUEGO"""
     
-    def __init__(self, game_type: str, patient_id: str, enable_logging: bool = True):
+    def __init__(self, game_type: str, patient_id: str, enable_logging: bool = True,
+                 log_format: str = "binary", durability: str = "balanced"):
         self.game_type = game_type.lower().replace(" ", "_")
         self.patient_id = patient_id
         self.enable_logging = enable_logging
+        # "binary" (.cglog compacto) por defecto; "csv" sigue disponible, y cualquier
+        # sesión binaria se exporta a CSV bajo demanda (SessionManager.export_session_to_csv)
+        self.log_format = log_format
+        self.schema = schema_for_game(self.game_type)
         
         # Estructura organizada: data/cognitive/{game_type}/sessions/
         self.base_dir = f"data/cognitive/{self.game_type}"
         self.sessions_dir = f"{self.base_dir}/sessions"
         
-        # Archivo de sesión con timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.session_id = f"{patient_id}_{self.game_type}_{timestamp}"
-        self.log_file = f"{self.sessions_dir}/{self.session_id}.csv"
+        self.durability = durability
+        self._assign_session_file()
         
         self.events_logged = 0
+        self.finalized = False
+        self.opened = False
+        self.summary = SessionSummary(self.schema)
+        self._event_writer: Optional[EventLogWriter] = None
+        self._csv_stream = None
+        self._csv_writer = None
+        self.journal: Optional[SessionJournal] = None
+        
+        # Los archivos y el manifiesto se crean con el primer evento: un juego
+        # construido de antemano (warm pool) que nunca llega a jugarse no deja
+        # sesiones vacías "in_progress" que luego se recuperan y sincronizan
+    
+    def _assign_session_file(self):
+        """Id y ruta de la sesión con el timestamp actual"""
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        self.session_id = f"{self.patient_id}_{self.game_type}_{timestamp}"
+        station_id = os.environ.get(STATION_ENV_VAR)
+        if station_id:
+            self.session_id += f"_{station_id}"
+        extension = EVENT_LOG_EXTENSION if self.log_format == "binary" else ".csv"
+        self.log_file = f"{self.sessions_dir}/{self.session_id}{extension}"
+    
+    def _open(self):
+        """Abrir la sesión en disco (primer evento): archivo + manifiesto in_progress"""
+        # La sesión empieza cuando se juega, no cuando se construyó el juego
+        self._assign_session_file()
+        self.opened = True
         
-        if self.enable_logging:
-            self._ensure_directories()
+        # Journal: manifiesto write-ahead + política de fsync (fast/balanced/safe)
+        self.journal = SessionJournal(self.log_file, {
+            'session_id': self.session_id,
+            'game_type': self.game_type,
+            'patient_id': self.patient_id,
+            'log_format': self.log_format
+        }, durability=self.durability)
+        
+        self._ensure_directories()
+        self.journal.open()
+        if self.log_format == "binary":
+            self._event_writer = EventLogWriter(
+                self.log_file, self.game_type, self.session_id, self.patient_id
+            )
+        else:
             self._initialize_csv()
     
     def _ensure_directories(self):
@@ -37,45 +94,15 @@ class CognitiveLogger:
         os.makedirs(self.sessions_dir, exist_ok=True)
         print(f"📁 Directorio creado: {self.sessions_dir}")
     
-    def _create_csv_file(self) -> str:
-        """Crear archivo CSV con headers apropiados"""
-        filename = f"{self.session_id}.csv"
-        filepath = os.path.join(self.data_dir, filename)
-        
-        # Headers específicos por tipo de juego
-        if self.game_type == "piano_simon" or self.game_type == "piano_digital":
-            headers = [
-                "timestamp", "session_id", "level", "sequence_length", 
-                "presentation_time_ms", "response_time_ms", "accuracy",
-                "error_type", "sequence_shown", "sequence_input", 
-                "reaction_latency_ms", "is_correct", "error_position"
-            ]
-        elif self.game_type == "two_lane_runner":
-            headers = [
-                "timestamp", "session_id", "obstacle_position", 
-                "reaction_time_ms", "success", "lane_change_accuracy",
-                "speed_level", "decision_time_ms"
-            ]
-        elif self.game_type == "osu_rhythm":
-            headers = [
-                "timestamp", "session_id", "circle_x", "circle_y", 
-                "cursor_x", "cursor_y", "spawn_time", "hit_time",
-                "reaction_time_ms", "spatial_accuracy", "temporal_accuracy",
-                "hit_result", "score", "combo", "difficulty_level"
-            ]
-        else:
-            # Headers genéricos para otros juegos
-            headers = [
-                "timestamp", "session_id", "event_type", "value", 
-                "reaction_time_ms", "accuracy", "success"
-            ]
-        
-        # Crear archivo con headers
-        with open(filepath, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow(headers)
+    def _initialize_csv(self) -> str:
+        """Crear archivo CSV con headers apropiados según el juego"""
+        # Archivo abierto durante toda la sesión; el journal decide cuándo sincronizar
+        self._csv_stream = open(self.log_file, 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.writer(self._csv_stream)
+        self._csv_writer.writerow(CSV_COLUMNS[self.schema])
+        self._csv_stream.flush()
         
-        return filepath
+        return self.log_file
     
     def log_piano_event(self, level: int, sequence_shown: list, sequence_input: list,
                        presentation_time: float, response_time: float, **kwargs):
@@ -87,42 +114,35 @@ class CognitiveLogger:
         error_position = self._find_error_position(sequence_shown, sequence_input)
         is_correct = accuracy == 1.0
         
-        # Datos para CSV
-        row_data = [
-            datetime.now().isoformat(),
-            self.session_id,
-            level,
-            len(sequence_shown),
-            presentation_time,
-            response_time,
-            accuracy,
-            error_type,
-            '|'.join(map(str, sequence_shown)),  # Simple: separar con |
-            '|'.join(map(str, sequence_input)),
-            kwargs.get('reaction_latency', 0),
-            is_correct,
-            error_position
-        ]
-        
-        self._write_row(row_data)
+        self._write_event({
+            'timestamp': time.time(),
+            'level': level,
+            'sequence_length': len(sequence_shown),
+            'presentation_time_ms': presentation_time,
+            'response_time_ms': response_time,
+            'accuracy': accuracy,
+            'error_type': error_type,
+            'sequence_shown': sequence_shown,
+            'sequence_input': sequence_input,
+            'reaction_latency_ms': kwargs.get('reaction_latency', 0),
+            'is_correct': is_correct,
+            'error_position': error_position
+        })
         print(f"📊 Piano event logged: L{level}, Acc:{accuracy:.2f}")
     
     def log_runner_event(self, obstacle_position: str, reaction_time: float,
                         success: bool, lane_accuracy: float, speed_level: int, **kwargs):
         """Log específico para Two-Lane Runner"""
         
-        row_data = [
-            datetime.now().isoformat(),
-            self.session_id,
-            obstacle_position,
-            reaction_time,
-            success,
-            lane_accuracy,
-            speed_level,
-            kwargs.get('decision_time', 0)
-        ]
-        
-        self._write_row(row_data)
+        self._write_event({
+            'timestamp': time.time(),
+            'obstacle_position': obstacle_position,
+            'reaction_time_ms': reaction_time,
+            'success': success,
+            'lane_change_accuracy': lane_accuracy,
+            'speed_level': speed_level,
+            'decision_time_ms': kwargs.get('decision_time', 0)
+        })
         print(f"🏃 Runner event logged: {obstacle_position}, Success:{success}")
     
     def log_generic_event(self, event_type: str, value: Any, 
@@ -130,17 +150,14 @@ class CognitiveLogger:
                          success: bool = False):
         """Log genérico para otros juegos"""
         
-        row_data = [
-            datetime.now().isoformat(),
-            self.session_id,
-            event_type,
-            str(value),
-            reaction_time,
-            accuracy,
-            success
-        ]
-        
-        self._write_row(row_data)
+        self._write_event({
+            'timestamp': time.time(),
+            'event_type': event_type,
+            'value': str(value),
+            'reaction_time_ms': reaction_time,
+            'accuracy': accuracy,
+            'success': success
+        })
         print(f"🎮 Generic event logged: {event_type}")
     
     def log_osu_event(self, circle_x: int, circle_y: int, cursor_x: int, cursor_y: int,
@@ -149,37 +166,100 @@ class CognitiveLogger:
                      score: int, combo: int, difficulty_level: int):
         """Log específico para juego Osu - Precisión espacial y temporal"""
         
-        row_data = [
-            datetime.now().isoformat(),
-            self.session_id,
-            circle_x,
-            circle_y,
-            cursor_x,
-            cursor_y,
-            spawn_time,
-            hit_time,
-            reaction_time,
-            spatial_accuracy,
-            temporal_accuracy,
-            hit_result,
-            score,
-            combo,
-            difficulty_level
-        ]
-        
-        self._write_row(row_data)
+        self._write_event({
+            'timestamp': time.time(),
+            'circle_x': circle_x,
+            'circle_y': circle_y,
+            'cursor_x': cursor_x,
+            'cursor_y': cursor_y,
+            'spawn_time': spawn_time,
+            'hit_time': hit_time,
+            'reaction_time_ms': reaction_time,
+            'spatial_accuracy': spatial_accuracy,
+            'temporal_accuracy': temporal_accuracy,
+            'hit_result': hit_result,
+            'score': score,
+            'combo': combo,
+            'difficulty_level': difficulty_level
+        })
         print(f"🎯 Osu event logged: {hit_result}, Spatial:{spatial_accuracy:.1f}%, Temporal:{temporal_accuracy:.1f}%")
     
-    def _write_row(self, row_data: list):
+    def _write_event(self, event: Dict[str, Any]):
+        """Escribir evento crudo: binario directo o fila CSV formateada"""
+        if not self.enable_logging or self.finalized:
+            return
+        
+        if not self.opened:
+            try:
+                self._open()
+            except Exception as e:
+                print(f"❌ Error abriendo sesión cognitiva: {e}")
+                return
+        
+        if self._event_writer:
+            try:
+                self._event_writer.append(event)
+                self.journal.commit(self._event_writer.stream)
+                self.events_logged += 1
+                self.summary.add(event)
+            except Exception as e:
+                print(f"❌ Error logging evento: {e}")
+        else:
+            if self._write_row(format_csv_row(self.schema, event, self.session_id)):
+                self.events_logged += 1
+                self.summary.add(event)
+    
+    def _write_row(self, row_data: list) -> bool:
         """Escribir fila al CSV - Súper simple"""
         try:
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow(row_data)
+            self._csv_writer.writerow(row_data)
+            self.journal.commit(self._csv_stream)
+            return True
         except Exception as e:
             print(f"❌ Error logging evento: {e}")
             return False
     
+    def _register_in_index(self, manifest: Dict[str, Any]):
+        """Guardar sesión y métricas resumen en el índice (consultas sin leer el archivo)"""
+        try:
+            stat = os.stat(self.log_file)
+            session = {
+                'session_id': self.session_id,
+                'file_path': os.path.normpath(self.log_file),
+                'patient_id': self.patient_id,
+                'game_type': self.game_type,
+                'started_at': manifest['started_at'],
+                'finished_at': manifest.get('finished_at'),
+                'status': manifest['status'],
+                'log_format': self.log_format,
+                'file_size': stat.st_size,
+                'file_mtime': stat.st_mtime
+            }
+            session.update(self.summary.as_dict())
+            get_session_index().upsert_session(session)
+        except Exception as e:
+            print(f"⚠️ Error indexando sesión: {e}")
+    
+    def _calculate_accuracy(self, sequence_shown: list, sequence_input: list) -> float:
+        """Proporción de notas correctas en su posición"""
+        if not sequence_shown:
+            return 0.0
+        matches = sum(1 for shown, played in zip(sequence_shown, sequence_input) if shown == played)
+        return matches / len(sequence_shown)
+    
+    def _detect_error_type(self, sequence_shown: list, sequence_input: list) -> str:
+        """Clasificar el tipo de error de la secuencia"""
+        if list(sequence_shown) == list(sequence_input):
+            return "correct"
+        return "sequence_error"
+    
+    def _find_error_position(self, sequence_shown: list, sequence_input: list) -> int:
+        """Posición del primer error (-1 si no hay)"""
+        for position, shown in enumerate(sequence_shown):
+            if position >= len(sequence_input) or sequence_input[position] != shown:
+                return position
+        return -1
+    
     def _get_all_headers(self) -> list:
         """Obtener todos los headers (comunes + específicos)"""
         common = [
@@ -196,15 +276,35 @@ class CognitiveLogger:
             'patient_id': self.patient_id,
             'log_file': self.log_file,
             'events_logged': self.events_logged,
-            'enable_logging': self.enable_logging
+            'enable_logging': self.enable_logging,
+            'log_format': self.log_format
         }
     
     def finalize_session(self) -> Dict[str, Any]:
         """Finalizar sesión y retornar resumen"""
         if not self.enable_logging:
             return {'status': 'logging_disabled'}
+        
+        if self.finalized:
+            return {'status': 'already_finalized', 'session_id': self.session_id}
+        
+        if not self.opened:
+            # Sin eventos no hay sesión que guardar (ni archivo ni manifiesto)
+            self.finalized = True
+            return {'status': 'empty', 'session_id': self.session_id, 'total_events': 0}
             
         try:
+            # Sincronizar a disco, cerrar y escribir manifiesto "completed"
+            stream = self._event_writer.stream if self._event_writer else self._csv_stream
+            self.journal.manifest['summary'] = self.summary.as_dict()
+            manifest = self.journal.close(stream, self.events_logged)
+            if self._event_writer:
+                self._event_writer.close()
+            if self._csv_stream:
+                self._csv_stream.close()
+            self.finalized = True
+            self._register_in_index(manifest)
+            
             session_summary = {
                 'session_id': self.session_id,
                 'game_type': self.game_type,
@@ -1,19 +1,47 @@
 """
 Utilidad para limpiar archivos de datos cognitivos - Súper simple
+
+Backups incrementales: cada archivo se guarda una sola vez, comprimido y
+nombrado por su SHA-256 (backup/objects/ab/abcd....gz); cada ejecución
+escribe solo un manifiesto (backup/snapshots/snapshot_*.json) con la ruta y
+el hash de cada archivo. Los archivos sin cambios (mismo tamaño y mtime que
+en el snapshot anterior) ni siquiera se vuelven a leer.
 """
 
 import os
 import glob
-from typing import List, Dict
+import gzip
+import hashlib
+import json
+import shutil
+import sqlite3
+import tempfile
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 
 
+SNAPSHOT_VERSION = 1
+SESSION_PATTERNS = ("*.csv", "*.cglog", "*.manifest.json")
+REGISTRY_DB = os.path.join("shared", "cognitive.db")  # Relativo a data_dir
+
+
+def _hash_file(path: str) -> str:
+    """SHA-256 del contenido (por bloques)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
 class CognitiveDataCleaner:
     """Utilidad súper simple para manejo de archivos cognitivos"""
     
-    def __init__(self):
-        self.data_dir = "data/cognitive"
-        self.backup_dir = "data/cognitive/backup"
+    def __init__(self, data_dir: str = "data/cognitive"):
+        self.data_dir = data_dir
+        self.backup_dir = os.path.join(data_dir, "backup")
+        self.objects_dir = os.path.join(self.backup_dir, "objects")
+        self.snapshots_dir = os.path.join(self.backup_dir, "snapshots")
     
     def list_all_files(self) -> List[Dict]:
         """Listar todos los archivos CSV cognitivos"""
@@ -127,29 +155,35 @@ class CognitiveDataCleaner:
         
         return result
     
-    def backup_all_files(self) -> str:
-        """Hacer backup de todos los archivos antes de eliminar"""
-        files = self.list_all_files()
+    def backup_all_files(self, incremental: bool = True) -> str:
+        """Hacer backup de todos los archivos antes de eliminar
+        
+        incremental=True: snapshot deduplicado y comprimido (ver docstring del módulo).
+        incremental=False: copia completa en backup/backup_<fecha>/ (modo anterior).
+        """
+        if incremental:
+            return self.create_snapshot()
+        
+        files = self._backup_sources()
         if not files:
             return "❌ No hay archivos para hacer backup"
         
         # Crear directorio de backup
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_folder = os.path.join(self.backup_dir, f"backup_{timestamp}")
-        os.makedirs(backup_folder, exist_ok=True)
         
         backed_up = 0
         errors = []
         
-        for file_info in files:
+        for relative_path, filepath in files:
             try:
-                import shutil
-                backup_path = os.path.join(backup_folder, file_info['filename'])
-                shutil.copy2(file_info['filepath'], backup_path)
+                backup_path = os.path.join(backup_folder, relative_path)
+                os.makedirs(os.path.dirname(backup_path), exist_ok=True)
+                shutil.copy2(filepath, backup_path)
                 backed_up += 1
-                print(f"💾 Backup: {file_info['filename']}")
+                print(f"💾 Backup: {relative_path}")
             except Exception as e:
-                errors.append(f"Error en backup {file_info['filename']}: {e}")
+                errors.append(f"Error en backup {relative_path}: {e}")
         
         result = f"✅ Backup completado: {backed_up} archivos en {backup_folder}"
         if errors:
@@ -157,6 +191,208 @@ class CognitiveDataCleaner:
         
         return result
     
+    # ===== BACKUPS INCREMENTALES =====
+    
+    def _backup_sources(self) -> List[Tuple[str, str]]:
+        """(ruta relativa a data_dir, ruta real) de todo lo que entra en un backup
+        
+        CSV sueltos (estructura anterior), sesiones de cada juego con sus
+        manifiestos y los patients.json; el registro SQLite va aparte.
+        """
+        if not os.path.exists(self.data_dir):
+            return []
+        
+        paths = set(glob.glob(os.path.join(self.data_dir, "*.csv")))
+        paths.update(glob.glob(os.path.join(self.data_dir, "*", "patients.json")))
+        paths.update(glob.glob(os.path.join(self.data_dir, "shared", "*.json")))
+        for pattern in SESSION_PATTERNS:
+            paths.update(glob.glob(os.path.join(self.data_dir, "*", "sessions", pattern)))
+        
+        backup_root = os.path.abspath(self.backup_dir)
+        sources = []
+        for path in sorted(paths):
+            if os.path.abspath(path).startswith(backup_root + os.sep):
+                continue
+            relative_path = os.path.relpath(path, self.data_dir).replace(os.sep, "/")
+            sources.append((relative_path, path))
+        return sources
+    
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.gz")
+    
+    def _store_object(self, path: str, digest: str) -> bool:
+        """Guardar el contenido comprimido si aún no existe - retorna True si es nuevo"""
+        object_path = self._object_path(digest)
+        if os.path.exists(object_path):
+            return False
+        
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        temp_path = f"{object_path}.{os.getpid()}.tmp"
+        with open(path, 'rb') as source, gzip.open(temp_path, 'wb', compresslevel=6) as target:
+            shutil.copyfileobj(source, target, 1 << 20)
+        os.replace(temp_path, object_path)
+        return True
+    
+    def list_snapshots(self) -> List[Dict]:
+        """Snapshots existentes (más recientes primero) con sus totales"""
+        snapshots = []
+        for path in glob.glob(os.path.join(self.snapshots_dir, "snapshot_*.json")):
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    manifest = json.load(file)
+                manifest['manifest_path'] = path
+                snapshots.append(manifest)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Manifiesto ilegible {path}: {e}")
+        snapshots.sort(key=lambda manifest: manifest.get('created', ''), reverse=True)
+        return snapshots
+    
+    def create_snapshot(self) -> str:
+        """Backup incremental: guardar solo contenido nuevo y escribir el manifiesto"""
+        sources = self._backup_sources()
+        registry_db = os.path.join(self.data_dir, REGISTRY_DB)
+        if not sources and not os.path.exists(registry_db):
+            return "❌ No hay archivos para hacer backup"
+        
+        # Hashes del snapshot anterior: si tamaño y mtime no cambiaron no se relee el archivo
+        previous = self.list_snapshots()
+        known = {entry['path']: entry for entry in previous[0]['files']} if previous else {}
+        
+        entries = []
+        new_objects = 0
+        new_bytes = 0
+        errors = []
+        
+        for relative_path, path in sources:
+            try:
+                stat = os.stat(path)
+                entry = known.get(relative_path)
+                if not (entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns
+                        and os.path.exists(self._object_path(entry['sha256']))):
+                    digest = _hash_file(path)
+                    if self._store_object(path, digest):
+                        new_objects += 1
+                        new_bytes += stat.st_size
+                        print(f"💾 Backup: {relative_path}")
+                    entry = {'path': relative_path, 'sha256': digest,
+                             'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+                entries.append(entry)
+            except Exception as e:
+                errors.append(f"Error en backup {relative_path}: {e}")
+        
+        # Registro de pacientes: copia consistente con la API de backup de SQLite (modo WAL)
+        if os.path.exists(registry_db):
+            try:
+                entry, is_new = self._snapshot_registry(registry_db)
+                entries.append(entry)
+                if is_new:
+                    new_objects += 1
+                    new_bytes += entry['size']
+            except Exception as e:
+                errors.append(f"Error en backup {REGISTRY_DB}: {e}")
+        
+        created = datetime.now()
+        manifest = {
+            'version': SNAPSHOT_VERSION,
+            'created': created.isoformat(),
+            'data_dir': os.path.abspath(self.data_dir),
+            'files': entries,
+            'total_files': len(entries),
+            'total_bytes': sum(entry['size'] for entry in entries),
+            'new_objects': new_objects,
+            'new_bytes': new_bytes,
+        }
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        manifest_path = os.path.join(self.snapshots_dir,
+                                     f"snapshot_{created.strftime('%Y%m%d_%H%M%S_%f')}.json")
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=1)
+        os.replace(temp_path, manifest_path)
+        
+        result = (f"✅ Backup completado: {len(entries)} archivos en {manifest_path} "
+                  f"({new_objects} nuevos, {new_bytes / 1024:.1f} KB sin comprimir)")
+        if errors:
+            result += f"\n❌ {len(errors)} errores:\n" + "\n".join(errors)
+        
+        return result
+    
+    def _snapshot_registry(self, registry_db: str) -> Tuple[Dict, bool]:
+        """Copiar el registro SQLite a un temporal consistente y guardarlo como objeto"""
+        handle, temp_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        try:
+            source = sqlite3.connect(registry_db, timeout=10.0)
+            target = sqlite3.connect(temp_path)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+                source.close()
+            
+            digest = _hash_file(temp_path)
+            is_new = self._store_object(temp_path, digest)
+            size = os.path.getsize(temp_path)
+        finally:
+            os.remove(temp_path)
+        
+        return {'path': REGISTRY_DB.replace(os.sep, "/"), 'sha256': digest,
+                'size': size, 'mtime_ns': 0}, is_new
+    
+    def restore_snapshot(self, manifest_path: Optional[str] = None,
+                         target_dir: Optional[str] = None) -> str:
+        """Restaurar un snapshot (el más reciente por defecto) en target_dir
+        
+        Por seguridad, sin target_dir se restaura en backup/restore_<fecha>/
+        en lugar de sobrescribir data_dir.
+        """
+        snapshots = self.list_snapshots()
+        if manifest_path is None:
+            if not snapshots:
+                return "❌ No hay snapshots para restaurar"
+            manifest_path = snapshots[0]['manifest_path']
+        
+        with open(manifest_path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+        
+        if target_dir is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            target_dir = os.path.join(self.backup_dir, f"restore_{timestamp}")
+        
+        restored = 0
+        errors = []
+        for entry in manifest['files']:
+            try:
+                target_path = os.path.join(target_dir, *entry['path'].split("/"))
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                with gzip.open(self._object_path(entry['sha256']), 'rb') as source, \
+                        open(target_path, 'wb') as target:
+                    shutil.copyfileobj(source, target, 1 << 20)
+                restored += 1
+            except Exception as e:
+                errors.append(f"Error restaurando {entry['path']}: {e}")
+        
+        result = f"✅ Restaurados {restored} archivos en {target_dir}"
+        if errors:
+            result += f"\n❌ {len(errors)} errores:\n" + "\n".join(errors)
+        
+        return result
+    
+    def prune_snapshots(self, keep: int = 30) -> str:
+        """Conservar los últimos `keep` snapshots y borrar objetos ya no referenciados"""
+        snapshots = self.list_snapshots()
+        for manifest in snapshots[keep:]:
+            os.remove(manifest['manifest_path'])
+        
+        referenced = {entry['sha256'] for manifest in snapshots[:keep] for entry in manifest['files']}
+        removed = 0
+        for object_path in glob.glob(os.path.join(self.objects_dir, "*", "*.gz")):
+            if os.path.basename(object_path)[:-3] not in referenced:
+                os.remove(object_path)
+                removed += 1
+        
+        return f"✅ {len(snapshots[keep:])} snapshots y {removed} objetos eliminados"
+    
     def get_storage_summary(self) -> str:
         """Obtener resumen de almacenamiento"""
         files = self.list_all_files()
@@ -231,6 +467,6 @@ class CognitiveDataCleaner:
         summary += "\n💡 OPCIONES RÁPIDAS:\n"
         summary += "   • delete_old_files(30) - Eliminar archivos >30 días\n"
         summary += "   • delete_all_files(confirm=True) - Eliminar TODO\n"
-        summary += "   • backup_all_files() - Hacer backup primero\n"
+        summary += "   • backup_all_files() - Hacer backup primero (incremental)\n"
         
         return summary 
\ No newline at end of file
@@ -0,0 +1,373 @@
+"""
+Log de Eventos Binario - RESPONSABILIDAD ÚNICA
+Formato append-only compacto para sesiones cognitivas, con lector NumPy y exportación CSV
+
+Estructura del archivo (.cglog):
+- Cabecera de tamaño fijo (HEADER_SIZE bytes): magic, versión de esquema,
+  longitud + JSON con campos y vocabularios de enums, relleno con ceros
+- Registros de ancho fijo: prefijo u16 con la longitud del registro + campos numéricos
+
+Como todos los registros miden lo mismo, el lector mapea el archivo con
+np.memmap sin copiar ni parsear texto.
+"""
+
+import csv
+import json
+import os
+import struct
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+EVENT_LOG_EXTENSION = ".cglog"
+EVENT_LOG_MAGIC = b"CGEV"
+SCHEMA_VERSION = 1
+HEADER_SIZE = 4096
+
+# Notas/pasos por secuencia (las melodías más largas tienen 9 notas)
+SEQUENCE_SLOTS = 16
+SEQUENCE_PAD = 0xFF
+TEXT_SLOTS = 32
+
+_PREAMBLE = struct.Struct("<4sHI")  # magic, versión, longitud del JSON
+
+# Códigos propios -> códigos struct / dtype NumPy
+#   E = enum internado (u8), S = secuencia de notas, T = texto corto UTF-8
+_STRUCT_CODES = {"E": "B", "S": f"{SEQUENCE_SLOTS}s", "T": f"{TEXT_SLOTS}s"}
+_NUMPY_CODES = {
+    "d": "<f8", "f": "<f4", "I": "<u4", "H": "<u2", "h": "<i2",
+    "B": "u1", "b": "i1", "?": "?", "E": "u1",
+}
+
+# Campos por esquema, en el mismo orden que las columnas CSV (sin session_id)
+EVENT_SCHEMAS: Dict[str, List[Tuple[str, str]]] = {
+    "piano": [
+        ("timestamp", "d"), ("level", "H"), ("sequence_length", "B"),
+        ("presentation_time_ms", "f"), ("response_time_ms", "f"), ("accuracy", "d"),
+        ("error_type", "E"), ("sequence_shown", "S"), ("sequence_input", "S"),
+        ("reaction_latency_ms", "f"), ("is_correct", "?"), ("error_position", "b"),
+    ],
+    "runner": [
+        ("timestamp", "d"), ("obstacle_position", "E"), ("reaction_time_ms", "f"),
+        ("success", "?"), ("lane_change_accuracy", "f"), ("speed_level", "H"),
+        ("decision_time_ms", "f"),
+    ],
+    "osu": [
+        ("timestamp", "d"), ("circle_x", "h"), ("circle_y", "h"),
+        ("cursor_x", "h"), ("cursor_y", "h"), ("spawn_time", "d"), ("hit_time", "d"),
+        ("reaction_time_ms", "f"), ("spatial_accuracy", "f"), ("temporal_accuracy", "f"),
+        ("hit_result", "E"), ("score", "I"), ("combo", "H"), ("difficulty_level", "H"),
+    ],
+    "generic": [
+        ("timestamp", "d"), ("event_type", "E"), ("value", "T"),
+        ("reaction_time_ms", "f"), ("accuracy", "f"), ("success", "?"),
+    ],
+}
+
+# Vocabularios conocidos; valores nuevos se internan al vuelo en la cabecera
+ENUM_VOCABULARIES: Dict[str, List[str]] = {
+    "error_type": ["correct", "sequence_error", "wrong_note"],
+    "hit_result": ["MISS", "NORMAL", "GOOD", "PERFECT"],
+    "obstacle_position": ["left", "right"],
+    "event_type": [],
+}
+
+# Columnas CSV por esquema - única fuente de verdad para logger y exportación
+CSV_COLUMNS: Dict[str, List[str]] = {
+    name: ["timestamp", "session_id"] + [field for field, _ in fields[1:]]
+    for name, fields in EVENT_SCHEMAS.items()
+}
+
+
+def schema_for_game(game_type: str) -> str:
+    """Obtener nombre de esquema para un tipo de juego"""
+    if game_type in ("piano_simon", "piano_digital"):
+        return "piano"
+    if game_type == "two_lane_runner":
+        return "runner"
+    if game_type == "osu_rhythm":
+        return "osu"
+    return "generic"
+
+
+def _record_struct(fields: List[Tuple[str, str]]) -> struct.Struct:
+    """Construir struct del registro (prefijo de longitud + campos)"""
+    codes = "".join(_STRUCT_CODES.get(code, code) for _, code in fields)
+    return struct.Struct("<H" + codes)
+
+
+def format_csv_row(schema: str, event: Dict[str, Any], session_id: str) -> List[Any]:
+    """Convertir evento crudo a fila CSV legible (timestamps ISO, secuencias con |)"""
+    row = []
+    for column in CSV_COLUMNS[schema]:
+        if column == "session_id":
+            row.append(session_id)
+            continue
+
+        value = event.get(column, 0)
+        if column == "timestamp":
+            value = datetime.fromtimestamp(value).isoformat()
+        elif isinstance(value, (list, tuple)):
+            value = "|".join(map(str, value))
+        row.append(value)
+    return row
+
+
+class EventLogWriter:
+    """Escritor append-only de eventos con registros de ancho fijo"""
+
+    def __init__(self, file_path: str, game_type: str, session_id: str, patient_id: str):
+        self.file_path = file_path
+        self.schema = schema_for_game(game_type)
+        self.fields = EVENT_SCHEMAS[self.schema]
+        self.record_struct = _record_struct(self.fields)
+        self.events_written = 0
+
+        self.metadata = {
+            "schema": self.schema,
+            "schema_version": SCHEMA_VERSION,
+            "game_type": game_type,
+            "session_id": session_id,
+            "patient_id": patient_id,
+            "created": datetime.now().isoformat(),
+            "record_size": self.record_struct.size,
+            "fields": self.fields,
+            "enums": {
+                name: list(ENUM_VOCABULARIES.get(name, []))
+                for name, code in self.fields if code == "E"
+            },
+        }
+        self._enum_codes = {
+            name: {value: index for index, value in enumerate(values)}
+            for name, values in self.metadata["enums"].items()
+        }
+
+        self._file = open(file_path, "wb")
+        self._write_header()
+
+    def _write_header(self):
+        """Escribir (o reescribir en sitio) la cabecera de tamaño fijo"""
+        payload = json.dumps(self.metadata, ensure_ascii=False).encode("utf-8")
+        if _PREAMBLE.size + len(payload) > HEADER_SIZE:
+            raise ValueError("Cabecera del log excede HEADER_SIZE (demasiados valores de enum)")
+
+        header = _PREAMBLE.pack(EVENT_LOG_MAGIC, SCHEMA_VERSION, len(payload)) + payload
+        position = self._file.tell()
+        self._file.seek(0)
+        self._file.write(header.ljust(HEADER_SIZE, b"\x00"))
+        if position > HEADER_SIZE:
+            self._file.seek(position)
+
+    def _intern(self, field: str, value: Any) -> int:
+        """Obtener código de enum, internando valores nuevos en la cabecera"""
+        value = str(value)
+        codes = self._enum_codes[field]
+        if value not in codes:
+            if len(codes) >= 255:
+                raise ValueError(f"Demasiados valores distintos para {field}")
+            codes[value] = len(codes)
+            self.metadata["enums"][field].append(value)
+            self._write_header()
+        return codes[value]
+
+    def _encode(self, name: str, code: str, value: Any) -> Any:
+        """Codificar un valor al tipo fijo del campo"""
+        if code == "E":
+            return self._intern(name, value)
+        if code == "S":
+            if isinstance(value, str):
+                value = [int(v) for v in value.split("|") if v != ""]
+            return bytes(value[:SEQUENCE_SLOTS]).ljust(SEQUENCE_SLOTS, bytes([SEQUENCE_PAD]))
+        if code == "T":
+            return str(value).encode("utf-8")[:TEXT_SLOTS]
+        if code == "?":
+            return bool(value)
+        if code in "df":
+            return float(value or 0)
+        return int(value or 0)
+
+    def append(self, event: Dict[str, Any]):
+        """Añadir un evento (dict con los nombres de campo del esquema)"""
+        values = [self._encode(name, code, event.get(name, 0)) for name, code in self.fields]
+        self._file.write(self.record_struct.pack(self.record_struct.size, *values))
+        self.events_written += 1
+
+    @property
+    def stream(self):
+        """Archivo subyacente (para políticas de flush/fsync externas)"""
+        return self._file
+
+    def flush(self):
+        """Vaciar buffers al sistema operativo"""
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        """Cerrar archivo"""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_event_log_header(file_path: str) -> Dict[str, Any]:
+    """Leer y validar la cabecera de un log binario"""
+    with open(file_path, "rb") as file:
+        raw = file.read(HEADER_SIZE)
+
+    if len(raw) < _PREAMBLE.size:
+        raise ValueError(f"Log binario truncado: {file_path}")
+
+    magic, version, length = _PREAMBLE.unpack_from(raw)
+    if magic != EVENT_LOG_MAGIC:
+        raise ValueError(f"No es un log de eventos cognitivos: {file_path}")
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Versión de esquema no soportada: {version}")
+
+    metadata = json.loads(raw[_PREAMBLE.size:_PREAMBLE.size + length].decode("utf-8"))
+    metadata["fields"] = [tuple(field) for field in metadata["fields"]]
+    return metadata
+
+
+def count_event_log_records(file_path: str, header: Optional[Dict[str, Any]] = None) -> int:
+    """Contar registros completos sin leerlos (registros parciales se ignoran)"""
+    header = header or read_event_log_header(file_path)
+    payload = max(0, os.path.getsize(file_path) - HEADER_SIZE)
+    return payload // header["record_size"]
+
+
+def event_log_dtype(header: Dict[str, Any]):
+    """Construir dtype estructurado NumPy equivalente al registro"""
+    import numpy as np
+
+    dtype_fields = [("_record_size", "<u2")]
+    for name, code in header["fields"]:
+        if code == "S":
+            dtype_fields.append((name, "u1", (SEQUENCE_SLOTS,)))
+        elif code == "T":
+            dtype_fields.append((name, f"S{TEXT_SLOTS}"))
+        else:
+            dtype_fields.append((name, _NUMPY_CODES[code]))
+    return np.dtype(dtype_fields)
+
+
+def load_event_log(file_path: str):
+    """Mapear registros en memoria sin copia - retorna (cabecera, array estructurado)"""
+    import numpy as np
+
+    header = read_event_log_header(file_path)
+    dtype = event_log_dtype(header)
+    if dtype.itemsize != header["record_size"]:
+        raise ValueError("Tamaño de registro inconsistente con el esquema")
+
+    count = count_event_log_records(file_path, header)
+    if count == 0:
+        return header, np.zeros(0, dtype=dtype)
+
+    records = np.memmap(file_path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
+    return header, records
+
+
+def iter_event_log(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Iterar eventos decodificados (solo biblioteca estándar, para exportar)"""
+    header = read_event_log_header(file_path)
+    fields = header["fields"]
+    record_struct = _record_struct(fields)
+    count = count_event_log_records(file_path, header)
+
+    with open(file_path, "rb") as file:
+        file.seek(HEADER_SIZE)
+        payload = file.read(count * record_struct.size)
+
+    for values in record_struct.iter_unpack(payload):
+        event = {}
+        for (name, code), value in zip(fields, values[1:]):
+            if code == "E":
+                value = header["enums"][name][value]
+            elif code == "S":
+                value = [note for note in value if note != SEQUENCE_PAD]
+            elif code == "T":
+                value = value.rstrip(b"\x00").decode("utf-8", errors="ignore")
+            event[name] = value
+        yield event
+
+
+def default_export_path(file_path: str) -> str:
+    """{game}/sessions/x.cglog -> {game}/exports/x.csv (fuera de sessions: no se indexa dos veces)"""
+    sessions_dir = os.path.dirname(file_path)
+    exports_dir = os.path.join(os.path.dirname(sessions_dir), "exports")
+    return os.path.join(exports_dir, os.path.splitext(os.path.basename(file_path))[0] + ".csv")
+
+
+def _local_datetimes(values):
+    """Epoch -> datetime local sin zona, igual que el CSV (datetime.fromtimestamp)"""
+    import numpy as np
+    import pandas as pd
+
+    # Microsegundos como datetime.fromtimestamp: separar los segundos enteros y
+    # redondear solo la fracción (t * 1e6 directo pierde precisión; to_datetime trunca)
+    fractions, seconds = np.modf(np.asarray(values, dtype="f8"))
+    micros = seconds.astype("i8") * 1_000_000 + np.round(fractions * 1e6).astype("i8")
+    utc = pd.to_datetime(micros, unit="us")
+    if len(values) == 0:
+        return utc
+
+    def offset(value: float):
+        moment = float(value)
+        return datetime.fromtimestamp(moment) - datetime.fromtimestamp(moment, timezone.utc).replace(tzinfo=None)
+
+    first, last = offset(values[0]), offset(values[-1])
+    if first == last:
+        return utc + first
+    # Cambio de horario durante la sesión: convertir uno a uno
+    return pd.to_datetime([datetime.fromtimestamp(float(value)) for value in values])
+
+
+def event_log_to_dataframe(file_path: str):
+    """Cargar log binario como DataFrame con las mismas columnas que el CSV"""
+    import numpy as np
+    import pandas as pd
+
+    header, records = load_event_log(file_path)
+    data = {}
+
+    for column in CSV_COLUMNS[header["schema"]]:
+        if column == "session_id":
+            data[column] = np.full(len(records), header["session_id"], dtype=object)
+            continue
+
+        code = dict(header["fields"])[column]
+        values = records[column]
+        if column == "timestamp":
+            data[column] = _local_datetimes(values)
+        elif code == "E":
+            data[column] = pd.Categorical.from_codes(values, header["enums"][column])
+        elif code == "S":
+            data[column] = ["|".join(str(n) for n in row if n != SEQUENCE_PAD) for row in values]
+        elif code == "T":
+            data[column] = np.char.decode(values, "utf-8")
+        else:
+            data[column] = np.asarray(values)
+
+    return pd.DataFrame(data)
+
+
+def export_event_log_to_csv(file_path: str, csv_path: Optional[str] = None) -> str:
+    """Exportar log binario a CSV (formato clínico legible) - retorna ruta del CSV"""
+    header = read_event_log_header(file_path)
+    if csv_path is None:
+        csv_path = default_export_path(file_path)
+    os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+
+    with open(csv_path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_COLUMNS[header["schema"]])
+        for event in iter_event_log(file_path):
+            writer.writerow(format_csv_row(header["schema"], event, header["session_id"]))
+
+    print(f"📤 Log exportado a CSV: {csv_path}")
+    return csv_path
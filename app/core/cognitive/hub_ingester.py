@@ -0,0 +1,247 @@
+"""
+Ingesta del Hub - RESPONSABILIDAD ÚNICA
+Recibe archivos de sesión de las estaciones, los verifica y actualiza índice y rollups
+
+Estructura en el hub:
+    {root}/stations/{station_id}/{game_type}/sessions/{archivo}   (copia de cada estación)
+    {root}/incoming/{station_id}/...part                          (subidas a medias)
+    {root}/hub.db                                                 (índice, archivos recibidos, rollups)
+
+Las subidas son por trozos comprimidos (zlib) y reanudables: el hub guarda lo
+recibido en un .part por hash de contenido y responde desde qué byte seguir.
+Al confirmar se verifica el SHA-256, se mueve el archivo a su sitio de forma
+atómica y se reindexa la sesión (SessionIndex.index_file) y su rollup diario.
+
+Los IDs de paciente son locales a cada estación (cada una tiene su registro):
+en el hub se guardan como "{station_id}:{patient_id}" para que dos pacientes
+P_001 de estaciones distintas no se mezclen en índice ni rollups.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .event_log import EVENT_LOG_EXTENSION
+from .session_index import SessionIndex
+from .session_journal import MANIFEST_SUFFIX
+
+HUB_DB_NAME = "hub.db"
+MAX_CHUNK_BYTES = 4 * 1024 * 1024  # Tamaño máximo de un trozo descomprimido
+
+_SHA256 = re.compile(r"^[0-9a-f]{64}$")
+_STATION_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+_SESSION_FILE = re.compile(r"^[A-Za-z0-9_.-]+$")
+_SESSION_EXTENSIONS = (".csv", EVENT_LOG_EXTENSION, MANIFEST_SUFFIX)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS received_files (
+    station_id    TEXT NOT NULL,
+    rel_path      TEXT NOT NULL,
+    sha256        TEXT NOT NULL,
+    size          INTEGER NOT NULL,
+    received_at   TEXT NOT NULL,
+    PRIMARY KEY (station_id, rel_path)
+);
+CREATE TABLE IF NOT EXISTS session_rollups (
+    patient_id       TEXT NOT NULL,
+    game_type        TEXT NOT NULL,
+    day              TEXT NOT NULL,
+    sessions         INTEGER NOT NULL,
+    events           INTEGER NOT NULL,
+    avg_accuracy     REAL,
+    avg_reaction_ms  REAL,
+    success_rate     REAL,
+    best_score       INTEGER,
+    best_level       INTEGER,
+    PRIMARY KEY (patient_id, game_type, day)
+);
+"""
+
+_SQL_RECEIVED = "SELECT sha256 FROM received_files WHERE station_id = ? AND rel_path = ?"
+_SQL_MARK_RECEIVED = "INSERT OR REPLACE INTO received_files VALUES (?, ?, ?, ?, ?)"
+_SQL_SESSION_KEY = "SELECT patient_id, game_type, substr(started_at, 1, 10) FROM sessions WHERE file_path = ?"
+_SQL_DELETE_ROLLUP = "DELETE FROM session_rollups WHERE patient_id = ? AND game_type = ? AND day = ?"
+_SQL_ROLLUP = """
+INSERT INTO session_rollups
+SELECT patient_id, game_type, substr(started_at, 1, 10), COUNT(*), SUM(event_count),
+       AVG(avg_accuracy), AVG(avg_reaction_ms), AVG(success_rate), MAX(max_score), MAX(max_level)
+FROM sessions
+WHERE patient_id = ? AND game_type = ? AND substr(started_at, 1, 10) = ?
+GROUP BY patient_id, game_type, substr(started_at, 1, 10)
+"""
+_SQL_QUERY_ROLLUPS = "SELECT * FROM session_rollups{where} ORDER BY day DESC, patient_id, game_type"
+
+
+def validate_upload(station_id: str, rel_path: str, sha256: Optional[str] = None) -> str:
+    """Validar estación, ruta relativa {game_type}/sessions/{archivo} y hash - ValueError si no"""
+    if sha256 is not None and not _SHA256.match(sha256):
+        raise ValueError(f"Hash inválido: {sha256!r}")
+    if not _STATION_ID.match(station_id or ""):
+        raise ValueError(f"Estación inválida: {station_id!r}")
+    parts = (rel_path or "").replace("\\", "/").split("/")
+    if (len(parts) != 3 or parts[1] != "sessions" or not _SESSION_FILE.match(parts[0])
+            or not _SESSION_FILE.match(parts[2]) or parts[2].startswith(".")
+            or not parts[2].endswith(_SESSION_EXTENSIONS)):
+        raise ValueError(f"Ruta de sesión inválida: {rel_path!r}")
+    return "/".join(parts)
+
+
+class HubIngester:
+    """Almacén central de sesiones de todas las estaciones"""
+
+    def __init__(self, root: str = "data/hub"):
+        self.root = root
+        self.stations_dir = os.path.join(root, "stations")
+        self.incoming_dir = os.path.join(root, "incoming")
+        os.makedirs(self.stations_dir, exist_ok=True)
+        os.makedirs(self.incoming_dir, exist_ok=True)
+
+        db_path = os.path.join(root, HUB_DB_NAME)
+        self.index = SessionIndex(db_path)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=10.0, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA busy_timeout=10000")
+        self._conn.executescript(_SCHEMA)
+
+    def _final_path(self, station_id: str, rel_path: str) -> str:
+        return os.path.normpath(os.path.join(self.stations_dir, station_id, rel_path))
+
+    def _part_path(self, station_id: str, rel_path: str, sha256: str) -> str:
+        name = f"{rel_path.replace('/', '__')}.{sha256[:16]}.part"
+        return os.path.join(self.incoming_dir, station_id, name)
+
+    # ===== PROTOCOLO DE SUBIDA =====
+
+    def missing(self, station_id: str, manifest: Dict[str, str]) -> List[str]:
+        """De {rel_path: sha256}, las rutas que el hub no tiene con ese contenido"""
+        result = []
+        with self._lock:
+            for rel_path, sha256 in manifest.items():
+                rel_path = validate_upload(station_id, rel_path)
+                row = self._conn.execute(_SQL_RECEIVED, (station_id, rel_path)).fetchone()
+                if row is None or row[0] != sha256:
+                    result.append(rel_path)
+        return result
+
+    def begin_upload(self, station_id: str, rel_path: str, sha256: str) -> int:
+        """Bytes ya recibidos de este contenido (0 = empezar de cero)"""
+        rel_path = validate_upload(station_id, rel_path, sha256)
+        part = self._part_path(station_id, rel_path, sha256)
+        return os.path.getsize(part) if os.path.exists(part) else 0
+
+    def put_chunk(self, station_id: str, rel_path: str, sha256: str, offset: int, data: bytes) -> int:
+        """Añadir un trozo comprimido en offset - retorna bytes recibidos (desde ahí sigue el cliente)"""
+        rel_path = validate_upload(station_id, rel_path, sha256)
+        part = self._part_path(station_id, rel_path, sha256)
+        os.makedirs(os.path.dirname(part), exist_ok=True)
+
+        with self._lock:
+            received = os.path.getsize(part) if os.path.exists(part) else 0
+            if offset != received:
+                # Trozo repetido o fuera de orden: el cliente retoma desde lo recibido
+                return received
+            decompressor = zlib.decompressobj()
+            raw = decompressor.decompress(data, MAX_CHUNK_BYTES)
+            if decompressor.unconsumed_tail or not decompressor.eof:
+                raise ValueError("Trozo demasiado grande o incompleto")
+            with open(part, "ab") as f:
+                f.write(raw)
+            return received + len(raw)
+
+    def commit_upload(self, station_id: str, rel_path: str, sha256: str) -> Dict[str, Any]:
+        """Verificar el hash, colocar el archivo y actualizar índice y rollups"""
+        rel_path = validate_upload(station_id, rel_path, sha256)
+        part = self._part_path(station_id, rel_path, sha256)
+        if not os.path.exists(part):
+            raise ValueError(f"No hay subida pendiente de {rel_path}")
+
+        with self._lock:
+            if file_sha256(part) != sha256:
+                os.remove(part)
+                raise ValueError(f"Hash no coincide para {rel_path}, se descarta la subida")
+
+            final_path = self._final_path(station_id, rel_path)
+            os.makedirs(os.path.dirname(final_path), exist_ok=True)
+            os.replace(part, final_path)
+            with self._conn:
+                self._conn.execute(_SQL_MARK_RECEIVED, (
+                    station_id, rel_path, sha256, os.path.getsize(final_path), datetime.now().isoformat(),
+                ))
+
+        session = self._ingest(station_id, final_path)
+        return {"rel_path": rel_path, "indexed": session is not None}
+
+    # ===== ÍNDICE Y ROLLUPS =====
+
+    def _ingest(self, station_id: str, file_path: str) -> Optional[Dict[str, Any]]:
+        """Indexar la sesión del archivo recibido (el manifiesto reindexa su log)"""
+        if file_path.endswith(MANIFEST_SUFFIX):
+            base = file_path[:-len(MANIFEST_SUFFIX)]
+            logs = [base + extension for extension in (EVENT_LOG_EXTENSION, ".csv")
+                    if os.path.exists(base + extension)]
+            if not logs:
+                return None
+            file_path = logs[0]
+
+        previous_key = self._session_key(file_path)
+        session = self.index.index_file(file_path)
+        if session:
+            session["patient_id"] = hub_patient_id(station_id, session["patient_id"])
+            self.index.upsert_session(session)
+            for key in {previous_key, self._session_key(file_path)}:
+                if key:
+                    self._refresh_rollup(*key)
+        return session
+
+    def _session_key(self, file_path: str):
+        with self._lock:
+            row = self._conn.execute(_SQL_SESSION_KEY, (os.path.normpath(file_path),)).fetchone()
+        return tuple(row) if row else None
+
+    def _refresh_rollup(self, patient_id: str, game_type: str, day: str):
+        """Recalcular el resumen diario de un paciente y juego"""
+        with self._lock, self._conn:
+            self._conn.execute(_SQL_DELETE_ROLLUP, (patient_id, game_type, day))
+            self._conn.execute(_SQL_ROLLUP, (patient_id, game_type, day))
+
+    def query_rollups(self, patient_id: Optional[str] = None,
+                      game_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Resúmenes diarios por paciente ("{station_id}:{patient_id}") y juego"""
+        clauses, params = [], []
+        if patient_id:
+            clauses.append("patient_id = ?")
+            params.append(patient_id)
+        if game_type:
+            clauses.append("game_type = ?")
+            params.append(game_type)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(_SQL_QUERY_ROLLUPS.format(where=where), params).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """Cerrar conexiones"""
+        with self._lock:
+            self._conn.close()
+        self.index.close()
+
+
+def hub_patient_id(station_id: str, patient_id: str) -> str:
+    """ID de paciente en el hub: el de la estación con su estación delante"""
+    return f"{station_id}:{patient_id}"
+
+
+def file_sha256(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """SHA-256 de un archivo leído por bloques"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
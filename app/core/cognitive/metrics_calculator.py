@@ -6,6 +6,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 
+from .event_log import EVENT_LOG_EXTENSION, event_log_to_dataframe
+
 
 class MetricsCalculator:
     """Calcula métricas cognitivas básicas de archivos CSV"""
@@ -16,8 +18,10 @@ class MetricsCalculator:
         self.game_type = self._detect_game_type()
     
     def _load_data(self) -> Optional[pd.DataFrame]:
-        """Cargar datos del CSV"""
+        """Cargar datos del CSV o del log binario (.cglog)"""
         try:
+            if self.csv_file.endswith(EVENT_LOG_EXTENSION):
+                return event_log_to_dataframe(self.csv_file)
             return pd.read_csv(self.csv_file)
         except Exception as e:
             print(f"❌ Error cargando CSV: {e}")
@@ -0,0 +1,236 @@
+"""
+Registro de Pacientes - RESPONSABILIDAD ÚNICA
+Registro único de pacientes en SQLite (modo WAL) compartido por todos los juegos
+
+Reemplaza los patients.json por juego: cada alta es un INSERT indexado en lugar de
+reescribir el archivo completo, y varias estaciones pueden leer/escribir a la vez.
+"""
+
+import glob
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_DB_PATH = "data/cognitive/shared/cognitive.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS patients (
+    patient_id      TEXT PRIMARY KEY,
+    name            TEXT NOT NULL,
+    name_key        TEXT NOT NULL,
+    age             INTEGER,
+    notes           TEXT NOT NULL DEFAULT '',
+    game_type       TEXT,
+    created         TEXT NOT NULL,
+    sessions_count  INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_patients_name_key ON patients(name_key);
+CREATE INDEX IF NOT EXISTS idx_patients_created ON patients(created);
+CREATE INDEX IF NOT EXISTS idx_patients_game_created ON patients(game_type, created);
+"""
+
+# Consultas fijas: sqlite3 reutiliza el statement preparado por texto SQL
+_SQL_GET = "SELECT * FROM patients WHERE patient_id = ?"
+_SQL_FIND_NAME = "SELECT * FROM patients WHERE name_key = ? ORDER BY created DESC"
+_SQL_SEARCH_NAME = "SELECT * FROM patients WHERE name_key >= ? AND name_key < ? ORDER BY name_key LIMIT ?"
+_SQL_LIST = "SELECT * FROM patients ORDER BY created LIMIT ? OFFSET ?"
+_SQL_COUNT = "SELECT COUNT(*) FROM patients"
+_SQL_LATEST = "SELECT * FROM patients ORDER BY created DESC LIMIT 1"
+_SQL_LATEST_GAME = "SELECT * FROM patients WHERE game_type = ? ORDER BY created DESC LIMIT 1"
+_SQL_NEXT = "SELECT * FROM patients WHERE (created, patient_id) > (?, ?) ORDER BY created, patient_id LIMIT 1"
+_SQL_FIRST = "SELECT * FROM patients ORDER BY created, patient_id LIMIT 1"
+_SQL_INSERT = """INSERT INTO patients
+    (patient_id, name, name_key, age, notes, game_type, created, sessions_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _name_key(name: str) -> str:
+    """Clave normalizada para búsquedas por nombre"""
+    return " ".join(name.strip().lower().split())
+
+
+class PatientRegistry:
+    """Registro de pacientes indexado y compartido (SQLite WAL)"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, import_legacy: bool = True):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.import_duplicates: List[Dict[str, Any]] = []  # IDs omitidos al importar
+        self._conn = sqlite3.connect(db_path, timeout=10.0, check_same_thread=False,
+                                     cached_statements=64)
+        self._conn.row_factory = sqlite3.Row
+
+        # WAL: lectores no bloquean al escritor (varias estaciones a la vez)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=10000")
+        self._conn.executescript(_SCHEMA)
+
+        if import_legacy and self.count() == 0:
+            base_dir = os.path.dirname(os.path.dirname(db_path))
+            self.import_legacy_json_files(base_dir)
+
+    def _row_to_dict(self, row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        """Convertir fila a dict (mismo formato que patients.json + patient_id)"""
+        if row is None:
+            return None
+        patient = dict(row)
+        patient.pop("name_key", None)
+        return patient
+
+    # ===== CONSULTAS =====
+
+    def get_patient(self, patient_id: str) -> Optional[Dict[str, Any]]:
+        """Buscar paciente por ID"""
+        with self._lock:
+            row = self._conn.execute(_SQL_GET, (patient_id,)).fetchone()
+        return self._row_to_dict(row)
+
+    def find_by_name(self, name: str) -> List[Dict[str, Any]]:
+        """Buscar pacientes por nombre exacto (sin distinguir mayúsculas)"""
+        with self._lock:
+            rows = self._conn.execute(_SQL_FIND_NAME, (_name_key(name),)).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def search_by_name(self, prefix: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Buscar pacientes cuyo nombre empieza por un prefijo (rango sobre el índice)"""
+        key = _name_key(prefix)
+        with self._lock:
+            rows = self._conn.execute(_SQL_SEARCH_NAME, (key, key + "\uffff", limit)).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def list_patients(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """Listar pacientes paginados por fecha de alta"""
+        with self._lock:
+            rows = self._conn.execute(_SQL_LIST, (limit, offset)).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def count(self) -> int:
+        """Número total de pacientes"""
+        with self._lock:
+            return self._conn.execute(_SQL_COUNT).fetchone()[0]
+
+    def get_latest_patient(self, game_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Último paciente registrado (opcionalmente de un juego)"""
+        with self._lock:
+            if game_type:
+                row = self._conn.execute(_SQL_LATEST_GAME, (game_type,)).fetchone()
+            else:
+                row = self._conn.execute(_SQL_LATEST).fetchone()
+        return self._row_to_dict(row)
+
+    def get_next_patient(self, patient_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Paciente siguiente en orden de alta (circular) - para rotar selección"""
+        current = self.get_patient(patient_id) if patient_id else None
+        with self._lock:
+            row = None
+            if current:
+                row = self._conn.execute(_SQL_NEXT, (current["created"], patient_id)).fetchone()
+            if row is None:
+                row = self._conn.execute(_SQL_FIRST).fetchone()
+        return self._row_to_dict(row)
+
+    # ===== ESCRITURA =====
+
+    def add_patient(self, name: str, game_type: Optional[str] = None,
+                    age: Optional[int] = None, notes: str = "") -> Optional[str]:
+        """Registrar paciente nuevo y retornar su ID"""
+        if not name or not name.strip():
+            return None
+
+        now = datetime.now()
+        with self._lock:
+            # BEGIN IMMEDIATE: el contador no se repite entre estaciones concurrentes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                number = self._conn.execute(_SQL_COUNT).fetchone()[0] + 1
+                while True:
+                    # Un ID importado de patients.json puede ocupar ya el número
+                    patient_id = f"P_{number:03d}_{now.strftime('%Y%m%d_%H%M%S')}"
+                    try:
+                        self._conn.execute(_SQL_INSERT, (
+                            patient_id, name.strip(), _name_key(name), age, notes,
+                            game_type, now.isoformat(), 0,
+                        ))
+                        break
+                    except sqlite3.IntegrityError:
+                        number += 1
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return patient_id
+
+    # ===== IMPORTACIÓN DE patients.json =====
+
+    def import_json_file(self, json_file: str, game_type: Optional[str] = None) -> int:
+        """Importar un patients.json existente - retorna pacientes nuevos
+
+        Un ID que ya está registrado (p. ej. el mismo ID en los patients.json de
+        dos juegos) no se sobrescribe: se avisa y se anota en import_duplicates.
+        """
+        try:
+            with open(json_file, "r", encoding="utf-8") as f:
+                patients = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ No se pudo importar {json_file}: {e}")
+            return 0
+
+        imported = 0
+        with self._lock, self._conn:
+            for patient_id, info in patients.items():
+                name = str(info.get("name", patient_id))
+                try:
+                    self._conn.execute(_SQL_INSERT, (
+                        patient_id, name, _name_key(name), info.get("age"), info.get("notes", ""),
+                        game_type, info.get("created", ""), int(info.get("sessions_count", 0)),
+                    ))
+                    imported += 1
+                except sqlite3.IntegrityError:
+                    existing = self._conn.execute(_SQL_GET, (patient_id,)).fetchone()
+                    if existing["game_type"] == game_type and existing["name"] == name:
+                        continue  # Ya importado (otra estación importó el mismo archivo)
+                    self.import_duplicates.append({
+                        "patient_id": patient_id,
+                        "name": name,
+                        "game_type": game_type,
+                        "kept_name": existing["name"],
+                        "kept_game_type": existing["game_type"],
+                    })
+                    print(f"⚠️ ID duplicado {patient_id} en {json_file}: se conserva "
+                          f"'{existing['name']}' ({existing['game_type']}), se omite '{name}'")
+
+        print(f"📥 Importados {imported} pacientes desde {json_file}")
+        return imported
+
+    def import_legacy_json_files(self, base_dir: str = "data/cognitive") -> int:
+        """Importar todos los data/cognitive/<juego>/patients.json"""
+        total = 0
+        for json_file in sorted(glob.glob(f"{base_dir}/*/patients.json")):
+            game_type = os.path.basename(os.path.dirname(json_file))
+            total += self.import_json_file(json_file, game_type)
+        return total
+
+    def close(self):
+        """Cerrar conexión"""
+        with self._lock:
+            self._conn.close()
+
+
+_registries: Dict[str, PatientRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_patient_registry(db_path: str = DEFAULT_DB_PATH) -> PatientRegistry:
+    """Obtener el registro compartido del proceso (una conexión por base de datos)"""
+    key = os.path.abspath(db_path)
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = PatientRegistry(db_path)
+        return _registries[key]
@@ -0,0 +1,410 @@
+"""
+Índice de Sesiones - RESPONSABILIDAD ÚNICA
+Tabla indexada de sesiones con métricas resumen, en la base SQLite compartida
+
+Evita listar archivos, leer cada CSV y adivinar la fecha desde el nombre:
+las consultas por paciente, juego, rango de fechas o métricas van contra
+índices compuestos (patient_id, game_type, started_at) y son paginadas.
+"""
+
+import csv
+import glob
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from .event_log import EVENT_LOG_EXTENSION, iter_event_log, schema_for_game
+from .patient_registry import DEFAULT_DB_PATH
+from .session_journal import read_manifest
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    file_path         TEXT PRIMARY KEY,
+    session_id        TEXT NOT NULL,
+    patient_id        TEXT NOT NULL,
+    game_type         TEXT NOT NULL,
+    started_at        TEXT NOT NULL,
+    finished_at       TEXT,
+    status            TEXT NOT NULL DEFAULT 'legacy',
+    log_format        TEXT NOT NULL DEFAULT 'csv',
+    event_count       INTEGER NOT NULL DEFAULT 0,
+    file_size         INTEGER NOT NULL DEFAULT 0,
+    file_mtime        REAL NOT NULL DEFAULT 0,
+    avg_accuracy      REAL,
+    avg_reaction_ms   REAL,
+    success_rate      REAL,
+    max_score         INTEGER,
+    max_level         INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_patient_game_started
+    ON sessions(patient_id, game_type, started_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_game_started ON sessions(game_type, started_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions(started_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_session_id ON sessions(session_id);
+"""
+
+_COLUMNS = (
+    "session_id", "file_path", "patient_id", "game_type", "started_at", "finished_at",
+    "status", "log_format", "event_count", "file_size", "file_mtime",
+    "avg_accuracy", "avg_reaction_ms", "success_rate", "max_score", "max_level",
+)
+
+_SQL_UPSERT = (
+    f"INSERT OR REPLACE INTO sessions ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _COLUMNS)})"
+)
+_SQL_FILE_STATES = "SELECT file_path, file_mtime, file_size FROM sessions"
+_SQL_GET = "SELECT * FROM sessions WHERE session_id = ? LIMIT 1"
+_SQL_DELETE_FILE = "DELETE FROM sessions WHERE file_path = ?"
+_SQL_PATIENTS = "SELECT DISTINCT patient_id FROM sessions ORDER BY patient_id"
+_SQL_GAMES = "SELECT DISTINCT game_type FROM sessions ORDER BY game_type"
+_SQL_TOTALS = "SELECT COUNT(*), COALESCE(SUM(event_count), 0) FROM sessions"
+
+# Campos de cada esquema que alimentan las métricas resumen
+# accuracy: (columna, factor para llevarla a porcentaje 0-100)
+SUMMARY_FIELDS: Dict[str, Dict[str, Any]] = {
+    "piano": {"accuracy": ("accuracy", 100.0), "reaction": "response_time_ms",
+              "success": "is_correct", "level": "level"},
+    "runner": {"accuracy": ("lane_change_accuracy", 100.0), "reaction": "reaction_time_ms",
+               "success": "success", "level": "speed_level"},
+    "osu": {"accuracy": ("spatial_accuracy", 1.0), "reaction": "reaction_time_ms",
+            "score": "score", "level": "difficulty_level"},
+    "generic": {"accuracy": ("accuracy", 100.0), "reaction": "reaction_time_ms",
+                "success": "success"},
+}
+
+# Sufijo opcional: ID de estación en modo multi-estación (..._20250301_101010_E1)
+_SESSION_TIMESTAMP = re.compile(r"_(\d{8}_\d{6})(?:_[A-Za-z0-9]+)?$")
+
+
+def parse_session_id(session_id: str, game_type: str) -> Dict[str, Any]:
+    """Separar {patient_id}_{game_type}_{YYYYmmdd_HHMMSS}[_{estación}] (IDs con '_' incluidos)"""
+    patient_id = "unknown"
+    started_at = None
+
+    match = _SESSION_TIMESTAMP.search(session_id)
+    prefix = session_id[:match.start()] if match else session_id
+    if match:
+        try:
+            started_at = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+        except ValueError:
+            pass
+
+    suffix = f"_{game_type}"
+    if prefix.endswith(suffix) and len(prefix) > len(suffix):
+        patient_id = prefix[:-len(suffix)]
+    elif match and "_" in prefix:
+        patient_id = prefix.rsplit("_", 1)[0]
+
+    return {"patient_id": patient_id, "started_at": started_at}
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Convertir valor crudo o texto CSV a float (None si no es numérico)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        if value in ("True", "False"):
+            return 1.0 if value == "True" else 0.0
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return float(value)
+
+
+class SessionSummary:
+    """Acumulador de métricas resumen - se alimenta evento a evento"""
+
+    def __init__(self, schema: str):
+        self.fields = SUMMARY_FIELDS.get(schema, SUMMARY_FIELDS["generic"])
+        self.events = 0
+        self._sums = {"accuracy": 0.0, "reaction": 0.0, "success": 0.0}
+        self._counts = {"accuracy": 0, "reaction": 0, "success": 0}
+        self.max_score: Optional[int] = None
+        self.max_level: Optional[int] = None
+
+    def add(self, event: Dict[str, Any]):
+        """Sumar un evento (dict crudo del logger o fila CSV)"""
+        self.events += 1
+
+        accuracy_field = self.fields.get("accuracy")
+        if accuracy_field:
+            value = _to_float(event.get(accuracy_field[0]))
+            if value is not None:
+                self._sums["accuracy"] += value * accuracy_field[1]
+                self._counts["accuracy"] += 1
+
+        for key in ("reaction", "success"):
+            column = self.fields.get(key)
+            value = _to_float(event.get(column)) if column else None
+            if value is not None:
+                self._sums[key] += value
+                self._counts[key] += 1
+
+        for key in ("score", "level"):
+            column = self.fields.get(key)
+            value = _to_float(event.get(column)) if column else None
+            if value is not None:
+                attr = f"max_{key}"
+                current = getattr(self, attr)
+                setattr(self, attr, int(value) if current is None else max(current, int(value)))
+
+    def _mean(self, key: str) -> Optional[float]:
+        count = self._counts[key]
+        return self._sums[key] / count if count else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Métricas resumen listas para guardar en el índice"""
+        success = self._mean("success")
+        return {
+            "event_count": self.events,
+            "avg_accuracy": self._mean("accuracy"),
+            "avg_reaction_ms": self._mean("reaction"),
+            "success_rate": success * 100.0 if success is not None else None,
+            "max_score": self.max_score,
+            "max_level": self.max_level,
+        }
+
+
+def summarize_session_file(file_path: str, game_type: str) -> Dict[str, Any]:
+    """Leer un archivo de sesión una sola vez y calcular sus métricas resumen"""
+    summary = SessionSummary(schema_for_game(game_type))
+    first_timestamp = None
+
+    if file_path.endswith(EVENT_LOG_EXTENSION):
+        events: Iterable[Dict[str, Any]] = iter_event_log(file_path)
+        for event in events:
+            if first_timestamp is None:
+                first_timestamp = datetime.fromtimestamp(event["timestamp"])
+            summary.add(event)
+    else:
+        with open(file_path, "r", encoding="utf-8", newline="") as file:
+            for row in csv.DictReader(file):
+                if first_timestamp is None:
+                    try:
+                        first_timestamp = datetime.fromisoformat(row.get("timestamp", ""))
+                    except ValueError:
+                        pass
+                summary.add(row)
+
+    result = summary.as_dict()
+    result["first_event_at"] = first_timestamp
+    return result
+
+
+class SessionIndex:
+    """Índice de sesiones consultable sin tocar los archivos crudos"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=10.0, check_same_thread=False,
+                                     cached_statements=64)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=10000")
+        self._conn.executescript(_SCHEMA)
+
+    # ===== ESCRITURA =====
+
+    def upsert_session(self, session: Dict[str, Any]):
+        """Insertar o reemplazar una sesión (dict con las columnas del índice)"""
+        row = tuple(session.get(column) for column in _COLUMNS)
+        with self._lock, self._conn:
+            self._conn.execute(_SQL_UPSERT, row)
+
+    def remove_file(self, file_path: str):
+        """Quitar del índice la sesión de un archivo eliminado"""
+        with self._lock, self._conn:
+            self._conn.execute(_SQL_DELETE_FILE, (os.path.normpath(file_path),))
+
+    def index_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Indexar un archivo existente (sesiones antiguas o modificadas fuera del logger)"""
+        try:
+            file_path = os.path.normpath(file_path)
+            stat = os.stat(file_path)
+            session_id = os.path.splitext(os.path.basename(file_path))[0]
+            game_type = os.path.basename(os.path.dirname(os.path.dirname(file_path)))
+
+            manifest = read_manifest(file_path) or {}
+            parsed = parse_session_id(session_id, game_type)
+            summary = summarize_session_file(file_path, game_type)
+
+            first_event_at = summary.pop("first_event_at")
+            started_at = manifest.get("started_at")
+            if not started_at:
+                started = parsed["started_at"] or first_event_at
+                started_at = (started or datetime.fromtimestamp(stat.st_mtime)).isoformat()
+
+            session = {
+                "session_id": manifest.get("session_id", session_id),
+                "file_path": file_path,
+                "patient_id": manifest.get("patient_id", parsed["patient_id"]),
+                "game_type": manifest.get("game_type", game_type),
+                "started_at": started_at,
+                "finished_at": manifest.get("finished_at"),
+                "status": manifest.get("status", "legacy"),
+                "log_format": "binary" if file_path.endswith(EVENT_LOG_EXTENSION) else "csv",
+                "file_size": stat.st_size,
+                "file_mtime": stat.st_mtime,
+            }
+            session.update(summary)
+            self.upsert_session(session)
+            return session
+        except Exception as e:
+            print(f"⚠️ No se pudo indexar {file_path}: {e}")
+            return None
+
+    def sync(self, base_dir: str = "data/cognitive") -> int:
+        """Reconciliar índice con el disco: solo relee archivos nuevos o modificados"""
+        with self._lock:
+            known = {row[0]: (row[1], row[2])
+                     for row in self._conn.execute(_SQL_FILE_STATES).fetchall()}
+
+        on_disk = set()
+        updated = 0
+        for extension in (".csv", EVENT_LOG_EXTENSION):
+            for file_path in glob.glob(f"{base_dir}/*/sessions/*{extension}"):
+                file_path = os.path.normpath(file_path)
+                on_disk.add(file_path)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                if known.get(file_path) == (stat.st_mtime, stat.st_size):
+                    continue
+                if self.index_file(file_path):
+                    updated += 1
+
+        prefix = os.path.normpath(base_dir) + os.sep
+        removed = [path for path in known if path.startswith(prefix) and path not in on_disk]
+        if removed:
+            with self._lock, self._conn:
+                self._conn.executemany(_SQL_DELETE_FILE, [(path,) for path in removed])
+
+        if updated or removed:
+            print(f"🗂️ Índice de sesiones: {updated} actualizadas, {len(removed)} eliminadas")
+        return updated
+
+    # ===== CONSULTAS =====
+
+    def _where(self, patient_id: Optional[str], game_type: Optional[str],
+               date_from: Optional[Any], date_to: Optional[Any], status: Optional[str],
+               min_accuracy: Optional[float], max_accuracy: Optional[float]):
+        """Construir cláusula WHERE (el orden de columnas sigue al índice compuesto)"""
+        clauses, params = [], []
+        if patient_id:
+            clauses.append("patient_id = ?")
+            params.append(patient_id)
+        if game_type:
+            clauses.append("game_type = ?")
+            params.append(game_type)
+        if date_from:
+            clauses.append("started_at >= ?")
+            params.append(_as_iso(date_from))
+        if date_to:
+            clauses.append("started_at < ?")
+            params.append(_as_iso(date_to))
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if min_accuracy is not None:
+            clauses.append("avg_accuracy >= ?")
+            params.append(min_accuracy)
+        if max_accuracy is not None:
+            clauses.append("avg_accuracy < ?")
+            params.append(max_accuracy)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query(self, patient_id: Optional[str] = None, game_type: Optional[str] = None,
+              date_from: Optional[Any] = None, date_to: Optional[Any] = None,
+              status: Optional[str] = None, min_accuracy: Optional[float] = None,
+              max_accuracy: Optional[float] = None, limit: Optional[int] = 50,
+              offset: int = 0, newest_first: bool = True) -> List[Dict[str, Any]]:
+        """Consultar sesiones paginadas (date_to exclusivo, precisión en %)"""
+        where, params = self._where(patient_id, game_type, date_from, date_to,
+                                    status, min_accuracy, max_accuracy)
+        order = "DESC" if newest_first else "ASC"
+        sql = (f"SELECT * FROM sessions{where} "
+               f"ORDER BY started_at {order}, session_id {order} LIMIT ? OFFSET ?")
+        params.extend([limit if limit is not None else -1, offset])
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_row_to_session(row) for row in rows]
+
+    def count(self, patient_id: Optional[str] = None, game_type: Optional[str] = None,
+              date_from: Optional[Any] = None, date_to: Optional[Any] = None,
+              status: Optional[str] = None, min_accuracy: Optional[float] = None,
+              max_accuracy: Optional[float] = None) -> int:
+        """Contar sesiones con los mismos filtros que query()"""
+        where, params = self._where(patient_id, game_type, date_from, date_to,
+                                    status, min_accuracy, max_accuracy)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM sessions{where}", params).fetchone()[0]
+
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Buscar sesión por ID"""
+        with self._lock:
+            row = self._conn.execute(_SQL_GET, (session_id,)).fetchone()
+        return _row_to_session(row) if row else None
+
+    def get_patients(self) -> List[str]:
+        """Pacientes con al menos una sesión"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(_SQL_PATIENTS).fetchall()]
+
+    def get_games(self) -> List[str]:
+        """Juegos con al menos una sesión"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(_SQL_GAMES).fetchall()]
+
+    def get_totals(self) -> Dict[str, int]:
+        """Totales de sesiones y eventos"""
+        with self._lock:
+            sessions, events = self._conn.execute(_SQL_TOTALS).fetchone()
+        return {"total_sessions": sessions, "total_events": events}
+
+    def close(self):
+        """Cerrar conexión"""
+        with self._lock:
+            self._conn.close()
+
+
+def _as_iso(value: Any) -> str:
+    """Aceptar datetime/date o texto ISO en los filtros de fecha"""
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _row_to_session(row: sqlite3.Row) -> Dict[str, Any]:
+    """Fila del índice -> dict compatible con SessionManager.get_session_info"""
+    session = dict(row)
+    started = datetime.fromisoformat(session["started_at"])
+    session.update({
+        "filepath": session["file_path"],
+        "date": started.strftime("%Y-%m-%d"),
+        "time": started.strftime("%H:%M:%S"),
+    })
+    return session
+
+
+_indexes: Dict[str, SessionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_session_index(db_path: str = DEFAULT_DB_PATH) -> SessionIndex:
+    """Obtener el índice compartido del proceso (una conexión por base de datos)"""
+    key = os.path.abspath(db_path)
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = SessionIndex(db_path)
+        return _indexes[key]
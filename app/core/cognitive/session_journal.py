@@ -0,0 +1,263 @@
+"""
+Journal de Sesiones - RESPONSABILIDAD ÚNICA
+Durabilidad configurable (group commit con fsync) y recuperación de sesiones incompletas
+
+Cada sesión tiene un manifiesto {session_id}.manifest.json junto a su log:
+- Se escribe ANTES del primer evento con estado "in_progress" (write-ahead)
+- Se reescribe de forma atómica al finalizar con estado "completed"
+- Si el proceso muere, la pasada de recuperación repara el log y lo marca "recovered"
+"""
+
+import glob
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, IO, List, Optional
+
+from .event_log import EVENT_LOG_EXTENSION, HEADER_SIZE, read_event_log_header
+
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Modos de durabilidad: compromiso latencia/seguridad
+#   fast     -> flush + fsync solo en cada group commit (puede perder el último grupo)
+#   balanced -> flush por evento (sobrevive a crash del proceso), fsync por grupo
+#   safe     -> flush + fsync por evento (sobrevive a corte de luz, más lento)
+DURABILITY_MODES = ("fast", "balanced", "safe")
+
+
+def manifest_path_for(log_file: str) -> str:
+    """Ruta del manifiesto asociado a un archivo de sesión"""
+    return os.path.splitext(log_file)[0] + MANIFEST_SUFFIX
+
+
+def read_manifest(log_file: str) -> Optional[Dict[str, Any]]:
+    """Leer manifiesto de una sesión (None si no existe o es ilegible)"""
+    path = manifest_path_for(log_file)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(log_file: str, manifest: Dict[str, Any]):
+    """Escribir manifiesto de forma atómica (tmp + fsync + replace)"""
+    path = manifest_path_for(log_file)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class SessionJournal:
+    """Controla flush/fsync de un log de sesión y su manifiesto"""
+
+    def __init__(self, log_file: str, session_info: Dict[str, Any],
+                 durability: str = "balanced", group_commit_events: int = 20,
+                 group_commit_interval: float = 1.0):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Modo de durabilidad no válido: {durability}")
+
+        self.log_file = log_file
+        self.durability = durability
+        self.group_commit_events = max(1, group_commit_events)
+        self.group_commit_interval = group_commit_interval
+
+        self.manifest = dict(session_info)
+        self.manifest.update({
+            "log_file": os.path.basename(log_file),
+            "status": "in_progress",
+            "started_at": datetime.now().isoformat(),
+            "pid": os.getpid(),
+            "pid_start": _process_start_token(os.getpid()),
+            "durability": durability,
+        })
+
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def open(self):
+        """Registrar intención de sesión antes de escribir eventos"""
+        write_manifest(self.log_file, self.manifest)
+
+    def commit(self, stream: IO):
+        """Llamar tras cada evento escrito - aplica la política de durabilidad"""
+        self._pending += 1
+
+        if self.durability == "safe":
+            self._sync(stream)
+            return
+
+        if self.durability == "balanced":
+            stream.flush()
+
+        due = (self._pending >= self.group_commit_events or
+               time.monotonic() - self._last_commit >= self.group_commit_interval)
+        if due:
+            self._sync(stream)
+
+    def _sync(self, stream: IO):
+        """Group commit: vaciar buffers y forzar a disco"""
+        stream.flush()
+        os.fsync(stream.fileno())
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def close(self, stream: Optional[IO], events: int) -> Dict[str, Any]:
+        """Sincronizar datos pendientes y escribir manifiesto final"""
+        if stream is not None and not stream.closed:
+            self._sync(stream)
+
+        self.manifest.update({
+            "status": "completed",
+            "finished_at": datetime.now().isoformat(),
+            "events": events,
+            "size_bytes": os.path.getsize(self.log_file) if os.path.exists(self.log_file) else 0,
+        })
+        write_manifest(self.log_file, self.manifest)
+        return self.manifest
+
+
+def _process_start_token(pid: int) -> Optional[str]:
+    """Identificador del arranque del proceso (None si no se puede saber)
+
+    Un PID se reutiliza tras reiniciar el equipo; PID + instante de creación no.
+    - Linux: boot_id + starttime de /proc/<pid>/stat
+    - Windows: hora de creación (GetProcessTimes)
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            creation, exit_time, kernel, user = (ctypes.c_ulonglong() for _ in range(4))
+            if not kernel32.GetProcessTimes(handle, ctypes.byref(creation), ctypes.byref(exit_time),
+                                            ctypes.byref(kernel), ctypes.byref(user)):
+                return None
+            return str(creation.value)
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        with open(f"/proc/{pid}/stat", "r", encoding="utf-8") as f:
+            # El nombre del proceso va entre paréntesis y puede contener espacios
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/sys/kernel/random/boot_id", "r", encoding="utf-8") as f:
+            boot_id = f.read().strip()
+        return f"{boot_id}:{fields[19]}"
+    except (OSError, IndexError):
+        return None
+
+
+def _process_alive(pid: int, start_token: Optional[str] = None) -> bool:
+    """Verificar si el proceso que abrió la sesión sigue vivo (y no es otro con el mismo PID)"""
+    if pid == os.getpid():
+        return start_token is None or start_token == _process_start_token(pid)
+    if pid <= 0:
+        return False
+
+    if sys.platform == "win32":
+        import ctypes
+
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+            if exit_code.value != STILL_ACTIVE:
+                return False
+        finally:
+            kernel32.CloseHandle(handle)
+    else:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+
+    # PID vivo: si el manifiesto guardó el arranque, debe ser el mismo proceso
+    if start_token is None:
+        return True
+    current = _process_start_token(pid)
+    return current is None or current == start_token
+
+
+def _repair_event_log(log_file: str) -> Dict[str, int]:
+    """Truncar registro binario parcial al final - retorna eventos y bytes descartados"""
+    header = read_event_log_header(log_file)
+    size = os.path.getsize(log_file)
+    events = max(0, size - HEADER_SIZE) // header["record_size"]
+    valid_size = HEADER_SIZE + events * header["record_size"]
+
+    if size > valid_size:
+        with open(log_file, "r+b") as f:
+            f.truncate(valid_size)
+    return {"events": events, "discarded_bytes": max(0, size - valid_size)}
+
+
+def _repair_csv_log(log_file: str) -> Dict[str, int]:
+    """Descartar última línea CSV incompleta - retorna eventos y bytes descartados"""
+    with open(log_file, "rb") as f:
+        data = f.read()
+
+    valid_size = data.rfind(b"\n") + 1
+    if valid_size < len(data):
+        with open(log_file, "r+b") as f:
+            f.truncate(valid_size)
+
+    lines = data[:valid_size].count(b"\n")
+    return {"events": max(0, lines - 1), "discarded_bytes": len(data) - valid_size}
+
+
+def recover_incomplete_sessions(base_dir: str = "data/cognitive") -> List[Dict[str, Any]]:
+    """Pasada de recuperación al arrancar: repara y marca sesiones sin finalizar"""
+    recovered = []
+
+    for manifest_file in glob.glob(f"{base_dir}/*/sessions/*{MANIFEST_SUFFIX}"):
+        try:
+            with open(manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Manifiesto ilegible {manifest_file}: {e}")
+            continue
+
+        if manifest.get("status") != "in_progress" or _process_alive(manifest.get("pid", -1), manifest.get("pid_start")):
+            continue
+
+        log_file = os.path.join(os.path.dirname(manifest_file), manifest.get("log_file", ""))
+        try:
+            if not os.path.exists(log_file):
+                manifest.update({"status": "corrupt", "error": "log no encontrado"})
+            else:
+                if log_file.endswith(EVENT_LOG_EXTENSION):
+                    repair = _repair_event_log(log_file)
+                else:
+                    repair = _repair_csv_log(log_file)
+                manifest.update(repair)
+                manifest.update({
+                    "status": "recovered",
+                    "recovered_at": datetime.now().isoformat(),
+                    "size_bytes": os.path.getsize(log_file),
+                })
+        except Exception as e:
+            manifest.update({"status": "corrupt", "error": str(e)})
+
+        write_manifest(log_file, manifest)
+        recovered.append(manifest)
+        print(f"🩹 Sesión {manifest.get('session_id')} marcada como {manifest['status']}")
+
+    return recovered
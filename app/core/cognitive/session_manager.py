@@ -7,30 +7,124 @@ import os
 import csv
 import glob
 from datetime import datetime
+from functools import partial
 from typing import List, Dict, Any, Optional
 
+from .cognitive_logger import CognitiveLogger
+from .event_log import (
+    EVENT_LOG_EXTENSION,
+    count_event_log_records,
+    event_log_to_dataframe,
+    export_event_log_to_csv,
+)
+from .session_index import get_session_index, parse_session_id
+from .session_journal import manifest_path_for, read_manifest, recover_incomplete_sessions
+
 
 class SessionManager:
     """Gestor simple de sesiones cognitivas - ORGANIZADO POR JUEGO"""
     
     def __init__(self, base_dir: str = "data/cognitive"):
         self.base_dir = base_dir
+        self.current_logger: Optional[CognitiveLogger] = None
         
         # Asegurar que existe el directorio
         os.makedirs(self.base_dir, exist_ok=True)
+        
+        # Índice de sesiones (se reconcilia con el disco en la primera consulta)
+        self.index = get_session_index(os.path.join(self.base_dir, "shared", "cognitive.db"))
+        self._index_synced = False
+    
+    def start_session(self, game_type: str, patient_id: str, **logger_options) -> CognitiveLogger:
+        """Iniciar sesión cognitiva (cierra la anterior si seguía abierta)"""
+        if self.current_logger:
+            self.end_session()
+        
+        self.current_logger = CognitiveLogger(game_type, patient_id, **logger_options)
+        return self.current_logger
+    
+    def end_session(self) -> Optional[str]:
+        """Finalizar sesión actual - retorna ruta del archivo de sesión"""
+        if not self.current_logger:
+            return None
+        
+        logger = self.current_logger
+        self.current_logger = None
+        summary = logger.finalize_session()
+        return summary.get('file_path')
+    
+    def recover_incomplete_sessions(self) -> List[Dict[str, Any]]:
+        """Reparar y marcar sesiones que no llegaron a finalizar"""
+        return recover_incomplete_sessions(self.base_dir)
+    
+    def refresh_index(self) -> int:
+        """Reconciliar índice con el disco (solo relee archivos nuevos o modificados)"""
+        self._index_synced = True
+        return self.index.sync(self.base_dir)
+    
+    def _ensure_index(self):
+        """Sincronizar el índice una vez por gestor"""
+        if not self._index_synced:
+            self.refresh_index()
+    
+    def query_sessions(self, patient_id: Optional[str] = None, game_type: Optional[str] = None,
+                       date_from=None, date_to=None, status: Optional[str] = None,
+                       min_accuracy: Optional[float] = None, max_accuracy: Optional[float] = None,
+                       limit: Optional[int] = 50, offset: int = 0,
+                       newest_first: bool = True) -> List[Dict[str, Any]]:
+        """Consultar sesiones indexadas (paginado, sin leer archivos)
+        
+        Ej: sesiones Osu de un paciente en marzo con precisión < 60%:
+            query_sessions("P_001_...", "osu_rhythm", datetime(2025, 3, 1),
+                           datetime(2025, 4, 1), max_accuracy=60)
+        """
+        self._ensure_index()
+        return self.index.query(patient_id, game_type, date_from, date_to, status,
+                                min_accuracy, max_accuracy, limit, offset, newest_first)
+    
+    def count_sessions(self, patient_id: Optional[str] = None, game_type: Optional[str] = None,
+                       date_from=None, date_to=None, status: Optional[str] = None,
+                       min_accuracy: Optional[float] = None,
+                       max_accuracy: Optional[float] = None) -> int:
+        """Contar sesiones indexadas con los mismos filtros que query_sessions"""
+        self._ensure_index()
+        return self.index.count(patient_id, game_type, date_from, date_to, status,
+                                min_accuracy, max_accuracy)
+    
+    @staticmethod
+    def load_session_data(file_path: str):
+        """Cargar eventos de una sesión (CSV o .cglog) como DataFrame"""
+        if file_path.endswith(EVENT_LOG_EXTENSION):
+            return event_log_to_dataframe(file_path)
+        
+        import pandas as pd
+        return pd.read_csv(file_path)
+    
+    def session_chunk_loaders(self, game_type: Optional[str] = None,
+                              patient_id: Optional[str] = None, **filters) -> List:
+        """Un loader por sesión indexada (orden cronológico) para exportar por trozos
+        
+        Cada trozo lleva session_file y session_date, como en las ventanas de análisis.
+        """
+        sessions = self.query_sessions(patient_id=patient_id, game_type=game_type, limit=None,
+                                       newest_first=False, **filters)
+        return [partial(self._load_session_chunk, session) for session in sessions]
+    
+    def _load_session_chunk(self, session: Dict[str, Any]):
+        data = self.load_session_data(session['file_path'])
+        data['session_file'] = os.path.basename(session['file_path'])
+        data['session_date'] = datetime.fromisoformat(session['started_at'])
+        return data
     
     def list_session_files(self, game_type: Optional[str] = None) -> List[str]:
         """Listar archivos de sesión, opcionalmente filtrados por juego"""
         session_files = []
         
-        if game_type:
-            # Buscar solo en el directorio específico del juego
-            pattern = f"{self.base_dir}/{game_type}/sessions/*.csv"
-            session_files = glob.glob(pattern)
-        else:
-            # Buscar en todos los directorios de juegos
-            pattern = f"{self.base_dir}/*/sessions/*.csv"
-            session_files = glob.glob(pattern)
+        # Buscar solo en el directorio del juego o en todos los juegos
+        game_pattern = game_type if game_type else "*"
+        for extension in (".csv", EVENT_LOG_EXTENSION):
+            pattern = f"{self.base_dir}/{game_pattern}/sessions/*{extension}"
+            session_files.extend(glob.glob(pattern))
         
         # Ordenar por fecha de modificación (más reciente primero)
         session_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
@@ -46,7 +140,7 @@ class SessionManager:
             
             # Extraer información del nombre del archivo
             filename = os.path.basename(file_path)
-            session_id = filename.replace('.csv', '')
+            session_id = os.path.splitext(filename)[0]
             
             # Determinar tipo de juego desde la ruta
             path_parts = file_path.replace('\\', '/').split('/')
@@ -56,16 +150,16 @@ class SessionManager:
                     game_type = path_parts[i + 1]
                     break
             
-            # Extraer patient_id del session_id
-            patient_id = "unknown"
-            if '_' in session_id:
-                parts = session_id.split('_')
-                if len(parts) >= 3:
-                    patient_id = parts[0]
+            # Extraer patient_id del session_id ({patient_id}_{game_type}_{timestamp})
+            patient_id = parse_session_id(session_id, game_type)['patient_id']
             
             # Contar eventos en el archivo
             event_count = self._count_events_in_file(file_path)
             
+            # Estado según manifiesto (sesiones antiguas no tienen)
+            manifest = read_manifest(file_path)
+            status = manifest.get('status', 'unknown') if manifest else 'legacy'
+            
             return {
                 'filepath': file_path,
                 'session_id': session_id,
@@ -74,7 +168,8 @@ class SessionManager:
                 'date': mod_time.strftime('%Y-%m-%d'),
                 'time': mod_time.strftime('%H:%M:%S'),
                 'file_size': file_size,
-                'event_count': event_count
+                'event_count': event_count,
+                'status': status
             }
             
         except Exception as e:
@@ -87,12 +182,17 @@ class SessionManager:
                 'date': 'unknown',
                 'time': 'unknown',
                 'file_size': 0,
-                'event_count': 0
+                'event_count': 0,
+                'status': 'error'
             }
     
     def _count_events_in_file(self, file_path: str) -> int:
-        """Contar número de eventos en archivo CSV"""
+        """Contar número de eventos en archivo CSV o log binario"""
         try:
+            if file_path.endswith(EVENT_LOG_EXTENSION):
+                # Registros de ancho fijo: el tamaño del archivo basta
+                return count_event_log_records(file_path)
+            
             with open(file_path, 'r', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 # Saltar header y contar filas
@@ -104,20 +204,11 @@ class SessionManager:
     
     def get_sessions_by_game(self, game_type: str) -> List[Dict[str, Any]]:
         """Obtener sesiones específicas de un juego"""
-        files = self.list_session_files(game_type)
-        return [self.get_session_info(f) for f in files]
+        return self.query_sessions(game_type=game_type, limit=None)
     
     def get_sessions_by_patient(self, patient_id: str) -> List[Dict[str, Any]]:
         """Obtener todas las sesiones de un paciente específico"""
-        all_files = self.list_session_files()
-        patient_sessions = []
-        
-        for file_path in all_files:
-            session_info = self.get_session_info(file_path)
-            if session_info['patient_id'] == patient_id:
-                patient_sessions.append(session_info)
-        
-        return patient_sessions
+        return self.query_sessions(patient_id=patient_id, limit=None)
     
     def get_available_games(self) -> List[str]:
         """Obtener lista de juegos que tienen datos"""
@@ -137,41 +228,44 @@ class SessionManager:
     
     def get_available_patients(self) -> List[str]:
         """Obtener lista de pacientes que tienen datos"""
-        patients = set()
-        
-        all_files = self.list_session_files()
-        for file_path in all_files:
-            session_info = self.get_session_info(file_path)
-            if session_info['patient_id'] != 'unknown':
-                patients.add(session_info['patient_id'])
-        
-        return sorted(list(patients))
+        self._ensure_index()
+        return [patient for patient in self.index.get_patients() if patient != 'unknown']
     
     def get_summary_stats(self) -> Dict[str, Any]:
         """Obtener estadísticas generales"""
-        all_files = self.list_session_files()
         games = self.get_available_games()
         patients = self.get_available_patients()
-        
-        total_events = 0
-        for file_path in all_files:
-            session_info = self.get_session_info(file_path)
-            total_events += session_info['event_count']
+        totals = self.index.get_totals()
         
         return {
-            'total_sessions': len(all_files),
+            'total_sessions': totals['total_sessions'],
             'total_games': len(games),
             'total_patients': len(patients),
-            'total_events': total_events,
+            'total_events': totals['total_events'],
             'available_games': games,
             'available_patients': patients
         }
     
+    def export_session_to_csv(self, file_path: str, csv_path: Optional[str] = None) -> Optional[str]:
+        """Exportar sesión binaria a CSV bajo demanda (para clínicos)"""
+        if not file_path.endswith(EVENT_LOG_EXTENSION):
+            return file_path  # Ya es CSV
+        
+        try:
+            return export_event_log_to_csv(file_path, csv_path)
+        except Exception as e:
+            print(f"❌ Error exportando sesión {file_path}: {e}")
+            return None
+    
     def delete_session(self, file_path: str) -> bool:
         """Eliminar sesión específica"""
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
+                manifest_file = manifest_path_for(file_path)
+                if os.path.exists(manifest_file):
+                    os.remove(manifest_file)
+                self.index.remove_file(file_path)
                 print(f"🗑️ Sesión eliminada: {file_path}")
                 return True
             else:
@@ -0,0 +1,258 @@
+"""
+Sincronización de Sesiones - RESPONSABILIDAD ÚNICA
+Envía al hub central solo los archivos de sesión nuevos o modificados
+
+Cada pasada:
+1. Recorre data/cognitive/*/sessions y calcula el SHA-256 de cada archivo
+   (solo si cambió su tamaño/mtime desde la última pasada: sync_state.json)
+2. Pregunta al hub qué contenidos le faltan (manifiesto {ruta: hash})
+3. Sube cada archivo que falta en trozos comprimidos; si la subida se corta,
+   la siguiente pasada sigue desde el último byte que recibió el hub
+
+Las sesiones "in_progress" (aún escribiéndose) se envían cuando terminan.
+El hub puede ser remoto (HttpHubClient -> managers.hub.HubServer) o local
+(LocalHub, mismo proceso: útil en pruebas o con una carpeta compartida).
+"""
+
+import glob
+import json
+import os
+import socket
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cognitive_logger import STATION_ENV_VAR
+from .event_log import EVENT_LOG_EXTENSION
+from .hub_ingester import HubIngester, file_sha256
+from .session_journal import MANIFEST_SUFFIX, read_manifest
+
+SYNC_STATE_FILE = "data/cognitive/shared/sync_state.json"
+SYNC_CHUNK_BYTES = 256 * 1024  # Trozo sin comprimir por petición
+SYNC_COMPRESSION_LEVEL = 6
+SYNC_INTERVAL = 60.0           # Segundos entre pasadas en segundo plano
+HUB_TIMEOUT = 30.0
+HUB_TOKEN_HEADER = "X-Hub-Token"
+
+
+def default_station_id() -> str:
+    """Estación de este proceso: la del modo multi-estación o el nombre del equipo"""
+    return os.environ.get(STATION_ENV_VAR) or socket.gethostname()
+
+
+class LocalHub:
+    """Hub en el mismo proceso (sustituto local del servicio)"""
+
+    def __init__(self, root: str = "data/hub"):
+        self.ingester = HubIngester(root)
+
+    def missing(self, station_id: str, manifest: Dict[str, str]) -> List[str]:
+        return self.ingester.missing(station_id, manifest)
+
+    def begin_upload(self, station_id: str, rel_path: str, sha256: str) -> int:
+        return self.ingester.begin_upload(station_id, rel_path, sha256)
+
+    def put_chunk(self, station_id: str, rel_path: str, sha256: str, offset: int, data: bytes) -> int:
+        return self.ingester.put_chunk(station_id, rel_path, sha256, offset, data)
+
+    def commit_upload(self, station_id: str, rel_path: str, sha256: str) -> Dict[str, Any]:
+        return self.ingester.commit_upload(station_id, rel_path, sha256)
+
+
+class HttpHubClient:
+    """Cliente del servicio hub (managers.hub.HubServer)"""
+
+    def __init__(self, url: str, token: Optional[str] = None, timeout: float = HUB_TIMEOUT):
+        self.url = url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, body: bytes, content_type: str) -> Any:
+        headers = {"Content-Type": content_type}
+        if self.token:
+            headers[HUB_TOKEN_HEADER] = self.token
+        request = urllib.request.Request(f"{self.url}{path}", data=body, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read()).get("error", e.reason)
+            except ValueError:
+                message = e.reason
+            raise ConnectionError(f"Hub respondió {e.code}: {message}") from None
+
+    def _post_json(self, path: str, payload: Dict[str, Any]) -> Any:
+        return self._request("POST", path, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def missing(self, station_id: str, manifest: Dict[str, str]) -> List[str]:
+        return self._post_json("/sync/missing", {"station_id": station_id, "manifest": manifest})["missing"]
+
+    def begin_upload(self, station_id: str, rel_path: str, sha256: str) -> int:
+        return self._post_json("/sync/begin", {"station_id": station_id, "rel_path": rel_path,
+                                               "sha256": sha256})["offset"]
+
+    def put_chunk(self, station_id: str, rel_path: str, sha256: str, offset: int, data: bytes) -> int:
+        query = urllib.parse.urlencode({"station_id": station_id, "rel_path": rel_path,
+                                        "sha256": sha256, "offset": offset})
+        return self._request("PUT", f"/sync/chunk?{query}", data, "application/octet-stream")["offset"]
+
+    def commit_upload(self, station_id: str, rel_path: str, sha256: str) -> Dict[str, Any]:
+        return self._post_json("/sync/commit", {"station_id": station_id, "rel_path": rel_path,
+                                                "sha256": sha256})
+
+
+class SyncAgent:
+    """Envía las sesiones de esta estación al hub (solo lo nuevo o cambiado)"""
+
+    def __init__(self, hub, station_id: Optional[str] = None, base_dir: str = "data/cognitive",
+                 state_file: str = SYNC_STATE_FILE):
+        self.hub = hub
+        self.station_id = station_id or default_station_id()
+        self.base_dir = base_dir
+        self.state_file = state_file
+        # rel_path -> {"size", "mtime", "sha256", "synced"}
+        self.state: Dict[str, Dict[str, Any]] = self._load_state()
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ===== ESTADO LOCAL =====
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+        tmp_path = self.state_file + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=1)
+        os.replace(tmp_path, self.state_file)
+
+    # ===== ESCANEO =====
+
+    def _session_files(self) -> List[Tuple[str, str]]:
+        """(rel_path, ruta) de los archivos listos para enviar, manifiestos antes que sus logs"""
+        files = []
+        for extension in (MANIFEST_SUFFIX, ".csv", EVENT_LOG_EXTENSION):
+            for file_path in glob.glob(f"{self.base_dir}/*/sessions/*{extension}"):
+                if extension == MANIFEST_SUFFIX:
+                    in_progress = _manifest_in_progress(file_path)
+                else:
+                    in_progress = (read_manifest(file_path) or {}).get("status") == "in_progress"
+                if in_progress:
+                    continue
+                rel_path = os.path.relpath(file_path, self.base_dir).replace(os.sep, "/")
+                files.append((rel_path, file_path))
+        return files
+
+    def scan(self) -> Dict[str, str]:
+        """Actualizar hashes de lo que cambió - retorna {rel_path: sha256} pendientes de enviar"""
+        pending = {}
+        seen = set()
+        for rel_path, file_path in self._session_files():
+            seen.add(rel_path)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            entry = self.state.get(rel_path)
+            if not entry or entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime:
+                entry = {"size": stat.st_size, "mtime": stat.st_mtime,
+                         "sha256": file_sha256(file_path), "synced": entry.get("synced") if entry else None}
+                self.state[rel_path] = entry
+            if entry["synced"] != entry["sha256"]:
+                pending[rel_path] = entry["sha256"]
+
+        # Archivos borrados localmente: el hub conserva su copia
+        for rel_path in set(self.state) - seen:
+            del self.state[rel_path]
+        return pending
+
+    # ===== ENVÍO =====
+
+    def _upload(self, rel_path: str, sha256: str) -> Dict[str, Any]:
+        """Subir un archivo en trozos comprimidos, retomando desde lo que ya tiene el hub"""
+        file_path = os.path.join(self.base_dir, *rel_path.split("/"))
+        size = self.state[rel_path]["size"]
+        offset = self.hub.begin_upload(self.station_id, rel_path, sha256)
+
+        with open(file_path, "rb") as f:
+            while offset < size:
+                f.seek(offset)
+                raw = f.read(SYNC_CHUNK_BYTES)
+                if not raw:
+                    break
+                data = zlib.compress(raw, SYNC_COMPRESSION_LEVEL)
+                offset = self.hub.put_chunk(self.station_id, rel_path, sha256, offset, data)
+
+        return self.hub.commit_upload(self.station_id, rel_path, sha256)
+
+    def sync_once(self) -> Dict[str, int]:
+        """Una pasada completa - retorna contadores"""
+        with self._sync_lock:
+            pending = self.scan()
+            result = {"pending": len(pending), "uploaded": 0, "already_on_hub": 0, "failed": 0}
+            if not pending:
+                self._save_state()
+                return result
+
+            missing = set(self.hub.missing(self.station_id, pending))
+            for rel_path, sha256 in pending.items():
+                if rel_path not in missing:
+                    self.state[rel_path]["synced"] = sha256
+                    result["already_on_hub"] += 1
+                    continue
+                try:
+                    self._upload(rel_path, sha256)
+                    self.state[rel_path]["synced"] = sha256
+                    result["uploaded"] += 1
+                except (OSError, ValueError, ConnectionError) as e:
+                    # Se reintenta en la próxima pasada (si cambió, con el hash nuevo)
+                    print(f"⚠️ No se pudo sincronizar {rel_path}: {e}")
+                    result["failed"] += 1
+                finally:
+                    self._save_state()
+
+            print(f"📤 Sincronización con hub: {result['uploaded']} enviados, "
+                  f"{result['already_on_hub']} ya estaban, {result['failed']} con error")
+            return result
+
+    # ===== SEGUNDO PLANO =====
+
+    def start(self, interval: float = SYNC_INTERVAL):
+        """Sincronizar cada interval segundos en un hilo"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="session-sync", daemon=True)
+        self._thread.start()
+
+    def _run(self, interval: float):
+        while True:
+            try:
+                self.sync_once()
+            except Exception as e:
+                print(f"⚠️ Hub no disponible, se reintentará: {e}")
+            if self._stop.wait(interval):
+                break
+
+    def stop(self, timeout: float = HUB_TIMEOUT):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+
+def _manifest_in_progress(manifest_file: str) -> bool:
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            return json.load(f).get("status") == "in_progress"
+    except (OSError, ValueError):
+        return True
@@ -1,20 +1,108 @@
 """
 Visualizador de gráficas cognitivas - Súper simple y efectivo
+
+Las series por intento se reducen con LTTB + envolvente min/max cuando
+superan point_budget puntos (sesiones muy largas siguen siendo legibles).
+
+Las figuras se dibujan en un pool de procesos (Agg, sin pyplot) y se guardan
+con nombre derivado del hash de las sesiones + parámetros: si los datos no
+cambiaron se reutiliza la imagen ya generada. Las sesiones pueden ser CSV o
+.cglog (se leen con SessionManager.load_session_data).
+
+El pool se cierra con close() o usando el analizador como context manager:
+    with CognitiveVisualAnalyzer() as analyzer:
+        analyzer.create_dashboards_batch(files)
 """
 
-import matplotlib.pyplot as plt
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, List, Tuple
+
+import matplotlib
+from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, List
-import os
-from datetime import datetime
+
+from core.analytics.components.downsampling import DEFAULT_POINT_BUDGET, plot_downsampled
+from .session_manager import SessionManager
+
+
+CHART_DIR = "data/cognitive"
+CHART_DPI = 300
+CHART_CACHE_VERSION = 1  # Subir al cambiar el dibujo de alguna gráfica
+
+# Tipo de gráfica -> (prefijo del PNG, mensaje de error)
+CHART_KINDS = {
+    'dashboard': ('dashboard', 'Error creando dashboard'),
+    'comparison': ('comparison', 'Error creando comparación'),
+    'fatigue': ('fatiga_analysis', 'Error en análisis de fatiga'),
+}
+
+
+def _file_digest(path: str) -> str:
+    """SHA-1 del contenido de un archivo (por bloques)"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chart_cache_key(kind: str, csv_files: List[str], params: Dict) -> str:
+    """Clave de caché: contenido de los CSV + tipo de gráfica + parámetros"""
+    payload = json.dumps({
+        'version': CHART_CACHE_VERSION,
+        'kind': kind,
+        'files': [_file_digest(csv_file) for csv_file in csv_files],
+        'params': params,
+    }, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:20]
+
+
+def _init_render_worker():
+    """Backend sin ventana en los procesos de dibujo"""
+    matplotlib.use('Agg')
+
+
+def render_chart(kind: str, csv_files: List[str], output_path: str, params: Dict) -> Optional[str]:
+    """Dibujar una gráfica y guardarla en output_path (corre dentro del pool)
+
+    Retorna None si se guardó, o el mensaje de error para el usuario.
+    """
+    try:
+        analyzer = CognitiveVisualAnalyzer(point_budget=params['point_budget'], max_workers=1)
+        builders = {
+            'dashboard': analyzer._dashboard_figure,
+            'comparison': analyzer._comparison_figure,
+            'fatigue': analyzer._fatigue_figure,
+        }
+        figure = builders[kind](csv_files, params)
+        if isinstance(figure, str):
+            return figure
+
+        # Escritura atómica: un PNG a medias nunca cuenta como caché válida
+        temp_path = f"{output_path}.{os.getpid()}.tmp"
+        figure.savefig(temp_path, format='png', dpi=params['dpi'], bbox_inches='tight')
+        os.replace(temp_path, output_path)
+        return None
+    except Exception as e:
+        return f"❌ {CHART_KINDS[kind][1]}: {e}"
 
 
 class CognitiveVisualAnalyzer:
     """Visualizador súper simple para análisis cognitivos"""
     
-    def __init__(self):
+    def __init__(self, point_budget: int = DEFAULT_POINT_BUDGET, output_dir: str = CHART_DIR,
+                 dpi: int = CHART_DPI, max_workers: Optional[int] = None):
         self.fig_size = (12, 8)
+        self.point_budget = point_budget
+        self.output_dir = output_dir
+        self.dpi = dpi
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
         self.colors = {
             'primary': '#2E86C1',
             'success': '#28B463', 
@@ -23,56 +111,141 @@ class CognitiveVisualAnalyzer:
             'secondary': '#85929E'
         }
     
+    # ------------------------------------------------------------------
+    # Render en pool + caché por contenido
+    # ------------------------------------------------------------------
+    
+    def _chart_job(self, kind: str, csv_files: List[str], **extra) -> Tuple:
+        """(tipo, archivos, ruta de salida, parámetros) listo para render_chart"""
+        params = {'dpi': self.dpi, 'point_budget': self.point_budget, **extra}
+        prefix = CHART_KINDS[kind][0]
+        key = chart_cache_key(kind, csv_files, params)
+        return kind, list(csv_files), os.path.join(self.output_dir, f"{prefix}_{key}.png"), params
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             initializer=_init_render_worker)
+        return self._pool
+    
+    def close(self):
+        """Cerrar el pool de procesos de dibujo"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _render_many(self, jobs: List[Tuple]) -> List[Optional[str]]:
+        """Dibujar los trabajos sin imagen en caché; retorna error (o None) por trabajo"""
+        results: List[Optional[str]] = [None] * len(jobs)
+        pending = [(i, job) for i, job in enumerate(jobs) if not os.path.exists(job[2])]
+        if not pending:
+            return results
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        if self.max_workers > 1:
+            try:
+                pool = self._get_pool()
+                futures = [(i, pool.submit(render_chart, *job)) for i, job in pending]
+                for i, future in futures:
+                    results[i] = future.result()
+                return results
+            except Exception as e:
+                print(f"⚠️ Pool de procesos no disponible, dibujando en serie: {e}")
+                self._pool = None
+        
+        for i, job in pending:
+            results[i] = render_chart(*job)
+        return results
+    
+    def _render_cached(self, kind: str, csv_files: List[str], **extra) -> Tuple[str, Optional[str]]:
+        """Ruta de la imagen (cacheada o recién dibujada) y error si lo hubo"""
+        job = self._chart_job(kind, csv_files, **extra)
+        return job[2], self._render_many([job])[0]
+    
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+    
     def create_piano_performance_dashboard(self, csv_file: str, save_path: str = None) -> str:
         """Crear dashboard completo de rendimiento Piano-Simon"""
         try:
-            # Cargar datos
-            data = pd.read_csv(csv_file)
-            
-            if data.empty:
-                return "❌ No hay datos en el archivo CSV"
-            
-            # Crear figura con subplots
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
-            fig.suptitle('🧠 DASHBOARD COGNITIVO - PIANO SIMON', fontsize=16, fontweight='bold')
-            
-            # Gráfica 1: Precisión por intento
-            self._plot_accuracy_trend(data, ax1)
-            
-            # Gráfica 2: Tiempo de reacción por nivel
-            self._plot_reaction_time_by_level(data, ax2)
-            
-            # Gráfica 3: Tipos de errores
-            self._plot_error_types(data, ax3)
-            
-            # Gráfica 4: Progresión de niveles
-            self._plot_level_progression(data, ax4)
+            chart_path, error = self._render_cached('dashboard', [csv_file])
+            if error:
+                return error
             
-            plt.tight_layout()
-            
-            # Guardar o mostrar
             if save_path:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
-                plt.close()
+                shutil.copyfile(chart_path, save_path)
                 return f"✅ Dashboard guardado: {save_path}"
-            else:
-                # Generar nombre automático
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                auto_path = f"data/cognitive/dashboard_{timestamp}.png"
-                os.makedirs(os.path.dirname(auto_path), exist_ok=True)
-                plt.savefig(auto_path, dpi=300, bbox_inches='tight')
-                plt.close()
-                return f"✅ Dashboard guardado: {auto_path}"
+            return f"✅ Dashboard guardado: {chart_path}"
         
         except Exception as e:
             return f"❌ Error creando dashboard: {e}"
     
+    def create_dashboards_batch(self, csv_files: List[str]) -> Dict[str, str]:
+        """Dashboards de muchas sesiones (p. ej. varios pacientes) en paralelo
+        
+        Retorna {csv_file: mensaje} en el mismo orden que csv_files.
+        """
+        results = {}
+        jobs = []
+        for csv_file in dict.fromkeys(csv_files):
+            try:
+                jobs.append((csv_file, self._chart_job('dashboard', [csv_file])))
+            except Exception as e:
+                results[csv_file] = f"❌ Error creando dashboard: {e}"
+        
+        errors = self._render_many([job for _, job in jobs])
+        for (csv_file, job), error in zip(jobs, errors):
+            results[csv_file] = error or f"✅ Dashboard guardado: {job[2]}"
+        
+        created = sum(1 for result in results.values() if result.startswith("✅"))
+        print(f"✅ {created}/{len(results)} dashboards listos")
+        return {csv_file: results[csv_file] for csv_file in csv_files}
+    
+    # ------------------------------------------------------------------
+    # Figuras (se ejecutan en los procesos del pool)
+    # ------------------------------------------------------------------
+    
+    def _dashboard_figure(self, csv_files: List[str], params: Dict):
+        """Figura del dashboard Piano-Simon (o mensaje si no hay datos)"""
+        data = SessionManager.load_session_data(csv_files[0])
+        
+        if data.empty:
+            return "❌ No hay datos en el archivo CSV"
+        
+        # Crear figura con subplots
+        fig = Figure(figsize=(15, 10))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+        fig.suptitle('🧠 DASHBOARD COGNITIVO - PIANO SIMON', fontsize=16, fontweight='bold')
+        
+        # Gráfica 1: Precisión por intento
+        self._plot_accuracy_trend(data, ax1)
+        
+        # Gráfica 2: Tiempo de reacción por nivel
+        self._plot_reaction_time_by_level(data, ax2)
+        
+        # Gráfica 3: Tipos de errores
+        self._plot_error_types(data, ax3)
+        
+        # Gráfica 4: Progresión de niveles
+        self._plot_level_progression(data, ax4)
+        
+        fig.tight_layout()
+        return fig
+    
     def _plot_accuracy_trend(self, data: pd.DataFrame, ax):
         """Gráfica de tendencia de precisión"""
         accuracy_values = data['accuracy'].values
-        attempts = range(1, len(accuracy_values) + 1)
+        attempts = np.arange(1, len(accuracy_values) + 1)
         
-        ax.plot(attempts, accuracy_values, 'o-', color=self.colors['primary'], linewidth=2, markersize=6)
+        plot_downsampled(ax, attempts, accuracy_values, budget=self.point_budget, marker='o',
+                         color=self.colors['primary'], linewidth=2, markersize=6)
         ax.set_title('📈 Tendencia de Precisión', fontweight='bold')
         ax.set_xlabel('Intento')
         ax.set_ylabel('Precisión (0-1)')
@@ -153,138 +326,104 @@ class CognitiveVisualAnalyzer:
             if not csv_files:
                 return "❌ No hay archivos para comparar"
             
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-            fig.suptitle('🔄 COMPARACIÓN ENTRE SESIONES', fontsize=16, fontweight='bold')
-            
-            metrics_summary = []
             labels = patient_names if patient_names else [f"Sesión {i+1}" for i in range(len(csv_files))]
-            
-            for i, csv_file in enumerate(csv_files):
-                try:
-                    data = pd.read_csv(csv_file)
-                    if not data.empty:
-                        metrics = {
-                            'label': labels[i],
-                            'avg_accuracy': data['accuracy'].mean(),
-                            'avg_reaction': data['response_time_ms'].mean(),
-                            'max_level': data['level'].max(),
-                            'error_rate': (data['is_correct'] == False).mean()
-                        }
-                        metrics_summary.append(metrics)
-                except Exception as e:
-                    print(f"⚠️ Error procesando {csv_file}: {e}")
-            
-            if not metrics_summary:
-                return "❌ No se pudieron procesar los archivos"
-            
-            # Gráfica 1: Precisión promedio
-            labels_list = [m['label'] for m in metrics_summary]
-            accuracies = [m['avg_accuracy'] for m in metrics_summary]
-            reactions = [m['avg_reaction'] for m in metrics_summary]
-            
-            bars1 = ax1.bar(labels_list, accuracies, color=self.colors['success'], alpha=0.8)
-            ax1.set_title('📊 Precisión Promedio', fontweight='bold')
-            ax1.set_ylabel('Precisión (0-1)')
-            ax1.set_ylim(0, 1.1)
-            
-            # Añadir valores
-            for bar, acc in zip(bars1, accuracies):
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height + 0.02,
-                        f'{acc:.2f}', ha='center', va='bottom', fontweight='bold')
-            
-            # Gráfica 2: Tiempo de reacción promedio
-            bars2 = ax2.bar(labels_list, reactions, color=self.colors['warning'], alpha=0.8)
-            ax2.set_title('⏱️ Tiempo de Reacción Promedio', fontweight='bold')
-            ax2.set_ylabel('Tiempo (ms)')
-            
-            # Añadir valores
-            for bar, react in zip(bars2, reactions):
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height + 50,
-                        f'{react:.0f}ms', ha='center', va='bottom', fontweight='bold')
-            
-            plt.tight_layout()
-            
-            # Guardar
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_path = f"data/cognitive/comparison_{timestamp}.png"
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            save_path, error = self._render_cached('comparison', csv_files, labels=list(labels))
+            if error:
+                return error
             
             return f"✅ Comparación guardada: {save_path}"
         
         except Exception as e:
             return f"❌ Error creando comparación: {e}"
     
+    def _comparison_figure(self, csv_files: List[str], params: Dict):
+        """Figura de comparación entre sesiones (o mensaje si nada se pudo leer)"""
+        metrics_summary = []
+        labels = params['labels']
+        
+        for i, csv_file in enumerate(csv_files):
+            try:
+                data = SessionManager.load_session_data(csv_file)
+                if not data.empty:
+                    metrics = {
+                        'label': labels[i],
+                        'avg_accuracy': data['accuracy'].mean(),
+                        'avg_reaction': data['response_time_ms'].mean(),
+                        'max_level': data['level'].max(),
+                        'error_rate': (data['is_correct'] == False).mean()
+                    }
+                    metrics_summary.append(metrics)
+            except Exception as e:
+                print(f"⚠️ Error procesando {csv_file}: {e}")
+        
+        if not metrics_summary:
+            return "❌ No se pudieron procesar los archivos"
+        
+        fig = Figure(figsize=(15, 6))
+        ax1, ax2 = fig.subplots(1, 2)
+        fig.suptitle('🔄 COMPARACIÓN ENTRE SESIONES', fontsize=16, fontweight='bold')
+        
+        # Gráfica 1: Precisión promedio
+        labels_list = [m['label'] for m in metrics_summary]
+        accuracies = [m['avg_accuracy'] for m in metrics_summary]
+        reactions = [m['avg_reaction'] for m in metrics_summary]
+        
+        bars1 = ax1.bar(labels_list, accuracies, color=self.colors['success'], alpha=0.8)
+        ax1.set_title('📊 Precisión Promedio', fontweight='bold')
+        ax1.set_ylabel('Precisión (0-1)')
+        ax1.set_ylim(0, 1.1)
+        
+        # Añadir valores
+        for bar, acc in zip(bars1, accuracies):
+            height = bar.get_height()
+            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.02,
+                    f'{acc:.2f}', ha='center', va='bottom', fontweight='bold')
+        
+        # Gráfica 2: Tiempo de reacción promedio
+        bars2 = ax2.bar(labels_list, reactions, color=self.colors['warning'], alpha=0.8)
+        ax2.set_title('⏱️ Tiempo de Reacción Promedio', fontweight='bold')
+        ax2.set_ylabel('Tiempo (ms)')
+        
+        # Añadir valores
+        for bar, react in zip(bars2, reactions):
+            height = bar.get_height()
+            ax2.text(bar.get_x() + bar.get_width()/2., height + 50,
+                    f'{react:.0f}ms', ha='center', va='bottom', fontweight='bold')
+        
+        fig.tight_layout()
+        return fig
+    
+    @staticmethod
+    def _fatigue_halves(data: pd.DataFrame) -> Dict[str, float]:
+        """Promedios de precisión y reacción en la primera y segunda mitad"""
+        mid_point = len(data) // 2
+        first_half = data.iloc[:mid_point]
+        second_half = data.iloc[mid_point:]
+        return {
+            'mid_point': mid_point,
+            'first_avg': first_half['accuracy'].mean(),
+            'second_avg': second_half['accuracy'].mean(),
+            'first_reaction_avg': first_half['response_time_ms'].mean(),
+            'second_reaction_avg': second_half['response_time_ms'].mean(),
+        }
+    
     def create_fatigue_analysis(self, csv_file: str) -> str:
         """Análisis específico de fatiga cognitiva"""
         try:
-            data = pd.read_csv(csv_file)
+            data = SessionManager.load_session_data(csv_file)
             
             if len(data) < 6:
                 return "❌ Datos insuficientes para análisis de fatiga (min 6 eventos)"
             
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-            fig.suptitle('🧠 ANÁLISIS DE FATIGA COGNITIVA', fontsize=16, fontweight='bold')
-            
-            # Dividir en primera y segunda mitad
-            mid_point = len(data) // 2
-            first_half = data.iloc[:mid_point]
-            second_half = data.iloc[mid_point:]
-            
-            # Gráfica 1: Precisión a lo largo del tiempo
-            attempts = range(1, len(data) + 1)
-            accuracies = data['accuracy'].values
-            
-            ax1.plot(attempts, accuracies, 'o-', color=self.colors['primary'], alpha=0.7)
-            ax1.axvline(x=mid_point, color=self.colors['error'], linestyle='--', 
-                       label=f'Punto medio (intento {mid_point})')
-            
-            # Tendencias
-            first_avg = first_half['accuracy'].mean()
-            second_avg = second_half['accuracy'].mean()
-            
-            ax1.axhline(y=first_avg, xmin=0, xmax=0.5, color=self.colors['success'], 
-                       linewidth=3, label=f'Primera mitad: {first_avg:.2f}')
-            ax1.axhline(y=second_avg, xmin=0.5, xmax=1, color=self.colors['warning'], 
-                       linewidth=3, label=f'Segunda mitad: {second_avg:.2f}')
-            
-            ax1.set_title('📉 Tendencia de Precisión (Análisis de Fatiga)', fontweight='bold')
-            ax1.set_xlabel('Intento')
-            ax1.set_ylabel('Precisión')
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
-            
-            # Gráfica 2: Tiempo de reacción a lo largo del tiempo
-            reaction_times = data['response_time_ms'].values
-            
-            ax2.plot(attempts, reaction_times, 's-', color=self.colors['warning'], alpha=0.7)
-            ax2.axvline(x=mid_point, color=self.colors['error'], linestyle='--')
-            
-            first_reaction_avg = first_half['response_time_ms'].mean()
-            second_reaction_avg = second_half['response_time_ms'].mean()
-            
-            ax2.axhline(y=first_reaction_avg, xmin=0, xmax=0.5, color=self.colors['success'], 
-                       linewidth=3, label=f'Primera mitad: {first_reaction_avg:.0f}ms')
-            ax2.axhline(y=second_reaction_avg, xmin=0.5, xmax=1, color=self.colors['error'], 
-                       linewidth=3, label=f'Segunda mitad: {second_reaction_avg:.0f}ms')
-            
-            ax2.set_title('⏱️ Tendencia Tiempo de Reacción', fontweight='bold')
-            ax2.set_xlabel('Intento')
-            ax2.set_ylabel('Tiempo de Reacción (ms)')
-            ax2.legend()
-            ax2.grid(True, alpha=0.3)
+            # Los índices se calculan aquí (baratos); solo el dibujo va al pool/caché
+            save_path, error = self._render_cached('fatigue', [csv_file])
+            if error:
+                return error
             
-            plt.tight_layout()
-            
-            # Guardar
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_path = f"data/cognitive/fatiga_analysis_{timestamp}.png"
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            halves = self._fatigue_halves(data)
+            first_avg, second_avg = halves['first_avg'], halves['second_avg']
+            first_reaction_avg = halves['first_reaction_avg']
+            second_reaction_avg = halves['second_reaction_avg']
             
             # Calcular índice de fatiga
             fatigue_accuracy = (first_avg - second_avg) / first_avg if first_avg > 0 else 0
@@ -316,4 +455,56 @@ class CognitiveVisualAnalyzer:
             return analysis
             
         except Exception as e:
-            return f"❌ Error en análisis de fatiga: {e}" 
\ No newline at end of file
+            return f"❌ Error en análisis de fatiga: {e}"
+    
+    def _fatigue_figure(self, csv_files: List[str], params: Dict):
+        """Figura del análisis de fatiga (primera vs segunda mitad)"""
+        data = SessionManager.load_session_data(csv_files[0])
+        halves = self._fatigue_halves(data)
+        mid_point = halves['mid_point']
+        
+        fig = Figure(figsize=(12, 10))
+        ax1, ax2 = fig.subplots(2, 1)
+        fig.suptitle('🧠 ANÁLISIS DE FATIGA COGNITIVA', fontsize=16, fontweight='bold')
+        
+        # Gráfica 1: Precisión a lo largo del tiempo
+        attempts = np.arange(1, len(data) + 1)
+        accuracies = data['accuracy'].values
+        
+        plot_downsampled(ax1, attempts, accuracies, budget=self.point_budget, marker='o',
+                         color=self.colors['primary'], alpha=0.7)
+        ax1.axvline(x=mid_point, color=self.colors['error'], linestyle='--', 
+                   label=f'Punto medio (intento {mid_point})')
+        
+        # Tendencias
+        ax1.axhline(y=halves['first_avg'], xmin=0, xmax=0.5, color=self.colors['success'], 
+                   linewidth=3, label=f"Primera mitad: {halves['first_avg']:.2f}")
+        ax1.axhline(y=halves['second_avg'], xmin=0.5, xmax=1, color=self.colors['warning'], 
+                   linewidth=3, label=f"Segunda mitad: {halves['second_avg']:.2f}")
+        
+        ax1.set_title('📉 Tendencia de Precisión (Análisis de Fatiga)', fontweight='bold')
+        ax1.set_xlabel('Intento')
+        ax1.set_ylabel('Precisión')
+        ax1.legend()
+        ax1.grid(True, alpha=0.3)
+        
+        # Gráfica 2: Tiempo de reacción a lo largo del tiempo
+        reaction_times = data['response_time_ms'].values
+        
+        plot_downsampled(ax2, attempts, reaction_times, budget=self.point_budget, marker='s',
+                         color=self.colors['warning'], alpha=0.7)
+        ax2.axvline(x=mid_point, color=self.colors['error'], linestyle='--')
+        
+        ax2.axhline(y=halves['first_reaction_avg'], xmin=0, xmax=0.5, color=self.colors['success'], 
+                   linewidth=3, label=f"Primera mitad: {halves['first_reaction_avg']:.0f}ms")
+        ax2.axhline(y=halves['second_reaction_avg'], xmin=0.5, xmax=1, color=self.colors['error'], 
+                   linewidth=3, label=f"Segunda mitad: {halves['second_reaction_avg']:.0f}ms")
+        
+        ax2.set_title('⏱️ Tendencia Tiempo de Reacción', fontweight='bold')
+        ax2.set_xlabel('Intento')
+        ax2.set_ylabel('Tiempo de Reacción (ms)')
+        ax2.legend()
+        ax2.grid(True, alpha=0.3)
+        
+        fig.tight_layout()
+        return fig
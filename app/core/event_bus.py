@@ -0,0 +1,194 @@
+"""
+Bus de eventos publicar/suscribir para el estado en vivo de los juegos
+
+Antes la interfaz pedía get_game_status() al juego (un dict nuevo por
+llamada, incluso cada frame). Ahora los juegos publican *deltas*: solo los
+campos que cambiaron (puntos, combo, nivel, aciertos...), y solo si alguien
+escucha. Los suscriptores eligen:
+- min_interval: como máximo una entrega cada N segundos; los deltas que
+  llegan entre medias se fusionan y se entregan juntos (nunca se pierde el último)
+- post: cómo entregar, p. ej. `lambda cb: root.after(0, cb)` para el hilo de Tk
+
+Uso en un juego:
+    self.status = StatusPublisher("osu_rhythm")
+    if self.status.active:
+        self.status.update(score=self.score, combo=self.combo)
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+TOPIC_GAME_STATUS = "game.status"
+
+
+@dataclass(frozen=True)
+class StatusDelta:
+    """Campos del estado de un juego que cambiaron"""
+
+    game_id: str
+    changes: Dict[str, Any]
+    timestamp: float = field(default_factory=time.time)
+
+    def merge(self, newer: "StatusDelta") -> "StatusDelta":
+        """Fusionar con un delta posterior (gana el valor más nuevo)"""
+        if newer.game_id != self.game_id:
+            return newer
+        return StatusDelta(self.game_id, {**self.changes, **newer.changes}, newer.timestamp)
+
+
+class Subscription:
+    """Suscripción a un tópico, con limitación de frecuencia opcional"""
+
+    def __init__(self, bus: "EventBus", topic: str, callback: Callable[[Any], None],
+                 min_interval: float = 0.0, post: Optional[Callable[[Callable], None]] = None):
+        self.bus = bus
+        self.topic = topic
+        self.callback = callback
+        self.min_interval = min_interval
+        self.post = post
+        self.active = True
+        self._pending = None
+        self._last_delivery = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def _receive(self, event):
+        with self._lock:
+            if not self.active:
+                return
+            if self._pending is not None:
+                event = self._merge(self._pending, event)
+            wait = self._last_delivery + self.min_interval - time.monotonic()
+            if wait > 0:
+                # Demasiado pronto: guardar (fusionado) y entregar al cumplirse el intervalo
+                self._pending = event
+                if self._timer is None:
+                    self._timer = threading.Timer(wait, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            self._pending = None
+            self._last_delivery = time.monotonic()
+        self._deliver(event)
+
+    @staticmethod
+    def _merge(pending, event):
+        return pending.merge(event) if hasattr(pending, "merge") else event
+
+    def _flush(self):
+        with self._lock:
+            self._timer = None
+            event, self._pending = self._pending, None
+            if event is None or not self.active:
+                return
+            self._last_delivery = time.monotonic()
+        self._deliver(event)
+
+    def _deliver(self, event):
+        def run():
+            if not self.active:
+                return
+            try:
+                self.callback(event)
+            except Exception as e:
+                print(f"⚠️ Error en suscriptor de {self.topic}: {e}")
+
+        if self.post is None:
+            run()
+            return
+        try:
+            self.post(run)
+        except Exception as e:
+            # Ventana ya destruida: nadie espera el evento
+            print(f"⚠️ No se pudo entregar evento {self.topic}: {e}")
+            self.cancel()
+
+    def cancel(self):
+        """Dejar de recibir eventos"""
+        with self._lock:
+            self.active = False
+            self._pending = None
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """Bus de eventos en proceso; publicar sin suscriptores no cuesta nada"""
+
+    def __init__(self):
+        self._subscriptions: Dict[str, List[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic: str, callback: Callable[[Any], None], min_interval: float = 0.0,
+                  post: Optional[Callable[[Callable], None]] = None) -> Subscription:
+        """Suscribirse a un tópico - retorna la suscripción (cancel() para terminar)"""
+        subscription = Subscription(self, topic, callback, min_interval, post)
+        with self._lock:
+            # Copia al escribir: publish itera sin bloquear
+            self._subscriptions[topic] = self._subscriptions.get(topic, []) + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            remaining = [s for s in self._subscriptions.get(subscription.topic, []) if s is not subscription]
+            if remaining:
+                self._subscriptions[subscription.topic] = remaining
+            else:
+                self._subscriptions.pop(subscription.topic, None)
+
+    def has_subscribers(self, topic: str) -> bool:
+        return bool(self._subscriptions.get(topic))
+
+    def publish(self, topic: str, event):
+        """Entregar event a los suscriptores del tópico"""
+        for subscription in self._subscriptions.get(topic, ()):
+            subscription._receive(event)
+
+
+class StatusPublisher:
+    """Publica el estado de un juego como deltas: solo campos que cambiaron"""
+
+    def __init__(self, game_id: str, bus: Optional[EventBus] = None, topic: str = TOPIC_GAME_STATUS):
+        self.game_id = game_id
+        self.bus = bus or get_event_bus()
+        self.topic = topic
+        self._last: Dict[str, Any] = {}
+
+    @property
+    def active(self) -> bool:
+        """¿Hay alguien escuchando? Si no, no vale la pena armar el estado"""
+        if self.bus.has_subscribers(self.topic):
+            return True
+        # Sin oyentes se olvida lo publicado: el próximo suscriptor recibe el estado completo
+        self._last.clear()
+        return False
+
+    def update(self, **fields):
+        """Publicar los campos que difieren de lo último publicado"""
+        changes = {key: value for key, value in fields.items()
+                   if key not in self._last or self._last[key] != value}
+        if not changes:
+            return
+        self._last.update(changes)
+        self.bus.publish(self.topic, StatusDelta(self.game_id, changes))
+
+    def reset(self):
+        """Volver a publicar todo en el próximo update (p. ej. nueva partida)"""
+        self._last.clear()
+
+
+_bus: Optional[EventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """Bus compartido de la plataforma"""
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            _bus = EventBus()
+        return _bus
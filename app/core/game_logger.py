@@ -1,17 +1,519 @@
+import atexit
+import gzip
+import json
 import logging
 import os
+import queue
+import shutil
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, Optional
+
+from .cognitive.cognitive_logger import STATION_ENV_VAR
+
+# Políticas cuando la cola de logs está llena
+OVERFLOW_DROP_NEWEST = "drop_newest"   # Descartar el registro nuevo (por defecto)
+OVERFLOW_DROP_OLDEST = "drop_oldest"   # Descartar el registro más antiguo en cola
+OVERFLOW_BLOCK = "block"               # Esperar hasta BLOCK_TIMEOUT y luego descartar
+OVERFLOW_POLICIES = (OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST, OVERFLOW_BLOCK)
+
+DEFAULT_QUEUE_SIZE = 10000
+BLOCK_TIMEOUT = 0.05   # segundos máximos que el hilo del juego puede esperar
+WRITE_BATCH = 256      # registros que el escritor procesa por vuelta
+
+_LEVELS = {"ERROR": logging.ERROR, "WARNING": logging.WARNING}
+
+JSONL_FORMAT = "game-events"
+JSONL_VERSION = 1
+
+# Rotación: segmentos cerrados en <log_dir>/segments/<juego>/ comprimidos con gzip
+SEGMENTS_DIR_NAME = "segments"
+SEGMENT_INDEX_NAME = "index.json"
+STATIONS_DIR_NAME = "stations"
+ROTATION_BUCKETS = {"hour": "%Y%m%d_%H", "day": "%Y%m%d"}
+DEFAULT_MAX_SEGMENT_BYTES = 32 * 1024 * 1024
+
+# Marcas booleanas del registro estructurado (mismas palabras clave que LogParser)
+_FLAG_KEYWORDS = (
+    ("PLAYER DEATH", "is_death"), ("GAME OVER", "is_death"),
+    ("GOLPE EXITOSO", "is_success"), ("esquivado", "is_success"),
+    ("PAUSADO", "is_pause"), ("PAUSED", "is_pause"),
+    ("JUEGO INICIADO", "is_game_start"), ("GAME STARTED", "is_game_start"),
+)
+
+
+# ===== FORMATEO (se ejecuta en el hilo escritor en modo asíncrono) =====
+
+def _format_event(message: str, score: Optional[int], ball_pos: Optional[tuple]) -> str:
+    log_parts = [message]
+
+    if score is not None:
+        log_parts.append(f"Score: {score}")
+
+    if ball_pos is not None:
+        log_parts.append(f"Ball: {ball_pos}")
+
+    return " | ".join(log_parts)
+
+
+def _format_death_ping_pong(death_reason: str, side: str, final_score: int,
+                            total_hits: int, left_hits: int, right_hits: int,
+                            game_duration: float, game_speed: float) -> str:
+    return (
+        f"💀 PLAYER DEATH 💀 | Reason: {death_reason} | Side: {side} | "
+        f"Final Score: {final_score} | Total Hits: {total_hits} | "
+        f"Left Hits: {left_hits} | Right Hits: {right_hits} | "
+        f"Game Duration: {game_duration:.2f}s | Speed: {game_speed:.2f}s"
+    )
+
+
+def _format_death_simon(reason: str, final_level: int, sequences_completed: int,
+                        button_presses: int, mistakes: int, game_duration: float) -> str:
+    return (
+        f"💀 SIMON END 💀 | Reason: {reason} | Final Level: {final_level} | "
+        f"Sequences Completed: {sequences_completed} | Button Presses: {button_presses} | "
+        f"Mistakes: {mistakes} | Game Duration: {game_duration:.2f}s | "
+        f"Accuracy: {((button_presses - mistakes) / max(1, button_presses) * 100):.1f}%"
+    )
+
+
+def _format_death_two_lanes(death_reason: str, lane: str, final_score: int,
+                            obstacles_dodged: int, lane_changes: int,
+                            game_duration: float, game_speed: float) -> str:
+    return (
+        f"💀 PLAYER DEATH 💀 | Reason: {death_reason} | Lane: {lane} | "
+        f"Final Score: {final_score} | Obstacles Dodged: {obstacles_dodged} | "
+        f"Lane Changes: {lane_changes} | Game Duration: {game_duration:.2f}s | "
+        f"Speed: {game_speed:.2f}s"
+    )
+
+
+def _structured_event(event_type: str, body: str, fields: Optional[Dict]) -> Dict:
+    """Registro tipado para el sink JSON-lines (campos explícitos, sin reparsear texto)"""
+    event = {"event_type": event_type, "message": body}
+    for keyword, flag in _FLAG_KEYWORDS:
+        if keyword in body:
+            event[flag] = True
+    if fields:
+        event.update((key, value) for key, value in fields.items() if value is not None)
+    return event
+
+
+def _event_fields(score: Optional[int], ball_pos: Optional[tuple],
+                  fields: Optional[Dict]) -> Optional[Dict]:
+    """Unir score/posición de la API con campos extra"""
+    if score is None and ball_pos is None:
+        return fields
+    merged = dict(fields or {})
+    if score is not None:
+        merged.setdefault("score", score)
+    if ball_pos is not None:
+        merged.setdefault("x_pos", ball_pos[0])
+        merged.setdefault("y_pos", ball_pos[1])
+    return merged
+
+
+def _compress_file(src: str, dst: str) -> str:
+    """Comprimir src con gzip en dst (sin pisar segmentos existentes) y borrar src"""
+    base, suffix = dst[:-len(".gz")], ".gz"
+    counter = 1
+    while os.path.exists(dst):
+        root, ext = os.path.splitext(base)
+        dst = f"{root}_{counter}{ext}{suffix}"
+        counter += 1
+
+    tmp_path = dst + ".tmp"
+    with open(src, "rb") as source, gzip.open(tmp_path, "wb") as target:
+        shutil.copyfileobj(source, target)
+    os.replace(tmp_path, dst)
+    os.remove(src)
+    return dst
+
+
+def _iso(created: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(created).isoformat(timespec="milliseconds") if created else None
+
+
+class JsonLinesHandler(logging.FileHandler):
+    """Sink JSON-lines: un objeto por evento con campos tipados
+
+    La primera línea es una cabecera con el tamaño que tenía el log de texto
+    al crearse el sink (log_offset): lo anterior solo existe en el .log.
+
+    Con rotation ("hour"/"day") el segmento activo se cierra al cambiar de
+    franja o superar max_bytes: se comprime a segments/<juego>/ junto con el
+    .log de texto, y se anota en index.json (rango de tiempo, eventos, score
+    máximo, errores) para que LogParser abra solo los segmentos necesarios.
+    """
+
+    def __init__(self, filename: str, text_log_path: str, rotation: Optional[str] = "day",
+                 max_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+                 text_handler: Optional[logging.FileHandler] = None):
+        if rotation is not None and rotation not in ROTATION_BUCKETS:
+            raise ValueError(f"Rotación no soportada: {rotation}")
+
+        self.text_log_path = text_log_path
+        self.text_handler = text_handler
+        self.rotation = rotation
+        self.max_bytes = max_bytes
+        self.stem = os.path.splitext(os.path.basename(filename))[0]
+        self.segments_dir = os.path.join(os.path.dirname(filename), SEGMENTS_DIR_NAME, self.stem)
+
+        is_new = not os.path.exists(filename) or os.path.getsize(filename) == 0
+        super().__init__(filename, encoding="utf-8")
+        if is_new:
+            self._write_header(self._text_log_size())
+        self._scan_segment()
+
+    def _text_log_size(self) -> int:
+        return os.path.getsize(self.text_log_path) if os.path.exists(self.text_log_path) else 0
+
+    def _write_header(self, log_offset: int):
+        header = {"_header": {"format": JSONL_FORMAT, "version": JSONL_VERSION,
+                              "log_offset": log_offset, "opened": _iso(time.time())}}
+        self.stream.write(json.dumps(header) + self.terminator)
+        self.flush()
+        self.log_offset = log_offset
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.stats = {"bucket": None, "start": None, "end": None,
+                      "events": 0, "max_score": None, "errors": 0}
+
+    def _scan_segment(self):
+        """Recalcular estadísticas del segmento activo al reabrirlo"""
+        self.log_offset = 0
+        self._reset_stats()
+        with open(self.baseFilename, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if "_header" in event:
+                    self.log_offset = event["_header"].get("log_offset", 0)
+                    continue
+                try:
+                    created = datetime.fromisoformat(event["timestamp"]).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    continue
+                self._update_stats(created, event)
+
+    def _bucket(self, created: float) -> Optional[str]:
+        if self.rotation is None:
+            return None
+        return datetime.fromtimestamp(created).strftime(ROTATION_BUCKETS[self.rotation])
+
+    def _update_stats(self, created: float, event: Dict):
+        stats = self.stats
+        if stats["start"] is None:
+            stats["start"] = created
+            stats["bucket"] = self._bucket(created)
+        stats["end"] = created
+        stats["events"] += 1
+        score = event.get("score")
+        if score is not None and (stats["max_score"] is None or score > stats["max_score"]):
+            stats["max_score"] = score
+        if event.get("level") == "ERROR":
+            stats["errors"] += 1
+
+    def emit(self, record: logging.LogRecord):
+        # Solo registros emitidos por GameLogger (con payload estructurado)
+        structured = getattr(record, "structured", None)
+        if structured is None:
+            return
+
+        try:
+            if self._should_rollover(record.created):
+                self.rollover()
+        except Exception as e:
+            print(f"⚠️ Error rotando log {self.stem}: {e}")
+
+        super().emit(record)
+        self._update_stats(record.created, {"score": structured.get("score"),
+                                            "level": record.levelname})
+
+    def _should_rollover(self, created: float) -> bool:
+        if self.rotation is None or not self.stats["events"]:
+            return False
+        if self._bucket(created) != self.stats["bucket"]:
+            return True
+        return self.stream is not None and self.stream.tell() >= self.max_bytes
+
+    def rollover(self):
+        """Cerrar el segmento activo: comprimirlo, indexarlo y empezar uno nuevo"""
+        if not self.stats["events"]:
+            return
+
+        os.makedirs(self.segments_dir, exist_ok=True)
+        stamp = datetime.fromtimestamp(self.stats["start"]).strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(self.segments_dir, f"{self.stem}_{stamp}")
+
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+        events_path = _compress_file(self.baseFilename, base + ".jsonl.gz")
+        entries = [{
+            "file": os.path.basename(events_path), "kind": "events",
+            "start": _iso(self.stats["start"]), "end": _iso(self.stats["end"]),
+            "events": self.stats["events"], "max_score": self.stats["max_score"],
+            "errors": self.stats["errors"], "bytes": os.path.getsize(events_path),
+        }]
+
+        # El .log de texto rota a la vez (su historia previa al sink queda marcada)
+        text_rotated = self._rotate_text_log(base + ".log.gz", entries)
+        self._append_index(entries)
+
+        self.stream = self._open()
+        self._write_header(0 if text_rotated else self._text_log_size())
+        print(f"🗜️ Segmento de log cerrado: {os.path.basename(events_path)} ({entries[0]['events']} eventos)")
+
+    def _rotate_text_log(self, destination: str, entries: list) -> bool:
+        if self.text_handler is None:
+            return False
+
+        self.text_handler.acquire()
+        try:
+            if self.text_handler.stream is not None:
+                self.text_handler.stream.close()
+                self.text_handler.stream = None
+            if os.path.exists(self.text_log_path) and os.path.getsize(self.text_log_path):
+                text_path = _compress_file(self.text_log_path, destination)
+                entry = {"file": os.path.basename(text_path), "kind": "text",
+                         "start": None if self.log_offset else entries[0]["start"],
+                         "end": entries[0]["end"], "bytes": os.path.getsize(text_path)}
+                if self.log_offset:
+                    # Bytes iniciales anteriores al sink: solo existen en este segmento
+                    entry["legacy_bytes"] = self.log_offset
+                entries.append(entry)
+            return True
+        finally:
+            self.text_handler.release()
+
+    def _append_index(self, entries: list):
+        """Añadir segmentos al índice (escritura atómica)"""
+        index_path = os.path.join(self.segments_dir, SEGMENT_INDEX_NAME)
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {"game": self.stem, "segments": []}
+
+        index["segments"].extend(entries)
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1)
+        os.replace(tmp_path, index_path)
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+        }
+        event.update(record.structured)
+        return json.dumps(event, ensure_ascii=False)
+
+
+class AsyncLogWriter:
+    """Cola + hilo escritor para un logger
+
+    El hilo del juego solo encola tuplas (hora, nivel, tipo, formateador, args,
+    campos, eco); el escritor arma el mensaje y lo pasa a los handlers,
+    así una escritura lenta a disco nunca frena el loop del juego.
+    """
+
+    def __init__(self, logger: logging.Logger, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 overflow: str = OVERFLOW_DROP_NEWEST):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Política de desborde no soportada: {overflow}")
+
+        self.logger = logger
+        self.overflow = overflow
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._stats_lock = threading.Lock()
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self._reported_dropped = 0
+
+        self._thread = threading.Thread(target=self._run, name=f"log-{logger.name}", daemon=True)
+        self._thread.start()
+
+    # ===== LADO DEL JUEGO =====
+
+    def put(self, item: tuple) -> bool:
+        """Encolar registro sin bloquear (según política) - False si se descartó"""
+        try:
+            if self.overflow == OVERFLOW_BLOCK:
+                self._queue.put(item, timeout=BLOCK_TIMEOUT)
+            else:
+                self._queue.put_nowait(item)
+        except queue.Full:
+            if self.overflow != OVERFLOW_DROP_OLDEST or not self._replace_oldest(item):
+                self._count("dropped")
+                return False
+            self._count("dropped")  # Se perdió el más antiguo en su lugar
+
+        self._count("enqueued")
+        return True
+
+    def _replace_oldest(self, item: tuple) -> bool:
+        """Sacar el registro más antiguo y encolar el nuevo"""
+        try:
+            oldest = self._queue.get_nowait()
+            if not isinstance(oldest, tuple):
+                # Marcador de flush/cierre: se conserva y se descarta el nuevo
+                self._queue.put_nowait(oldest)
+                return False
+            self._queue.put_nowait(item)
+            return True
+        except (queue.Empty, queue.Full):
+            return False
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    # ===== CONTROL =====
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Esperar a que el escritor vacíe lo encolado hasta ahora"""
+        if not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 2.0):
+        """Vaciar la cola y detener el hilo escritor"""
+        if self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Contadores de la cola (encolados, escritos, descartados)"""
+        with self._stats_lock:
+            return {
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "queued": self._queue.qsize(),
+                "overflow": self.overflow,
+            }
+
+    # ===== HILO ESCRITOR =====
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in batch:
+                if item is None:
+                    self._report_dropped()
+                    return
+                if isinstance(item, threading.Event):
+                    self._report_dropped()
+                    item.set()
+                    continue
+                self._write(item)
+                self._count("written")
+
+            self._report_dropped()
+
+    def _write(self, item: tuple):
+        created, levelno, event_type, tagged, formatter, args, fields, echo = item
+        try:
+            body = formatter(*args)
+            message = f"[{event_type}] {body}" if tagged else body
+            record = self.logger.makeRecord(self.logger.name, levelno, "(game)", 0, message, None, None,
+                                            extra={"structured": _structured_event(event_type, body, fields)})
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            self.logger.handle(record)
+            if echo:
+                print(f"🎮 {message}")  # Eventos críticos también en consola
+        except Exception as e:
+            print(f"❌ Error escribiendo log de {self.logger.name}: {e}")
+
+    def _report_dropped(self):
+        """Dejar constancia en el log de registros perdidos por cola llena"""
+        with self._stats_lock:
+            lost = self.dropped - self._reported_dropped
+            self._reported_dropped = self.dropped
+        if lost:
+            self._write((time.time(), logging.WARNING, "LOGGER", True, _format_event,
+                         (f"⚠️ {lost} eventos descartados (cola de logs llena)", None, None),
+                         {"dropped": lost}, False))
+
+
+# Un escritor por logger: varias instancias del mismo juego comparten cola e hilo
+_writers: Dict[str, AsyncLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _get_writer(logger: logging.Logger, queue_size: int, overflow: str) -> AsyncLogWriter:
+    with _writers_lock:
+        writer = _writers.get(logger.name)
+        if writer is None or not writer._thread.is_alive():
+            writer = AsyncLogWriter(logger, queue_size, overflow)
+            _writers[logger.name] = writer
+        return writer
+
+
+@atexit.register
+def shutdown_game_loggers():
+    """Vaciar y detener todos los escritores (al salir del proceso)"""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
 
 class GameLogger:
-    """Manejador de logging para el juego"""
+    """Manejador de logging para el juego
 
-    def __init__(self, game_name: str = "PingPongGame", log_dir: str = "main/data"):
+    Por defecto (async_mode=True) el juego solo encola registros; un hilo
+    escritor los formatea y escribe. overflow define qué hacer si la cola se llena.
+    Con structured=True cada evento se escribe también en <juego>.jsonl con
+    campos tipados, que LogParser lee sin regex; rotation ("hour", "day" o
+    None) y max_segment_bytes controlan la rotación en segmentos comprimidos.
+
+    En modo multi-estación cada proceso escribe en <log_dir>/stations/<estación>/:
+    la rotación (renombrar, comprimir, index.json) no es segura entre procesos.
+    """
+
+    def __init__(self, game_name: str = "PingPongGame", log_dir: str = "main/data",
+                 async_mode: bool = True, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 overflow: str = OVERFLOW_DROP_NEWEST, structured: bool = True,
+                 rotation: Optional[str] = "day",
+                 max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES):
         self.game_name = game_name
-        self.log_dir = log_dir
+        station_id = os.environ.get(STATION_ENV_VAR)
+        self.log_dir = os.path.join(log_dir, STATIONS_DIR_NAME, station_id) if station_id else log_dir
+        self.structured = structured
+        self.rotation = rotation
+        self.max_segment_bytes = max_segment_bytes
         self.logger = None
+        self.writer: Optional[AsyncLogWriter] = None
         self._setup_logging()
 
+        if async_mode:
+            self.writer = _get_writer(self.logger, queue_size, overflow)
+
     def _setup_logging(self):
         """Configurar el sistema de logging"""
         # Crear carpeta data si no existe
@@ -24,11 +526,22 @@ class GameLogger:
         # Evitar duplicar handlers si ya existen
         if not self.logger.handlers:
             # Handler para archivo (nombre específico por juego)
-            log_filename = f"{self.game_name.lower().replace(' ', '_')}.log"
-            log_file = os.path.join(self.log_dir, log_filename)
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            log_name = self.game_name.lower().replace(' ', '_')
+            log_file = os.path.join(self.log_dir, f"{log_name}.log")
+
+            file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
             file_handler.setLevel(logging.INFO)
 
+            # Sink estructurado: va primero para rotar el .log antes de escribir en él
+            if self.structured:
+                jsonl_handler = JsonLinesHandler(
+                    os.path.join(self.log_dir, f"{log_name}.jsonl"), log_file,
+                    rotation=self.rotation, max_bytes=self.max_segment_bytes,
+                    text_handler=file_handler,
+                )
+                jsonl_handler.setLevel(logging.INFO)
+                self.logger.addHandler(jsonl_handler)
+
             # Formato personalizado con fecha y hora
             formatter = logging.Formatter(
                 '%(asctime)s | %(levelname)s | %(message)s',
@@ -44,64 +557,76 @@ class GameLogger:
             console_handler.setFormatter(formatter)
             self.logger.addHandler(console_handler)
 
-    def log_game_event(self, event_type: str, message: str, level: str = "INFO",
-                      score: Optional[int] = None, ball_pos: Optional[tuple] = None):
-        """Registrar evento del juego"""
-        log_parts = [f"[{event_type}] {message}"]
+    def _log(self, levelno: int, event_type: str, formatter: Callable[..., str], args: tuple,
+             fields: Optional[Dict] = None, tagged: bool = True, echo: bool = False):
+        """Encolar (asíncrono) o escribir directamente (síncrono)
 
-        if score is not None:
-            log_parts.append(f"Score: {score}")
+        tagged=False: el mensaje de texto no lleva el prefijo [EVENT_TYPE].
+        """
+        if not self.logger.isEnabledFor(levelno):
+            return
 
-        if ball_pos is not None:
-            log_parts.append(f"Ball: {ball_pos}")
+        if self.writer is not None:
+            self.writer.put((time.time(), levelno, event_type, tagged, formatter, args, fields, echo))
+            return
 
-        log_message = " | ".join(log_parts)
+        body = formatter(*args)
+        message = f"[{event_type}] {body}" if tagged else body
+        self.logger.log(levelno, message,
+                        extra={"structured": _structured_event(event_type, body, fields)})
+        if echo:
+            print(f"🎮 {message}")  # También mostrar en consola para eventos críticos
 
-        if level == "ERROR":
-            self.logger.error(log_message)
-        elif level == "WARNING":
-            self.logger.warning(log_message)
-        else:
-            self.logger.info(log_message)
+    def log_game_event(self, event_type: str, message: str, level: str = "INFO",
+                      score: Optional[int] = None, ball_pos: Optional[tuple] = None,
+                      fields: Optional[Dict] = None):
+        """Registrar evento del juego
+
+        fields: datos tipados extra solo para el sink estructurado
+        (p. ej. {"speed": 0.8, "game_duration": 12.5}); no alteran el texto.
+        """
+        self._log(_LEVELS.get(level, logging.INFO), event_type, _format_event,
+                  (message, score, ball_pos), _event_fields(score, ball_pos, fields))
 
     def log_player_death_ping_pong(self, death_reason: str, side: str, final_score: int,
                         total_hits: int, left_hits: int, right_hits: int,
                         game_duration: float, game_speed: float):
         """Registrar muerte/error especial del jugador"""
-        death_message = (
-            f"💀 PLAYER DEATH 💀 | Reason: {death_reason} | Side: {side} | "
-            f"Final Score: {final_score} | Total Hits: {total_hits} | "
-            f"Left Hits: {left_hits} | Right Hits: {right_hits} | "
-            f"Game Duration: {game_duration:.2f}s | Speed: {game_speed:.2f}s"
-        )
-
-        self.logger.error(death_message)
-        print(f"🎮 {death_message}")  # También mostrar en consola para eventos críticos
+        self._log(logging.ERROR, "PLAYER_DEATH", _format_death_ping_pong,
+                  (death_reason, side, final_score, total_hits, left_hits, right_hits,
+                   game_duration, game_speed),
+                  {"score": final_score, "game_duration": game_duration, "speed": game_speed,
+                   "is_death": True, "total_hits": total_hits},
+                  tagged=False, echo=True)
 
     def log_player_death_simon(self, reason: str, final_level: int,
                         sequences_completed: int, button_presses: int,
                         mistakes: int, game_duration: float):
         """Registrar muerte/victoria del jugador en Simon"""
-        death_message = (
-            f"💀 SIMON END 💀 | Reason: {reason} | Final Level: {final_level} | "
-            f"Sequences Completed: {sequences_completed} | Button Presses: {button_presses} | "
-            f"Mistakes: {mistakes} | Game Duration: {game_duration:.2f}s | "
-            f"Accuracy: {((button_presses - mistakes) / max(1, button_presses) * 100):.1f}%"
-        )
-
-        self.logger.error(death_message)
-        print(f"🎮 {death_message}")  # También mostrar en consola para eventos críticos
+        self._log(logging.ERROR, "SIMON_END", _format_death_simon,
+                  (reason, final_level, sequences_completed, button_presses,
+                   mistakes, game_duration),
+                  {"game_duration": game_duration, "is_death": True, "final_level": final_level,
+                   "mistakes": mistakes},
+                  tagged=False, echo=True)
 
     def log_player_death_two_lanes(self, death_reason: str, lane: str, final_score: int,
                         obstacles_dodged: int, lane_changes: int,
                         game_duration: float, game_speed: float):
         """Registrar muerte/error especial del jugador en Two Lanes"""
-        death_message = (
-            f"💀 PLAYER DEATH 💀 | Reason: {death_reason} | Lane: {lane} | "
-            f"Final Score: {final_score} | Obstacles Dodged: {obstacles_dodged} | "
-            f"Lane Changes: {lane_changes} | Game Duration: {game_duration:.2f}s | "
-            f"Speed: {game_speed:.2f}s"
-        )
-
-        self.logger.error(death_message)
-        print(f"🎮 {death_message}")  # También mostrar en consola para eventos críticos
+        self._log(logging.ERROR, "PLAYER_DEATH", _format_death_two_lanes,
+                  (death_reason, lane, final_score, obstacles_dodged, lane_changes,
+                   game_duration, game_speed),
+                  {"score": final_score, "game_duration": game_duration, "speed": game_speed,
+                   "is_death": True, "obstacles_dodged": obstacles_dodged},
+                  tagged=False, echo=True)
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Esperar a que los registros encolados lleguen al archivo"""
+        if self.writer is None:
+            return True
+        return self.writer.flush(timeout)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Contadores del logging asíncrono (vacío en modo síncrono)"""
+        return self.writer.get_stats() if self.writer else {}
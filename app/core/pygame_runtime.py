@@ -0,0 +1,352 @@
+"""
+Runtime pygame compartido: ventana y mixer que sobreviven a los cambios de juego
+
+Antes cada juego hacía pygame.init()/set_mode/mixer.init() al iniciar y
+pygame.quit()/mixer.quit() al detenerse, así que cambiar de juego cerraba y
+volvía a abrir la ventana y el dispositivo de audio (segundos, y a veces fallaba).
+
+Ahora los juegos *piden prestado*:
+- acquire_display(owner, size, caption) -> Surface (se reutiliza la ventana;
+  solo se redimensiona si cambia el tamaño)
+- acquire_audio(owner) -> bool (mixer inicializado una sola vez con una
+  configuración fija; usar `sample_rate` al sintetizar sonidos)
+
+y al terminar devuelven (release_display / release_audio): se detienen los
+canales, se limpia la pantalla y la cola de eventos, sin teardown. Si la
+ventana queda sin usar IDLE_WINDOW_SECONDS se cierra solo el display.
+shutdown() hace el pygame.quit() completo al cerrar la aplicación.
+
+Hilo pygame: en Windows los mensajes de una ventana llegan solo al hilo que
+la creó, y pygame.event.get() solo bombea los de su hilo. Por eso un único
+hilo persistente ("pygame") crea la ventana y ejecuta los loops de todos los
+juegos (start_loop / call); acquire_display llamado desde otro hilo (p. ej.
+el worker de ciclo de vida) se delega a él. Sin juego activo, ese hilo sigue
+bombeando eventos para que la ventana no quede "sin responder".
+
+pygame se importa al primer uso (la app arranca sin cargarlo).
+"""
+
+import queue
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, Tuple
+
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 512
+
+IDLE_WINDOW_SECONDS = 15.0  # Cerrar la ventana si ningún juego la vuelve a pedir
+IDLE_CAPTION = "Arduino Multi-Game Platform"
+
+PYGAME_THREAD_NAME = "pygame"
+CALL_TIMEOUT = 10.0         # Espera máxima de una tarea en el hilo pygame (p. ej. crear ventana)
+IDLE_PUMP_SECONDS = 0.1     # Bombeo de eventos mientras ningún loop usa la ventana
+
+
+class PygameLoop:
+    """Loop de juego en el hilo pygame - misma interfaz que threading.Thread para esperar"""
+
+    def __init__(self, name: str, runtime: "PygameRuntime"):
+        self.name = name
+        self._runtime = runtime
+        self._done = threading.Event()
+
+    def is_alive(self) -> bool:
+        return not self._done.is_set()
+
+    def join(self, timeout: Optional[float] = None):
+        # Desde el propio loop (p. ej. ESC -> stop_game) no hay nada que esperar
+        if self._runtime.on_pygame_thread():
+            return
+        self._done.wait(timeout)
+
+
+class PygameRuntime:
+    """Ventana y mixer de pygame compartidos por todos los juegos"""
+
+    def __init__(self):
+        self.pygame = None
+        self.screen = None
+        self.display_owner = None
+        self.audio_owners = weakref.WeakSet()  # Una instancia descartada no retiene el mixer
+        self._idle_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        self._tasks: "queue.Queue[Tuple[Callable, tuple, Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._loops = set()  # Loops encolados o en curso
+
+    # ===== HILO PYGAME =====
+
+    def on_pygame_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def _ensure_thread(self):
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run_tasks, name=PYGAME_THREAD_NAME,
+                                                daemon=True)
+                self._thread.start()
+
+    def _run_tasks(self):
+        """Ejecutar tareas y loops en orden; entre medias, mantener viva la ventana"""
+        while True:
+            try:
+                task = self._tasks.get(timeout=IDLE_PUMP_SECONDS)
+            except queue.Empty:
+                self._pump_idle()
+                continue
+            func, args, future = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _pump_idle(self):
+        with self._lock:
+            if self.screen is None or self.display_owner is not None:
+                return
+            try:
+                self.pygame.event.pump()
+            except Exception:
+                pass
+
+    def submit(self, func: Callable, *args) -> Future:
+        """Encolar func(*args) en el hilo pygame"""
+        future: Future = Future()
+        self._ensure_thread()
+        self._tasks.put((func, args, future))
+        return future
+
+    def call(self, func: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """Ejecutar func(*args) en el hilo pygame y esperar su resultado"""
+        if self.on_pygame_thread():
+            return func(*args)
+        return self.submit(func, *args).result(timeout)
+
+    def start_loop(self, target: Callable, *args, name: str = "game-loop") -> PygameLoop:
+        """Ejecutar el loop de un juego en el hilo pygame (donde se crea la ventana)
+
+        Retorna un handle con is_alive()/join() como threading.Thread.
+        """
+        loop = PygameLoop(name, self)
+
+        def run():
+            try:
+                target(*args)
+            except Exception as e:
+                print(f"❌ Error en loop {name}: {e}")
+            finally:
+                self._loops.discard(loop)
+                loop._done.set()
+
+        self._loops.add(loop)
+        self.submit(run)
+        return loop
+
+    def loop_active(self) -> bool:
+        """Hay un loop encolado o en curso (el hilo pygame no atenderá tareas nuevas)"""
+        return bool(self._loops)
+
+    # ===== INICIALIZACIÓN =====
+
+    def _ensure_pygame(self):
+        """Importar e inicializar pygame una sola vez (mixer con configuración fija)"""
+        if self.pygame is not None and self.pygame.get_init():
+            return self.pygame
+
+        import pygame
+
+        # pre_init antes de pygame.init(): init() también arranca el mixer
+        pygame.mixer.pre_init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE,
+                              channels=MIXER_CHANNELS, buffer=MIXER_BUFFER)
+        pygame.init()
+        self.pygame = pygame
+        print("✅ Runtime pygame inicializado")
+        return pygame
+
+    def is_initialized(self) -> bool:
+        return self.pygame is not None and self.pygame.get_init()
+
+    def ensure_initialized(self) -> bool:
+        """Inicializar pygame sin abrir ventana (para pre-cargar fuentes y sonidos)"""
+        if self.is_initialized():
+            return True
+        if not self.on_pygame_thread():
+            # pygame.init() (video incluido) siempre en el hilo pygame
+            try:
+                return self.call(self.ensure_initialized, timeout=CALL_TIMEOUT)
+            except Exception as e:
+                print(f"⚠️ No se pudo inicializar pygame: {e}")
+                return False
+        with self._lock:
+            try:
+                self._ensure_pygame()
+                return True
+            except Exception as e:
+                print(f"⚠️ No se pudo inicializar pygame: {e}")
+                return False
+
+    @property
+    def sample_rate(self) -> int:
+        """Frecuencia real del mixer (para sintetizar sonidos a la velocidad correcta)"""
+        if self.pygame is not None and self.pygame.mixer.get_init():
+            return self.pygame.mixer.get_init()[0]
+        return MIXER_FREQUENCY
+
+    # ===== DISPLAY =====
+
+    def acquire_display(self, owner, size: Tuple[int, int], caption: str):
+        """Obtener la ventana para un juego (la crea o la reutiliza en el hilo pygame)"""
+        if not self.on_pygame_thread():
+            return self.call(self.acquire_display, owner, size, caption, timeout=CALL_TIMEOUT)
+
+        with self._lock:
+            pygame = self._ensure_pygame()
+            self._cancel_idle_timer()
+
+            has_window = (self.screen is not None and pygame.display.get_init()
+                          and pygame.display.get_surface() is not None)
+            if not has_window or self.screen.get_size() != tuple(size):
+                if not pygame.display.get_init():
+                    pygame.display.init()
+                self.screen = pygame.display.set_mode(tuple(size))
+
+            pygame.display.set_caption(caption)
+            self.screen.fill((0, 0, 0))
+            pygame.event.clear()
+            self.display_owner = owner
+            return self.screen
+
+    def release_display(self, owner=None):
+        """Devolver la ventana: se limpia y queda lista para el siguiente juego
+
+        owner=None libera sea quien sea el dueño (limpieza desde el gestor seguro).
+        """
+        if not self.on_pygame_thread():
+            if self.screen is None:
+                return
+            try:
+                self.call(self.release_display, owner, timeout=CALL_TIMEOUT)
+            except Exception as e:
+                print(f"⚠️ Hilo pygame ocupado, no se pudo liberar la ventana: {e}")
+            return
+
+        with self._lock:
+            if self.pygame is None or self.screen is None:
+                return
+            if owner is not None and self.display_owner is not owner:
+                return
+            self.display_owner = None
+            try:
+                self.screen.fill((0, 0, 0))
+                self.pygame.display.flip()
+                self.pygame.display.set_caption(IDLE_CAPTION)
+                self.pygame.event.clear()
+            except Exception as e:
+                print(f"⚠️ Error limpiando ventana pygame: {e}")
+            self._start_idle_timer()
+
+    def _start_idle_timer(self):
+        self._cancel_idle_timer()
+        self._idle_timer = threading.Timer(IDLE_WINDOW_SECONDS, self.submit, args=(self._close_idle_window,))
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _cancel_idle_timer(self):
+        if self._idle_timer:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _close_idle_window(self):
+        with self._lock:
+            if self.display_owner is not None or self.pygame is None:
+                return
+            try:
+                self.pygame.display.quit()
+            except Exception as e:
+                print(f"⚠️ Error cerrando ventana pygame: {e}")
+            self.screen = None
+
+    # ===== AUDIO =====
+
+    def acquire_audio(self, owner) -> bool:
+        """Asegurar el mixer para un juego - retorna si hay audio disponible"""
+        if not self.ensure_initialized():
+            return False
+        with self._lock:
+            try:
+                pygame = self._ensure_pygame()
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE,
+                                      channels=MIXER_CHANNELS, buffer=MIXER_BUFFER)
+            except Exception as e:
+                print(f"❌ Error inicializando audio: {e}")
+                return False
+            self.audio_owners.add(owner)
+            return True
+
+    def release_audio(self, owner=None):
+        """Detener lo que suena y devolver el mixer (sigue abierto)"""
+        with self._lock:
+            if owner is None:
+                self.audio_owners.clear()
+            else:
+                self.audio_owners.discard(owner)
+            self.stop_audio()
+
+    def stop_audio(self):
+        """Detener todos los canales y la música"""
+        if self.pygame is None or not self.pygame.mixer.get_init():
+            return
+        try:
+            self.pygame.mixer.stop()
+            self.pygame.mixer.music.stop()
+        except Exception as e:
+            print(f"⚠️ Error deteniendo audio: {e}")
+
+    # ===== CICLO DE VIDA =====
+
+    def reset(self):
+        """Estado limpio entre juegos: sin sonido, ventana libre, cola de eventos vacía"""
+        self.release_audio()
+        self.release_display()
+
+    def shutdown(self):
+        """Teardown completo (cierre de la aplicación o parada de emergencia)"""
+        if self._thread is not None and self._thread.is_alive() and not self.on_pygame_thread():
+            try:
+                return self.call(self.shutdown, timeout=CALL_TIMEOUT)
+            except Exception as e:
+                print(f"⚠️ Hilo pygame ocupado, cierre forzado: {e}")
+        with self._lock:
+            self._cancel_idle_timer()
+            if self.pygame is None:
+                return
+            try:
+                self.stop_audio()
+                self.pygame.mixer.quit()
+                self.pygame.display.quit()
+                self.pygame.quit()
+            except Exception as e:
+                print(f"⚠️ Error cerrando pygame: {e}")
+            self.screen = None
+            self.display_owner = None
+            self.audio_owners.clear()
+
+
+_runtime: Optional[PygameRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_pygame_runtime() -> PygameRuntime:
+    """Runtime compartido de la plataforma"""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = PygameRuntime()
+        return _runtime
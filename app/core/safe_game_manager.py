@@ -4,9 +4,9 @@ Gestor seguro de juegos para manejar detención sin crashes
 
 import threading
 import time
-import pygame
 from typing import Optional
 from core.base_game import BaseGame
+from core.pygame_runtime import get_pygame_runtime
 
 
 class SafeGameManager:
@@ -92,7 +92,7 @@ class SafeGameManager:
                     print(f"⚠️ Error esperando {thread_name}: {e}")
     
     def _cleanup_audio(self, game: BaseGame):
-        """Limpiar recursos de audio"""
+        """Limpiar recursos de audio (el mixer compartido sigue abierto)"""
         try:
             # Piano modular
             if hasattr(game, 'audio_manager'):
@@ -100,23 +100,14 @@ class SafeGameManager:
                     game.audio_manager.detener_todos_sonidos()
                 print("✅ Audio manager limpiado")
             
-            # Otros juegos con pygame.mixer
-            elif hasattr(game, 'audio_initialized') and game.audio_initialized:
-                pygame.mixer.stop()
-                print("✅ Pygame mixer detenido")
+            # Detener todo lo que suene y devolver el mixer al runtime
+            get_pygame_runtime().release_audio()
             
-            # Intentar limpiar mixer de forma general
-            try:
-                pygame.mixer.stop()
-                pygame.mixer.quit()
-            except:
-                pass
-                
         except Exception as e:
             print(f"⚠️ Error limpiando audio: {e}")
     
     def _cleanup_pygame(self, game: BaseGame):
-        """Limpiar Pygame de forma segura"""
+        """Devolver la ventana pygame al runtime (sin cerrarla)"""
         try:
             # Piano modular
             if hasattr(game, 'visual_manager'):
@@ -126,27 +117,11 @@ class SafeGameManager:
             
             # Otros juegos con pygame
             elif hasattr(game, 'pygame_initialized') and game.pygame_initialized:
-                try:
-                    pygame.display.quit()
-                    pygame.quit()
-                    game.pygame_initialized = False
-                    print("✅ Pygame cerrado")
-                except Exception as e:
-                    print(f"⚠️ Error cerrando pygame del juego: {e}")
-                    # Intentar cerrar de forma forzada
-                    try:
-                        pygame.quit()
-                        game.pygame_initialized = False
-                    except:
-                        pass
+                game.pygame_initialized = False
+                print("✅ Ventana pygame liberada")
             
-            # Limpiar pygame de forma general si está activo
-            try:
-                if pygame.get_init():
-                    pygame.display.quit()
-                    pygame.quit()
-            except:
-                pass
+            # Liberar la ventana sea quien sea el dueño (queda lista para el siguiente juego)
+            get_pygame_runtime().release_display()
                 
         except Exception as e:
             print(f"⚠️ Error limpiando Pygame: {e}")
@@ -193,20 +168,8 @@ class SafeGameManager:
         """Parada de emergencia para todos los recursos"""
         print("🚨 PARADA DE EMERGENCIA - Limpiando todos los recursos")
         
-        try:
-            # Detener todo el audio
-            pygame.mixer.stop()
-            pygame.mixer.quit()
-        except:
-            pass
-        
-        try:
-            # Cerrar pygame completamente
-            if pygame.get_init():
-                pygame.display.quit()
-                pygame.quit()
-        except:
-            pass
+        # Aquí sí teardown completo: el estado de pygame no es confiable
+        get_pygame_runtime().shutdown()
         
         # Resetear estado
         self.current_game = None
@@ -0,0 +1,102 @@
+"""
+Daemon de estación sin interfaz para quioscos
+
+Sin tkinter ni matplotlib: solo Arduino, juegos (pygame) y la API de
+control local. Ejemplos:
+
+    python daemon.py --arduino auto
+    python daemon.py --arduino COM3 --api-port 8765 --patient P_001_20240101_120000
+    python daemon.py --arduino auto --station E1 --hub http://hub.local:8770 --hub-token SECRETO
+
+    curl -X POST localhost:8765/start -H 'Content-Type: application/json' -d '{"game_id": "osu_rhythm"}'
+    curl -N localhost:8765/events
+
+Con --api-token (o la variable ARDUINO_DAEMON_TOKEN) cada petición debe
+llevar la cabecera "Authorization: Bearer <token>".
+"""
+
+import argparse
+import os
+import signal
+import threading
+
+from core.cognitive.cognitive_logger import STATION_ENV_VAR
+from core.cognitive.session_journal import recover_incomplete_sessions
+from core.cognitive.session_sync import HttpHubClient, SyncAgent
+from managers.daemon import ControlServer, StationDaemon
+from managers.daemon.control_api import API_TOKEN_ENV_VAR, DEFAULT_API_HOST, DEFAULT_API_PORT
+
+
+def main():
+    """Función principal del daemon"""
+    parser = argparse.ArgumentParser(description="Arduino Multi-Game Platform - daemon sin interfaz")
+    parser.add_argument("--arduino", metavar="PUERTO",
+                        help="Puerto del Arduino (p. ej. COM3) o 'auto' para buscarlo al arrancar")
+    parser.add_argument("--api-port", type=int, default=DEFAULT_API_PORT,
+                        help=f"Puerto de la API de control en {DEFAULT_API_HOST} (por defecto {DEFAULT_API_PORT})")
+    parser.add_argument("--api-token", default=os.environ.get(API_TOKEN_ENV_VAR),
+                        help=f"Token Bearer exigido por la API de control (por defecto ${API_TOKEN_ENV_VAR})")
+    parser.add_argument("--patient", metavar="PATIENT_ID", help="Paciente inicial (logging cognitivo)")
+    parser.add_argument("--no-warm", action="store_true", help="No pre-cargar juegos entre partidas")
+    parser.add_argument("--station", help="ID de la estación (se añade a los IDs de sesión)")
+    parser.add_argument("--hub", metavar="URL", help="Hub central al que enviar las sesiones nuevas")
+    parser.add_argument("--hub-token", help="Token del hub")
+    args = parser.parse_args()
+
+    if args.station:
+        os.environ[STATION_ENV_VAR] = args.station
+
+    print("🎮 Arduino Multi-Game Platform - Daemon")
+    print("=" * 60)
+
+    # Reparar sesiones cognitivas que quedaron abiertas por un cierre abrupto
+    recover_incomplete_sessions()
+
+    station = StationDaemon(warm_games=not args.no_warm)
+    try:
+        server = ControlServer(station, DEFAULT_API_HOST, args.api_port, token=args.api_token)
+    except OSError as e:
+        print(f"❌ No se pudo abrir la API en {DEFAULT_API_HOST}:{args.api_port}: {e}")
+        station.shutdown()
+        return
+
+    # SIGINT (Ctrl+C) y SIGTERM (systemd, docker stop): cierre limpio
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    server.start()
+    print(f"🌐 API de control en http://{DEFAULT_API_HOST}:{args.api_port}"
+          f"{' (con token)' if args.api_token else ''}")
+
+    # Envío periódico de sesiones terminadas al hub
+    sync_agent = None
+    if args.hub:
+        sync_agent = SyncAgent(HttpHubClient(args.hub, token=args.hub_token), station_id=args.station)
+        sync_agent.start()
+        print(f"📤 Sincronizando sesiones con {args.hub} como {sync_agent.station_id}")
+
+    try:
+        if args.arduino:
+            _, message = station.connect(None if args.arduino == "auto" else args.arduino)
+            print(f"🔌 {message}")
+        if args.patient:
+            try:
+                station.select_patient(args.patient)
+            except ValueError as e:
+                print(f"⚠️ {e}")
+
+        # wait con timeout: en Windows un wait sin límite no deja pasar Ctrl+C
+        while not stop.wait(1.0):
+            pass
+    finally:
+        print("\n💻 Cerrando daemon...")
+        if sync_agent:
+            sync_agent.stop()
+        server.stop()
+        station.shutdown()
+        print("👋 Daemon cerrado")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ import threading
 import math
 from typing import Optional, Dict, Any
 
+from core.pygame_runtime import get_pygame_runtime
+
 
 class OsuAudioManager:
     """Maneja todos los efectos de sonido del juego Osu"""
@@ -27,9 +29,10 @@ class OsuAudioManager:
             import pygame
             self.pygame = pygame
             
-            # Inicializar mixer de pygame
-            pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=1024)
-            pygame.mixer.init()
+            # Mixer compartido de la plataforma (no se reabre al cambiar de juego)
+            if not get_pygame_runtime().acquire_audio(self):
+                self.enable_audio = False
+                return
             
             # Crear sonidos sintéticos
             self._create_synthetic_sounds()
@@ -51,7 +54,7 @@ class OsuAudioManager:
         try:
             import numpy as np
             
-            sample_rate = 22050
+            sample_rate = get_pygame_runtime().sample_rate
             
             # Sonido de hit perfecto (nota alta y brillante)
             perfect_freq = 800
@@ -142,7 +145,7 @@ class OsuAudioManager:
             
         try:
             # Crear tonos simples usando pygame
-            sample_rate = 22050
+            sample_rate = get_pygame_runtime().sample_rate
             
             # Función helper para crear tonos
             def create_tone(frequency: int, duration: float, volume: float = 0.5):
@@ -304,8 +307,7 @@ class OsuAudioManager:
         """Limpiar recursos de audio"""
         try:
             self.stop_all_sounds()
-            if self.pygame:
-                self.pygame.mixer.quit()
+            get_pygame_runtime().release_audio(self)
             print("🧹 Audio Osu limpiado")
         except Exception as e:
             print(f"⚠️ Error limpiando audio: {e}") 
\ No newline at end of file
@@ -9,6 +9,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+from core.event_bus import StatusPublisher
+
 # Importar logging cognitivo
 try:
     import sys
@@ -142,6 +144,11 @@ class OsuGameLogic:
                 print(f"❌ Error iniciando logging cognitivo: {e}")
                 self.cognitive_logging = False
         
+        # Estado para HUD y suscriptores: se actualiza en cada evento, no en cada frame
+        self.hud: Dict[str, Any] = {}
+        self.status = StatusPublisher("osu_rhythm")
+        self._update_hud()
+        
         # Callbacks para eventos
         self.on_circle_spawn = None
         self.on_circle_hit = None
@@ -178,6 +185,8 @@ class OsuGameLogic:
         self.hits.clear()
         
         self.last_spawn_time = self.game_start_time
+        self.game_duration = 0.0
+        self._update_hud()
         
         # COGNITIVE LOGGING: Iniciar nueva sesión
         if self.cognitive_logging and self.session_manager:
@@ -270,6 +279,8 @@ class OsuGameLogic:
         if self.total_circles % self.circles_per_level == 0:
             self.difficulty_level += 1
             print(f"🆙 Nivel de dificultad: {self.difficulty_level}")
+        
+        self._update_hud()
     
     def _process_player_click(self, current_time: float, cursor_x: int, cursor_y: int) -> bool:
         """Procesar click del jugador"""
@@ -334,6 +345,7 @@ class OsuGameLogic:
             points=points
         )
         self.hits.append(hit)
+        self._update_hud()
         
         # COGNITIVE LOGGING
         if self.cognitive_logging and self.current_logger:
@@ -425,6 +437,7 @@ class OsuGameLogic:
                     
                     self.circles_missed += 1
                     self.combo = 0  # Reset combo en miss
+                    self._update_hud()
                     
                     if self.on_circle_miss:
                         self.on_circle_miss()
@@ -441,6 +454,7 @@ class OsuGameLogic:
     def _check_game_end_conditions(self, current_time: float):
         """Verificar condiciones de fin de juego"""
         self.game_duration = current_time - self.game_start_time
+        self.hud["game_duration"] = self.game_duration / 1000.0
         
         # Fin por tiempo (ejemplo: 2 minutos)
         if self.game_duration > 120000:  # 2 minutos en ms
@@ -449,6 +463,7 @@ class OsuGameLogic:
     def end_game(self):
         """Terminar juego y mostrar resultados"""
         self.game_state = GameState.RESULTS
+        self._update_hud()
         
         # COGNITIVE LOGGING: Cerrar sesión
         if self.cognitive_logging and self.session_manager:
@@ -465,33 +480,51 @@ class OsuGameLogic:
         """Pausar juego"""
         if self.game_state == GameState.PLAYING:
             self.game_state = GameState.PAUSED
+            self._update_hud()
     
     def resume_game(self):
         """Reanudar juego"""
         if self.game_state == GameState.PAUSED:
             self.game_state = GameState.PLAYING
+            self._update_hud()
     
-    def get_game_status(self) -> Dict[str, Any]:
-        """Obtener estado completo del juego"""
-        accuracy = (self.circles_hit / max(1, self.total_circles)) * 100
+    def _update_hud(self):
+        """Recalcular el HUD tras un evento y publicar lo que cambió"""
+        self.hud.update(
+            score=self.score,
+            combo=self.combo,
+            max_combo=self.max_combo,
+            total_circles=self.total_circles,
+            circles_hit=self.circles_hit,
+            circles_missed=self.circles_missed,
+            perfect_hits=self.perfect_hits,
+            good_hits=self.good_hits,
+            normal_hits=self.normal_hits,
+            accuracy=(self.circles_hit / max(1, self.total_circles)) * 100,
+            difficulty_level=self.difficulty_level,
+            game_duration=self.game_duration / 1000.0,  # en segundos
+            active_circles=sum(1 for c in self.circles if not c.is_hit),
+        )
         
+        if self.status.active:
+            self.status.update(
+                game_state=self.game_state.name,
+                score=self.score,
+                combo=self.combo,
+                max_combo=self.max_combo,
+                difficulty_level=self.difficulty_level,
+                circles_hit=self.circles_hit,
+                circles_missed=self.circles_missed,
+                accuracy=round(self.hud["accuracy"], 1),
+            )
+    
+    def get_game_status(self) -> Dict[str, Any]:
+        """Obtener estado completo del juego (para el HUD por frame usar `hud`)"""
         return {
+            **self.hud,
             "game_state": self.game_state,
-            "score": self.score,
-            "combo": self.combo,
-            "max_combo": self.max_combo,
-            "total_circles": self.total_circles,
-            "circles_hit": self.circles_hit,
-            "circles_missed": self.circles_missed,
-            "perfect_hits": self.perfect_hits,
-            "good_hits": self.good_hits,
-            "normal_hits": self.normal_hits,
-            "accuracy": accuracy,
-            "difficulty_level": self.difficulty_level,
-            "game_duration": self.game_duration / 1000.0,  # en segundos
-            "active_circles": len([c for c in self.circles if not c.is_hit]),
             "circles": self.circles,
-            "recent_hits": self.hits[-10:] if len(self.hits) > 10 else self.hits
+            "recent_hits": self.hits[-10:]
         }
     
     def get_difficulty_info(self) -> Dict[str, Any]:
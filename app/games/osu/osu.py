@@ -8,6 +8,7 @@ from typing import Dict, Any
 
 from core.base_game import BaseGame
 from core.arduino_manager import ArduinoManager
+from core.pygame_runtime import get_pygame_runtime
 from .hardware_manager import OsuHardwareManager
 from .audio_manager import OsuAudioManager
 from .visual_manager import OsuVisualManager
@@ -66,6 +67,10 @@ class OsuGame(BaseGame):
             on_combo_milestone=self._on_combo_milestone,
         )
 
+    def prewarm(self):
+        """Pre-cargar fuentes (los sonidos ya se sintetizan al construir)"""
+        self.visual_manager.preload_assets()
+
     def initialize_hardware(self) -> bool:
         """Inicializar hardware específico del juego"""
         print("🔧 Inicializando hardware Osu...")
@@ -109,10 +114,10 @@ class OsuGame(BaseGame):
             self.audio_manager.start_background_rhythm(120)  # 120 BPM
 
             # Iniciar hilo principal del juego
-            self.game_thread = threading.Thread(
-                target=self._main_game_loop, daemon=True
+            # En el hilo pygame: el mismo que creó la ventana bombea sus eventos
+            self.game_thread = get_pygame_runtime().start_loop(
+                self._main_game_loop, name="osu"
             )
-            self.game_thread.start()
 
             print("✅ Osu Game iniciado correctamente")
             return True
@@ -259,14 +264,13 @@ class OsuGame(BaseGame):
                     ):
                         self.game_logic.start_game()
 
-                # Renderizar frame
-                game_status = self.game_logic.get_game_status()
+                # Renderizar frame (HUD mantenido por la lógica, sin armar dicts por frame)
                 self.visual_manager.render_frame(
                     current_state,
-                    game_status["circles"],
+                    self.game_logic.circles,
                     self.current_cursor_x,
                     self.current_cursor_y,
-                    game_status,
+                    self.game_logic.hud,
                 )
 
                 # Control de framerate
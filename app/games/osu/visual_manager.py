@@ -5,6 +5,7 @@ Manejo visual para el juego Osu! - Renderizado de círculos, cursor y efectos
 import time
 import math
 from typing import List, Tuple, Optional, Dict, Any
+from core.pygame_runtime import get_pygame_runtime
 from .game_logic import GameState, Circle, HitResult
 
 
@@ -22,6 +23,7 @@ class OsuVisualManager:
         self.font_small = None
         self.font_medium = None
         self.font_large = None
+        self.effect_fonts = {}  # Fuentes de efectos de hit por tamaño (24-72)
 
         # Estados visuales
         self.cursor_trail = []
@@ -62,22 +64,14 @@ class OsuVisualManager:
 
             self.pygame = pygame
 
-            # Inicializar pygame
-            pygame.init()
-
-            # Crear ventana
-            self.screen = pygame.display.set_mode(
-                (self.screen_width, self.screen_height)
+            # Ventana compartida de la plataforma (no se recrea al cambiar de juego)
+            self.screen = get_pygame_runtime().acquire_display(
+                self, (self.screen_width, self.screen_height), "🎯 Osu! - Rhythm Game"
             )
-            pygame.display.set_caption("🎯 Osu! - Rhythm Game")
-
-            # Clock para FPS
-            self.clock = pygame.time.Clock()
 
-            # Fuentes
-            self.font_small = pygame.font.Font(None, 24)
-            self.font_medium = pygame.font.Font(None, 36)
-            self.font_large = pygame.font.Font(None, 48)
+            # Fuentes y clock (ya creados si el juego se pre-cargó)
+            if self.font_large is None:
+                self._load_fonts()
 
             self.initialized = True
             print("✅ Visual manager Osu inicializado (desde initialize_pygame)")
@@ -90,6 +84,37 @@ class OsuVisualManager:
             print(f"❌ Error inicializando visual: {e}")
             return False
 
+    def _load_fonts(self):
+        """Crear clock y fuentes (no necesita ventana)"""
+        pygame = self.pygame
+        self.clock = pygame.time.Clock()
+        self.font_small = pygame.font.Font(None, 24)
+        self.font_medium = pygame.font.Font(None, 36)
+        self.font_large = pygame.font.Font(None, 48)
+
+    def preload_assets(self) -> bool:
+        """Pre-cargar fuentes antes de abrir la ventana (pool de juegos pre-calentados)"""
+        try:
+            import pygame
+
+            self.pygame = pygame
+            if not get_pygame_runtime().ensure_initialized():
+                return False
+            self._load_fonts()
+            for size in range(24, 73):
+                self._effect_font(size)
+            return True
+        except Exception as e:
+            print(f"⚠️ Error pre-cargando visual Osu: {e}")
+            return False
+
+    def _effect_font(self, size: int):
+        """Fuente de efectos de hit (cacheada: cargarla en cada frame es caro)"""
+        font = self.effect_fonts.get(size)
+        if font is None:
+            font = self.effect_fonts[size] = self.pygame.font.Font(None, size)
+        return font
+
     def update_cursor_position(self, x: int, y: int):
         """Actualizar posición del cursor y su trail"""
         # Agregar posición actual al trail
@@ -424,7 +449,7 @@ class OsuVisualManager:
 
             # Renderizar texto con efecto
             font_size = int(24 * scale)
-            font = self.pygame.font.Font(None, font_size)
+            font = self._effect_font(font_size)
             text_surface = font.render(result_text, True, color[:3])
 
             # Posición con movimiento hacia arriba
@@ -623,8 +648,9 @@ class OsuVisualManager:
     def cleanup(self):
         """Limpiar recursos visuales"""
         try:
-            if self.pygame:
-                self.pygame.quit()
+            if self.initialized:
+                get_pygame_runtime().release_display(self)
+            self.initialized = False
             print("🧹 Visual manager Osu limpiado")
         except Exception as e:
             print(f"⚠️ Error limpiando visual: {e}")
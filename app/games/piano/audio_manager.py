@@ -3,13 +3,15 @@ import numpy as np
 import time
 from typing import Dict, List, Tuple
 
+from core.pygame_runtime import get_pygame_runtime
+
 
 class PianoAudioManager:
     """Maneja todo lo relacionado con audio y generación de sonidos del piano"""
     
     def __init__(self):
-        # Configuración de audio
-        self.SAMPLE_RATE = 44100
+        # Configuración de audio (frecuencia real del mixer compartido)
+        self.SAMPLE_RATE = get_pygame_runtime().sample_rate
         self.DURACION_NOTA = 0.8
         self.VOLUMEN = 0.4
         
@@ -27,6 +29,7 @@ class PianoAudioManager:
         
         # Estado de audio
         self.audio_initialized = False
+        self.notas_cache = {}  # Sonidos pre-generados (duración por defecto)
         self.sounds_playing = {}
         self.last_note_played = None
         self.total_notes_played = 0
@@ -36,16 +39,29 @@ class PianoAudioManager:
     
     def _initialize_audio(self):
         """Inicializar sistema de audio"""
-        try:
-            pygame.mixer.pre_init(
-                frequency=self.SAMPLE_RATE, size=-16, channels=2, buffer=512
-            )
-            pygame.mixer.init()
-            self.audio_initialized = True
+        runtime = get_pygame_runtime()
+        self.audio_initialized = runtime.acquire_audio(self)
+        if self.audio_initialized:
+            self.SAMPLE_RATE = runtime.sample_rate
             print("✅ Audio inicializado correctamente")
-        except Exception as e:
-            print(f"❌ Error inicializando audio: {e}")
-            self.audio_initialized = False
+    
+    def _crear_sonido(self, frecuencia: float, duration: float):
+        """Sintetizar una nota como pygame.mixer.Sound"""
+        audio_data = self._generate_sine_wave(frecuencia, duration)
+        
+        # Crear array estéreo
+        stereo_data = np.column_stack((audio_data, audio_data))
+        stereo_data = np.ascontiguousarray(stereo_data, dtype=np.int16)
+        return pygame.sndarray.make_sound(stereo_data)
+    
+    def precargar_notas(self):
+        """Generar de antemano las 8 notas con la duración por defecto"""
+        if not self.audio_initialized:
+            return
+        for index, (nombre, frecuencia, _) in enumerate(self.NOTAS):
+            if index not in self.notas_cache:
+                self.notas_cache[index] = self._crear_sonido(frecuencia, self.DURACION_NOTA)
+        print(f"✅ {len(self.notas_cache)} notas pre-generadas")
     
     def reproducir_nota(self, note_index: int, duration: float = None):
         """Reproducir una nota específica"""
@@ -60,15 +76,12 @@ class PianoAudioManager:
         
         try:
             if self.audio_initialized:
-                # Generar audio
-                audio_data = self._generate_sine_wave(frecuencia, duration)
-                
-                # Crear array estéreo
-                stereo_data = np.column_stack((audio_data, audio_data))
-                stereo_data = np.ascontiguousarray(stereo_data, dtype=np.int16)
-                
-                # Reproducir sonido
-                sound = pygame.sndarray.make_sound(stereo_data)
+                # Usar la nota pre-generada si existe, si no generarla ahora
+                sound = None
+                if duration == self.DURACION_NOTA:
+                    sound = self.notas_cache.get(note_index)
+                if sound is None:
+                    sound = self._crear_sonido(frecuencia, duration)
                 sound.play()
                 
                 # Guardar referencia del sonido
@@ -159,7 +172,7 @@ class PianoAudioManager:
     def detener_todos_sonidos(self):
         """Detener todos los sonidos"""
         if self.audio_initialized:
-            pygame.mixer.stop()
+            get_pygame_runtime().stop_audio()
             self.sounds_playing.clear()
     
     def obtener_info_nota(self, note_index: int) -> Tuple[str, int, str]:
@@ -6,6 +6,9 @@ Maneja reglas, estados y progresión del juego con MELODÍAS FAMOSAS
 import time
 import random
 from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.event_bus import StatusPublisher
 
 # Importar logging cognitivo - SÚPER SIMPLE
 try:
@@ -132,6 +135,9 @@ class PianoGameLogic:
         # Mensaje del juego
         self.game_message = "🎹 Presiona cualquier tecla para empezar"
         
+        # Deltas de estado para la interfaz (solo si alguien escucha)
+        self.status = StatusPublisher("piano_digital")
+        
         print(f"🎵 Piano Simon inicializado: max {self.max_level} niveles con melodías famosas")
     
     def set_callbacks(self, on_play_note=None, on_highlight_note=None, 
@@ -344,6 +350,20 @@ class PianoGameLogic:
         """¿Está esperando input del jugador?"""
         return self.game_state == GameState.PLAYER_INPUT
     
+    def publish_status(self):
+        """Publicar los campos que cambiaron (no hace nada si nadie escucha)"""
+        if self.status.active:
+            self.status.update(
+                game_state=self.game_state.name,
+                level=self.player_level,
+                max_level=self.max_level,
+                input_progress=self.input_progress,
+                sequence_length=len(self.game_sequence),
+                best_level=self.best_level,
+                total_games=self.total_games,
+                perfect_games=self.perfect_games,
+            )
+    
     def get_game_status(self) -> Dict[str, Any]:
         """Obtener estado completo del juego"""
         return {
@@ -8,6 +8,8 @@ import time
 from enum import Enum
 from typing import Callable, Optional
 
+from core.pygame_runtime import PygameLoop, get_pygame_runtime
+
 
 class GameLifecycleState(Enum):
     """Estados del ciclo de vida del juego"""
@@ -28,7 +30,7 @@ class GameStateManager:
         self.state_lock = threading.Lock()
         
         # Control de hilos
-        self.game_thread: Optional[threading.Thread] = None
+        self.game_thread: Optional[PygameLoop] = None
         self.stop_event = threading.Event()
         
         # Callbacks de limpieza
@@ -63,15 +65,10 @@ class GameStateManager:
             self.stop_event.clear()
             
         try:
-            # Crear nuevo hilo
-            self.game_thread = threading.Thread(
-                target=self._run_game_safely,
-                args=(game_loop_func, args, kwargs),
-                daemon=True,
-                name="GameThread"
+            # Loop en el hilo pygame (el que crea la ventana y bombea sus eventos)
+            self.game_thread = get_pygame_runtime().start_loop(
+                self._run_game_safely, game_loop_func, args, kwargs, name="GameThread"
             )
-            
-            self.game_thread.start()
             self.start_time = time.time()
             self.total_runs += 1
             
@@ -70,6 +70,11 @@ class PianoSimonGame(BaseGame):
         self.state_manager.add_cleanup_callback(self.visual_manager.cerrar)
         self.state_manager.add_cleanup_callback(self.hardware_manager.cleanup)
 
+    def prewarm(self):
+        """Pre-generar notas y fuentes antes de iniciar"""
+        self.audio_manager.precargar_notas()
+        self.visual_manager.precargar_recursos()
+
     def initialize_hardware(self) -> bool:
         """Inicializar hardware específico del juego (método abstracto)"""
         return self.hardware_manager.initialize_hardware()
@@ -193,20 +198,23 @@ class PianoSimonGame(BaseGame):
                     callback_test_nota=self._handle_keyboard_test,
                 )
 
-                # Dibujar visualización
-                game_status = self.game_logic.get_game_status()
+                # Publicar cambios de estado a los suscriptores
+                logic = self.game_logic
+                logic.publish_status()
+
+                # Dibujar visualización (lectura directa: sin dict ni copia de secuencia por frame)
                 self.visual_manager.dibujar_todo(
-                    game_state=game_status["game_state"],
-                    game_message=game_status["game_message"],
-                    player_level=game_status["player_level"],
-                    max_level=game_status["max_level"],
-                    game_sequence=game_status["current_sequence"],
-                    input_count=game_status["input_progress"],
+                    game_state=logic.game_state,
+                    game_message=logic.game_message,
+                    player_level=logic.player_level,
+                    max_level=logic.max_level,
+                    game_sequence=logic.game_sequence,
+                    input_count=logic.input_progress,
                     button_pressed=self.hardware_manager.get_button_states(),
                     arduino_connected=self.arduino.connected,
-                    total_games=game_status["total_games"],
-                    best_level=game_status["best_level"],
-                    perfect_games=game_status["perfect_games"],
+                    total_games=logic.total_games,
+                    best_level=logic.best_level,
+                    perfect_games=logic.perfect_games,
                 )
 
                 self.visual_manager.actualizar_display()
@@ -307,21 +315,12 @@ class PianoSimonGame(BaseGame):
     def _get_or_create_patient_id(self) -> str:
         """Obtener patient_id del sistema de gestión o crear uno nuevo"""
         try:
-            # Intentar cargar del sistema de gestión de pacientes específico de piano_simon
-            import json
-            import os
-
-            patients_file = "data/cognitive/piano_simon/patients.json"
-            if os.path.exists(patients_file):
-                with open(patients_file, "r", encoding="utf-8") as f:
-                    patients = json.load(f)
-
-                # Si hay pacientes, usar el último
-                if patients:
-                    latest_patient = max(
-                        patients.keys(), key=lambda k: patients[k].get("created", "")
-                    )
-                    return latest_patient
+            # Registro compartido de pacientes (SQLite, consulta indexada)
+            from core.cognitive.patient_registry import get_patient_registry
+
+            latest_patient = get_patient_registry().get_latest_patient()
+            if latest_patient:
+                return latest_patient["patient_id"]
 
         except Exception as e:
             print(f"⚠️ No se pudo acceder al sistema de pacientes: {e}")
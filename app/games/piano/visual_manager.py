@@ -5,6 +5,8 @@ import numpy as np
 from typing import List, Dict, Any
 from enum import Enum
 
+from core.pygame_runtime import get_pygame_runtime
+
 
 class GameState(Enum):
     WAITING_TO_START = 0
@@ -74,22 +76,32 @@ class PianoVisualManager:
         # NO inicializar Pygame automáticamente - solo cuando se use
         # self._initialize_pygame()
     
+    def _crear_fuentes(self):
+        """Crear fuentes y clock (no necesita ventana)"""
+        self.font_large = pygame.font.Font(None, 48)
+        self.font_medium = pygame.font.Font(None, 32)
+        self.font_small = pygame.font.Font(None, 24)
+        self.clock = pygame.time.Clock()
+    
+    def precargar_recursos(self):
+        """Pre-cargar fuentes antes de abrir la ventana (pool de juegos pre-calentados)"""
+        if self.font_large is None and get_pygame_runtime().ensure_initialized():
+            self._crear_fuentes()
+    
     def _initialize_pygame(self):
         """Inicializar componentes de Pygame"""
         if not self.pygame_initialized:
             try:
-                pygame.init()
-                self.screen = pygame.display.set_mode(
-                    (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+                # Ventana compartida de la plataforma (no se recrea al cambiar de juego)
+                self.screen = get_pygame_runtime().acquire_display(
+                    self, (self.WINDOW_WIDTH, self.WINDOW_HEIGHT),
+                    "Piano Simon Says - Arduino + Python"
                 )
-                pygame.display.set_caption("Piano Simon Says - Arduino + Python")
                 
-                # Fuentes
-                self.font_large = pygame.font.Font(None, 48)
-                self.font_medium = pygame.font.Font(None, 32)
-                self.font_small = pygame.font.Font(None, 24)
+                # Fuentes y clock (ya creados si el juego se pre-cargó)
+                if self.font_large is None:
+                    self._crear_fuentes()
                 
-                self.clock = pygame.time.Clock()
                 self.pygame_initialized = True
                 print("✅ Pygame inicializado correctamente")
             except Exception as e:
@@ -553,29 +565,16 @@ class PianoVisualManager:
             self.key_highlights = [0.0] * 8
             self.note_particles.clear()
             
-            # Cerrar Pygame solo si está inicializado
+            # Devolver la ventana al runtime (queda abierta para el siguiente juego)
             if self.pygame_initialized:
-                if self.screen:
-                    # Llenar pantalla de negro antes de cerrar
-                    self.screen.fill((0, 0, 0))
-                    pygame.display.flip()
-                
-                # Cerrar Pygame limpiamente
-                pygame.quit()
-                self.pygame_initialized = False
-                self.screen = None
-                print("✅ Pygame cerrado correctamente")
+                get_pygame_runtime().release_display(self)
+                print("✅ Ventana liberada correctamente")
             
         except Exception as e:
             print(f"⚠️ Error cerrando visual manager: {e}")
-            # Forzar cierre si hay problemas
-            try:
-                pygame.quit()
-            except:
-                pass
-            finally:
-                self.pygame_initialized = False
-                self.screen = None
+        finally:
+            self.pygame_initialized = False
+            self.screen = None
     
     def is_initialized(self) -> bool:
         """¿Está el visual manager inicializado?"""
@@ -1,6 +1,5 @@
 import pygame
 import time
-import threading
 from typing import Dict, Any
 from abc import ABC, abstractmethod
 
@@ -8,6 +7,7 @@ from core.base_game import BaseGame
 from core.arduino_manager import ArduinoManager
 from core.lcd.lcd_controller import LCDController, ButtonReader
 from core.game_logger import GameLogger
+from core.pygame_runtime import get_pygame_runtime
 
 from games.ping_pong.ping_pong_pygame_renderer import PingPongPygameRenderer
 
@@ -106,8 +106,8 @@ class PingPongGame(BaseGame):
             self._show_welcome_screen()
 
             # Iniciar hilo del juego
-            self.game_thread = threading.Thread(target=self._game_loop, daemon=True)
-            self.game_thread.start()
+            # En el hilo pygame: el mismo que creó la ventana bombea sus eventos
+            self.game_thread = get_pygame_runtime().start_loop(self._game_loop, name="ping-pong")
 
             print("🎮 Ping Pong iniciado correctamente")
             return True
@@ -135,8 +135,11 @@ class PingPongGame(BaseGame):
             # Log final del juego
             if self.game_start_time:
                 total_duration = time.time() - self.game_start_time
-                self.logger.log_game_event("GAME", f"✅ Juego detenido - Duración total: {total_duration:.2f}s")
+                self.logger.log_game_event("GAME", f"✅ Juego detenido - Duración total: {total_duration:.2f}s",
+                                           fields={"game_duration": total_duration})
 
+            # Vaciar la cola de logs antes de dar el juego por detenido
+            self.logger.flush()
             print("✅ Ping Pong detenido")
 
         except Exception as e:
@@ -327,8 +330,10 @@ class PingPongGame(BaseGame):
         self.ball_y += self.ball_dy
 
         # Log movimiento de pelota (solo ocasionalmente para no saturar)
+        # x_pos/y_pos = primer par del texto, igual que lo extrae LogParser del .log
         if self.score % 3 == 0 or abs(self.ball_x - old_x) > 1:
-            self.logger.log_game_event("BALL", f"Pelota movida de ({old_x}, {old_y}) a ({self.ball_x}, {self.ball_y})")
+            self.logger.log_game_event("BALL", f"Pelota movida de ({old_x}, {old_y}) a ({self.ball_x}, {self.ball_y})",
+                                       fields={"x_pos": old_x, "y_pos": old_y})
 
         # Colisiones verticales
         if self.ball_y < 0:
@@ -348,7 +353,8 @@ class PingPongGame(BaseGame):
                 self.score += 1
                 self.total_hits += 1
                 self.left_paddle_hits += 1
-                self.logger.log_game_event("HIT", f"🏓 GOLPE EXITOSO con pala IZQUIERDA - Nuevo score: {self.score}")
+                self.logger.log_game_event("HIT", f"🏓 GOLPE EXITOSO con pala IZQUIERDA - Nuevo score: {self.score}",
+                                           fields={"score": self.score})
             else:
                 self._handle_game_over("LEFT", "Pala izquierda no estaba activa")
                 return
@@ -359,7 +365,8 @@ class PingPongGame(BaseGame):
                 self.score += 1
                 self.total_hits += 1
                 self.right_paddle_hits += 1
-                self.logger.log_game_event("HIT", f"🏓 GOLPE EXITOSO con pala DERECHA - Nuevo score: {self.score}")
+                self.logger.log_game_event("HIT", f"🏓 GOLPE EXITOSO con pala DERECHA - Nuevo score: {self.score}",
+                                           fields={"score": self.score})
             else:
                 self._handle_game_over("RIGHT", "Pala derecha no estaba activa")
                 return
@@ -369,7 +376,8 @@ class PingPongGame(BaseGame):
             old_speed = self.game_speed
             self.game_speed = max(0.1, self.game_speed - 0.02)
             if old_speed != self.game_speed:
-                self.logger.log_game_event("SPEED", f"⚡ Velocidad aumentada de {old_speed:.2f}s a {self.game_speed:.2f}s")
+                self.logger.log_game_event("SPEED", f"⚡ Velocidad aumentada de {old_speed:.2f}s a {self.game_speed:.2f}s",
+                                           fields={"speed": self.game_speed})
 
         self._draw_game()
 
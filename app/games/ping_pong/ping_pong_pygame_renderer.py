@@ -1,6 +1,8 @@
 import pygame
 from typing import Optional, Tuple
 
+from core.pygame_runtime import get_pygame_runtime
+
 class PingPongPygameRenderer:
     """Manejador de visualización con Pygame"""
 
@@ -31,9 +33,9 @@ class PingPongPygameRenderer:
     def initialize(self):
         """Inicializar Pygame"""
         if not self.initialized:
-            pygame.init()
-            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-            pygame.display.set_caption("Ping Pong - Arduino + Python")
+            self.screen = get_pygame_runtime().acquire_display(
+                self, (self.screen_width, self.screen_height), "Ping Pong - Arduino + Python"
+            )
 
             # Inicializar fuentes
             self.font_large = pygame.font.Font(None, 48)
@@ -44,21 +46,15 @@ class PingPongPygameRenderer:
             self.initialized = True
 
     def quit(self):
-        """Cerrar Pygame de forma segura"""
+        """Devolver la ventana al runtime (queda abierta para el siguiente juego)"""
         try:
             if self.initialized:
-                pygame.display.quit()
-                pygame.quit()
-                self.initialized = False
-                print("✅ Pygame cerrado correctamente")
+                get_pygame_runtime().release_display(self)
+                print("✅ Ventana liberada correctamente")
         except Exception as e:
-            print(f"⚠️ Error cerrando Pygame: {e}")
-            # Forzar cierre si hay problemas
-            try:
-                pygame.quit()
-                self.initialized = False
-            except:
-                pass
+            print(f"⚠️ Error liberando ventana: {e}")
+        finally:
+            self.initialized = False
 
     def draw_game(self, ball_x: int, ball_y: int, left_paddle_active: bool,
                   right_paddle_active: bool, score: int, game_over: bool,
@@ -1,6 +1,5 @@
 import pygame
 import time
-import threading
 import math
 import random
 from typing import Dict, Any, List, Tuple
@@ -10,6 +9,7 @@ from core.base_game import BaseGame
 from core.arduino_manager import ArduinoManager
 from core.lcd.lcd_controller import LCDController, ButtonReader
 from core.game_logger import GameLogger
+from core.pygame_runtime import get_pygame_runtime
 
 class TwoLaneRunnerGame(BaseGame):
     """Two-Lane Runner que implementa BaseGame"""
@@ -176,9 +176,9 @@ class TwoLaneRunnerGame(BaseGame):
     def _initialize_pygame(self):
         """Inicializar componentes de Pygame"""
         if not self.pygame_initialized:
-            pygame.init()
-            self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-            pygame.display.set_caption("Two-Lane Runner - Arduino + Python")
+            self.screen = get_pygame_runtime().acquire_display(
+                self, (self.WINDOW_WIDTH, self.WINDOW_HEIGHT), "Two-Lane Runner - Arduino + Python"
+            )
 
             # Fuentes
             self.font_large = pygame.font.Font(None, 48)
@@ -205,8 +205,8 @@ class TwoLaneRunnerGame(BaseGame):
             self._show_welcome_screen()
 
             # Iniciar hilo del juego
-            self.game_thread = threading.Thread(target=self._game_loop, daemon=True)
-            self.game_thread.start()
+            # En el hilo pygame: el mismo que creó la ventana bombea sus eventos
+            self.game_thread = get_pygame_runtime().start_loop(self._game_loop, name="two-lanes")
 
             print("🏃 Two-Lane Runner iniciado correctamente")
             return True
@@ -230,24 +230,19 @@ class TwoLaneRunnerGame(BaseGame):
                 self.lcd.clear()
 
             if self.pygame_initialized:
-                try:
-                    pygame.display.quit()
-                    pygame.quit()
-                    self.pygame_initialized = False
-                    self.logger.log_game_event("HARDWARE", "Pygame cerrado correctamente")
-                except Exception as e:
-                    self.logger.log_game_event("HARDWARE", f"Error cerrando Pygame: {e}", "WARNING")
-                    try:
-                        pygame.quit()
-                        self.pygame_initialized = False
-                    except:
-                        pass
+                # Devolver la ventana al runtime (queda abierta para el siguiente juego)
+                get_pygame_runtime().release_display(self)
+                self.pygame_initialized = False
+                self.logger.log_game_event("HARDWARE", "Ventana pygame liberada")
 
             # Log final del juego
             if self.game_start_time:
                 total_duration = time.time() - self.game_start_time
-                self.logger.log_game_event("GAME", f"✅ Juego detenido - Duración total: {total_duration:.2f}s")
+                self.logger.log_game_event("GAME", f"✅ Juego detenido - Duración total: {total_duration:.2f}s",
+                                           fields={"game_duration": total_duration})
 
+            # Vaciar la cola de logs antes de dar el juego por detenido
+            self.logger.flush()
             print("✅ Two-Lane Runner detenido")
 
         except Exception as e:
@@ -424,13 +419,15 @@ class TwoLaneRunnerGame(BaseGame):
                 self.obstacles.remove(obstacle)
                 self.score += 1
                 self.obstacles_dodged += 1
-                self.logger.log_game_event("SCORE", f"🎯 Obstáculo esquivado - Score: {self.score} | Total esquivados: {self.obstacles_dodged}")
+                self.logger.log_game_event("SCORE", f"🎯 Obstáculo esquivado - Score: {self.score} | Total esquivados: {self.obstacles_dodged}",
+                                           fields={"score": self.score, "obstacles_dodged": self.obstacles_dodged})
 
                 # Aumentar velocidad cada 10 puntos
                 if self.score % 10 == 0:
                     old_speed = self.game_speed
                     self.game_speed = max(self.MIN_SPEED, self.game_speed - 0.03)
-                    self.logger.log_game_event("SPEED", f"⚡ Velocidad aumentada de {old_speed:.2f}s a {self.game_speed:.2f}s")
+                    self.logger.log_game_event("SPEED", f"⚡ Velocidad aumentada de {old_speed:.2f}s a {self.game_speed:.2f}s",
+                                               fields={"speed": self.game_speed})
 
         # Generar nuevos obstáculos
         self.scroll_counter += 1
@@ -528,7 +525,8 @@ class TwoLaneRunnerGame(BaseGame):
         if self.score > self.best_score:
             self.best_score = self.score
             
-        self.logger.log_game_event("GAME", f"💀 GAME OVER mostrado - Score final: {self.score}")
+        self.logger.log_game_event("GAME", f"💀 GAME OVER mostrado - Score final: {self.score}",
+                                   fields={"score": self.score})
 
     def _draw_pygame_visualization(self):
         """Dibujar visualización completa en Pygame"""
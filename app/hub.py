@@ -0,0 +1,87 @@
+"""
+Hub central de datos cognitivos y envío de sesiones desde una estación
+
+    python hub.py serve --root data/hub --host 0.0.0.0 --port 8770 --token SECRETO
+    python hub.py serve --root data/hub     (solo este equipo, sin token)
+    python hub.py push --hub http://hub.local:8770 --token SECRETO
+    python hub.py push --local data/hub          (hub local de prueba, sin red)
+"""
+
+import argparse
+import signal
+import threading
+
+from core.cognitive.hub_ingester import HubIngester
+from core.cognitive.session_sync import HttpHubClient, LocalHub, SyncAgent
+from managers.hub.hub_server import DEFAULT_HUB_HOST, DEFAULT_HUB_PORT, HubServer
+
+
+def serve(args):
+    """Servicio hub hasta SIGINT/SIGTERM"""
+    ingester = HubIngester(args.root)
+    try:
+        server = HubServer(ingester, args.host, args.port, token=args.token)
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo abrir el hub en {args.host}:{args.port}: {e}")
+        ingester.close()
+        return
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    server.start()
+    print(f"🌐 Hub escuchando en http://{args.host}:{args.port} (datos en {args.root})")
+    if not args.token:
+        print("⚠️ Hub sin token: solo acepta sesiones de este equipo")
+    try:
+        while not stop.wait(1.0):
+            pass
+    finally:
+        server.stop()
+        ingester.close()
+        print("👋 Hub cerrado")
+
+
+def push(args):
+    """Una pasada de sincronización de esta estación"""
+    if args.local:
+        hub = LocalHub(args.local)
+    elif args.hub:
+        hub = HttpHubClient(args.hub, token=args.token)
+    else:
+        print("❌ Indica --hub URL o --local CARPETA")
+        return
+    agent = SyncAgent(hub, station_id=args.station)
+    print(f"📤 Estación {agent.station_id}: sincronizando sesiones...")
+    try:
+        agent.sync_once()
+    except OSError as e:
+        print(f"❌ Hub no disponible: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arduino Multi-Game Platform - hub de datos cognitivos")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Ejecutar el servicio hub")
+    serve_parser.add_argument("--root", default="data/hub", help="Carpeta de datos del hub")
+    serve_parser.add_argument("--host", default=DEFAULT_HUB_HOST,
+                              help=f"Dirección de escucha (por defecto {DEFAULT_HUB_HOST}; otra exige --token)")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_HUB_PORT)
+    serve_parser.add_argument("--token", help="Token compartido que deben enviar las estaciones")
+    serve_parser.set_defaults(run=serve)
+
+    push_parser = commands.add_parser("push", help="Enviar al hub las sesiones nuevas de esta estación")
+    push_parser.add_argument("--hub", metavar="URL", help="URL del servicio hub")
+    push_parser.add_argument("--local", metavar="CARPETA", help="Hub local de prueba en esta carpeta")
+    push_parser.add_argument("--token", help="Token del hub")
+    push_parser.add_argument("--station", help="ID de esta estación (por defecto, el nombre del equipo)")
+    push_parser.set_defaults(run=push)
+
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,29 @@
+import argparse
+
 from ui.main_window import MainWindow
-from core.arduino_manager import ArduinoManager
+from core.arduino_manager import ArduinoManager, is_arduino_like, list_serial_ports
+from core.cognitive.session_journal import recover_incomplete_sessions
+
+
+def parse_stations(value: str):
+    """'COM3,COM4' o 'auto' -> [(station_id, port), ...]"""
+    if value == "auto":
+        ports = [device for device, description in list_serial_ports() if is_arduino_like(description)]
+    else:
+        ports = [port.strip() for port in value.split(",") if port.strip()]
+    return [(f"E{index}", port) for index, port in enumerate(ports, start=1)]
 
 
 def main():
     """Función principal"""
+    parser = argparse.ArgumentParser(description="Arduino Multi-Game Platform")
+    parser.add_argument(
+        "--stations",
+        metavar="PUERTOS",
+        help="Modo multi-estación: puertos separados por coma (p. ej. COM3,COM4) o 'auto'",
+    )
+    args = parser.parse_args()
+
     print("🎮 Arduino Multi-Game Platform - Versión 2.0")
     print("=" * 60)
     print("🎯 Juegos disponibles: Ping Pong, Two-Lane Runner")
@@ -12,6 +32,18 @@ def main():
     print("=" * 60)
 
     try:
+        # Reparar sesiones cognitivas que quedaron abiertas por un cierre abrupto
+        recover_incomplete_sessions()
+
+        if args.stations:
+            stations = parse_stations(args.stations)
+            if not stations:
+                print("❌ No se encontraron puertos para las estaciones")
+                return
+            from ui.station_dashboard import StationDashboard
+            StationDashboard(stations).run()
+            return
+
         arduino_manager = ArduinoManager()
         app = MainWindow(arduino_manager)
         app.run()
@@ -3,19 +3,52 @@ Componentes modularizados para el GameController
 
 Responsabilidades separadas:
 - GameRegistry: Registro y metadatos de juegos
-- GameLifecycle: Inicio, parada y ciclo de vida  
+- GameLifecycle: Inicio, parada y ciclo de vida
+- LifecycleWorker: Transiciones de juegos fuera del hilo de Tk
+- GameWarmPool: Juego probable construido de antemano en el menú
 - GameUIManager: Creación de interfaces y widgets
 - GameStatusManager: Ventanas de estado detallado
+
+Los componentes se importan al primer acceso: el daemon sin interfaz usa
+GameRegistry y GameLifecycle sin cargar tkinter (GameUIManager y
+GameStatusManager solo se cargan desde la interfaz).
 """
 
-from .game_registry import GameRegistry
-from .game_lifecycle import GameLifecycle
-from .game_ui_manager import GameUIManager
-from .game_status_manager import GameStatusManager
-
-__all__ = [
-    "GameRegistry",
-    "GameLifecycle", 
-    "GameUIManager",
-    "GameStatusManager"
-] 
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING
+
+# Nombre público -> submódulo que lo define
+_LAZY_ATTRS = {
+    "GameRegistry": "game_registry",
+    "GameLifecycle": "game_lifecycle",
+    "LifecycleWorker": "lifecycle_worker",
+    "LifecycleTask": "lifecycle_worker",
+    "GameWarmPool": "game_warm_pool",
+    "GameUIManager": "game_ui_manager",
+    "GameStatusManager": "game_status_manager",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .game_registry import GameRegistry
+    from .game_lifecycle import GameLifecycle
+    from .lifecycle_worker import LifecycleWorker, LifecycleTask
+    from .game_warm_pool import GameWarmPool
+    from .game_ui_manager import GameUIManager
+    from .game_status_manager import GameStatusManager
+
+
+def __getattr__(name: str):
+    """Importar el submódulo del componente pedido y cachearlo en el paquete"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
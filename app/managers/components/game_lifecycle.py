@@ -1,35 +1,85 @@
 """
 Manejo del ciclo de vida de juegos (inicio, parada, estado)
+
+Los métodos síncronos (start_game, start_test_mode, stop_current_game)
+bloquean: hardware, LCD, ventana pygame y joins de hilos. La interfaz usa
+las variantes *_async, que los ejecutan en el LifecycleWorker y devuelven
+el resultado y el progreso en el hilo de Tk.
+
+Con warm_games, el juego probable se construye de antemano en el menú
+(GameWarmPool) y start_game lo toma ya listo.
+
+Con un paciente seleccionado (set_patient), los juegos con logging
+cognitivo se construyen registrando la sesión a su nombre. El logger no
+crea archivos hasta el primer evento: un juego pre-calentado que se descarta
+no deja sesión en disco.
 """
 
+import threading
 import time
-from typing import Optional
-from tkinter import messagebox
+from typing import Callable, Optional
 from core.base_game import BaseGame
 from core.safe_game_manager import SafeGameManager
 from core.arduino_manager import ArduinoManager
 from .game_registry import GameRegistry
+from .game_warm_pool import GameWarmPool
+from .lifecycle_worker import LifecycleCancelled, LifecycleTask, LifecycleWorker
+
+SWITCH_PAUSE_SECONDS = 0.5  # Pausa entre detener un juego e iniciar otro
 
 
 class GameLifecycle:
     """Maneja el ciclo de vida completo de los juegos"""
-    
-    def __init__(self, arduino_manager: ArduinoManager, game_registry: GameRegistry):
+
+    def __init__(self, arduino_manager: ArduinoManager, game_registry: GameRegistry, root=None,
+                 warm_games: bool = True):
         self.arduino = arduino_manager
         self.registry = game_registry
         self.safe_manager = SafeGameManager()
         self.current_game: Optional[BaseGame] = None
-    
+        self._current_game_id: Optional[str] = None
+        self._last_game_id: Optional[str] = None
+        self.patient_id: Optional[str] = None
+
+        # Juego pre-calentado en el menú (opcional)
+        self.warm_pool = GameWarmPool(self._build_game) if warm_games else None
+
+        # Transiciones en segundo plano (una a la vez, la más nueva reemplaza a la pendiente)
+        self.worker = LifecycleWorker(root)
+        self._transition: Optional[LifecycleTask] = None
+        self._lock = threading.RLock()
+
     def is_game_running(self) -> bool:
         """Verificar si hay un juego ejecutándose"""
         return self.safe_manager.is_game_running()
-    
+
     def get_current_game(self) -> Optional[BaseGame]:
         """Obtener el juego actual"""
         return self.current_game
-    
+
+    def get_current_game_id(self) -> Optional[str]:
+        """Obtener el game_id del juego actual"""
+        return self._current_game_id if self.current_game else None
+
+    def set_patient(self, patient_id: Optional[str]):
+        """Paciente de los próximos juegos (None = sin logging cognitivo)"""
+        if patient_id == self.patient_id:
+            return
+        self.patient_id = patient_id
+        # El juego pre-calentado se construyó para el paciente anterior
+        if self.warm_pool:
+            self.warm_pool.discard()
+
     def stop_current_game(self) -> bool:
         """Detener juego actual de forma segura"""
+        with self._lock:
+            stopped = self._stop_current_game()
+        # De vuelta en el menú: lo más probable es repetir el mismo juego
+        if stopped and self._last_game_id:
+            self.prewarm(self._last_game_id)
+        return stopped
+
+    def _stop_current_game(self) -> bool:
         if not self.current_game:
             return True
 
@@ -60,8 +110,70 @@ class GameLifecycle:
             except Exception as emergency_error:
                 print(f"💀 Error en parada de emergencia: {emergency_error}")
                 return False
-    
-    def start_game(self, game_id: str) -> tuple[bool, str]:
+
+    def _stop_before_switch(self, task: Optional[LifecycleTask]) -> Optional[str]:
+        """Detener el juego actual antes de iniciar otro - retorna error o None"""
+        if not (self.current_game and self.is_game_running()):
+            return None
+
+        print("🔄 Deteniendo juego actual antes de iniciar nuevo...")
+        if task:
+            task.report(f"Deteniendo {self.current_game.name}...")
+        if not self._stop_current_game():
+            return "No se pudo detener el juego actual"
+
+        # Pequeña pausa para asegurar limpieza
+        if task:
+            task.wait(SWITCH_PAUSE_SECONDS)
+        else:
+            time.sleep(SWITCH_PAUSE_SECONDS)
+        return None
+
+    def _build_game(self, game_id: str) -> BaseGame:
+        """Importar (la primera vez) e instanciar el juego"""
+        game_class = self.registry.get_game_class(game_id)
+        if self.patient_id and self.registry.supports_cognitive_logging(game_id):
+            return game_class(self.arduino, enable_cognitive_logging=True, patient_id=self.patient_id)
+        return game_class(self.arduino)
+
+    def _create_game(self, game_id: str, task: Optional[LifecycleTask]) -> BaseGame:
+        """Tomar la instancia pre-calentada o construir una nueva"""
+        if task:
+            task.report(f"Cargando {self.registry.get_game_name(game_id)}...")
+        game = None
+        if self.warm_pool:
+            game = self.warm_pool.take(game_id)
+            # Otro juego pre-calentado ya no sirve
+            self.warm_pool.discard()
+        if game is None:
+            game = self._build_game(game_id)
+        else:
+            print(f"⚡ Usando {game.name} pre-cargado")
+        if task:
+            task.check_cancelled()
+        return game
+
+    def prewarm(self, game_id: str):
+        """Construir game_id en segundo plano si estamos en el menú"""
+        if not self.warm_pool or not self.registry.is_valid_game(game_id):
+            return
+        if self.is_game_running() or self.is_transition_in_progress():
+            return
+        self.warm_pool.prepare(game_id)
+
+    def _activate(self, game_id: str, new_game: BaseGame, task: Optional[LifecycleTask]):
+        """Registrar el juego recién iniciado; si se canceló mientras arrancaba, detenerlo"""
+        self.current_game = new_game
+        self._current_game_id = game_id
+        self._last_game_id = game_id
+        self.safe_manager.set_current_game(new_game)
+
+        if task and task.cancelled:
+            print(f"↩️ Inicio de {new_game.name} cancelado, deteniendo...")
+            self._stop_current_game()
+            raise LifecycleCancelled(task.description)
+
+    def start_game(self, game_id: str, task: Optional[LifecycleTask] = None) -> tuple[bool, str]:
         """
         Iniciar un juego
         Returns: (success: bool, message: str)
@@ -69,41 +181,42 @@ class GameLifecycle:
         # Validaciones previas
         if not self.arduino.connected:
             return False, "Conecta el Arduino primero"
-        
+
         if not self.registry.is_valid_game(game_id):
             return False, f"Juego '{game_id}' no es válido"
 
-        # Detener juego actual si existe
-        if self.current_game and self.is_game_running():
-            print("🔄 Deteniendo juego actual antes de iniciar nuevo...")
-            if not self.stop_current_game():
-                return False, "No se pudo detener el juego actual"
-            time.sleep(0.5)  # Pequeña pausa para asegurar limpieza
+        with self._lock:
+            # Detener juego actual si existe
+            error = self._stop_before_switch(task)
+            if error:
+                return False, error
 
-        # Crear e inicializar nuevo juego
-        try:
-            game_class = self.registry.get_game_class(game_id)
-            new_game = game_class(self.arduino)
+            # Crear e inicializar nuevo juego
+            try:
+                new_game = self._create_game(game_id, task)
+
+                if task:
+                    task.report(f"Iniciando {new_game.name}...")
+                if not new_game.start_game():
+                    return False, f"No se pudo iniciar {new_game.name}"
 
-            if not new_game.start_game():
-                return False, f"No se pudo iniciar {new_game.name}"
+                # Establecer como juego actual
+                self._activate(game_id, new_game, task)
+
+                success_msg = (
+                    f"🎮 {self.current_game.name} iniciado correctamente!\n\n"
+                    f"Descripción: {self.current_game.description}\n\n"
+                    f"¡Diviértete jugando!"
+                )
 
-            # Establecer como juego actual
-            self.current_game = new_game
-            self.safe_manager.set_current_game(new_game)
+                return True, success_msg
 
-            success_msg = (
-                f"🎮 {self.current_game.name} iniciado correctamente!\n\n"
-                f"Descripción: {self.current_game.description}\n\n"
-                f"¡Diviértete jugando!"
-            )
-            
-            return True, success_msg
+            except LifecycleCancelled:
+                raise
+            except Exception as e:
+                return False, f"Error iniciando juego: {e}"
 
-        except Exception as e:
-            return False, f"Error iniciando juego: {e}"
-    
-    def start_test_mode(self, game_id: str) -> tuple[bool, str]:
+    def start_test_mode(self, game_id: str, task: Optional[LifecycleTask] = None) -> tuple[bool, str]:
         """
         Iniciar modo de prueba para un juego
         Returns: (success: bool, message: str)
@@ -111,44 +224,94 @@ class GameLifecycle:
         # Validaciones previas
         if not self.arduino.connected:
             return False, "Conecta el Arduino primero"
-        
+
         if game_id not in self.registry.get_games_with_test_mode():
             return False, f"El modo prueba no está disponible para este juego"
 
-        # Detener juego actual si existe
-        if self.current_game and self.is_game_running():
-            print("🔄 Deteniendo juego actual antes de iniciar modo prueba...")
-            if not self.stop_current_game():
-                return False, "No se pudo detener el juego actual"
-            time.sleep(0.5)
+        with self._lock:
+            # Detener juego actual si existe
+            error = self._stop_before_switch(task)
+            if error:
+                return False, error
 
-        # Iniciar modo de prueba
-        try:
-            game_class = self.registry.get_game_class(game_id)
-            new_game = game_class(self.arduino)
+            # Iniciar modo de prueba
+            try:
+                new_game = self._create_game(game_id, task)
 
-            if hasattr(new_game, "start_test_mode"):
-                if not new_game.start_test_mode():
-                    return False, f"No se pudo iniciar modo prueba para {new_game.name}"
+                if hasattr(new_game, "start_test_mode"):
+                    if task:
+                        task.report(f"Iniciando modo prueba de {new_game.name}...")
+                    if not new_game.start_test_mode():
+                        return False, f"No se pudo iniciar modo prueba para {new_game.name}"
 
-                # Establecer como juego actual
-                self.current_game = new_game
-                self.safe_manager.set_current_game(new_game)
-
-                test_msg = (
-                    f"🧪 Modo de prueba para {self.current_game.name} iniciado!\n\n"
-                    f"Presiona los botones conectados a los pines 2-9 para probar\n"
-                    f"las notas musicales. También puedes usar las teclas 1-8.\n\n"
-                    f"ESC = Salir | R = Reiniciar"
-                )
-                
-                return True, test_msg
-            else:
-                return False, f"El modo prueba no está disponible para {new_game.name}"
+                    # Establecer como juego actual
+                    self._activate(game_id, new_game, task)
+
+                    test_msg = (
+                        f"🧪 Modo de prueba para {self.current_game.name} iniciado!\n\n"
+                        f"Presiona los botones conectados a los pines 2-9 para probar\n"
+                        f"las notas musicales. También puedes usar las teclas 1-8.\n\n"
+                        f"ESC = Salir | R = Reiniciar"
+                    )
+
+                    return True, test_msg
+                else:
+                    return False, f"El modo prueba no está disponible para {new_game.name}"
+
+            except LifecycleCancelled:
+                raise
+            except Exception as e:
+                return False, f"Error iniciando modo prueba: {e}"
+
+    # ===== TRANSICIONES EN SEGUNDO PLANO =====
+
+    def start_game_async(self, game_id: str, on_done: Callable[[bool, str, bool], None],
+                         on_progress: Optional[Callable[[str], None]] = None) -> LifecycleTask:
+        """Iniciar un juego sin bloquear la interfaz"""
+        return self._submit("Inicio de juego", lambda task: self.start_game(game_id, task),
+                            on_done, on_progress)
+
+    def start_test_mode_async(self, game_id: str, on_done: Callable[[bool, str, bool], None],
+                              on_progress: Optional[Callable[[str], None]] = None) -> LifecycleTask:
+        """Iniciar modo de prueba sin bloquear la interfaz"""
+        return self._submit("Modo prueba", lambda task: self.start_test_mode(game_id, task),
+                            on_done, on_progress)
+
+    def stop_current_game_async(self, on_done: Callable[[bool, str, bool], None],
+                                on_progress: Optional[Callable[[str], None]] = None) -> LifecycleTask:
+        """Detener el juego actual sin bloquear la interfaz"""
+        def job(task: LifecycleTask):
+            game_name = getattr(self.current_game, "name", "Juego")
+            task.report(f"Deteniendo {game_name}...")
+            return self.stop_current_game(), game_name
+
+        return self._submit("Detención de juego", job, on_done, on_progress)
+
+    def _submit(self, description: str, job, on_done, on_progress) -> LifecycleTask:
+        # Una transición nueva reemplaza a la que aún no terminó
+        self.cancel_transition()
+        self._transition = self.worker.submit(description, job, on_done, on_progress)
+        return self._transition
+
+    def is_transition_in_progress(self) -> bool:
+        """Verificar si hay un inicio/parada en curso o en cola"""
+        return self._transition is not None and not self._transition.done()
+
+    def cancel_transition(self) -> bool:
+        """Cancelar la transición en curso - retorna si había alguna"""
+        if not self.is_transition_in_progress():
+            return False
+        print(f"✋ Cancelando: {self._transition.description}")
+        self._transition.cancel()
+        return True
+
+    def shutdown(self):
+        """Cancelar transiciones y esperar a que el worker termine (al cerrar la app)"""
+        self.cancel_transition()
+        if self.warm_pool:
+            self.warm_pool.shutdown()
+        self.worker.shutdown(wait=True)
 
-        except Exception as e:
-            return False, f"Error iniciando modo prueba: {e}"
-    
     def force_stop_all(self):
         """Parada de emergencia para casos críticos"""
         print("🚨 FORZANDO PARADA DE TODOS LOS JUEGOS")
@@ -158,16 +321,16 @@ class GameLifecycle:
             print("✅ Parada forzada completada")
         except Exception as e:
             print(f"💀 Error en parada forzada: {e}")
-    
+
     def get_current_game_status(self) -> dict:
         """Obtener estado del juego actual"""
         if not self.current_game:
             return {"running": False, "game": None}
-        
+
         try:
             status = self.current_game.get_game_status()
             status["running"] = self.is_game_running()
             return status
         except Exception as e:
             print(f"❌ Error obteniendo estado del juego: {e}")
-            return {"running": False, "error": str(e)} 
\ No newline at end of file
+            return {"running": False, "error": str(e)}
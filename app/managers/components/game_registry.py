@@ -1,108 +1,170 @@
 """
 Registro de juegos disponibles y sus metadatos
+
+Los juegos se declaran como plugins: nombre, icono, descripción e info
+técnica/cognitiva viven aquí, y el módulo del juego (pygame, numpy,
+logging cognitivo...) solo se importa al lanzarlo. Así la ventana principal
+aparece sin cargar ningún juego.
 """
 
-from typing import Dict, Type
+import importlib
+from dataclasses import dataclass
+from typing import Dict, Optional, Type
+
 from core.base_game import BaseGame
-from games.ping_pong.ping_pong import PingPongGame
-from games.two_lanes.two_lanes import TwoLaneRunnerGame
-from games.piano.piano import PianoSimonGame
-from games.osu.osu import OsuGame
+
+
+@dataclass(frozen=True)
+class GamePlugin:
+    """Metadatos de un juego + dónde está su clase (importada bajo demanda)"""
+    game_id: str
+    module: str
+    class_name: str
+    name: str
+    description: str
+    icon: str = "🎮"
+    tech_info: str = "Información técnica no disponible"
+    cognitive_info: str = ""  # Vacío = sin logging cognitivo
+    test_mode: bool = False
+
+    @property
+    def supports_cognitive_logging(self) -> bool:
+        return bool(self.cognitive_info)
+
+
+# Registro de juegos disponibles (orden = orden en la interfaz)
+GAME_PLUGINS = (
+    GamePlugin(
+        "ping_pong", "games.ping_pong.ping_pong", "PingPongGame",
+        name="Ping Pong",
+        description="Juego clásico de Ping Pong con LCD y botones",
+        icon="🏓",
+        tech_info="Juego de Ping Pong con dos palas y una pelota. Requiere sensores de movimiento.",
+    ),
+    GamePlugin(
+        "two_lane_runner", "games.two_lanes.two_lanes", "TwoLaneRunnerGame",
+        name="Two-Lane Runner",
+        description="Esquiva obstáculos corriendo entre dos carriles",
+        icon="🏃",
+        tech_info="Juego de carreras en dos carriles. Utiliza sensores de distancia para detectar obstáculos.",
+        # Futuro: "🧠 Evalúa atención dividida, coordinación, tiempo de reacción"
+    ),
+    GamePlugin(
+        "piano_digital", "games.piano.piano", "PianoSimonGame",
+        name="Piano Simon Says",
+        description="Juego Simon Says usando piano digital de 8 notas",
+        icon="🎹",
+        tech_info="Piano digital con teclas táctiles. Requiere sensores capacitivos en pines 2-9.",
+        cognitive_info="🧠 Evalúa memoria, secuencias, tiempo de reacción, fatiga cognitiva",
+        test_mode=True,
+    ),
+    GamePlugin(
+        "osu_rhythm", "games.osu.osu", "OsuGame",
+        name="Ossa! Rhythm Game",
+        description="Juego de ritmo y precisión usando joystick analógico KY-023",
+        icon="🎯",
+        tech_info="Juego de ritmo y precisión. Requiere joystick analógico KY-023 en pines A0, A1 y D2.",
+        cognitive_info="🧠 Evalúa coordinación ojo-mano, precisión espacial, timing, velocidad de procesamiento",
+        test_mode=True,
+    ),
+    # Futuros juegos:
+    # GamePlugin("simon_says", "games.simon.simon", "SimonGame", ...,
+    #            tech_info="Juego de memoria Simon Says con 6 LEDs y keypad 4x4. Comunicación serial directa."),
+    # GamePlugin("tetris", ..., icon="🧩"), GamePlugin("snake", ..., icon="🐍"),
+    # GamePlugin("breakout", ..., icon="🧱"),
+)
 
 
 class GameRegistry:
     """Registro centralizado de juegos disponibles y sus metadatos"""
-    
+
     def __init__(self):
-        # Registro de juegos disponibles
-        self.available_games: Dict[str, Type[BaseGame]] = {
-            "ping_pong": PingPongGame,
-            "two_lane_runner": TwoLaneRunnerGame,
-            "piano_digital": PianoSimonGame,
-            "osu_rhythm": OsuGame,
-            # Futuros juegos:
-            # 'simon_says': SimonGame,
-            # 'tetris': TetrisGame,
-            # 'snake': SnakeGame,
-            # 'breakout': BreakoutGame,
-        }
-        
-        # Información técnica de cada juego
-        self.tech_info: Dict[str, str] = {
-            "ping_pong": "Juego de Ping Pong con dos palas y una pelota. Requiere sensores de movimiento.",
-            "two_lane_runner": "Juego de carreras en dos carriles. Utiliza sensores de distancia para detectar obstáculos.",
-            "piano_digital": "Piano digital con teclas táctiles. Requiere sensores capacitivos en pines 2-9.",
-            "osu_rhythm": "Juego de ritmo y precisión. Requiere joystick analógico KY-023 en pines A0, A1 y D2.",
-            "simon_says": "Juego de memoria Simon Says con 6 LEDs y keypad 4x4. Comunicación serial directa.",
-        }
-        
-        # NUEVO: Juegos que soportan logging cognitivo - SÚPER SIMPLE
-        self.cognitive_games: Dict[str, str] = {
-            "piano_digital": "🧠 Evalúa memoria, secuencias, tiempo de reacción, fatiga cognitiva",
-            "osu_rhythm": "🧠 Evalúa coordinación ojo-mano, precisión espacial, timing, velocidad de procesamiento",
-            # Futuros:
-            # "two_lane_runner": "🧠 Evalúa atención dividida, coordinación, tiempo de reacción",
-        }
-        
-        # Iconos para cada juego
-        self.game_icons: Dict[str, str] = {
-            "ping_pong": "🏓",
-            "two_lane_runner": "🏃",
-            "piano_digital": "🎹",
-            "osu_rhythm": "🎯",
-            "tetris": "🧩",
-            "snake": "🐍",
-            "breakout": "🧱",
-        }
-    
-    def get_available_games(self) -> Dict[str, Type[BaseGame]]:
-        """Obtener diccionario de juegos disponibles"""
-        return self.available_games
-    
-    def get_game_class(self, game_id: str) -> Type[BaseGame]:
-        """Obtener clase de un juego específico"""
-        return self.available_games.get(game_id)
-    
+        self.plugins: Dict[str, GamePlugin] = {plugin.game_id: plugin for plugin in GAME_PLUGINS}
+
+        # Clases ya importadas (se llenan al lanzar cada juego)
+        self._classes: Dict[str, Type[BaseGame]] = {}
+
+    def get_available_games(self) -> Dict[str, GamePlugin]:
+        """Obtener diccionario de juegos disponibles (metadatos, sin importar nada)"""
+        return self.plugins
+
+    def get_plugin(self, game_id: str) -> Optional[GamePlugin]:
+        """Obtener metadatos de un juego"""
+        return self.plugins.get(game_id)
+
+    def get_game_class(self, game_id: str) -> Optional[Type[BaseGame]]:
+        """Obtener clase de un juego (la importa la primera vez)"""
+        game_class = self._classes.get(game_id)
+        if game_class is not None:
+            return game_class
+
+        plugin = self.plugins.get(game_id)
+        if plugin is None:
+            return None
+
+        module = importlib.import_module(plugin.module)
+        game_class = getattr(module, plugin.class_name)
+        self._classes[game_id] = game_class
+        return game_class
+
+    def is_loaded(self, game_id: str) -> bool:
+        """Verificar si la clase del juego ya fue importada"""
+        return game_id in self._classes
+
+    def get_game_name(self, game_id: str) -> str:
+        """Obtener nombre visible de un juego"""
+        plugin = self.plugins.get(game_id)
+        return plugin.name if plugin else game_id
+
+    def get_game_description(self, game_id: str) -> str:
+        """Obtener descripción de un juego"""
+        plugin = self.plugins.get(game_id)
+        return plugin.description if plugin else ""
+
     def get_tech_info(self, game_id: str) -> str:
         """Obtener información técnica de un juego"""
-        return self.tech_info.get(game_id, "Información técnica no disponible")
-    
+        plugin = self.plugins.get(game_id)
+        return plugin.tech_info if plugin else "Información técnica no disponible"
+
     def get_game_icon(self, game_id: str) -> str:
         """Obtener icono de un juego"""
-        return self.game_icons.get(game_id, "🎮")
-    
+        plugin = self.plugins.get(game_id)
+        return plugin.icon if plugin else "🎮"
+
     def get_game_count(self) -> int:
         """Obtener cantidad total de juegos disponibles"""
-        return len(self.available_games)
-    
+        return len(self.plugins)
+
     def is_valid_game(self, game_id: str) -> bool:
         """Verificar si un game_id es válido"""
-        return game_id in self.available_games
-    
+        return game_id in self.plugins
+
     def get_games_with_test_mode(self) -> list:
         """Obtener lista de juegos que tienen modo de prueba"""
-        # Piano digital y Osu tienen modo de prueba
-        return ["piano_digital", "osu_rhythm"]
-    
+        return [game_id for game_id, plugin in self.plugins.items() if plugin.test_mode]
+
     def supports_cognitive_logging(self, game_id: str) -> bool:
         """Verificar si un juego soporta logging cognitivo"""
-        return game_id in self.cognitive_games
-    
+        plugin = self.plugins.get(game_id)
+        return bool(plugin and plugin.supports_cognitive_logging)
+
     def get_cognitive_info(self, game_id: str) -> str:
         """Obtener información sobre capacidades cognitivas de un juego"""
-        return self.cognitive_games.get(game_id, "")
-    
+        plugin = self.plugins.get(game_id)
+        return plugin.cognitive_info if plugin else ""
+
     def get_cognitive_enabled_games(self) -> Dict[str, str]:
         """Obtener todos los juegos con capacidades cognitivas"""
-        return self.cognitive_games
-    
+        return {game_id: plugin.cognitive_info for game_id, plugin in self.plugins.items()
+                if plugin.supports_cognitive_logging}
+
     def create_temp_game_instance(self, game_id: str, arduino_manager, enable_cognitive_logging: bool = False, patient_id: str = "default"):
-        """Crear instancia temporal de un juego para obtener información"""
+        """Crear instancia temporal de un juego (importa el juego; la UI usa los metadatos)"""
         if not self.is_valid_game(game_id):
             return None
-        
+
         game_class = self.get_game_class(game_id)
-        
+
         try:
             # Verificar si el juego soporta logging cognitivo
             if self.supports_cognitive_logging(game_id) and enable_cognitive_logging:
@@ -111,4 +173,4 @@ class GameRegistry:
                 return game_class(arduino_manager)
         except TypeError:
             # Si el constructor no acepta parámetros cognitivos, usar constructor normal
-            return game_class(arduino_manager) 
\ No newline at end of file
+            return game_class(arduino_manager)
@@ -4,9 +4,12 @@ Manejo de ventanas de estado detallado para juegos
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from core.event_bus import TOPIC_GAME_STATUS, StatusDelta, get_event_bus
 from ui.components.arduino_colors import ArduinoColors
 from .game_lifecycle import GameLifecycle
 
+LIVE_STATUS_INTERVAL = 0.5  # Segundos mínimos entre refrescos de la ventana de estado
+
 
 class GameStatusManager:
     """Maneja las ventanas de estado detallado de los juegos"""
@@ -97,10 +100,37 @@ class GameStatusManager:
         notebook.add(stats_frame, text="Estadísticas")
 
         # Contenido de estado general
-        self._create_general_status_tab(general_frame, status)
+        status_text = self._create_general_status_tab(general_frame, status)
 
         # Contenido de estadísticas
         self._create_stats_tab(stats_frame, status)
+
+        # Mantener la ventana al día con los deltas del juego mientras esté abierta
+        self._follow_live_status(status_window, status_text, status)
+
+    def _follow_live_status(self, status_window, status_text, status: dict):
+        """Suscribir la ventana a los cambios del juego actual (se cancela al cerrarla)"""
+        game_id = self.lifecycle.get_current_game_id()
+
+        def on_delta(delta: StatusDelta):
+            if delta.game_id != game_id:
+                return
+            status.update(delta.changes)
+            status_text.config(state=tk.NORMAL)
+            status_text.delete("1.0", tk.END)
+            status_text.insert(tk.END, self._format_game_status(status))
+            status_text.config(state=tk.DISABLED)
+
+        subscription = get_event_bus().subscribe(
+            TOPIC_GAME_STATUS,
+            on_delta,
+            min_interval=LIVE_STATUS_INTERVAL,
+            post=lambda callback: status_window.after(0, callback),
+        )
+        status_window.bind(
+            "<Destroy>",
+            lambda event: subscription.cancel() if event.widget is status_window else None,
+        )
     
     def _create_general_status_tab(self, parent, status):
         """Crear pestaña de estado general"""
@@ -120,6 +150,7 @@ class GameStatusManager:
         
         status_text.insert(tk.END, status_info)
         status_text.config(state=tk.DISABLED)
+        return status_text
     
     def _format_game_status(self, status: dict) -> str:
         """Formatear información de estado según el tipo de juego"""
@@ -3,7 +3,7 @@ Manejo de interfaz de usuario para juegos (widgets, layout, highlights)
 """
 
 import tkinter as tk
-from typing import Dict, Callable
+from typing import Dict, Callable, Optional
 from ui.components.arduino_colors import ArduinoColors
 from .game_registry import GameRegistry
 
@@ -18,8 +18,12 @@ class GameUIManager:
         
     def create_game_entries(self, parent_frame, start_game_callback: Callable, 
                            start_test_callback: Callable, stop_game_callback: Callable,
-                           show_status_callback: Callable):
-        """Crear entradas para cada juego disponible en layout de 3 por fila"""
+                           show_status_callback: Callable,
+                           hover_callback: Optional[Callable] = None):
+        """Crear entradas para cada juego disponible en layout de 3 por fila
+
+        hover_callback(game_id): el ratón entra en la tarjeta del juego (pre-carga)
+        """
         
         # Crear frame contenedor con grid
         games_grid = tk.Frame(parent_frame, bg=self.colors.BLACK)
@@ -33,24 +37,25 @@ class GameUIManager:
         available_games = self.registry.get_available_games()
         game_list = list(available_games.items())
         
-        for i, (game_id, game_class) in enumerate(game_list):
+        for i, (game_id, plugin) in enumerate(game_list):
             row = i // 3
             col = i % 3
             
             # Crear frame del juego
             game_frame = self._create_game_frame(games_grid, row, col)
             
-            # Crear componentes del juego
-            temp_game = self.registry.create_temp_game_instance(game_id, None)
-            if temp_game:
-                info_frame = self._create_info_section(game_frame, game_id, temp_game)
-                controls_frame = self._create_controls_section(
-                    game_frame, game_id, start_game_callback, 
-                    start_test_callback, stop_game_callback, show_status_callback
-                )
-                
-                # Guardar referencias de widgets
-                self._store_widget_references(game_id, game_frame, controls_frame)
+            # Crear componentes del juego (solo metadatos: el juego no se importa aquí)
+            info_frame = self._create_info_section(game_frame, game_id, plugin)
+            controls_frame = self._create_controls_section(
+                game_frame, game_id, start_game_callback, 
+                start_test_callback, stop_game_callback, show_status_callback
+            )
+            
+            if hover_callback:
+                game_frame.bind("<Enter>", lambda _event, gid=game_id: hover_callback(gid))
+            
+            # Guardar referencias de widgets
+            self._store_widget_references(game_id, game_frame, controls_frame)
     
     def _create_game_frame(self, parent, row: int, col: int) -> tk.Frame:
         """Crear frame principal para un juego"""
@@ -59,7 +64,7 @@ class GameUIManager:
         parent.rowconfigure(row, weight=1)
         return game_frame
     
-    def _create_info_section(self, parent, game_id: str, temp_game) -> tk.Frame:
+    def _create_info_section(self, parent, game_id: str, plugin) -> tk.Frame:
         """Crear sección de información del juego"""
         info_frame = tk.Frame(parent, bg=self.colors.LIGHT_GRAY)
         info_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=12, pady=12)
@@ -68,7 +73,7 @@ class GameUIManager:
         icon = self.registry.get_game_icon(game_id)
         title_label = tk.Label(
             info_frame,
-            text=f"{icon} {temp_game.name}",
+            text=f"{icon} {plugin.name}",
             bg=self.colors.LIGHT_GRAY,
             fg=self.colors.BLUE_DARK,
             font=("Arial", 14, "bold"),
@@ -78,7 +83,7 @@ class GameUIManager:
         # Descripción
         desc_label = tk.Label(
             info_frame,
-            text=temp_game.description,
+            text=plugin.description,
             bg=self.colors.LIGHT_GRAY,
             fg=self.colors.PURPLE,
             font=("Arial", 9),
@@ -240,6 +245,15 @@ class GameUIManager:
                 if "test_btn" in widgets:
                     widgets["test_btn"].config(text="🔧 Test HW", state=tk.NORMAL)
 
+    def show_transition(self, active_game_id: str, text: str):
+        """Bloquear botones de inicio mientras un juego arranca o se detiene"""
+        for game_id, widgets in self.game_widgets.items():
+            widgets["start_btn"].config(state=tk.DISABLED)
+            if "test_btn" in widgets:
+                widgets["test_btn"].config(state=tk.DISABLED)
+            if game_id == active_game_id:
+                widgets["start_btn"].config(text=text)
+    
     def restore_game_ui(self):
         """Restaurar UI de juegos al estado normal"""
         for game_id, widgets in self.game_widgets.items():
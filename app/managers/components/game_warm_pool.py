@@ -0,0 +1,84 @@
+"""
+Pool de juegos pre-calentados: el siguiente juego se construye en el menú
+
+Construir un juego cuesta (sonidos sintéticos de Osu/Piano, fuentes,
+import del módulo la primera vez). Mientras el terapeuta está en el menú
+se construye en segundo plano el juego probable (el que señala con el
+ratón o el último jugado) y se llama a su prewarm(); al pulsar JUGAR
+GameLifecycle lo toma ya hecho.
+
+Solo recursos sin hardware: los pines y la ventana se piden al iniciar.
+Cada instancia se usa una sola vez (nunca se devuelve un juego ya jugado).
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from core.base_game import BaseGame
+
+WARM_WAIT_SECONDS = 10.0  # Espera máxima por un calentamiento en curso al tomarlo
+
+
+class GameWarmPool:
+    """Una instancia lista (o preparándose) del juego que probablemente sigue"""
+
+    def __init__(self, factory: Callable[[str], BaseGame]):
+        self.factory = factory
+        # Un solo hilo: nunca se calientan dos juegos a la vez
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-warm")
+        self._lock = threading.Lock()
+        self._game_id: Optional[str] = None
+        self._future: Optional[Future] = None
+
+    def prepare(self, game_id: str):
+        """Calentar game_id en segundo plano (reemplaza al calentado anterior)"""
+        with self._lock:
+            if self._game_id == game_id and self._future is not None:
+                return
+            self._discard_locked()
+            self._game_id = game_id
+            self._future = self._executor.submit(self._build, game_id)
+
+    def _build(self, game_id: str) -> BaseGame:
+        game = self.factory(game_id)
+        game.prewarm()
+        print(f"🔥 {game.name} pre-cargado")
+        return game
+
+    def take(self, game_id: str) -> Optional[BaseGame]:
+        """Retirar la instancia caliente de game_id (espera si aún se está construyendo)"""
+        with self._lock:
+            if self._game_id != game_id or self._future is None:
+                return None
+            future = self._future
+            self._game_id, self._future = None, None
+
+        try:
+            return future.result(timeout=WARM_WAIT_SECONDS)
+        except Exception as e:
+            print(f"⚠️ Pre-carga de {game_id} no disponible: {e}")
+            return None
+
+    def discard(self):
+        """Olvidar la instancia caliente (p. ej. al iniciar otro juego)"""
+        with self._lock:
+            self._discard_locked()
+
+    def _discard_locked(self):
+        if self._future is not None:
+            # Si ya se está construyendo, termina en segundo plano y se descarta
+            self._future.cancel()
+        self._game_id, self._future = None, None
+
+    def is_ready(self, game_id: str) -> bool:
+        """Verificar si game_id está construido y listo para tomar"""
+        with self._lock:
+            future = self._future
+            return (self._game_id == game_id and future is not None
+                    and future.done() and not future.cancelled() and future.exception() is None)
+
+    def shutdown(self):
+        """Descartar y cerrar el hilo (al cerrar la app)"""
+        self.discard()
+        self._executor.shutdown(wait=False, cancel_futures=True)
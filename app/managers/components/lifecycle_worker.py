@@ -0,0 +1,114 @@
+"""
+Worker de ciclo de vida: inicio/parada de juegos fuera del hilo de Tk
+
+Un único hilo ejecuta las transiciones en orden (nunca hay dos juegos
+arrancando a la vez). Cada transición es un LifecycleTask con:
+- future: resultado (success, message)
+- cancel(): si aún no empezó no se ejecuta; si ya corre, la tarea lo
+  detecta en sus puntos de control y deshace lo hecho
+- progreso y resultado se entregan en el hilo de Tk con root.after
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+LifecycleResult = Tuple[bool, str]
+
+
+class LifecycleCancelled(Exception):
+    """La transición fue cancelada (por el usuario o por una transición más nueva)"""
+
+
+class LifecycleTask:
+    """Transición en curso o pendiente"""
+
+    def __init__(self, description: str, post: Callable[[Callable], None],
+                 on_progress: Optional[Callable[[str], None]] = None):
+        self.description = description
+        self.future: Optional[Future] = None
+        self._cancel_event = threading.Event()
+        self._post = post
+        self._on_progress = on_progress
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Cancelar: evita que arranque o marca la cancelación para la tarea en curso"""
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def check_cancelled(self):
+        """Punto de control: lanzar LifecycleCancelled si se pidió cancelar"""
+        if self._cancel_event.is_set():
+            raise LifecycleCancelled(self.description)
+
+    def wait(self, seconds: float):
+        """Pausa interrumpible por cancelación"""
+        if self._cancel_event.wait(seconds):
+            raise LifecycleCancelled(self.description)
+
+    def report(self, message: str):
+        """Informar progreso (se muestra en el hilo de Tk)"""
+        print(f"⏳ {message}")
+        if self._on_progress:
+            self._post(lambda: self._on_progress(message))
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+
+class LifecycleWorker:
+    """Ejecuta transiciones de juegos en un hilo dedicado"""
+
+    def __init__(self, root=None):
+        self.root = root
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-lifecycle")
+
+    def _post(self, callback: Callable):
+        """Ejecutar en el hilo de Tk (o directo si no hay ventana)"""
+        if self.root is None:
+            callback()
+            return
+        try:
+            self.root.after(0, callback)
+        except Exception as e:
+            # Ventana ya destruida: nadie espera el resultado
+            print(f"⚠️ No se pudo notificar a la interfaz: {e}")
+
+    def submit(self, description: str, job: Callable[[LifecycleTask], LifecycleResult],
+               on_done: Optional[Callable[[bool, str, bool], None]] = None,
+               on_progress: Optional[Callable[[str], None]] = None) -> LifecycleTask:
+        """Encolar una transición; job(task) -> (success, message)
+
+        on_done(success, message, cancelled) y on_progress(message) corren en el hilo de Tk.
+        """
+        task = LifecycleTask(description, self._post, on_progress)
+
+        def run() -> LifecycleResult:
+            try:
+                task.check_cancelled()
+                return job(task)
+            except LifecycleCancelled:
+                return False, f"{description}: cancelado"
+            except Exception as e:
+                return False, f"Error en {description.lower()}: {e}"
+
+        def finished(future: Future):
+            if future.cancelled():
+                result = (False, f"{description}: cancelado")
+            else:
+                result = future.result()
+            if on_done:
+                self._post(lambda: on_done(*result, task.cancelled))
+
+        task.future = self._executor.submit(run)
+        task.future.add_done_callback(finished)
+        return task
+
+    def shutdown(self, wait: bool = False):
+        """Cancelar lo pendiente y cerrar el hilo"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
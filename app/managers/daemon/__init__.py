@@ -0,0 +1,14 @@
+"""
+Daemon de estación sin interfaz (quioscos)
+
+- StationDaemon: Arduino, registro de juegos, ciclo de vida y paciente, sin Tk
+- ControlServer: API de control local (HTTP en localhost + eventos SSE)
+"""
+
+from .station_daemon import StationDaemon
+from .control_api import ControlServer
+
+__all__ = [
+    "StationDaemon",
+    "ControlServer",
+]
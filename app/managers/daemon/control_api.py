@@ -0,0 +1,285 @@
+"""
+API de control local del daemon: HTTP + JSON, solo en localhost
+
+GET  /status      Arduino, paciente, juego actual y su estado
+GET  /games       Juegos disponibles
+POST /connect     {"port": "COM3"} o {} para buscar el Arduino por handshake
+POST /disconnect
+POST /start       {"game_id": "osu_rhythm", "test": false}
+POST /stop
+GET  /patients    ?limit=100&offset=0
+POST /patients    {"name": "...", "age": 70, "notes": "", "game_type": null}
+GET  /patient     Paciente seleccionado
+POST /patient     {"patient_id": "P_001_..."} (null = sin logging cognitivo)
+GET  /events      Server-Sent Events: eventos del daemon y estado en vivo
+
+Protección frente a páginas web abiertas en el mismo equipo:
+- Host debe ser 127.0.0.1:<puerto> o localhost:<puerto> (DNS rebinding) -> 403
+- Todo POST debe ser Content-Type: application/json (un formulario de otra
+  web no puede enviarlo sin preflight CORS, que esta API no acepta) -> 415
+- Con token (--api-token o ARDUINO_DAEMON_TOKEN), cabecera
+  "Authorization: Bearer <token>" en cada petición -> 401
+
+Las respuestas de error son {"error": mensaje} con código 400/401/403/404/415/500.
+"""
+
+import hmac
+import json
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from core.event_bus import TOPIC_GAME_STATUS
+from managers.stations.station_protocol import EVENT_SNAPSHOT, EVENT_STATUS
+from .station_daemon import TOPIC_DAEMON, StationDaemon
+
+DEFAULT_API_HOST = "127.0.0.1"
+DEFAULT_API_PORT = 8765
+API_TOKEN_ENV_VAR = "ARDUINO_DAEMON_TOKEN"
+ALLOWED_HOSTNAMES = ("127.0.0.1", "localhost")
+JSON_CONTENT_TYPE = "application/json"
+STATUS_STREAM_INTERVAL = 0.25  # Segundos mínimos entre deltas de estado por cliente SSE
+EVENT_QUEUE_SIZE = 256         # Eventos pendientes por cliente SSE (los de un cliente lento se descartan)
+KEEPALIVE_SECONDS = 15.0
+EVENT_POLL_SECONDS = 1.0
+MAX_BODY_BYTES = 64 * 1024
+
+Response = Tuple[int, Any]
+
+
+class ControlRequestHandler(BaseHTTPRequestHandler):
+    """Una petición a la API (cada una en su hilo)"""
+
+    server: "ControlServer"
+
+    ROUTES = {
+        ("GET", "/status"): "get_status",
+        ("GET", "/games"): "get_games",
+        ("POST", "/connect"): "post_connect",
+        ("POST", "/disconnect"): "post_disconnect",
+        ("POST", "/start"): "post_start",
+        ("POST", "/stop"): "post_stop",
+        ("GET", "/patients"): "get_patients",
+        ("POST", "/patients"): "post_patients",
+        ("GET", "/patient"): "get_patient",
+        ("POST", "/patient"): "post_patient",
+        ("GET", "/events"): "get_events",
+    }
+
+    @property
+    def station(self) -> StationDaemon:
+        return self.server.station
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        if not self.server.allowed_host(self.headers.get("Host")):
+            self._send_json(403, {"error": "Host no permitido"})
+            return
+        if not self.server.authorized(self.headers.get("Authorization")):
+            self._send_json(401, {"error": "Token inválido"})
+            return
+        route = self.ROUTES.get((method, url.path.rstrip("/") or "/"))
+        if route is None:
+            self._send_json(404, {"error": f"Ruta no encontrada: {method} {url.path}"})
+            return
+        content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        if method == "POST" and content_type != JSON_CONTENT_TYPE:
+            self._send_json(415, {"error": f"Se esperaba Content-Type: {JSON_CONTENT_TYPE}"})
+            return
+
+        try:
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            body = self._read_json() if method == "POST" else {}
+            response = getattr(self, route)(body, query)
+        except ValueError as e:
+            response = (400, {"error": str(e)})
+        except Exception as e:
+            print(f"❌ Error en API de control ({method} {url.path}): {e}")
+            response = (500, {"error": str(e)})
+
+        # None = la ruta ya respondió (stream de eventos)
+        if response is not None:
+            self._send_json(*response)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ValueError("Cuerpo de la petición demasiado grande")
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido: {e}")
+        if not isinstance(body, dict):
+            raise ValueError("Se esperaba un objeto JSON")
+        return body
+
+    def _send_json(self, status: int, payload: Any):
+        data = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Sin log por petición: /status se consulta a menudo y ensuciaría la consola
+        pass
+
+    # ===== RUTAS =====
+
+    def get_status(self, body, query) -> Response:
+        return 200, self.station.status()
+
+    def get_games(self, body, query) -> Response:
+        return 200, self.station.list_games()
+
+    def post_connect(self, body, query) -> Response:
+        success, message = self.station.connect(body.get("port") or None)
+        return (200 if success else 409), {"success": success, "message": message}
+
+    def post_disconnect(self, body, query) -> Response:
+        success, message = self.station.disconnect()
+        return (200 if success else 500), {"success": success, "message": message}
+
+    def post_start(self, body, query) -> Response:
+        game_id = body.get("game_id")
+        if not game_id:
+            raise ValueError("Falta game_id")
+        return self._transition_response(self.station.start_game(game_id, test=bool(body.get("test"))))
+
+    def post_stop(self, body, query) -> Response:
+        return self._transition_response(self.station.stop_game())
+
+    @staticmethod
+    def _transition_response(result: Dict[str, Any]) -> Response:
+        # 202: sigue en curso (el resultado llegará por /events)
+        if result["pending"]:
+            return 202, result
+        return (200 if result["success"] or result["cancelled"] else 409), result
+
+    def get_patients(self, body, query) -> Response:
+        limit = int(query.get("limit", 100))
+        offset = int(query.get("offset", 0))
+        return 200, self.station.list_patients(limit=limit, offset=offset)
+
+    def post_patients(self, body, query) -> Response:
+        age = body.get("age")
+        patient = self.station.add_patient(
+            str(body.get("name") or ""),
+            game_type=body.get("game_type"),
+            age=int(age) if age not in (None, "") else None,
+            notes=str(body.get("notes") or ""),
+        )
+        return 201, patient
+
+    def get_patient(self, body, query) -> Response:
+        return 200, {"patient": self.station.get_patient()}
+
+    def post_patient(self, body, query) -> Response:
+        if "patient_id" not in body:
+            raise ValueError("Falta patient_id (null para ninguno)")
+        return 200, {"patient": self.station.select_patient(body["patient_id"])}
+
+    # ===== EVENTOS (SSE) =====
+
+    def get_events(self, body, query) -> Optional[Response]:
+        """Stream de eventos: snapshot inicial y luego eventos del daemon y deltas de estado"""
+        events: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+
+        def push(name: str, data: Any):
+            try:
+                events.put_nowait((name, data))
+            except queue.Full:
+                pass
+
+        bus = self.station.bus
+        subscriptions = [
+            bus.subscribe(TOPIC_DAEMON, lambda message: push(message["event"], message)),
+            bus.subscribe(
+                TOPIC_GAME_STATUS,
+                lambda delta: push(EVENT_STATUS, {"game_id": delta.game_id, "changes": delta.changes}),
+                min_interval=STATUS_STREAM_INTERVAL,
+            ),
+        ]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        try:
+            self._write_event(EVENT_SNAPSHOT, self.station.status())
+            last_write = time.monotonic()
+            while not self.server.stopping.is_set():
+                try:
+                    name, data = events.get(timeout=EVENT_POLL_SECONDS)
+                except queue.Empty:
+                    if time.monotonic() - last_write >= KEEPALIVE_SECONDS:
+                        self.wfile.write(b": keepalive\n\n")
+                        self.wfile.flush()
+                        last_write = time.monotonic()
+                    continue
+                self._write_event(name, data)
+                last_write = time.monotonic()
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            pass  # El cliente cerró el stream
+        finally:
+            for subscription in subscriptions:
+                subscription.cancel()
+        return None
+
+    def _write_event(self, name: str, data: Any):
+        payload = json.dumps(data, ensure_ascii=False, default=str)
+        self.wfile.write(f"event: {name}\ndata: {payload}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+
+class ControlServer(ThreadingHTTPServer):
+    """Servidor HTTP de la API de control (hilo propio, una petición por hilo)"""
+
+    daemon_threads = True
+
+    def __init__(self, station: StationDaemon, host: str = DEFAULT_API_HOST, port: int = DEFAULT_API_PORT,
+                 token: Optional[str] = None):
+        super().__init__((host, port), ControlRequestHandler)
+        self.station = station
+        self.token = token
+        self.stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Puerto real (port=0 elige uno libre)
+        self.allowed_hosts = {f"{hostname}:{self.server_address[1]}" for hostname in ALLOWED_HOSTNAMES}
+
+    def allowed_host(self, host: Optional[str]) -> bool:
+        return (host or "").strip().lower() in self.allowed_hosts
+
+    def authorized(self, authorization: Optional[str]) -> bool:
+        if not self.token:
+            return True
+        scheme, _, token = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer":
+            return False
+        return hmac.compare_digest(token.strip().encode("utf-8"), self.token.encode("utf-8"))
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="control-api", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Dejar de aceptar peticiones y cerrar los streams de eventos"""
+        self.stopping.set()
+        if self._thread:
+            self.shutdown()
+            self._thread.join(EVENT_POLL_SECONDS * 2)
+        self.server_close()
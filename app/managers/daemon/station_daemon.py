@@ -0,0 +1,200 @@
+"""
+Estación sin interfaz: Arduino, registro de juegos y ciclo de vida
+
+Para quioscos: mismo ArduinoManager, GameRegistry y GameLifecycle que la
+interfaz Tk, pero sin importar tkinter ni matplotlib. Se controla con la
+API local (control_api). Los eventos (progreso, resultados, conexión) se
+publican en el bus bajo TOPIC_DAEMON, con los nombres de evento del
+protocolo de estaciones; el estado en vivo de los juegos sigue en
+TOPIC_GAME_STATUS.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.arduino_connection import ArduinoConnectionService
+from core.arduino_manager import ArduinoManager
+from core.cognitive.patient_registry import get_patient_registry
+from core.event_bus import get_event_bus
+from core.pygame_runtime import get_pygame_runtime
+from managers.components.game_lifecycle import GameLifecycle
+from managers.components.game_registry import GameRegistry
+from managers.stations.station_protocol import (
+    EVENT_CONNECTION,
+    EVENT_PROGRESS,
+    EVENT_RESULT,
+    picklable_status,
+)
+
+TOPIC_DAEMON = "daemon.event"
+CONNECT_TIMEOUT = 30.0     # Búsqueda por handshake en todos los puertos
+TRANSITION_TIMEOUT = 30.0  # Espera máxima de un inicio/parada antes de responder "en curso"
+
+
+def _wait_for(start: Callable[[Callable], Any], timeout: float) -> Optional[tuple]:
+    """Lanzar una operación asíncrona y esperar los argumentos de su on_done (None = sin terminar)"""
+    done = threading.Event()
+    result = {}
+
+    def finish(*args):
+        result["args"] = args
+        done.set()
+
+    start(finish)
+    return result["args"] if done.wait(timeout) else None
+
+
+class StationDaemon:
+    """Estación controlada por API local en lugar de ventana"""
+
+    def __init__(self, warm_games: bool = True):
+        self.arduino = ArduinoManager()
+        self.registry = GameRegistry()
+        self.connection = ArduinoConnectionService(self.arduino, on_state=self._on_connection_state)
+        # Sin root: los resultados llegan en el hilo del worker (las peticiones esperan con _wait_for)
+        self.lifecycle = GameLifecycle(self.arduino, self.registry, warm_games=warm_games)
+        self.bus = get_event_bus()
+
+    def publish(self, name: str, **data):
+        self.bus.publish(TOPIC_DAEMON, {"event": name, **data})
+
+    def _on_connection_state(self, state: str, message: str):
+        self.publish(EVENT_CONNECTION, state=state, message=message)
+
+    # ===== ARDUINO =====
+
+    def connect(self, port: Optional[str] = None, timeout: float = CONNECT_TIMEOUT) -> Tuple[bool, str]:
+        """Conectar al puerto dado o buscar el Arduino por handshake"""
+        if self.arduino.connected:
+            return True, f"Ya conectado en {self.arduino.port}"
+
+        result = _wait_for(lambda done: self.connection.connect_async(port, done), timeout)
+        connected_port = result[0] if result else None
+        if not connected_port:
+            return False, f"No se pudo conectar a {port}" if port else "No se encontró ningún Arduino"
+
+        message = f"Conectado en {connected_port}"
+        self.publish(EVENT_CONNECTION, state="connected", message=message)
+        return True, message
+
+    def disconnect(self, timeout: float = CONNECT_TIMEOUT) -> Tuple[bool, str]:
+        """Detener el juego actual y soltar el Arduino"""
+        result = _wait_for(
+            lambda done: self.connection.disconnect_async(done, before=self.lifecycle.stop_current_game),
+            timeout,
+        )
+        if not result or not result[0]:
+            return False, "No se pudo desconectar"
+        self.publish(EVENT_CONNECTION, state="disconnected", message="Arduino desconectado")
+        return True, "Arduino desconectado"
+
+    # ===== JUEGOS =====
+
+    def list_games(self) -> List[Dict[str, Any]]:
+        test_games = self.registry.get_games_with_test_mode()
+        return [
+            {
+                "game_id": game_id,
+                "name": plugin.name,
+                "description": plugin.description,
+                "icon": plugin.icon,
+                "test_mode": game_id in test_games,
+                "cognitive_logging": plugin.supports_cognitive_logging,
+            }
+            for game_id, plugin in self.registry.get_available_games().items()
+        ]
+
+    def _transition(self, action: str, game_id: Optional[str], submit, timeout: float) -> Dict[str, Any]:
+        """Lanzar una transición del ciclo de vida, publicar su avance y esperar el resultado"""
+        def start(finish):
+            def on_done(success: bool, message: str, cancelled: bool):
+                self.publish(EVENT_RESULT, action=action, game_id=game_id, success=success,
+                             message=message, cancelled=cancelled)
+                finish(success, message, cancelled)
+
+            submit(on_done, lambda text: self.publish(EVENT_PROGRESS, message=text))
+
+        result = _wait_for(start, timeout)
+        if result is None:
+            return {"success": False, "pending": True, "cancelled": False,
+                    "message": "La operación sigue en curso"}
+        success, message, cancelled = result
+        return {"success": success, "pending": False, "cancelled": cancelled, "message": message}
+
+    def start_game(self, game_id: str, test: bool = False, timeout: float = TRANSITION_TIMEOUT) -> Dict[str, Any]:
+        """Iniciar un juego (o su modo prueba) y esperar el resultado"""
+        if not self.registry.is_valid_game(game_id):
+            return {"success": False, "pending": False, "cancelled": False,
+                    "message": f"Juego '{game_id}' no es válido"}
+
+        if test:
+            submit = lambda on_done, on_progress: self.lifecycle.start_test_mode_async(game_id, on_done, on_progress)
+        else:
+            submit = lambda on_done, on_progress: self.lifecycle.start_game_async(game_id, on_done, on_progress)
+        return self._transition("test" if test else "start", game_id, submit, timeout)
+
+    def stop_game(self, timeout: float = TRANSITION_TIMEOUT) -> Dict[str, Any]:
+        """Cancelar el inicio en curso o detener el juego actual"""
+        if self.lifecycle.cancel_transition():
+            return {"success": True, "pending": False, "cancelled": True, "message": "Operación cancelada"}
+
+        game_id = self.lifecycle.get_current_game_id()
+
+        def submit(on_done, on_progress):
+            self.lifecycle.stop_current_game_async(
+                lambda success, game_name, cancelled: on_done(success, f"{game_name} detenido", cancelled),
+                on_progress,
+            )
+
+        return self._transition("stop", game_id, submit, timeout)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "arduino": {"connected": self.arduino.connected, "port": self.arduino.port},
+            "patient_id": self.lifecycle.patient_id,
+            "game_id": self.lifecycle.get_current_game_id(),
+            "transition": self.lifecycle.is_transition_in_progress(),
+            "game": picklable_status(self.lifecycle.get_current_game_status()),
+        }
+
+    # ===== PACIENTES =====
+
+    def list_patients(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        return get_patient_registry().list_patients(limit=limit, offset=offset)
+
+    def add_patient(self, name: str, game_type: Optional[str] = None,
+                    age: Optional[int] = None, notes: str = "") -> Dict[str, Any]:
+        """Registrar paciente nuevo - ValueError si falta el nombre"""
+        registry = get_patient_registry()
+        patient_id = registry.add_patient(name, game_type=game_type, age=age, notes=notes)
+        if patient_id is None:
+            raise ValueError("El nombre del paciente es obligatorio")
+        return registry.get_patient(patient_id)
+
+    def get_patient(self) -> Optional[Dict[str, Any]]:
+        """Paciente seleccionado (None = juegos sin logging cognitivo)"""
+        if not self.lifecycle.patient_id:
+            return None
+        return get_patient_registry().get_patient(self.lifecycle.patient_id)
+
+    def select_patient(self, patient_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Seleccionar el paciente de los próximos juegos - ValueError si no existe"""
+        patient = None
+        if patient_id:
+            patient = get_patient_registry().get_patient(patient_id)
+            if patient is None:
+                raise ValueError(f"Paciente '{patient_id}' no encontrado")
+        self.lifecycle.set_patient(patient_id or None)
+        print(f"🧑 Paciente seleccionado: {patient['name'] if patient else 'ninguno'}")
+        return patient
+
+    # ===== CIERRE =====
+
+    def shutdown(self):
+        """Detener juego, soltar el Arduino y cerrar pygame"""
+        self.lifecycle.cancel_transition()
+        self.lifecycle.stop_current_game()
+        self.lifecycle.shutdown()
+        self.connection.shutdown()
+        self.arduino.disconnect()
+        get_pygame_runtime().shutdown()
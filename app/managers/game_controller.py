@@ -7,14 +7,17 @@ DESPUÉS: ~200 líneas de pura coordinación entre componentes especializados
 
 import time
 from tkinter import messagebox
-from typing import Optional
+from typing import Any, Dict, Optional
 from core.base_game import BaseGame
 from core.arduino_manager import ArduinoManager
+from core.event_bus import TOPIC_GAME_STATUS, StatusDelta, get_event_bus
 from ui.components.arduino_colors import ArduinoColors
 
 # Importar componentes modularizados
 from .components import GameRegistry, GameLifecycle, GameUIManager, GameStatusManager
 
+STATUS_UPDATE_INTERVAL = 0.5  # Segundos mínimos entre refrescos de la línea de sesión
+
 
 class GameController:
     """
@@ -41,10 +44,22 @@ class GameController:
 
         # Inicializar componentes especializados
         self.registry = GameRegistry()
-        self.lifecycle = GameLifecycle(arduino_manager, self.registry)
+        self.lifecycle = GameLifecycle(arduino_manager, self.registry, root=self.root)
         self.ui_manager = GameUIManager(self.registry)
         self.status_manager = GameStatusManager(main_window, self.lifecycle)
 
+        # Mensaje de progreso mientras un juego arranca/se detiene en segundo plano
+        self._transition_message: Optional[str] = None
+
+        # Estado en vivo del juego actual (deltas publicados por el juego)
+        self._live_status: Dict[str, Any] = {}
+        self._status_subscription = get_event_bus().subscribe(
+            TOPIC_GAME_STATUS,
+            self._on_status_delta,
+            min_interval=STATUS_UPDATE_INTERVAL,
+            post=lambda callback: self.root.after(0, callback),
+        )
+
     # ===== PROPIEDADES DE CONVENIENCIA =====
 
     @property
@@ -71,8 +86,21 @@ class GameController:
     # ===== MÉTODOS DE CONTROL DE JUEGOS =====
 
     def start_game(self, game_id: str):
-        """Iniciar un juego"""
-        success, message = self.lifecycle.start_game(game_id)
+        """Iniciar un juego (en segundo plano; la ventana sigue respondiendo)"""
+        self._begin_transition(game_id, "⏳ Cargando...")
+        self.lifecycle.start_game_async(
+            game_id,
+            on_done=lambda success, message, cancelled: self._on_game_started(
+                game_id, success, message, cancelled
+            ),
+            on_progress=self._on_transition_progress,
+        )
+
+    def _on_game_started(self, game_id: str, success: bool, message: str, cancelled: bool):
+        """Resultado del inicio (hilo de Tk)"""
+        self._end_transition()
+        if cancelled:
+            return
 
         if success:
             # Actualizar UI para mostrar juego activo
@@ -89,8 +117,21 @@ class GameController:
                 messagebox.showerror("Error", message)
 
     def start_test_mode(self, game_id: str):
-        """Iniciar modo de prueba para un juego específico"""
-        success, message = self.lifecycle.start_test_mode(game_id)
+        """Iniciar modo de prueba para un juego específico (en segundo plano)"""
+        self._begin_transition(game_id, "⏳ Preparando...")
+        self.lifecycle.start_test_mode_async(
+            game_id,
+            on_done=lambda success, message, cancelled: self._on_test_mode_started(
+                game_id, success, message, cancelled
+            ),
+            on_progress=self._on_transition_progress,
+        )
+
+    def _on_test_mode_started(self, game_id: str, success: bool, message: str, cancelled: bool):
+        """Resultado del modo prueba (hilo de Tk)"""
+        self._end_transition()
+        if cancelled:
+            return
 
         if success:
             # Actualizar UI para modo prueba
@@ -110,16 +151,30 @@ class GameController:
 
     def stop_game(self):
         """Detener juego actual desde UI con manejo inteligente"""
+        # Un juego que aún está arrancando se cancela (y se detiene si llegó a iniciar)
+        if self.lifecycle.cancel_transition():
+            self._on_transition_progress("Cancelando...")
+            return
+
         if not self.current_game or not self.current_game_is_running():
             messagebox.showinfo("Sin juego", "No hay juegos ejecutándose")
             return
 
-        try:
-            game_name = self.current_game.name
-            print(f"🛑 Intentando detener {game_name}...")
+        game_name = self.current_game.name
+        print(f"🛑 Intentando detener {game_name}...")
 
-            # Intentar detención segura
-            if self.lifecycle.stop_current_game():
+        # Intentar detención segura sin congelar la ventana (join de hilos hasta 5 s)
+        self._begin_transition(None, "")
+        self.lifecycle.stop_current_game_async(
+            on_done=lambda success, _name, cancelled: self._on_game_stopped(game_name, success),
+            on_progress=self._on_transition_progress,
+        )
+
+    def _on_game_stopped(self, game_name: str, success: bool):
+        """Resultado de la detención (hilo de Tk)"""
+        self._end_transition()
+        try:
+            if success:
                 # Detención exitosa
                 self.restore_game_ui()
                 messagebox.showinfo(
@@ -162,9 +217,41 @@ class GameController:
         self.restore_game_ui()
 
     def stop_current_game(self) -> bool:
-        """Detener juego actual de forma segura (método directo)"""
+        """Detener juego actual de forma segura (método directo, bloqueante)"""
         return self.lifecycle.stop_current_game()
 
+    def shutdown(self):
+        """Cancelar transiciones pendientes y cerrar el worker (al cerrar la app)"""
+        self._status_subscription.cancel()
+        self.lifecycle.shutdown()
+
+    # ===== TRANSICIONES EN SEGUNDO PLANO =====
+
+    def _begin_transition(self, game_id: Optional[str], button_text: str):
+        self._transition_message = "Procesando..."
+        self._live_status.clear()
+        self.ui_manager.show_transition(game_id, button_text)
+        self.update_session_stats()
+
+    def _on_transition_progress(self, message: str):
+        """Progreso del worker (hilo de Tk)"""
+        if self._transition_message is None:
+            return
+        self._transition_message = message
+        self.update_session_stats()
+
+    def _end_transition(self):
+        self._transition_message = None
+        self.restore_game_ui()
+        # Si sigue habiendo un juego activo (p. ej. se canceló un cambio), volver a marcarlo
+        game_id = self.lifecycle.get_current_game_id()
+        if game_id and self.current_game_is_running():
+            if getattr(self.current_game, "test_mode", False):
+                self.ui_manager.highlight_test_mode(game_id)
+            else:
+                self.ui_manager.highlight_active_game(game_id)
+        self.update_session_stats()
+
     # ===== MÉTODOS DE UI =====
 
     def create_game_entries(self, parent_frame):
@@ -175,6 +262,7 @@ class GameController:
             start_test_callback=self.start_test_mode,
             stop_game_callback=self.stop_game,
             show_status_callback=self.show_game_status,
+            hover_callback=self.lifecycle.prewarm,
         )
 
     def restore_game_ui(self):
@@ -195,13 +283,36 @@ class GameController:
         """Mostrar estado detallado del juego"""
         self.status_manager.show_game_status(game_id)
 
+    def _on_status_delta(self, delta: StatusDelta):
+        """Cambios de estado del juego actual (hilo de Tk, como máximo cada STATUS_UPDATE_INTERVAL)"""
+        if delta.game_id != self.lifecycle.get_current_game_id():
+            return
+        self._live_status.update(delta.changes)
+        self.update_session_stats()
+
+    def _format_live_status(self) -> str:
+        """Puntos / combo / nivel del juego actual para la línea de sesión"""
+        status = self._live_status
+        parts = []
+        if "score" in status:
+            parts.append(f"Puntos: {status['score']:,}")
+        if status.get("combo"):
+            parts.append(f"Combo: {status['combo']}x")
+        level = status.get("level", status.get("difficulty_level"))
+        if level is not None:
+            max_level = status.get("max_level")
+            parts.append(f"Nivel: {level}/{max_level}" if max_level else f"Nivel: {level}")
+        return "".join(f" | {part}" for part in parts)
+
     def update_session_stats(self):
         """Actualizar estadísticas de sesión"""
-        if self.current_game and self.current_game_is_running():
+        if self._transition_message:
+            active_game = f"⏳ {self._transition_message}"
+        elif self.current_game and self.current_game_is_running():
             if hasattr(self.current_game, "test_mode") and self.current_game.test_mode:
                 active_game = f"{self.current_game.name} (Modo Prueba)"
             else:
-                active_game = self.current_game.name
+                active_game = self.current_game.name + self._format_live_status()
         else:
             active_game = "Ninguno"
 
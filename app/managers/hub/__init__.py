@@ -0,0 +1,12 @@
+"""
+Hub central de datos cognitivos
+
+- HubServer: servicio HTTP que recibe las sesiones de las estaciones
+  (la ingesta, el índice y los rollups están en core.cognitive.hub_ingester)
+"""
+
+from .hub_server import HubServer
+
+__all__ = [
+    "HubServer",
+]
@@ -0,0 +1,176 @@
+"""
+Servicio hub: recibe las sesiones de las estaciones por HTTP
+
+POST /sync/missing   {"station_id", "manifest": {rel_path: sha256}} -> {"missing": [...]}
+POST /sync/begin     {"station_id", "rel_path", "sha256"} -> {"offset"}
+PUT  /sync/chunk     ?station_id=&rel_path=&sha256=&offset=  (cuerpo: trozo zlib) -> {"offset"}
+POST /sync/commit    {"station_id", "rel_path", "sha256"} -> {"rel_path", "indexed"}
+GET  /rollups        ?patient_id=&game_type= -> resúmenes diarios (patient_id = "{estación}:{paciente}")
+
+Por defecto escucha solo en 127.0.0.1; para aceptar estaciones de la red
+(p. ej. --host 0.0.0.0) el token es obligatorio. Con token, cada petición
+debe traer la cabecera X-Hub-Token. Las respuestas de error son
+{"error": mensaje} con código 400/401/404/500.
+"""
+
+import hmac
+import ipaddress
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from core.cognitive.hub_ingester import MAX_CHUNK_BYTES, HubIngester
+from core.cognitive.session_sync import HUB_TOKEN_HEADER
+
+DEFAULT_HUB_HOST = "127.0.0.1"
+DEFAULT_HUB_PORT = 8770
+MAX_JSON_BYTES = 16 * 1024 * 1024  # Un manifiesto con muchas sesiones
+
+Response = Tuple[int, Any]
+
+
+class HubRequestHandler(BaseHTTPRequestHandler):
+    """Una petición de una estación (cada una en su hilo)"""
+
+    server: "HubServer"
+
+    ROUTES = {
+        ("POST", "/sync/missing"): "post_missing",
+        ("POST", "/sync/begin"): "post_begin",
+        ("PUT", "/sync/chunk"): "put_chunk",
+        ("POST", "/sync/commit"): "post_commit",
+        ("GET", "/rollups"): "get_rollups",
+    }
+
+    @property
+    def ingester(self) -> HubIngester:
+        return self.server.ingester
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        route = self.ROUTES.get((method, url.path.rstrip("/")))
+        if route is None:
+            self._send_json(404, {"error": f"Ruta no encontrada: {method} {url.path}"})
+            return
+        if not self.server.authorized(self.headers.get(HUB_TOKEN_HEADER)):
+            self._send_json(401, {"error": "Token inválido"})
+            return
+
+        try:
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            response = getattr(self, route)(query)
+        except ValueError as e:
+            response = (400, {"error": str(e)})
+        except Exception as e:
+            print(f"❌ Error en hub ({method} {url.path}): {e}")
+            response = (500, {"error": str(e)})
+        self._send_json(*response)
+
+    def _read_body(self, limit: int) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > limit:
+            raise ValueError("Cuerpo de la petición demasiado grande")
+        return self.rfile.read(length) if length else b""
+
+    def _read_json(self) -> Dict[str, Any]:
+        try:
+            body = json.loads(self._read_body(MAX_JSON_BYTES) or b"{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido: {e}")
+        if not isinstance(body, dict):
+            raise ValueError("Se esperaba un objeto JSON")
+        return body
+
+    def _send_json(self, status: int, payload: Any):
+        data = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Sin log por petición: cada trozo es una petición
+        pass
+
+    # ===== RUTAS =====
+
+    def post_missing(self, query) -> Response:
+        body = self._read_json()
+        manifest = body.get("manifest")
+        if not isinstance(manifest, dict):
+            raise ValueError("Falta manifest")
+        return 200, {"missing": self.ingester.missing(str(body.get("station_id")), manifest)}
+
+    def post_begin(self, query) -> Response:
+        body = self._read_json()
+        offset = self.ingester.begin_upload(str(body.get("station_id")), str(body.get("rel_path")),
+                                            str(body.get("sha256")))
+        return 200, {"offset": offset}
+
+    def put_chunk(self, query) -> Response:
+        # Comprimido nunca debería superar mucho al original
+        data = self._read_body(MAX_CHUNK_BYTES + 1024)
+        offset = self.ingester.put_chunk(query.get("station_id", ""), query.get("rel_path", ""),
+                                         query.get("sha256", ""), int(query.get("offset", -1)), data)
+        return 200, {"offset": offset}
+
+    def post_commit(self, query) -> Response:
+        body = self._read_json()
+        return 200, self.ingester.commit_upload(str(body.get("station_id")), str(body.get("rel_path")),
+                                                str(body.get("sha256")))
+
+    def get_rollups(self, query) -> Response:
+        return 200, self.ingester.query_rollups(query.get("patient_id"), query.get("game_type"))
+
+
+def is_loopback_host(host: str) -> bool:
+    """¿Dirección solo accesible desde este equipo?"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class HubServer(ThreadingHTTPServer):
+    """Servidor HTTP del hub (hilo propio, una petición por hilo)"""
+
+    daemon_threads = True
+
+    def __init__(self, ingester: HubIngester, host: str = DEFAULT_HUB_HOST,
+                 port: int = DEFAULT_HUB_PORT, token: Optional[str] = None):
+        if not token and not is_loopback_host(host):
+            raise ValueError(f"Escuchar en {host} sin token expondría el hub a toda la red: usa --token")
+        super().__init__((host, port), HubRequestHandler)
+        self.ingester = ingester
+        self.token = token
+        self._thread: Optional[threading.Thread] = None
+
+    def authorized(self, token: Optional[str]) -> bool:
+        if not self.token:
+            return True
+        return hmac.compare_digest((token or "").encode("utf-8"), self.token.encode("utf-8"))
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="hub-server", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Dejar de aceptar peticiones"""
+        if self._thread:
+            self.shutdown()
+            self._thread.join(2.0)
+        self.server_close()
@@ -0,0 +1,16 @@
+"""
+Modo multi-estación: varias estaciones de juego en un mismo equipo
+
+- StationSupervisor: lanza un proceso por Arduino/puerto y los comanda
+- StationHandle: estado de una estación visto desde el supervisor
+- run_station: punto de entrada del proceso de estación
+"""
+
+from .station_supervisor import StationSupervisor, StationHandle
+from .station_worker import run_station
+
+__all__ = [
+    "StationSupervisor",
+    "StationHandle",
+    "run_station",
+]
@@ -0,0 +1,55 @@
+"""
+Protocolo entre el supervisor y los procesos de estación
+
+Los mensajes son dicts simples (se envían por multiprocessing.Queue):
+- Órdenes al proceso:  {"command": CMD_*, ...}
+- Eventos al supervisor: {"station": id, "event": EVENT_*, ...}
+"""
+
+from typing import Any, Dict
+
+# Órdenes
+CMD_START = "start"        # game_id
+CMD_TEST = "test"          # game_id
+CMD_STOP = "stop"
+CMD_STATUS = "status"
+CMD_SHUTDOWN = "shutdown"
+
+# Eventos
+EVENT_CONNECTED = "connected"    # port
+EVENT_CONNECTION = "connection"  # state, message (hot-plug: perdida / reconectada)
+EVENT_PROGRESS = "progress"      # message
+EVENT_RESULT = "result"          # action, game_id, success, message, cancelled
+EVENT_STATUS = "status"          # game_id, changes (delta del bus de eventos)
+EVENT_SNAPSHOT = "snapshot"      # status (get_game_status completo)
+EVENT_ERROR = "error"            # message
+EVENT_EXITED = "exited"          # exitcode
+
+# Estados de estación (vistos desde el supervisor)
+STATE_STARTING = "Iniciando"
+STATE_READY = "Lista"
+STATE_BUSY = "Procesando"
+STATE_PLAYING = "Jugando"
+STATE_DISCONNECTED = "Sin Arduino"
+STATE_FAILED = "Error"
+STATE_STOPPED = "Detenida"
+
+
+def command(name: str, **data) -> Dict[str, Any]:
+    return {"command": name, **data}
+
+
+def event(station_id: str, name: str, **data) -> Dict[str, Any]:
+    return {"station": station_id, "event": name, **data}
+
+
+def picklable_status(status: Dict[str, Any]) -> Dict[str, Any]:
+    """Solo valores simples del estado del juego (no se envían objetos del juego)"""
+    simple = (str, int, float, bool, type(None))
+    result = {}
+    for key, value in status.items():
+        if isinstance(value, simple):
+            result[key] = value
+        elif isinstance(value, (list, tuple)) and all(isinstance(item, simple) for item in value):
+            result[key] = list(value)
+    return result
@@ -0,0 +1,249 @@
+"""
+Supervisor multi-estación: un proceso por Arduino/puerto
+
+El supervisor (proceso de la interfaz) lanza un proceso de estación por
+puerto y se comunica con él por colas:
+- una cola de órdenes por estación (start/test/stop/status/shutdown)
+- una cola de eventos compartida que lee un hilo del supervisor
+
+El estado de cada estación (StationHandle) se actualiza en el hilo donde
+corren los listeners (con `post`, normalmente el de Tk).
+"""
+
+import multiprocessing
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .station_protocol import (
+    CMD_SHUTDOWN,
+    CMD_START,
+    CMD_STATUS,
+    CMD_STOP,
+    CMD_TEST,
+    EVENT_CONNECTED,
+    EVENT_CONNECTION,
+    EVENT_ERROR,
+    EVENT_EXITED,
+    EVENT_PROGRESS,
+    EVENT_RESULT,
+    EVENT_SNAPSHOT,
+    EVENT_STATUS,
+    STATE_BUSY,
+    STATE_DISCONNECTED,
+    STATE_FAILED,
+    STATE_PLAYING,
+    STATE_READY,
+    STATE_STARTING,
+    STATE_STOPPED,
+    command,
+    event,
+)
+from .station_worker import run_station
+
+SHUTDOWN_TIMEOUT = 8.0  # Segundos para que una estación cierre antes de terminarla
+EVENT_POLL_SECONDS = 1.0
+
+
+@dataclass
+class StationHandle:
+    """Estación vista desde el supervisor"""
+
+    station_id: str
+    port: str
+    process: Any = None
+    commands: Any = None
+    state: str = STATE_STARTING
+    connected: bool = False
+    game_id: Optional[str] = None
+    message: str = ""
+    live_status: Dict[str, Any] = field(default_factory=dict)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def idle_state(self) -> str:
+        """Estado cuando no hay una orden en curso"""
+        if not self.connected:
+            return STATE_DISCONNECTED
+        return STATE_PLAYING if self.game_id else STATE_READY
+
+
+class StationSupervisor:
+    """Lanza, comanda y vigila los procesos de estación"""
+
+    def __init__(self, post: Optional[Callable[[Callable], None]] = None):
+        # spawn en todas las plataformas: cada estación arranca limpia (sin SDL/Tk heredados)
+        self._context = multiprocessing.get_context("spawn")
+        self._events = self._context.Queue()
+        self._post_callback = post
+        self.stations: Dict[str, StationHandle] = {}
+        self._listeners: List[Callable[[StationHandle, dict], None]] = []
+        self._stop = threading.Event()
+        self._reader = threading.Thread(target=self._read_events, name="station-events", daemon=True)
+        self._reader.start()
+
+    # ===== ESTACIONES =====
+
+    def add_station(self, station_id: str, port: str) -> StationHandle:
+        """Lanzar el proceso de una estación"""
+        if station_id in self.stations and self.stations[station_id].is_alive():
+            raise ValueError(f"La estación {station_id} ya está en marcha")
+
+        handle = StationHandle(station_id, port, commands=self._context.Queue())
+        handle.process = self._context.Process(
+            target=run_station,
+            args=(station_id, port, handle.commands, self._events),
+            name=f"station-{station_id}",
+            daemon=True,
+        )
+        self.stations[station_id] = handle
+        handle.process.start()
+        print(f"🏥 Estación {station_id} lanzada en {port} (pid {handle.process.pid})")
+        return handle
+
+    def remove_station(self, station_id: str, timeout: float = SHUTDOWN_TIMEOUT):
+        """Cerrar una estación (detiene su juego y suelta su Arduino)"""
+        handle = self.stations.pop(station_id, None)
+        if handle:
+            self._close(handle, timeout)
+
+    def _close(self, handle: StationHandle, timeout: float):
+        if handle.is_alive():
+            self._send(handle, command(CMD_SHUTDOWN))
+            handle.process.join(timeout)
+            if handle.process.is_alive():
+                print(f"⚠️ Estación {handle.station_id} no responde, terminando proceso")
+                handle.process.terminate()
+                handle.process.join(1.0)
+        handle.state = STATE_STOPPED
+
+    # ===== ÓRDENES =====
+
+    def _send(self, handle: StationHandle, message: dict) -> bool:
+        if not handle.is_alive():
+            return False
+        try:
+            handle.commands.put(message)
+            return True
+        except Exception as e:
+            print(f"⚠️ No se pudo enviar orden a {handle.station_id}: {e}")
+            return False
+
+    def _command(self, station_id: str, message: dict) -> bool:
+        handle = self.stations.get(station_id)
+        if handle is None:
+            return False
+        if message["command"] in (CMD_START, CMD_TEST, CMD_STOP):
+            handle.state = STATE_BUSY
+        return self._send(handle, message)
+
+    def start_game(self, station_id: str, game_id: str) -> bool:
+        return self._command(station_id, command(CMD_START, game_id=game_id))
+
+    def start_test_mode(self, station_id: str, game_id: str) -> bool:
+        return self._command(station_id, command(CMD_TEST, game_id=game_id))
+
+    def stop_game(self, station_id: str) -> bool:
+        return self._command(station_id, command(CMD_STOP))
+
+    def request_status(self, station_id: str) -> bool:
+        """Pedir el estado completo (llega como EVENT_SNAPSHOT)"""
+        return self._command(station_id, command(CMD_STATUS))
+
+    # ===== EVENTOS =====
+
+    def add_listener(self, callback: Callable[[StationHandle, dict], None]):
+        """callback(handle, event) por cada evento de cualquier estación"""
+        self._listeners.append(callback)
+
+    def _post(self, callback: Callable):
+        if self._post_callback is None:
+            callback()
+            return
+        try:
+            self._post_callback(callback)
+        except Exception as e:
+            print(f"⚠️ No se pudo notificar a la interfaz: {e}")
+
+    def _read_events(self):
+        while not self._stop.is_set():
+            try:
+                message = self._events.get(timeout=EVENT_POLL_SECONDS)
+            except queue.Empty:
+                self._check_processes()
+                continue
+            except (EOFError, OSError):
+                break
+            self._post(lambda message=message: self._dispatch(message))
+
+    def _check_processes(self):
+        """Estaciones que murieron sin avisar (p. ej. crash del intérprete)"""
+        for handle in list(self.stations.values()):
+            process = handle.process
+            if process is not None and not process.is_alive() and handle.state not in (STATE_FAILED, STATE_STOPPED):
+                message = event(handle.station_id, EVENT_EXITED, exitcode=process.exitcode)
+                self._post(lambda message=message: self._dispatch(message))
+
+    def _dispatch(self, message: dict):
+        handle = self.stations.get(message.get("station"))
+        if handle is None:
+            return
+        self._apply(handle, message)
+        for listener in list(self._listeners):
+            try:
+                listener(handle, message)
+            except Exception as e:
+                print(f"⚠️ Error en listener de estaciones: {e}")
+
+    @staticmethod
+    def _apply(handle: StationHandle, message: dict):
+        """Actualizar el estado de la estación según el evento"""
+        name = message["event"]
+        if name == EVENT_CONNECTED:
+            handle.connected = True
+            handle.state = STATE_READY
+            handle.message = f"Conectada en {message['port']}"
+        elif name == EVENT_CONNECTION:
+            # "lost" = core.arduino_connection.STATE_LOST (no se importa aquí: arrastra pyfirmata)
+            handle.connected = message["state"] != "lost"
+            if handle.state != STATE_BUSY:
+                handle.state = handle.idle_state()
+            handle.message = message["message"]
+        elif name == EVENT_PROGRESS:
+            handle.message = message["message"]
+        elif name == EVENT_RESULT:
+            handle.message = message["message"].split("\n")[0]
+            if message["cancelled"] or message["action"] == "stop":
+                handle.game_id = None
+                handle.live_status.clear()
+            elif message["success"]:
+                handle.game_id = message["game_id"]
+                handle.live_status.clear()
+            handle.state = handle.idle_state()
+        elif name == EVENT_STATUS:
+            if message["game_id"] == handle.game_id:
+                handle.live_status.update(message["changes"])
+        elif name == EVENT_SNAPSHOT:
+            handle.live_status.update(message["status"])
+        elif name == EVENT_ERROR:
+            handle.message = message["message"]
+            if handle.state == STATE_STARTING:
+                handle.state = STATE_FAILED
+        elif name == EVENT_EXITED:
+            handle.state = STATE_STOPPED if message.get("exitcode") == 0 else STATE_FAILED
+            handle.connected = False
+            handle.game_id = None
+
+    # ===== CIERRE =====
+
+    def shutdown(self):
+        """Cerrar todas las estaciones en paralelo y el lector de eventos"""
+        handles = list(self.stations.values())
+        for handle in handles:
+            self._send(handle, command(CMD_SHUTDOWN))
+        for handle in handles:
+            self._close(handle, SHUTDOWN_TIMEOUT)
+        self._stop.set()
+        self._reader.join(EVENT_POLL_SECONDS * 2)
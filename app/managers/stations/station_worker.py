@@ -0,0 +1,191 @@
+"""
+Proceso de estación: un Arduino, un juego y una ventana pygame por proceso
+
+Cada estación corre en su propio proceso (multiprocessing, contexto spawn):
+su ArduinoManager, su GameLifecycle, su runtime pygame y su logger
+cognitivo. Así el singleton de ArduinoManager y el current_game único
+siguen valiendo dentro de cada proceso, y las estaciones usan núcleos
+distintos en lugar de competir por el GIL.
+
+run_station es el punto de entrada del proceso (debe ser importable).
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+
+from .station_protocol import (
+    CMD_SHUTDOWN,
+    CMD_START,
+    CMD_STATUS,
+    CMD_STOP,
+    CMD_TEST,
+    EVENT_CONNECTED,
+    EVENT_CONNECTION,
+    EVENT_ERROR,
+    EVENT_EXITED,
+    EVENT_PROGRESS,
+    EVENT_RESULT,
+    EVENT_SNAPSHOT,
+    EVENT_STATUS,
+    event,
+    picklable_status,
+)
+
+STATUS_FORWARD_INTERVAL = 0.5  # Segundos mínimos entre deltas enviados al supervisor
+
+
+class StationWorker:
+    """Atiende las órdenes del supervisor dentro del proceso de estación"""
+
+    def __init__(self, station_id: str, port: str, commands, events):
+        self.station_id = station_id
+        self.port = port
+        self.commands = commands
+        self.events = events
+        self.arduino = None
+        self.connection = None
+        self.lifecycle = None
+        self._status_subscription = None
+
+    def emit(self, name: str, **data):
+        try:
+            self.events.put(event(self.station_id, name, **data))
+        except Exception as e:
+            print(f"⚠️ [{self.station_id}] No se pudo enviar evento {name}: {e}")
+
+    def setup(self) -> bool:
+        """Conectar el Arduino y preparar el ciclo de vida de juegos"""
+        # Importes aquí: se cargan en el proceso de la estación, no en el supervisor
+        from core.arduino_connection import ArduinoConnectionService
+        from core.arduino_manager import ArduinoManager
+        from core.event_bus import TOPIC_GAME_STATUS, get_event_bus
+        from managers.components.game_lifecycle import GameLifecycle
+        from managers.components.game_registry import GameRegistry
+
+        self.arduino = ArduinoManager()
+        if not self.arduino.connect(self.port):
+            self.emit(EVENT_ERROR, message=f"No se pudo conectar a {self.port}")
+            return False
+
+        # Reconexión automática si se desenchufa la placa de esta estación
+        self.connection = ArduinoConnectionService(
+            self.arduino,
+            on_state=lambda state, message: self.emit(EVENT_CONNECTION, state=state, message=message),
+        )
+        self.connection.start_watching()
+
+        # Sin pool de pre-carga: cada estación solo construye lo que se pide
+        self.lifecycle = GameLifecycle(self.arduino, GameRegistry(), warm_games=False)
+
+        self._status_subscription = get_event_bus().subscribe(
+            TOPIC_GAME_STATUS,
+            lambda delta: self.emit(EVENT_STATUS, game_id=delta.game_id, changes=delta.changes),
+            min_interval=STATUS_FORWARD_INTERVAL,
+        )
+
+        self.emit(EVENT_CONNECTED, port=self.arduino.port)
+        return True
+
+    def serve(self):
+        """Atender órdenes hasta CMD_SHUTDOWN"""
+        parent = multiprocessing.parent_process()
+        while True:
+            try:
+                message = self.commands.get(timeout=1.0)
+            except queue.Empty:
+                # Si el supervisor murió nadie mandará CMD_SHUTDOWN
+                if parent is not None and not parent.is_alive():
+                    print(f"⚠️ [{self.station_id}] Supervisor perdido, cerrando estación")
+                    break
+                continue
+            except (EOFError, OSError):
+                # El supervisor murió: cerrar la estación
+                break
+
+            name = message.get("command")
+            if name == CMD_SHUTDOWN:
+                break
+            try:
+                self.handle(name, message)
+            except Exception as e:
+                self.emit(EVENT_ERROR, message=f"Error procesando '{name}': {e}")
+
+    def handle(self, name: str, message: dict):
+        game_id = message.get("game_id")
+
+        if name == CMD_START:
+            self.lifecycle.start_game_async(
+                game_id,
+                on_done=lambda success, text, cancelled: self._result("start", game_id, success, text, cancelled),
+                on_progress=lambda text: self.emit(EVENT_PROGRESS, message=text),
+            )
+        elif name == CMD_TEST:
+            self.lifecycle.start_test_mode_async(
+                game_id,
+                on_done=lambda success, text, cancelled: self._result("test", game_id, success, text, cancelled),
+                on_progress=lambda text: self.emit(EVENT_PROGRESS, message=text),
+            )
+        elif name == CMD_STOP:
+            if self.lifecycle.cancel_transition():
+                return
+            current_id = self.lifecycle.get_current_game_id()
+            self.lifecycle.stop_current_game_async(
+                on_done=lambda success, game_name, cancelled: self._result(
+                    "stop", current_id, success, f"{game_name} detenido", cancelled
+                ),
+                on_progress=lambda text: self.emit(EVENT_PROGRESS, message=text),
+            )
+        elif name == CMD_STATUS:
+            status = self.lifecycle.get_current_game_status()
+            status["game_id"] = self.lifecycle.get_current_game_id()
+            self.emit(EVENT_SNAPSHOT, status=picklable_status(status))
+        else:
+            self.emit(EVENT_ERROR, message=f"Orden desconocida: {name}")
+
+    def _result(self, action: str, game_id, success: bool, message: str, cancelled: bool):
+        self.emit(EVENT_RESULT, action=action, game_id=game_id, success=success,
+                  message=message, cancelled=cancelled)
+
+    def teardown(self):
+        """Detener juego, soltar el Arduino y cerrar pygame"""
+        if self._status_subscription:
+            self._status_subscription.cancel()
+        if self.lifecycle:
+            self.lifecycle.stop_current_game()
+            self.lifecycle.shutdown()
+        if self.connection:
+            self.connection.shutdown()
+        if self.arduino:
+            self.arduino.disconnect()
+
+        from core.pygame_runtime import get_pygame_runtime
+        get_pygame_runtime().shutdown()
+
+
+def run_station(station_id: str, port: str, commands, events):
+    """Punto de entrada del proceso de estación"""
+    from core.cognitive.cognitive_logger import STATION_ENV_VAR
+
+    os.environ[STATION_ENV_VAR] = station_id
+    threading.current_thread().name = f"station-{station_id}"
+    print(f"🏥 Estación {station_id} iniciando en {port} (pid {os.getpid()})")
+
+    worker = StationWorker(station_id, port, commands, events)
+    exitcode = 0
+    try:
+        if worker.setup():
+            worker.serve()
+        else:
+            exitcode = 1
+    except Exception as e:
+        exitcode = 1
+        worker.emit(EVENT_ERROR, message=f"Error crítico en la estación: {e}")
+    finally:
+        try:
+            worker.teardown()
+        except Exception as e:
+            print(f"⚠️ [{station_id}] Error cerrando la estación: {e}")
+        worker.emit(EVENT_EXITED, exitcode=exitcode)
+        print(f"👋 Estación {station_id} cerrada")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests de la API de control del daemon: rutas, validación y protección local
+"""
+
+import http.client
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip("pyfirmata")  # StationDaemon importa ArduinoManager
+
+from core.event_bus import EventBus
+from managers.daemon.control_api import ControlServer
+
+
+class FakeStation:
+    """Estación mínima: registra las llamadas que recibe la API"""
+
+    def __init__(self):
+        self.bus = EventBus()
+        self.calls = []
+        self.patient = None
+
+    def status(self):
+        return {"arduino_connected": False, "current_game": None, "patient_id": self.patient}
+
+    def list_games(self):
+        return [{"id": "ping_pong", "name": "Ping Pong"}]
+
+    def start_game(self, game_id, test=False):
+        self.calls.append(("start", game_id, test))
+        return {"success": True, "pending": False, "cancelled": False, "message": "ok"}
+
+    def stop_game(self):
+        self.calls.append(("stop",))
+        return {"success": True, "pending": False, "cancelled": False, "message": "ok"}
+
+    def select_patient(self, patient_id):
+        if patient_id not in (None, "P_001"):
+            raise ValueError(f"Paciente no encontrado: {patient_id}")
+        self.patient = patient_id
+        return {"patient_id": patient_id} if patient_id else None
+
+
+@pytest.fixture
+def server():
+    servers = []
+
+    def start(token=None):
+        control = ControlServer(FakeStation(), "127.0.0.1", 0, token=token)
+        control.start()
+        servers.append(control)
+        return control
+
+    yield start
+    for control in servers:
+        control.stop()
+
+
+def _request(control, method, path, body=None, headers=None, host=None):
+    port = control.server_address[1]
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    request_headers = {"Host": host or f"127.0.0.1:{port}"}
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode("utf-8")
+        request_headers["Content-Type"] = "application/json"
+    request_headers.update(headers or {})
+    try:
+        connection.request(method, path, body=data, headers=request_headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_status_games_and_start(server):
+    control = server()
+
+    assert _request(control, "GET", "/status")[0] == 200
+    assert _request(control, "GET", "/games")[1][0]["id"] == "ping_pong"
+
+    status, result = _request(control, "POST", "/start", {"game_id": "ping_pong", "test": True})
+    assert (status, result["success"]) == (200, True)
+    assert control.station.calls == [("start", "ping_pong", True)]
+
+
+def test_validation_errors(server):
+    control = server()
+
+    assert _request(control, "POST", "/start", {})[0] == 400
+    assert _request(control, "POST", "/patient", {"patient_id": "P_404"})[0] == 400
+    assert _request(control, "GET", "/nada")[0] == 404
+
+    status, result = _request(control, "POST", "/patient", {"patient_id": "P_001"})
+    assert (status, result["patient"]["patient_id"]) == (200, "P_001")
+
+
+def test_rejects_foreign_host(server):
+    control = server()
+    port = control.server_address[1]
+
+    assert _request(control, "GET", "/status", host=f"localhost:{port}")[0] == 200
+    assert _request(control, "GET", "/status", host=f"evil.example:{port}")[0] == 403
+    assert _request(control, "GET", "/status", host="127.0.0.1:1")[0] == 403
+
+
+def test_post_requires_json_content_type(server):
+    control = server()
+
+    status, _ = _request(control, "POST", "/stop", headers={"Content-Type": "text/plain"})
+    assert status == 415
+    status, _ = _request(control, "POST", "/stop")  # Sin cuerpo ni Content-Type
+    assert status == 415
+    assert control.station.calls == []
+
+    status, _ = _request(control, "POST", "/stop", headers={"Content-Type": "application/json"})
+    assert status == 200
+
+
+def test_bearer_token(server):
+    control = server(token="secreto")
+
+    assert _request(control, "GET", "/status")[0] == 401
+    assert _request(control, "GET", "/status", headers={"Authorization": "Bearer otro"})[0] == 401
+    assert _request(control, "GET", "/status", headers={"Authorization": "Bearer secreto"})[0] == 200
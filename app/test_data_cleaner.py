@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests de los backups incrementales de CognitiveDataCleaner: deduplicación,
+restauración y poda de snapshots
+"""
+
+import glob
+import os
+import sqlite3
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.cognitive.data_cleaner import CognitiveDataCleaner
+
+
+def _make_data_dir(tmp_path):
+    data_dir = tmp_path / "cognitive"
+    sessions_dir = data_dir / "piano_simon" / "sessions"
+    sessions_dir.mkdir(parents=True)
+    (sessions_dir / "P_001_piano_simon_20250301_101010.csv").write_text("timestamp,level\n1.0,1\n")
+    # Mismo contenido en dos sesiones: un solo objeto en el almacén
+    (sessions_dir / "P_002_piano_simon_20250301_101010.csv").write_text("timestamp,level\n1.0,1\n")
+    (data_dir / "piano_simon" / "patients.json").write_text('{"P_001": {}}')
+    (data_dir / "shared").mkdir()
+    with sqlite3.connect(str(data_dir / "shared" / "cognitive.db")) as conn:
+        conn.execute("CREATE TABLE patients (id TEXT)")
+        conn.execute("INSERT INTO patients VALUES ('P_001')")
+    return data_dir
+
+
+def _objects(cleaner):
+    return glob.glob(os.path.join(cleaner.objects_dir, "*", "*.gz"))
+
+
+def test_snapshot_deduplicates_content(tmp_path):
+    cleaner = CognitiveDataCleaner(str(_make_data_dir(tmp_path)))
+
+    assert cleaner.create_snapshot().startswith("✅")
+    first = cleaner.list_snapshots()[0]
+    assert first['total_files'] == 4
+    # Dos CSV idénticos + patients.json + registro SQLite -> 3 objetos
+    assert first['new_objects'] == 3
+    assert len(_objects(cleaner)) == 3
+
+    # Sin cambios: nuevo manifiesto, ningún objeto nuevo
+    cleaner.create_snapshot()
+    second = cleaner.list_snapshots()[0]
+    assert second['manifest_path'] != first['manifest_path']
+    assert second['new_objects'] == 0
+    assert len(_objects(cleaner)) == 3
+
+
+def test_snapshot_stores_only_changed_files(tmp_path):
+    data_dir = _make_data_dir(tmp_path)
+    cleaner = CognitiveDataCleaner(str(data_dir))
+    cleaner.create_snapshot()
+
+    session = data_dir / "piano_simon" / "sessions" / "P_001_piano_simon_20250301_101010.csv"
+    session.write_text("timestamp,level\n1.0,1\n2.0,2\n")
+    cleaner.create_snapshot()
+
+    latest = cleaner.list_snapshots()[0]
+    assert latest['new_objects'] == 1
+    assert len(_objects(cleaner)) == 4
+
+
+def test_restore_round_trip(tmp_path):
+    data_dir = _make_data_dir(tmp_path)
+    cleaner = CognitiveDataCleaner(str(data_dir))
+    cleaner.create_snapshot()
+    original = cleaner.list_snapshots()[0]['manifest_path']
+
+    session = data_dir / "piano_simon" / "sessions" / "P_001_piano_simon_20250301_101010.csv"
+    session.write_text("cambiado\n")
+    cleaner.create_snapshot()
+
+    target = tmp_path / "restored"
+    result = cleaner.restore_snapshot(original, str(target))
+
+    assert result.startswith("✅ Restaurados 4 archivos")
+    restored = target / "piano_simon" / "sessions" / "P_001_piano_simon_20250301_101010.csv"
+    assert restored.read_text() == "timestamp,level\n1.0,1\n"
+    assert (target / "piano_simon" / "patients.json").read_text() == '{"P_001": {}}'
+    with sqlite3.connect(str(target / "shared" / "cognitive.db")) as conn:
+        assert conn.execute("SELECT id FROM patients").fetchall() == [("P_001",)]
+
+
+def test_prune_removes_unreferenced_objects(tmp_path):
+    data_dir = _make_data_dir(tmp_path)
+    cleaner = CognitiveDataCleaner(str(data_dir))
+    cleaner.create_snapshot()
+
+    session = data_dir / "piano_simon" / "sessions" / "P_001_piano_simon_20250301_101010.csv"
+    session.write_text("cambiado\n")
+    cleaner.create_snapshot()
+
+    cleaner.prune_snapshots(keep=1)
+
+    assert len(cleaner.list_snapshots()) == 1
+    # El CSV anterior de P_001 sigue referenciado por P_002 (mismo contenido)
+    assert len(_objects(cleaner)) == 4
+    assert cleaner.restore_snapshot(target_dir=str(tmp_path / "restored")).startswith("✅ Restaurados 4")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests de la reducción de puntos: LTTB y líneas que se recalculan al hacer zoom
+"""
+
+import os
+import sys
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.analytics.components.downsampling import lttb_indices, plot_downsampled
+
+
+def test_lttb_keeps_endpoints_and_order():
+    x = np.arange(10_000, dtype=float)
+    y = np.sin(x / 50.0) + np.random.default_rng(7).normal(0, 0.1, len(x))
+
+    keep = lttb_indices(x, y, 300)
+
+    assert len(keep) == 300
+    assert (keep[0], keep[-1]) == (0, len(x) - 1)
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_lttb_small_series_is_untouched():
+    x = np.arange(5, dtype=float)
+    assert list(lttb_indices(x, x, 10)) == [0, 1, 2, 3, 4]
+    assert list(lttb_indices(x, x, 2)) == [0, 1, 2, 3, 4]
+
+
+def test_lttb_keeps_isolated_peak():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[437] = 100.0
+
+    assert 437 in lttb_indices(x, y, 50)
+
+
+def test_line_without_marker_renders(tmp_path):
+    fig, ax = plt.subplots()
+    try:
+        line = plot_downsampled(ax, [1, 2, 3], [1, 2, 3], envelope=False, marker=None)
+        fig.savefig(str(tmp_path / "chart.png"))
+        assert line.line.get_marker() == "None"
+    finally:
+        plt.close(fig)
+
+
+def test_zoom_restores_full_resolution_and_marker():
+    x = np.arange(5000, dtype=float)
+    fig, ax = plt.subplots()
+    try:
+        line = plot_downsampled(ax, x, np.cos(x / 100.0), budget=200, marker="o")
+        assert len(line.line.get_xdata()) == 200
+        assert line.line.get_marker() == "None"
+
+        ax.set_xlim(1000, 1050)
+        assert len(line.line.get_xdata()) <= 200
+        assert line.line.get_xdata()[0] <= 1000 and line.line.get_xdata()[-1] >= 1050
+        assert line.line.get_marker() == "o"
+
+        ax.set_xlim(0, 4999)
+        assert len(line.line.get_xdata()) == 200
+        assert line.line.get_marker() == "None"
+    finally:
+        plt.close(fig)
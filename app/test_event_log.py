@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests del log binario de eventos (.cglog): ida y vuelta, DataFrame, exportación CSV
+y sesiones nuevas en binario por defecto
+"""
+
+import csv
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.cognitive.event_log import (
+    EVENT_LOG_EXTENSION,
+    EventLogWriter,
+    default_export_path,
+    event_log_to_dataframe,
+    export_event_log_to_csv,
+    iter_event_log,
+    read_event_log_header,
+)
+from core.cognitive.session_manager import SessionManager
+
+
+def _write_piano_log(directory, events=3):
+    sessions_dir = directory / "piano_simon" / "sessions"
+    sessions_dir.mkdir(parents=True)
+    file_path = str(sessions_dir / "P_001_piano_simon_20250301_101010.cglog")
+    start = time.time()
+    with EventLogWriter(file_path, "piano_simon", "P_001_piano_simon_20250301_101010", "P_001") as writer:
+        for index in range(events):
+            writer.append({
+                "timestamp": start + index,
+                "level": index + 1,
+                "sequence_length": 3,
+                "presentation_time_ms": 1500.0,
+                "response_time_ms": 800.0 + index,
+                "accuracy": 1.0 if index % 2 == 0 else 0.5,
+                "error_type": "correct" if index % 2 == 0 else "nota_nueva",
+                "sequence_shown": [1, 3, 2],
+                "sequence_input": [1, 3, 2] if index % 2 == 0 else [1, 4],
+                "reaction_latency_ms": 800.0,
+                "is_correct": index % 2 == 0,
+                "error_position": -1 if index % 2 == 0 else 1,
+            })
+    return file_path, start
+
+
+def test_round_trip(tmp_path):
+    file_path, start = _write_piano_log(tmp_path)
+
+    header = read_event_log_header(file_path)
+    assert header["schema"] == "piano"
+    assert header["patient_id"] == "P_001"
+    # Valor de enum desconocido: se interna en la cabecera
+    assert "nota_nueva" in header["enums"]["error_type"]
+
+    events = list(iter_event_log(file_path))
+    assert len(events) == 3
+    assert events[0]["timestamp"] == start
+    assert events[0]["sequence_shown"] == [1, 3, 2]
+    assert events[1]["sequence_input"] == [1, 4]
+    assert events[1]["error_type"] == "nota_nueva"
+    assert events[1]["is_correct"] is False
+    assert events[2]["level"] == 3
+
+
+def test_export_goes_outside_sessions(tmp_path):
+    file_path, _ = _write_piano_log(tmp_path)
+
+    csv_path = export_event_log_to_csv(file_path)
+    assert csv_path == default_export_path(file_path)
+    assert os.path.basename(os.path.dirname(csv_path)) == "exports"
+    # sessions/ solo tiene el log binario: el índice no ve la sesión dos veces
+    assert os.listdir(os.path.dirname(file_path)) == [os.path.basename(file_path)]
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3
+    assert rows[0]["sequence_shown"] == "1|3|2"
+
+
+def test_dataframe_and_csv_use_the_same_local_time(tmp_path):
+    file_path, _ = _write_piano_log(tmp_path)
+
+    with open(export_event_log_to_csv(file_path), newline="", encoding="utf-8") as f:
+        csv_timestamps = [row["timestamp"] for row in csv.DictReader(f)]
+    frame = event_log_to_dataframe(file_path)
+
+    assert [value.isoformat() for value in frame["timestamp"].dt.to_pydatetime()] == csv_timestamps
+    assert list(frame["sequence_input"]) == ["1|3|2", "1|4", "1|3|2"]
+
+
+def test_new_sessions_are_binary_and_export_csv_on_demand(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = SessionManager()
+
+    logger = manager.start_session("osu_rhythm", "P_001")
+    logger.log_generic_event("hit", 1, reaction_time=420.0, accuracy=1.0, success=True)
+    file_path = manager.end_session()
+
+    assert file_path.endswith(EVENT_LOG_EXTENSION)
+    assert manager.list_session_files("osu_rhythm") == [file_path]
+    assert list(manager.load_session_data(file_path)["reaction_time_ms"]) == [420.0]
+
+    with open(manager.export_session_to_csv(file_path), newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [float(row["reaction_time_ms"]) for row in rows] == [420.0]
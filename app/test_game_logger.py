@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests del GameLogger asíncrono: cola llena y contadores, vaciado al cerrar
+y rotación en segmentos comprimidos
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core import game_logger as game_logger_module
+from core.analytics.components.log_parser import LogParser
+from core.cognitive.cognitive_logger import STATION_ENV_VAR
+from core.game_logger import (
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_OLDEST,
+    GameLogger,
+    shutdown_game_loggers,
+)
+
+
+class GateHandler(logging.Handler):
+    """Handler que retiene al hilo escritor hasta abrir la compuerta"""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.entered.set()
+        self.gate.wait(5)
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def make_logger(tmp_path, monkeypatch):
+    """GameLogger en tmp_path (handlers y escritor cerrados al final: el nombre se reutiliza)"""
+    monkeypatch.delenv(STATION_ENV_VAR, raising=False)
+    loggers = []
+
+    def make(**options):
+        logger = GameLogger(f"LoggerTest{len(loggers)}", log_dir=str(tmp_path), **options)
+        loggers.append(logger)
+        return logger
+
+    yield make
+    for logger in loggers:
+        if logger.writer:
+            logger.writer.close()
+        for handler in list(logger.logger.handlers):
+            handler.close()
+            logger.logger.removeHandler(handler)
+
+
+def _blocked_logger(make_logger, overflow):
+    """Logger con cola de 2 y el escritor retenido en el primer evento"""
+    logger = make_logger(queue_size=2, overflow=overflow, structured=False)
+    gate = GateHandler()
+    logger.logger.addHandler(gate)
+    logger.log_game_event("GAME", "e0")
+    assert gate.entered.wait(5)
+    return logger, gate
+
+
+# ===== COLA LLENA =====
+
+def test_drop_newest_counts_and_reports(make_logger):
+    logger, gate = _blocked_logger(make_logger, OVERFLOW_DROP_NEWEST)
+    for i in range(1, 4):
+        logger.log_game_event("GAME", f"e{i}")
+
+    stats = logger.get_stats()
+    assert (stats["enqueued"], stats["dropped"], stats["queued"]) == (3, 1, 2)
+
+    gate.gate.set()
+    assert logger.flush()
+    # El aviso se escribe al terminar la tanda en curso (la del evento retenido)
+    assert gate.messages == ["[GAME] e0", "[LOGGER] ⚠️ 1 eventos descartados (cola de logs llena)",
+                             "[GAME] e1", "[GAME] e2"]
+    assert logger.get_stats()["written"] == 3
+
+
+def test_drop_oldest_keeps_newest(make_logger):
+    logger, gate = _blocked_logger(make_logger, OVERFLOW_DROP_OLDEST)
+    for i in range(1, 4):
+        logger.log_game_event("GAME", f"e{i}")
+
+    stats = logger.get_stats()
+    assert (stats["enqueued"], stats["dropped"], stats["queued"]) == (4, 1, 2)
+
+    gate.gate.set()
+    assert logger.flush()
+    assert gate.messages[0] == "[GAME] e0"
+    assert "1 eventos descartados" in gate.messages[1]
+    assert gate.messages[2:] == ["[GAME] e2", "[GAME] e3"]
+
+
+def test_block_waits_briefly_then_drops(make_logger):
+    logger, gate = _blocked_logger(make_logger, OVERFLOW_BLOCK)
+    logger.log_game_event("GAME", "e1")
+    logger.log_game_event("GAME", "e2")
+
+    started = time.monotonic()
+    logger.log_game_event("GAME", "e3")
+    waited = time.monotonic() - started
+
+    assert game_logger_module.BLOCK_TIMEOUT <= waited < 1.0
+    assert logger.get_stats()["dropped"] == 1
+
+    gate.gate.set()
+    assert logger.flush()
+    assert [m for m in gate.messages if m.startswith("[GAME]")] == ["[GAME] e0", "[GAME] e1", "[GAME] e2"]
+
+
+# ===== CIERRE =====
+
+def test_shutdown_flushes_queued_events(tmp_path, make_logger):
+    logger, gate = _blocked_logger(make_logger, OVERFLOW_DROP_NEWEST)
+    logger.log_game_event("GAME", "e1", score=5)
+    logger.log_game_event("GAME", "e2")
+
+    gate.gate.set()
+    shutdown_game_loggers()
+
+    assert not logger.writer._thread.is_alive()
+    with open(tmp_path / f"{logger.game_name.lower()}.log", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert [line.split(" | ", 2)[2] for line in lines] == ["[GAME] e0", "[GAME] e1 | Score: 5", "[GAME] e2"]
+
+
+# ===== ROTACIÓN =====
+
+def _segment_index(tmp_path, logger):
+    stem = logger.game_name.lower()
+    with open(tmp_path / "segments" / stem / "index.json", encoding="utf-8") as f:
+        return json.load(f)["segments"]
+
+
+def test_rotation_by_size_keeps_every_event(tmp_path, make_logger):
+    logger = make_logger(async_mode=False, rotation="day", max_segment_bytes=400)
+    for score in range(10):
+        logger.log_game_event("SCORE", f"Score: {score}", score=score)
+
+    segments = _segment_index(tmp_path, logger)
+    events = [segment for segment in segments if segment["kind"] == "events"]
+    assert events and all(os.path.exists(tmp_path / "segments" / logger.game_name.lower() / s["file"])
+                          for s in segments)
+    assert {segment["kind"] for segment in segments} == {"events", "text"}
+    assert events[0]["max_score"] == events[0]["events"] - 1
+
+    frame = LogParser(str(tmp_path), use_cache=False).load_all_logs()["Loggertest0"]
+    assert list(frame["score"]) == list(range(10))
+
+
+def test_rotation_when_day_changes(tmp_path, make_logger):
+    logger = make_logger(rotation="day")
+    yesterday = (datetime.now() - timedelta(days=1)).timestamp()
+    for created, message in ((yesterday, "ayer"), (time.time(), "hoy")):
+        logger.writer.put((created, logging.INFO, "GAME", True, game_logger_module._format_event,
+                           (message, None, None), None, False))
+    assert logger.flush()
+
+    segments = _segment_index(tmp_path, logger)
+    events = [segment for segment in segments if segment["kind"] == "events"]
+    assert len(events) == 1
+    assert events[0]["events"] == 1
+    assert datetime.fromisoformat(events[0]["start"]).date() == datetime.fromtimestamp(yesterday).date()
+
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    parser = LogParser(str(tmp_path), use_cache=False)
+    frame = parser.load_all_logs(start=today)["Loggertest0"]
+    assert list(frame["message"]) == ["hoy"]
+    assert len(parser.load_all_logs()["Loggertest0"]) == 2
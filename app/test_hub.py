@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests del hub: sincronización por HTTP, pacientes por estación y acceso
+"""
+
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.cognitive.hub_ingester import HubIngester
+from core.cognitive.session_journal import write_manifest
+from core.cognitive.session_sync import HttpHubClient, SyncAgent
+from managers.hub.hub_server import HubServer
+
+
+def _write_station(base_dir, rows):
+    sessions_dir = base_dir / "piano_simon" / "sessions"
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+    log_file = sessions_dir / "P_001_piano_simon_20250301_101010.csv"
+    lines = ["timestamp,level,accuracy,response_time_ms,is_correct"]
+    lines += [f"2025-03-01T10:10:{10 + i:02d},{i + 1},{accuracy},800,True" for i, accuracy in enumerate(rows)]
+    log_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_manifest(str(log_file), {"session_id": log_file.stem, "patient_id": "P_001",
+                                   "game_type": "piano_simon", "log_file": log_file.name,
+                                   "status": "completed", "started_at": "2025-03-01T10:10:10"})
+
+
+@pytest.fixture
+def hub(tmp_path):
+    servers = []
+
+    def start(token=None):
+        ingester = HubIngester(str(tmp_path / "hub"))
+        server = HubServer(ingester, "127.0.0.1", 0, token=token)
+        server.start()
+        servers.append(server)
+        return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.stop()
+        server.ingester.close()
+
+
+def _agent(tmp_path, station, url, token=None):
+    base_dir = tmp_path / station
+    return SyncAgent(HttpHubClient(url, token=token), station_id=station, base_dir=str(base_dir),
+                     state_file=str(base_dir / "sync_state.json"))
+
+
+def _get_json(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def test_sync_over_http_is_incremental(tmp_path, hub):
+    server, url = hub()
+    _write_station(tmp_path / "E1", [1.0, 0.5])
+    agent = _agent(tmp_path, "E1", url)
+
+    first = agent.sync_once()
+    assert (first["uploaded"], first["failed"]) == (2, 0)  # Log + manifiesto
+    assert agent.sync_once()["pending"] == 0
+
+    stored = tmp_path / "hub" / "stations" / "E1" / "piano_simon" / "sessions"
+    assert sorted(os.listdir(stored)) == ["P_001_piano_simon_20250301_101010.csv",
+                                          "P_001_piano_simon_20250301_101010.manifest.json"]
+
+
+def test_patients_are_namespaced_by_station(tmp_path, hub):
+    server, url = hub()
+    _write_station(tmp_path / "E1", [1.0, 1.0])
+    _write_station(tmp_path / "E2", [0.0, 0.0])
+    _agent(tmp_path, "E1", url).sync_once()
+    _agent(tmp_path, "E2", url).sync_once()
+
+    rollups = _get_json(f"{url}/rollups")
+    assert sorted(rollup["patient_id"] for rollup in rollups) == ["E1:P_001", "E2:P_001"]
+
+    e1 = _get_json(f"{url}/rollups?patient_id=E1:P_001")
+    assert len(e1) == 1
+    assert (e1[0]["sessions"], e1[0]["avg_accuracy"]) == (1, 100.0)
+
+
+def test_token_and_path_validation(tmp_path, hub):
+    server, url = hub(token="secreto")
+    _write_station(tmp_path / "E1", [1.0])
+
+    with pytest.raises(ConnectionError, match="401"):
+        _agent(tmp_path, "E1", url).sync_once()
+    assert _agent(tmp_path, "E1", url, token="secreto").sync_once()["uploaded"] == 2
+
+    client = HttpHubClient(url, token="secreto")
+    with pytest.raises(ConnectionError, match="400"):
+        client.begin_upload("E1", "../../etc/sessions/passwd.csv", "0" * 64)
+    with pytest.raises(urllib.error.HTTPError):
+        _get_json(f"{url}/rollups")
+
+
+def test_network_bind_requires_token(tmp_path):
+    ingester = HubIngester(str(tmp_path / "hub"))
+    try:
+        with pytest.raises(ValueError):
+            HubServer(ingester, "0.0.0.0", 0)
+        server = HubServer(ingester, "0.0.0.0", 0, token="secreto")
+        server.server_close()
+    finally:
+        ingester.close()
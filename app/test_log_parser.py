@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Tests del parser de logs: recarga incremental, checkpoints ante truncado o
+rotación, y vía rápida JSON-lines frente al parser de texto original
+"""
+
+import logging
+import os
+import re
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.analytics.components import log_parser
+from core.analytics.components.log_parser import EVENT_COLUMNS, LogParser, frame_to_events, parse_log_line
+from core.cognitive.cognitive_logger import STATION_ENV_VAR
+from core.game_logger import GameLogger
+
+
+def _line(second, event_type, message, level="INFO"):
+    return f"2025-03-01 10:00:{second:02d} | {level} | [{event_type}] {message}\n"
+
+
+def _reference_parse(line, line_num):
+    """Parser de texto original (una regex por campo), como referencia"""
+    match = re.match(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) \| (\w+) \| \[([A-Z_]+)\] (.+)", line)
+    if not match:
+        return None
+    timestamp_str, level, event_type, message = match.groups()
+    event = {"timestamp": datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S"), "level": level,
+             "event_type": event_type, "message": message, "line_number": line_num}
+
+    score_match = re.search(r"Score:?\s*(\d+)", message)
+    if score_match:
+        event["score"] = int(score_match.group(1))
+    pos_match = re.search(r"\((\d+),\s*(\d+)\)", message)
+    if pos_match:
+        event["x_pos"] = int(pos_match.group(1))
+        event["y_pos"] = int(pos_match.group(2))
+    speed_match = re.search(r"Speed:?\s*([\d.]+)s?", message)
+    if speed_match:
+        event["speed"] = float(speed_match.group(1))
+    duration_match = re.search(r"Duration:?\s*([\d.]+)s", message)
+    if duration_match:
+        event["game_duration"] = float(duration_match.group(1))
+
+    if "PLAYER DEATH" in message or "GAME OVER" in message:
+        event["is_death"] = True
+    if "GOLPE EXITOSO" in message or "esquivado" in message:
+        event["is_success"] = True
+    if "PAUSADO" in message or "PAUSED" in message:
+        event["is_pause"] = True
+    if "JUEGO INICIADO" in message or "GAME STARTED" in message:
+        event["is_game_start"] = True
+    return event
+
+
+@pytest.fixture
+def spy_ranges(monkeypatch):
+    """Registrar los rangos de bytes que se parsean"""
+    ranges = []
+    original = log_parser.parse_log_range
+
+    def spy(log_path, start, end):
+        ranges.append((start, end))
+        return original(log_path, start, end)
+
+    monkeypatch.setattr(log_parser, "parse_log_range", spy)
+    return ranges
+
+
+# ===== CARGA INCREMENTAL =====
+
+def test_reload_parses_only_appended_bytes(tmp_path, spy_ranges):
+    log_file = tmp_path / "ping_pong.log"
+    log_file.write_text(_line(1, "GAME", "GAME STARTED") + _line(2, "SCORE", "Score: 1"), encoding="utf-8")
+    first_size = log_file.stat().st_size
+
+    parser = LogParser(str(tmp_path))
+    assert len(parser.load_all_logs()["Ping Pong"]) == 2
+    assert spy_ranges == [(0, first_size)]
+
+    # Última línea a medio escribir: se deja para la próxima recarga
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write(_line(3, "SCORE", "Score: 2") + "2025-03-01 10:00:04 | INFO | [SCO")
+    complete_size = first_size + len(_line(3, "SCORE", "Score: 2").encode("utf-8"))
+
+    spy_ranges.clear()
+    frame = parser.load_all_logs()["Ping Pong"]
+    assert spy_ranges == [(first_size, complete_size)]
+    assert list(frame["score"].dropna()) == [1, 2]
+    assert list(frame["line_number"]) == [1, 2, 3]
+
+    # Sin cambios: nada que parsear
+    spy_ranges.clear()
+    assert len(parser.load_all_logs()["Ping Pong"]) == 3
+    assert spy_ranges == []
+
+
+def test_checkpoint_survives_restart_through_disk_cache(tmp_path, spy_ranges):
+    log_file = tmp_path / "two_lanes.log"
+    log_file.write_text(_line(1, "SCORE", "Score: 1"), encoding="utf-8")
+    LogParser(str(tmp_path)).load_all_logs()
+    size = log_file.stat().st_size
+
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write(_line(2, "SCORE", "Score: 2"))
+
+    spy_ranges.clear()
+    frame = LogParser(str(tmp_path)).load_all_logs()["Two Lanes"]
+    assert spy_ranges == [(size, log_file.stat().st_size)]
+    assert list(frame["score"]) == [1, 2]
+
+
+def test_truncated_file_resets_checkpoint(tmp_path, spy_ranges):
+    log_file = tmp_path / "ping_pong.log"
+    log_file.write_text("".join(_line(i, "SCORE", f"Score: {i}") for i in range(5)), encoding="utf-8")
+    parser = LogParser(str(tmp_path))
+    parser.load_all_logs()
+
+    log_file.write_text(_line(9, "GAME", "GAME OVER"), encoding="utf-8")
+
+    spy_ranges.clear()
+    frame = parser.load_all_logs()["Ping Pong"]
+    assert spy_ranges == [(0, log_file.stat().st_size)]
+    assert len(frame) == 1
+    assert bool(frame["is_death"].iloc[0])
+
+
+def test_rotated_file_resets_checkpoint(tmp_path, spy_ranges):
+    log_file = tmp_path / "ping_pong.log"
+    log_file.write_text(_line(1, "SCORE", "Score: 1"), encoding="utf-8")
+    parser = LogParser(str(tmp_path))
+    parser.load_all_logs()
+
+    # Archivo nuevo más largo que el anterior: el tamaño solo no basta, cuenta la firma
+    os.remove(log_file)
+    log_file.write_text(_line(5, "GAME", "GAME STARTED") + _line(6, "SCORE", "Score: 9"), encoding="utf-8")
+
+    spy_ranges.clear()
+    frame = parser.load_all_logs()["Ping Pong"]
+    assert spy_ranges == [(0, log_file.stat().st_size)]
+    assert list(frame["score"].dropna()) == [9]
+    assert list(frame["line_number"]) == [1, 2]
+
+
+# ===== PARSEO =====
+
+@pytest.mark.parametrize("message", [
+    "🎮 Juego iniciado - GAME STARTED",
+    "⏸️ Juego PAUSADO por jugador",
+    "Pelota movida de (3, 1) a (4, 2)",
+    "🏓 GOLPE EXITOSO con pala IZQUIERDA - Nuevo score: 3",
+    "🎯 Obstáculo esquivado - Score: 7 | Total esquivados: 7",
+    "Rebote | Score: 4 | Ball: (5, 1)",
+    "💀 GAME OVER | Duration: 12.50s | Speed: 0.80s | Score 12",
+    "Speed 1.5s antes de Score: 2 y (10, 20)",
+    "Arduino no conectado",
+])
+def test_single_pass_matches_reference_parser(message):
+    line = _line(7, "GAME", message).strip()
+    assert parse_log_line(line, 3) == _reference_parse(line, 3)
+
+
+def test_unrecognized_lines_are_skipped():
+    assert parse_log_line("texto libre sin formato", 1) is None
+    assert parse_log_line("2025-03-01 10:00:00 | ERROR | 💀 PLAYER DEATH 💀", 1) is None
+
+
+@pytest.fixture
+def game_logger(tmp_path, monkeypatch):
+    """GameLogger síncrono con sink JSON-lines en tmp_path (handlers cerrados al final)"""
+    monkeypatch.delenv(STATION_ENV_VAR, raising=False)
+    logger = GameLogger(f"FastPath{id(tmp_path)}", log_dir=str(tmp_path), async_mode=False,
+                        rotation=None)
+    yield logger
+    for handler in list(logger.logger.handlers):
+        handler.close()
+        logger.logger.removeHandler(handler)
+
+
+def _comparable(event):
+    """Campos del event frame, con la marca de tiempo al segundo (el .log no guarda ms)"""
+    event = {key: value for key, value in event.items() if key in EVENT_COLUMNS and key != "line_number"}
+    event["timestamp"] = event["timestamp"].replace(microsecond=0)
+    return event
+
+
+def test_jsonl_fast_path_matches_text_parser_per_event_type(tmp_path, game_logger):
+    # (tipo, mensaje, opciones, campos que solo el sink tipado conoce)
+    events = [
+        ("GAME", "🎮 Juego iniciado - GAME STARTED", {}, set()),
+        ("GAME", "⏸️ Juego PAUSADO por jugador", {}, set()),
+        ("BALL", "Pelota movida de (3, 1) a (4, 2)", {"fields": {"x_pos": 3, "y_pos": 1}}, set()),
+        ("HIT", "🏓 GOLPE EXITOSO con pala IZQUIERDA - Nuevo score: 3", {"fields": {"score": 3}}, {"score"}),
+        ("SCORE", "🎯 Obstáculo esquivado - Score: 7 | Total esquivados: 7",
+         {"fields": {"score": 7, "obstacles_dodged": 7}}, set()),
+        ("SPEED", "⚡ Velocidad aumentada de 0.80s a 0.77s", {"fields": {"speed": 0.77}}, {"speed"}),
+        ("COLLISION", "Rebote vertical", {"score": 4, "ball_pos": (5, 1)}, set()),
+        ("GAME", "💀 GAME OVER mostrado - Score final: 7", {"fields": {"score": 7}}, {"score"}),
+        ("GAME", "✅ Juego detenido - Duración total: 12.34s", {"fields": {"game_duration": 12.34}},
+         {"game_duration"}),
+        ("HARDWARE", "Arduino no conectado", {"level": "ERROR"}, set()),
+    ]
+    for event_type, message, options, _ in events:
+        game_logger.log_game_event(event_type, message, **options)
+    game_logger.log_player_death_ping_pong("miss", "LEFT", 7, 7, 4, 3, 12.34, 0.8)
+
+    fast = frame_to_events(LogParser(str(tmp_path), use_cache=False).load_all_logs()
+                           [game_logger.game_name.title()])
+    with open(tmp_path / f"{game_logger.game_name.lower()}.log", encoding="utf-8") as f:
+        reference = [_reference_parse(line.strip(), n) for n, line in enumerate(f, 1)]
+
+    # Las muertes se escriben sin [TIPO]: el parser de texto no las ve, el sink sí
+    assert reference[-1] is None
+    assert fast[-1]["event_type"] == "PLAYER_DEATH"
+    assert (fast[-1]["is_death"], fast[-1]["score"], fast[-1]["speed"]) == (True, 7, 0.8)
+
+    for (event_type, _, _, extras), text_event, fast_event in zip(events, reference, fast):
+        text_event, fast_event = _comparable(text_event), _comparable(fast_event)
+        assert fast_event["event_type"] == event_type
+        assert {key: fast_event.get(key) for key in text_event} == text_event
+        assert set(fast_event) - set(text_event) == extras
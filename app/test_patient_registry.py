@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests del registro de pacientes: altas, búsquedas, importación de patients.json
+y altas concurrentes desde dos conexiones
+"""
+
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.cognitive import patient_registry
+from core.cognitive.patient_registry import PatientRegistry
+
+
+def _db_path(tmp_path):
+    return str(tmp_path / "cognitive" / "shared" / "cognitive.db")
+
+
+def _write_patients(base_dir, game_type, patients):
+    game_dir = base_dir / game_type
+    game_dir.mkdir(parents=True, exist_ok=True)
+    (game_dir / "patients.json").write_text(json.dumps(patients), encoding="utf-8")
+
+
+def test_add_get_and_search(tmp_path):
+    registry = PatientRegistry(_db_path(tmp_path))
+    try:
+        ana = registry.add_patient("  Ana   García ", game_type="piano_simon", age=70)
+        registry.add_patient("Andrés López", game_type="osu_rhythm")
+        registry.add_patient("Beatriz Ruiz")
+        assert registry.add_patient("   ") is None
+
+        patient = registry.get_patient(ana)
+        assert ana.startswith("P_001_")
+        assert (patient["name"], patient["age"], patient["game_type"]) == ("Ana   García", 70, "piano_simon")
+        assert registry.find_by_name("ana garcía")[0]["patient_id"] == ana
+        assert [p["name"] for p in registry.search_by_name("an")] == ["Ana   García", "Andrés López"]
+        assert registry.count() == 3
+        assert registry.get_latest_patient("osu_rhythm")["name"] == "Andrés López"
+    finally:
+        registry.close()
+
+
+def test_legacy_import_counts_and_duplicates(tmp_path):
+    base_dir = tmp_path / "cognitive"
+    _write_patients(base_dir, "piano_simon", {
+        "P_001_20250101_100000": {"name": "Ana", "created": "2025-01-01T10:00:00"},
+        "P_002_20250102_100000": {"name": "Luis", "created": "2025-01-02T10:00:00"},
+    })
+    _write_patients(base_dir, "osu_rhythm", {
+        "P_001_20250101_100000": {"name": "Carmen", "created": "2025-01-01T10:00:00"},
+        "P_003_20250103_100000": {"name": "Marta", "created": "2025-01-03T10:00:00"},
+    })
+
+    registry = PatientRegistry(_db_path(tmp_path))
+    try:
+        assert registry.count() == 3
+        # Los archivos se importan en orden: osu_rhythm antes que piano_simon
+        assert registry.get_patient("P_001_20250101_100000")["name"] == "Carmen"
+        assert registry.import_duplicates == [{
+            "patient_id": "P_001_20250101_100000", "name": "Ana", "game_type": "piano_simon",
+            "kept_name": "Carmen", "kept_game_type": "osu_rhythm",
+        }]
+
+        # Reimportar un archivo ya importado no añade ni reporta nada
+        assert registry.import_json_file(str(base_dir / "osu_rhythm" / "patients.json"),
+                                         "osu_rhythm") == 0
+        assert len(registry.import_duplicates) == 1
+        assert registry.count() == 3
+    finally:
+        registry.close()
+
+
+def test_add_patient_skips_ids_taken_by_import(tmp_path, monkeypatch):
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2025, 3, 1, 10, 10, 10)
+
+    monkeypatch.setattr(patient_registry, "datetime", FixedDatetime)
+    base_dir = tmp_path / "cognitive"
+    _write_patients(base_dir, "piano_simon", {"P_002_20250301_101010": {"name": "Importado"}})
+
+    registry = PatientRegistry(_db_path(tmp_path))
+    try:
+        # Con 1 paciente el número siguiente es 2, ya ocupado por el importado
+        patient_id = registry.add_patient("Nuevo")
+        assert patient_id == "P_003_20250301_101010"
+        assert registry.get_patient("P_002_20250301_101010")["name"] == "Importado"
+        assert registry.count() == 2
+    finally:
+        registry.close()
+
+
+def test_concurrent_adds_from_two_connections(tmp_path):
+    db_path = _db_path(tmp_path)
+    registries = [PatientRegistry(db_path), PatientRegistry(db_path)]
+    ids = []
+    errors = []
+
+    def add_many(registry, prefix):
+        try:
+            for i in range(25):
+                ids.append(registry.add_patient(f"{prefix} {i}"))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=add_many, args=(registry, prefix))
+               for registry, prefix in zip(registries, ("Estación A", "Estación B"))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    try:
+        assert errors == []
+        assert len(ids) == 50 and None not in ids
+        assert len(set(ids)) == 50
+        assert registries[0].count() == 50
+        assert all(registries[1].get_patient(patient_id) for patient_id in ids)
+    finally:
+        for registry in registries:
+            registry.close()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests del índice de sesiones: indexado, sincronización incremental y consultas
+"""
+
+import os
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.cognitive.session_index import SessionIndex, parse_session_id
+
+
+def _write_csv_session(base_dir, session_id, rows):
+    sessions_dir = base_dir / "piano_simon" / "sessions"
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+    file_path = sessions_dir / f"{session_id}.csv"
+    lines = ["timestamp,level,accuracy,response_time_ms,is_correct"]
+    lines += [f"2025-03-01T10:10:{10 + index:02d},{level},{accuracy},{reaction},{correct}"
+              for index, (level, accuracy, reaction, correct) in enumerate(rows)]
+    file_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(file_path)
+
+
+def test_parse_session_id_with_underscores_in_patient():
+    parsed = parse_session_id("P_001_20240101_120000_piano_simon_20250301_101010", "piano_simon")
+    assert parsed["patient_id"] == "P_001_20240101_120000"
+    assert parsed["started_at"] == datetime(2025, 3, 1, 10, 10, 10)
+
+
+def test_parse_session_id_with_station_suffix():
+    parsed = parse_session_id("P_001_piano_simon_20250301_101010_E1", "piano_simon")
+    assert parsed["patient_id"] == "P_001"
+    assert parsed["started_at"] == datetime(2025, 3, 1, 10, 10, 10)
+
+
+def test_index_file_computes_summary(tmp_path):
+    file_path = _write_csv_session(tmp_path, "P_001_piano_simon_20250301_101010",
+                                   [(1, 1.0, 800, True), (2, 0.5, 1200, False)])
+    index = SessionIndex(str(tmp_path / "index.db"))
+    try:
+        session = index.index_file(file_path)
+        assert session["patient_id"] == "P_001"
+        assert session["status"] == "legacy"
+
+        stored = index.get_session("P_001_piano_simon_20250301_101010")
+        assert stored["event_count"] == 2
+        assert stored["avg_accuracy"] == 75.0
+        assert stored["avg_reaction_ms"] == 1000.0
+        assert stored["success_rate"] == 50.0
+        assert stored["max_level"] == 2
+        assert stored["date"] == "2025-03-01"
+    finally:
+        index.close()
+
+
+def test_sync_is_incremental_and_drops_deleted_files(tmp_path):
+    base_dir = tmp_path / "cognitive"
+    first = _write_csv_session(base_dir, "P_001_piano_simon_20250301_101010", [(1, 1.0, 800, True)])
+    _write_csv_session(base_dir, "P_002_piano_simon_20250302_101010", [(1, 0.0, 900, False)])
+    index = SessionIndex(str(tmp_path / "index.db"))
+    try:
+        assert index.sync(str(base_dir)) == 2
+        assert index.sync(str(base_dir)) == 0  # Sin cambios: no relee nada
+
+        os.remove(first)
+        index.sync(str(base_dir))
+        assert index.get_patients() == ["P_002"]
+        assert index.get_totals() == {"total_sessions": 1, "total_events": 1}
+    finally:
+        index.close()
+
+
+def test_query_filters_and_pagination(tmp_path):
+    base_dir = tmp_path / "cognitive"
+    for day in range(1, 6):
+        _write_csv_session(base_dir, f"P_001_piano_simon_202503{day:02d}_101010",
+                           [(day, day / 5, 800, True)])
+    index = SessionIndex(str(tmp_path / "index.db"))
+    try:
+        index.sync(str(base_dir))
+
+        assert index.count(patient_id="P_001") == 5
+        assert index.count(date_from=datetime(2025, 3, 2), date_to="2025-03-04") == 2
+        assert index.count(min_accuracy=60.0) == 3
+
+        page = index.query(patient_id="P_001", limit=2, offset=1)
+        assert [s["session_id"][-15:-7] for s in page] == ["20250304", "20250303"]
+        oldest = index.query(game_type="piano_simon", limit=1, newest_first=False)
+        assert oldest[0]["date"] == "2025-03-01"
+    finally:
+        index.close()
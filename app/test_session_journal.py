@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests del journal de sesiones: recuperación tras cierre abrupto
+"""
+
+import os
+import subprocess
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.cognitive.cognitive_logger import CognitiveLogger
+from core.cognitive.event_log import EventLogWriter, iter_event_log
+from core.cognitive.session_journal import (
+    SessionJournal,
+    read_manifest,
+    recover_incomplete_sessions,
+    write_manifest,
+)
+
+
+def _dead_pid():
+    """PID de un proceso que ya terminó"""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def _sessions_dir(tmp_path):
+    sessions_dir = tmp_path / "piano_simon" / "sessions"
+    sessions_dir.mkdir(parents=True)
+    return sessions_dir
+
+
+def _open_csv_session(sessions_dir, name, **manifest):
+    log_file = str(sessions_dir / f"{name}.csv")
+    journal = SessionJournal(log_file, {"session_id": name})
+    journal.open()
+    with open(log_file, "w", encoding="utf-8") as f:
+        f.write("timestamp,level\n1.0,1\n2.0,2\n3.0,")  # última línea a medias
+    if manifest:
+        journal.manifest.update(manifest)
+        write_manifest(log_file, journal.manifest)
+    return log_file, journal
+
+
+def test_crashed_csv_session_is_repaired(tmp_path):
+    log_file, _ = _open_csv_session(_sessions_dir(tmp_path), "crash_csv", pid=_dead_pid())
+
+    recovered = recover_incomplete_sessions(str(tmp_path))
+
+    assert [m["session_id"] for m in recovered] == ["crash_csv"]
+    manifest = read_manifest(log_file)
+    assert manifest["status"] == "recovered"
+    assert manifest["events"] == 2
+    assert manifest["discarded_bytes"] == len("3.0,")
+    with open(log_file, encoding="utf-8") as f:
+        assert f.read().endswith("2.0,2\n")
+
+
+def test_crashed_event_log_session_is_repaired(tmp_path):
+    sessions_dir = _sessions_dir(tmp_path)
+    log_file = str(sessions_dir / "crash_log.cglog")
+    with EventLogWriter(log_file, "piano_simon", "crash_log", "P_001") as writer:
+        for level in (1, 2):
+            writer.append({"timestamp": float(level), "level": level, "sequence_shown": [1],
+                           "sequence_input": [1], "is_correct": True})
+    with open(log_file, "ab") as f:
+        f.write(b"\x01\x02\x03")  # registro parcial
+    write_manifest(log_file, {"session_id": "crash_log", "log_file": os.path.basename(log_file),
+                              "status": "in_progress", "pid": _dead_pid()})
+
+    recover_incomplete_sessions(str(tmp_path))
+
+    manifest = read_manifest(log_file)
+    assert manifest["status"] == "recovered"
+    assert manifest["events"] == 2
+    assert manifest["discarded_bytes"] == 3
+    assert [event["level"] for event in iter_event_log(log_file)] == [1, 2]
+
+
+def test_reused_pid_does_not_block_recovery(tmp_path):
+    # Mismo PID que este proceso pero de otro arranque (p. ej. antes de reiniciar)
+    log_file, _ = _open_csv_session(_sessions_dir(tmp_path), "reused_pid",
+                                    pid=os.getpid(), pid_start="otro-arranque:1")
+
+    recover_incomplete_sessions(str(tmp_path))
+
+    assert read_manifest(log_file)["status"] == "recovered"
+
+
+def test_live_and_completed_sessions_are_untouched(tmp_path):
+    sessions_dir = _sessions_dir(tmp_path)
+    live_file, _ = _open_csv_session(sessions_dir, "live")
+    done_file, journal = _open_csv_session(sessions_dir, "done", pid=_dead_pid())
+    journal.close(None, events=2)
+
+    assert recover_incomplete_sessions(str(tmp_path)) == []
+    assert read_manifest(live_file)["status"] == "in_progress"
+    assert read_manifest(done_file)["status"] == "completed"
+    with open(live_file, encoding="utf-8") as f:
+        assert f.read().endswith("3.0,")
+
+
+def test_logger_opens_session_on_first_event(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    # Construido de antemano y descartado (warm pool): nada en disco
+    unused = CognitiveLogger("osu_rhythm", "P_001")
+    assert unused.finalize_session()["status"] == "empty"
+    assert not os.path.exists("data")
+
+    logger = CognitiveLogger("osu_rhythm", "P_001")
+    logger.log_generic_event("hit", 1, accuracy=1.0, success=True)
+    assert read_manifest(logger.log_file)["status"] == "in_progress"
+    summary = logger.finalize_session()
+    assert summary["total_events"] == 1
+    assert read_manifest(logger.log_file)["status"] == "completed"
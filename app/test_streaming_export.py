@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests de la exportación por trozos: CSV (con compresión), Excel y trozos omitidos
+"""
+
+import gzip
+import os
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.analytics.components.report_generator import ReportGenerator
+from core.analytics.components.streaming_export import (
+    frame_chunk_loaders,
+    stream_to_csv,
+    stream_to_excel,
+)
+
+
+def _frame(start, rows):
+    return pd.DataFrame({"level": range(start, start + rows), "score": [10] * rows})
+
+
+def _failing_loader():
+    raise OSError("sesión ilegible")
+
+
+def test_csv_round_trip_in_chunks(tmp_path):
+    frame = _frame(0, 25)
+    progress = []
+
+    path, rows, skipped = stream_to_csv(frame_chunk_loaders(frame, rows=10), str(tmp_path / "out.csv"),
+                                        progress=lambda done, total: progress.append((done, total)))
+
+    assert (rows, skipped) == (25, 0)
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    pd.testing.assert_frame_equal(pd.read_csv(path), frame)
+
+
+def test_csv_compression_from_suffix_and_fixed_columns(tmp_path):
+    loaders = [lambda: _frame(0, 2), lambda: pd.DataFrame({"level": [5]})]
+
+    path, rows, _ = stream_to_csv(loaders, str(tmp_path / "out.csv.gz"), columns=["level", "score"])
+
+    assert rows == 3
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert f.read().splitlines() == ["level,score", "0,10", "1,10", "5,"]
+
+
+def test_failed_chunks_are_counted(tmp_path):
+    loaders = [lambda: _frame(0, 2), _failing_loader, lambda: _frame(2, 2)]
+
+    path, rows, skipped = stream_to_csv(loaders, str(tmp_path / "out.csv"))
+
+    assert (rows, skipped) == (4, 1)
+    assert list(pd.read_csv(path)["level"]) == [0, 1, 2, 3]
+
+    message = ReportGenerator().export_data_to_csv("Ping Pong", loaders, str(tmp_path / "report.csv"))
+    assert message.startswith("✅")
+    assert "1 de 3 trozos omitidos" in message
+
+
+def test_nothing_readable_leaves_no_file(tmp_path):
+    path, rows, skipped = stream_to_csv([_failing_loader], str(tmp_path / "out.csv"))
+
+    assert (rows, skipped) == (0, 1)
+    assert not os.path.exists(path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_excel_sheets_and_skipped_chunks(tmp_path):
+    sheets = {"Ping Pong": [lambda: _frame(0, 3)], "Two Lanes": [_failing_loader, lambda: _frame(0, 1)]}
+
+    path, written, skipped = stream_to_excel(sheets, str(tmp_path / "out.xlsx"))
+
+    assert written == {"Ping Pong": 3, "Two Lanes": 1}
+    assert skipped == 1
+    workbook = pd.read_excel(path, sheet_name=None)
+    assert list(workbook) == ["Ping_Pong", "Two_Lanes"]
+    assert list(workbook["Ping_Pong"]["level"]) == [0, 1, 2]
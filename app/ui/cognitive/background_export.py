@@ -0,0 +1,63 @@
+"""
+Exportación a Excel en segundo plano para las ventanas de análisis
+
+El worker lee una sesión a la vez (stream_to_excel) y solo habla con Tk a
+través de window.after: el progreso va al título de la ventana y el
+resultado a un diálogo.
+"""
+
+import threading
+import tkinter as tk
+from tkinter import messagebox
+from typing import Callable, Dict, List
+
+from core.analytics.components.streaming_export import stream_to_excel
+
+
+class BackgroundExport:
+    """Una exportación a la vez por ventana; la ventana sigue respondiendo"""
+
+    def __init__(self, window: tk.Misc):
+        self.window = window
+        self.running = False
+
+    def start(self, sheets: Dict[str, List[Callable]], filename: str) -> bool:
+        """Lanzar la exportación (llamar desde el hilo de Tk) - False si ya hay una"""
+        if self.running:
+            return False
+        # Leer el título aquí: Tk no admite llamadas desde el worker
+        title = self.window.title()
+        self.running = True
+        threading.Thread(target=self._worker, args=(sheets, filename, title), daemon=True).start()
+        return True
+
+    def _worker(self, sheets: Dict[str, List[Callable]], filename: str, title: str):
+        total = sum(len(loaders) for loaders in sheets.values())
+
+        def progress(done: int, chunks: int):
+            self._post(lambda: self.window.title(f"{title} - 💾 Exportando {done}/{chunks}"))
+
+        try:
+            _, written, skipped = stream_to_excel(sheets, filename, progress=progress)
+            if written and skipped:
+                self._post(lambda: messagebox.showwarning(
+                    "Exportado con omisiones",
+                    f"Datos exportados a: {filename}\n\n"
+                    f"⚠️ {skipped} de {total} sesiones no se pudieron leer y se omitieron"))
+            elif written:
+                self._post(lambda: messagebox.showinfo("Exportado", f"Datos exportados a: {filename}"))
+            else:
+                self._post(lambda: messagebox.showwarning("Sin Datos", "No hay datos para exportar"))
+        except Exception as e:
+            error = e
+            self._post(lambda: messagebox.showerror("Error", f"Error exportando datos: {error}"))
+        finally:
+            self.running = False
+            self._post(lambda: self.window.title(title))
+
+    def _post(self, callback: Callable):
+        """Ejecutar en el hilo de Tk (ignorar si la ventana ya se cerró)"""
+        try:
+            self.window.after(0, callback)
+        except (tk.TclError, RuntimeError):
+            pass
@@ -151,13 +151,14 @@ class ButtonPanelComponent:
     
     def _compare_sessions(self, message_manager):
         """Comparar todas las sesiones"""
-        if len(self.session_list.sessions) < 2:
+        if self.session_list.total_sessions < 2:
             message_manager.show_message("❌ Necesita mín. 2 sesiones", self.colors['warning'])
             return
         
         try:
-            file_paths = [s['filepath'] for s in self.session_list.sessions]
-            labels = [f"{s['patient_id']}_{s['date']}" for s in self.session_list.sessions]
+            sessions = self.session_list.get_all_sessions()
+            file_paths = [s['filepath'] for s in sessions]
+            labels = [f"{s['patient_id']}_{s['date']}" for s in sessions]
             
             result = self.visual_analyzer.create_comparison_chart(file_paths, labels)
             
@@ -7,12 +7,14 @@ Solo coordina componentes, no hace el trabajo pesado
 import pygame
 import sys
 import os
+from typing import Callable, Optional
 
 # Añadir paths
 sys.path.append(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
+from core.pygame_runtime import PygameLoop, get_pygame_runtime
 from .session_list_component import SessionListComponent
 from .button_panel_component import ButtonPanelComponent
 from .info_panel_component import InfoPanelComponent
@@ -66,9 +68,9 @@ class CognitiveScreen:
             return False
 
         try:
-            pygame.init()
-            self.screen = pygame.display.set_mode((self.width, self.height))
-            pygame.display.set_caption("🧠 Análisis Cognitivo")
+            self.screen = get_pygame_runtime().acquire_display(
+                self, (self.width, self.height), "🧠 Análisis Cognitivo"
+            )
             self.clock = pygame.time.Clock()
 
             # Inicializar managers cognitivos
@@ -92,7 +94,32 @@ class CognitiveScreen:
             return False
 
     def run(self) -> bool:
-        """Ejecutar pantalla"""
+        """Ejecutar pantalla y esperar a que se cierre (uso standalone)"""
+        return get_pygame_runtime().call(self._run_loop)
+
+    def start(self, on_done: Optional[Callable[[bool], None]] = None) -> PygameLoop:
+        """Abrir la pantalla sin bloquear al llamador (p. ej. el hilo de Tk)
+
+        El loop corre en el hilo pygame; on_done(resultado) se llama desde ese
+        hilo al cerrarla. Si un juego ocupa el hilo pygame la pantalla no se
+        encola detrás: lanza RuntimeError.
+        """
+        runtime = get_pygame_runtime()
+        if runtime.loop_active():
+            raise RuntimeError("Hay un juego o pantalla en curso: ciérralo antes de abrir el análisis")
+
+        def run():
+            result = False
+            try:
+                result = self._run_loop()
+            finally:
+                if on_done:
+                    on_done(result)
+
+        return runtime.start_loop(run, name="CognitiveScreen")
+
+    def _run_loop(self) -> bool:
+        """Loop de la pantalla: crea la ventana y bombea sus eventos en el mismo hilo"""
         if not self.initialize():
             return False
 
@@ -125,7 +152,9 @@ class CognitiveScreen:
             self._draw()
             pygame.display.flip()
 
-        pygame.quit()
+        # Los procesos de dibujo no deben sobrevivir a la pantalla
+        self.visual_analyzer.close()
+        get_pygame_runtime().release_display(self)
         return True
 
     def _handle_mouse_click(self, event):
@@ -10,9 +10,11 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import os
-import glob
 from typing import Dict, List, Optional
 
+from core.cognitive.session_manager import SessionManager
+from .background_export import BackgroundExport
+
 
 class OsuCognitiveAnalyticsWindow:
     """Ventana especializada para análisis cognitivo del juego Osu"""
@@ -23,6 +25,7 @@ class OsuCognitiveAnalyticsWindow:
         self.window = None
         self.data_loaded = False
         self.session_data = []
+        self.session_manager = SessionManager()
         
         # Configuración de matplotlib en español
         plt.rcParams['font.size'] = 10
@@ -30,6 +33,7 @@ class OsuCognitiveAnalyticsWindow:
         plt.rcParams['axes.labelsize'] = 10
         
         self.create_window()
+        self.exporter = BackgroundExport(self.window)
         self.load_cognitive_data()
         self.setup_analytics_interface()
     
@@ -57,31 +61,25 @@ class OsuCognitiveAnalyticsWindow:
         self.window.geometry(f'{width}x{height}+{x}+{y}')
     
     def load_cognitive_data(self):
-        """Cargar datos de sesiones cognitivas desde archivos CSV"""
+        """Cargar datos de sesiones cognitivas consultando el índice de sesiones"""
         try:
-            # Buscar archivos de sesiones Osu
-            sessions_dir = f"data/cognitive/{self.game_id}/sessions"
-            if not os.path.exists(sessions_dir):
-                os.makedirs(sessions_dir, exist_ok=True)
-                return
-            
-            # Cargar todos los archivos CSV
-            csv_files = glob.glob(os.path.join(sessions_dir, "*.csv"))
+            # Consultar índice: fecha de inicio real, sin listar ni adivinar por nombre
+            sessions = self.session_manager.query_sessions(game_type=self.game_id, limit=None)
             
-            if not csv_files:
-                print(f"⚠️ No se encontraron datos de sesiones Osu en {sessions_dir}")
+            if not sessions:
+                print(f"⚠️ No se encontraron datos de sesiones Osu para {self.game_id}")
                 return
             
             all_sessions = []
-            for csv_file in csv_files:
+            for session in sessions:
                 try:
-                    df = pd.read_csv(csv_file)
-                    # Agregar información del archivo
-                    df['session_file'] = os.path.basename(csv_file)
-                    df['session_date'] = self.extract_date_from_filename(csv_file)
+                    df = self.session_manager.load_session_data(session['file_path'])
+                    # Agregar información de la sesión
+                    df['session_file'] = os.path.basename(session['file_path'])
+                    df['session_date'] = datetime.fromisoformat(session['started_at'])
                     all_sessions.append(df)
                 except Exception as e:
-                    print(f"⚠️ Error cargando {csv_file}: {e}")
+                    print(f"⚠️ Error cargando {session['file_path']}: {e}")
             
             if all_sessions:
                 self.session_data = pd.concat(all_sessions, ignore_index=True)
@@ -92,25 +90,6 @@ class OsuCognitiveAnalyticsWindow:
             print(f"❌ Error cargando datos cognitivos Osu: {e}")
             messagebox.showerror("Error", f"No se pudieron cargar los datos: {e}")
     
-    def extract_date_from_filename(self, filepath: str) -> datetime:
-        """Extraer fecha del nombre del archivo"""
-        try:
-            filename = os.path.basename(filepath)
-            # Buscar patrón de fecha en el nombre del archivo
-            parts = filename.split('_')
-            for part in parts:
-                if len(part) >= 8 and part.isdigit():
-                    # Formato: YYYYMMDD
-                    if len(part) == 8:
-                        return datetime.strptime(part, "%Y%m%d")
-                    # Formato: YYYYMMDDHHMMSS
-                    elif len(part) == 14:
-                        return datetime.strptime(part, "%Y%m%d%H%M%S")
-            # Si no encuentra fecha, usar fecha de modificación del archivo
-            return datetime.fromtimestamp(os.path.getmtime(filepath))
-        except:
-            return datetime.now()
-    
     def setup_analytics_interface(self):
         """Configurar la interfaz de análisis"""
         # Frame principal
@@ -552,15 +531,17 @@ class OsuCognitiveAnalyticsWindow:
         close_btn.pack(side=tk.RIGHT)
     
     def export_data(self):
-        """Exportar datos a Excel"""
+        """Exportar historial a Excel por trozos desde el índice (en segundo plano)"""
         try:
             if not self.data_loaded:
                 messagebox.showwarning("Sin Datos", "No hay datos para exportar")
                 return
+            if self.exporter.running:
+                return
             
             filename = f"analisis_osu_{self.game_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-            self.session_data.to_excel(filename, index=False)
-            messagebox.showinfo("Exportado", f"Datos exportados a: {filename}")
+            loaders = self.session_manager.session_chunk_loaders(game_type=self.game_id)
+            self.exporter.start({self.game_id: loaders}, filename)
             
         except Exception as e:
             messagebox.showerror("Error", f"Error exportando datos: {e}")
@@ -684,18 +665,13 @@ class OsuCognitiveAnalyticsWindow:
             )
             
             if result:
-                # Eliminar archivos CSV
-                sessions_dir = f"data/cognitive/{self.game_id}/sessions"
-                csv_files = glob.glob(os.path.join(sessions_dir, "*.csv"))
+                # Eliminar sesiones (.cglog y CSV) con su manifiesto y entrada del índice
+                session_files = self.session_manager.list_session_files(self.game_id)
                 
-                deleted_count = 0
-                for csv_file in csv_files:
-                    try:
-                        os.remove(csv_file)
-                        deleted_count += 1
-                        print(f"🗑️ Eliminado: {os.path.basename(csv_file)}")
-                    except Exception as e:
-                        print(f"❌ Error eliminando {csv_file}: {e}")
+                deleted_count = sum(
+                    1 for session_file in session_files
+                    if self.session_manager.delete_session(session_file)
+                )
                 
                 # Limpiar datos en memoria
                 self.session_data = []
@@ -4,13 +4,11 @@ Solo maneja identificación y selección de pacientes
 """
 
 import pygame
-import os
-import json
-from datetime import datetime
+from core.cognitive.patient_registry import get_patient_registry
 
 
 class PatientManagerComponent:
-    """Componente para gestión de pacientes con JSON separado por juego"""
+    """Componente para gestión de pacientes sobre el registro compartido (SQLite)"""
     
     def __init__(self, game_type: str = "piano_simon"):
         self.game_type = game_type.lower().replace(" ", "_")
@@ -18,16 +16,12 @@ class PatientManagerComponent:
         self.font_medium = None
         self.font_small = None
         
-        # Archivos específicos por juego
-        self.game_data_dir = f"data/cognitive/{self.game_type}"
-        self.patients_file = f"{self.game_data_dir}/patients.json"
-        
-        # Asegurar directorios
-        os.makedirs(self.game_data_dir, exist_ok=True)
+        # Registro único para todos los juegos (importa patients.json antiguos)
+        self.registry = get_patient_registry()
         
         # Estado del componente
-        self.patients = self._load_patients()
         self.current_patient_id = None
+        self.current_patient_name = None
         self.message = ""
         self.message_timer = 0
         
@@ -70,44 +64,14 @@ class PatientManagerComponent:
         self.showing_input = False
         self.input_text = ""
     
-    def _load_patients(self):
-        """Cargar lista de pacientes del archivo"""
-        try:
-            if os.path.exists(self.patients_file):
-                with open(self.patients_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return {}
-        except Exception as e:
-            print(f"❌ Error cargando pacientes: {e}")
-            return {}
-    
-    def save_patients(self):
-        """Guardar lista de pacientes"""
-        try:
-            with open(self.patients_file, 'w', encoding='utf-8') as f:
-                json.dump(self.patients, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"❌ Error guardando pacientes: {e}")
-    
     def add_patient(self, patient_name: str) -> str:
         """Añadir nuevo paciente y retornar su ID"""
         if not patient_name.strip():
             return None
-            
-        # Generar ID único
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        patient_id = f"P_{len(self.patients) + 1:03d}_{timestamp}"
-        
-        # Guardar paciente
-        self.patients[patient_id] = {
-            'name': patient_name.strip(),
-            'created': datetime.now().isoformat(),
-            'sessions_count': 0
-        }
         
-        self.save_patients()
+        patient_id = self.registry.add_patient(patient_name, game_type=self.game_type)
         self.current_patient_id = patient_id
+        self.current_patient_name = patient_name.strip()
         return patient_id
     
     def get_current_patient_id(self) -> str:
@@ -159,21 +123,15 @@ class PatientManagerComponent:
     
     def _show_patient_selection(self, message_manager):
         """Mostrar selección de pacientes (simplificado)"""
-        if not self.patients:
+        # Por simplicidad, rotar entre pacientes existentes (consulta indexada)
+        patient = self.registry.get_next_patient(self.current_patient_id)
+        if not patient:
             message_manager.show_message("❌ No hay pacientes registrados", self.GRAY)
             return
             
-        # Por simplicidad, rotar entre pacientes existentes
-        patient_ids = list(self.patients.keys())
-        if self.current_patient_id in patient_ids:
-            current_index = patient_ids.index(self.current_patient_id)
-            next_index = (current_index + 1) % len(patient_ids)
-        else:
-            next_index = 0
-            
-        self.current_patient_id = patient_ids[next_index]
-        patient_name = self.patients[self.current_patient_id]['name']
-        message_manager.show_message(f"👤 Paciente: {patient_name}", self.GREEN)
+        self.current_patient_id = patient['patient_id']
+        self.current_patient_name = patient['name']
+        message_manager.show_message(f"👤 Paciente: {self.current_patient_name}", self.GREEN)
     
     def draw(self, screen, mouse_pos):
         """Dibujar panel de gestión de pacientes"""
@@ -190,9 +148,8 @@ class PatientManagerComponent:
         screen.blit(title, (660, 470))
         
         # Info paciente actual
-        if self.current_patient_id and self.current_patient_id in self.patients:
-            patient_name = self.patients[self.current_patient_id]['name']
-            current_text = f"Actual: {patient_name} ({self.current_patient_id})"
+        if self.current_patient_id:
+            current_text = f"Actual: {self.current_patient_name} ({self.current_patient_id})"
         else:
             current_text = "No hay paciente seleccionado"
             
@@ -1,29 +1,52 @@
 """
 Componente de Lista de Sesiones - RESPONSABILIDAD ÚNICA
 Solo maneja la lista y selección de sesiones
+
+Lista virtualizada: solo se piden al índice las páginas visibles (en un hilo
+de fondo) y solo se dibujan las filas que caben en pantalla.
 """
 
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
 import pygame
-import os
 from core.cognitive.session_manager import SessionManager
 
 
+PAGE_SIZE = 50      # Filas por consulta al índice
+ROW_HEIGHT = 80     # Alto de cada fila (incluye separación)
+LIST_TOP = 170      # Y de la primera fila
+
+
 class SessionListComponent:
     """Componente pequeño - solo lista de sesiones"""
-    
+
     def __init__(self):
         # Manager de sesiones con nueva estructura
         self.session_manager = SessionManager()
-        
+
         # Filtro por tipo de juego
         self.current_game_filter = "piano_simon"  # Por defecto mostrar piano simon
         self.available_games = ["piano_simon", "ping_pong", "two_lanes", "all"]  # Futuros juegos
-        
-        self.sessions = []
+
+        self.total_sessions = 0
         self.selected_session = 0
         self.scroll_offset = 0
         self.visible_sessions = 8
-        
+        self.loading = False
+
+        # Caché de páginas del índice: {número de página: [sesiones]}
+        self._pages: Dict[int, List[Dict[str, Any]]] = {}
+        self._requested_pages = set()
+        self._generation = 0  # Invalida respuestas de una carga anterior
+        self._lock = threading.Lock()
+
+        # Worker de fondo: sincroniza el índice y trae páginas sin bloquear el dibujado
+        self._requests: "queue.Queue" = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
         # Colors
         self.colors = {
             'background': (20, 20, 30),
@@ -35,110 +58,226 @@ class SessionListComponent:
             'error': (255, 100, 100),
             'success': (100, 255, 100)
         }
-        
+
         # Configuración visual
         self.rect = pygame.Rect(20, 100, 600, 600)
-        
+        self.list_rect = pygame.Rect(30, LIST_TOP, 580, self.rect.bottom - LIST_TOP - 10)
+
+        # Fuentes y textos renderizados se crean una vez, no en cada frame
+        self.font_heading = pygame.font.Font(None, 36)
+        self.font_normal = pygame.font.Font(None, 24)
+        self.font_small = pygame.font.Font(None, 18)
+        self._row_surfaces: Dict[str, tuple] = {}
+
         # Cargar sesiones
         self.load_sessions()
-    
-    def load_sessions(self):
-        """Cargar sesiones usando el manager actualizado"""
-        try:
-            if self.current_game_filter == "all":
-                session_files = self.session_manager.list_session_files()
-            else:
-                session_files = self.session_manager.list_session_files(self.current_game_filter)
-            
-            self.sessions = []
-            for file_path in session_files:
-                session_info = self.session_manager.get_session_info(file_path)
-                if session_info:
-                    self.sessions.append(session_info)
-            
-            print(f"📁 Cargadas {len(self.sessions)} sesiones para {self.current_game_filter}")
-            
-        except Exception as e:
-            print(f"❌ Error cargando sesiones: {e}")
-            self.sessions = []
-    
+
+    @property
+    def game_type(self) -> Optional[str]:
+        """Filtro de juego para el índice (None = todos)"""
+        return None if self.current_game_filter == "all" else self.current_game_filter
+
+    @property
+    def sessions(self) -> List[Dict[str, Any]]:
+        """Sesiones ya cargadas en caché (en orden)"""
+        with self._lock:
+            return [session for page in sorted(self._pages) for session in self._pages[page]]
+
+    def load_sessions(self, refresh_index: bool = False):
+        """Reiniciar la lista; el worker cuenta sesiones y trae la primera página"""
+        with self._lock:
+            self._generation += 1
+            self._pages.clear()
+            self._requested_pages.clear()
+            self._row_surfaces.clear()
+            self.loading = True
+
+        self.selected_session = 0
+        self.scroll_offset = 0
+        self._requests.put(('reload', self._generation, refresh_index))
+        self._request_visible_pages()
+
+    def refresh_sessions(self):
+        """Releer sesiones reconciliando el índice con el disco"""
+        self.load_sessions(refresh_index=True)
+
+    def _worker_loop(self):
+        """Atender peticiones de recarga y de páginas en segundo plano"""
+        while True:
+            request = self._requests.get()
+            kind, generation = request[0], request[1]
+            if generation != self._generation:
+                continue
+
+            try:
+                if kind == 'reload':
+                    if request[2]:
+                        self.session_manager.refresh_index()
+                    total = self.session_manager.count_sessions(game_type=self.game_type)
+                    with self._lock:
+                        if generation == self._generation:
+                            self.total_sessions = total
+                            self.loading = False
+                    print(f"📁 {total} sesiones para {self.current_game_filter}")
+
+                elif kind == 'page':
+                    page = request[2]
+                    rows = self.session_manager.query_sessions(
+                        game_type=self.game_type, limit=PAGE_SIZE, offset=page * PAGE_SIZE
+                    )
+                    with self._lock:
+                        if generation == self._generation:
+                            self._pages[page] = rows
+
+            except Exception as e:
+                print(f"❌ Error cargando sesiones: {e}")
+                with self._lock:
+                    self._requested_pages.discard(request[2] if kind == 'page' else None)
+                    self.loading = False
+
+    def _visible_range(self) -> range:
+        """Índices de las filas que caen dentro del área visible"""
+        first = max(0, -self.scroll_offset // ROW_HEIGHT)
+        last = min(self.total_sessions, first + self.list_rect.height // ROW_HEIGHT + 2)
+        return range(first, max(first, last))
+
+    def _request_visible_pages(self):
+        """Pedir al worker las páginas visibles (y la siguiente) que falten"""
+        visible = self._visible_range()
+        first_page = visible.start // PAGE_SIZE
+        last_page = max(visible.start, visible.stop - 1) // PAGE_SIZE + 1
+
+        with self._lock:
+            for page in range(first_page, last_page + 1):
+                if page not in self._requested_pages:
+                    self._requested_pages.add(page)
+                    self._requests.put(('page', self._generation, page))
+
+    def _get_session(self, index: int) -> Optional[Dict[str, Any]]:
+        """Sesión de la caché por posición (None si su página aún no llegó)"""
+        with self._lock:
+            page = self._pages.get(index // PAGE_SIZE)
+        if page is None or index % PAGE_SIZE >= len(page):
+            return None
+        return page[index % PAGE_SIZE]
+
     def get_selected_session(self):
         """Obtener sesión seleccionada"""
-        if not self.sessions or self.selected_session >= len(self.sessions):
+        if not self.total_sessions or self.selected_session >= self.total_sessions:
             return None
-        return self.sessions[self.selected_session]
-    
+        return self._get_session(self.selected_session)
+
+    def get_all_sessions(self) -> List[Dict[str, Any]]:
+        """Todas las sesiones del filtro actual (para comparaciones)"""
+        return self.session_manager.query_sessions(game_type=self.game_type, limit=None)
+
+    def _max_scroll(self) -> int:
+        return max(0, self.total_sessions * ROW_HEIGHT - self.list_rect.height)
+
+    def _ensure_selected_visible(self):
+        """Ajustar scroll para que la selección quede en pantalla"""
+        top = self.selected_session * ROW_HEIGHT
+        if top + self.scroll_offset < 0:
+            self.scroll_offset = -top
+        elif top + ROW_HEIGHT + self.scroll_offset > self.list_rect.height:
+            self.scroll_offset = self.list_rect.height - top - ROW_HEIGHT
+        self.scroll_offset = max(-self._max_scroll(), min(0, self.scroll_offset))
+
     def handle_keydown(self, event):
         """Manejar navegación con teclado"""
-        if not self.sessions:
+        if not self.total_sessions:
             return
-            
+
         if event.key == pygame.K_UP:
             self.selected_session = max(0, self.selected_session - 1)
         elif event.key == pygame.K_DOWN:
-            self.selected_session = min(len(self.sessions) - 1, self.selected_session + 1)
-    
+            self.selected_session = min(self.total_sessions - 1, self.selected_session + 1)
+        elif event.key == pygame.K_PAGEUP:
+            self.selected_session = max(0, self.selected_session - self.visible_sessions)
+        elif event.key == pygame.K_PAGEDOWN:
+            self.selected_session = min(self.total_sessions - 1,
+                                        self.selected_session + self.visible_sessions)
+        else:
+            return
+
+        self._ensure_selected_visible()
+        self._request_visible_pages()
+
     def handle_click(self, mouse_pos):
         """Manejar clics en la lista"""
-        if not self.rect.collidepoint(mouse_pos):
+        if not self.list_rect.collidepoint(mouse_pos):
             return
-        
+
         # Calcular sesión clickeada
-        relative_y = mouse_pos[1] - 100 + abs(self.scroll_offset)
-        session_index = relative_y // 80
-        
-        if 0 <= session_index < len(self.sessions):
+        relative_y = mouse_pos[1] - LIST_TOP - self.scroll_offset
+        session_index = relative_y // ROW_HEIGHT
+
+        if 0 <= session_index < self.total_sessions:
             self.selected_session = session_index
-    
+
     def handle_scroll(self, event):
         """Manejar scroll"""
         self.scroll_offset += event.y * 30
-        max_scroll = max(0, len(self.sessions) * 80 - 400)
-        self.scroll_offset = max(-max_scroll, min(0, self.scroll_offset))
-    
+        self.scroll_offset = max(-self._max_scroll(), min(0, self.scroll_offset))
+        self._request_visible_pages()
+
+    def _render_row(self, session: Dict[str, Any]) -> tuple:
+        """Textos de una fila (renderizados una vez por sesión)"""
+        key = session['filepath']
+        surfaces = self._row_surfaces.get(key)
+        if surfaces is None:
+            patient_text = f"👤 {session['patient_id']}"
+            date_text = f"📅 {session['date']} {session['time']}"
+            events_text = f"📊 {session['event_count']} eventos"
+            surfaces = (
+                self.font_normal.render(patient_text, True, self.colors['text']),
+                self.font_small.render(date_text, True, self.colors['text_secondary']),
+                self.font_small.render(events_text, True, self.colors['success']),
+            )
+            self._row_surfaces[key] = surfaces
+        return surfaces
+
     def draw(self, screen):
-        """Dibujar lista de sesiones"""
+        """Dibujar lista de sesiones (solo filas visibles)"""
         # Marco principal
         pygame.draw.rect(screen, self.colors['list_bg'], self.rect)
         pygame.draw.rect(screen, self.colors['highlight'], self.rect, 2)
-        
+
         # Título
-        font_heading = pygame.font.Font(None, 36)
-        font_normal = pygame.font.Font(None, 24)
-        font_small = pygame.font.Font(None, 18)
-        
-        title = font_heading.render("📋 Sesiones Guardadas", True, self.colors['text'])
+        title = self.font_heading.render("📋 Sesiones Guardadas", True, self.colors['text'])
         screen.blit(title, (30, 110))
-        
+
         # Info general
-        info_text = f"Total: {len(self.sessions)} sesiones"
-        info_surface = font_normal.render(info_text, True, self.colors['text_secondary'])
+        info_text = "Cargando sesiones..." if self.loading else f"Total: {self.total_sessions} sesiones"
+        info_surface = self.font_normal.render(info_text, True, self.colors['text_secondary'])
         screen.blit(info_surface, (30, 140))
-        
-        # Lista de sesiones
-        y_offset = 170 + self.scroll_offset
-        
-        for i, session in enumerate(self.sessions):
-            session_rect = pygame.Rect(30, y_offset + i * 80, 580, 70)
-            
+
+        # Lista de sesiones: recortar al área de la lista
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.list_rect)
+
+        for i in self._visible_range():
+            y = LIST_TOP + i * ROW_HEIGHT + self.scroll_offset
+            session_rect = pygame.Rect(30, y, 580, 70)
+
             # Fondo según selección
             if i == self.selected_session:
                 pygame.draw.rect(screen, self.colors['selected'], session_rect)
                 pygame.draw.rect(screen, self.colors['highlight'], session_rect, 2)
             else:
                 pygame.draw.rect(screen, self.colors['background'], session_rect)
-            
-            # Textos de la sesión
-            patient_text = f"👤 {session['patient_id']}"
-            date_text = f"📅 {session['date']} {session['time']}"
-            events_text = f"📊 {session['event_count']} eventos"
-            
-            # Renderizar textos
-            patient_surface = font_normal.render(patient_text, True, self.colors['text'])
-            date_surface = font_small.render(date_text, True, self.colors['text_secondary'])
-            events_surface = font_small.render(events_text, True, self.colors['success'])
-            
+
+            session = self._get_session(i)
+            if session is None:
+                # Página aún en camino desde el worker
+                loading_surface = self.font_small.render("⏳ Cargando...", True, self.colors['text_secondary'])
+                screen.blit(loading_surface, (session_rect.x + 10, session_rect.y + 25))
+                continue
+
             # Posicionar textos
+            patient_surface, date_surface, events_surface = self._render_row(session)
             screen.blit(patient_surface, (session_rect.x + 10, session_rect.y + 5))
             screen.blit(date_surface, (session_rect.x + 10, session_rect.y + 25))
-            screen.blit(events_surface, (session_rect.x + 10, session_rect.y + 45)) 
\ No newline at end of file
+            screen.blit(events_surface, (session_rect.x + 10, session_rect.y + 45))
+
+        screen.set_clip(previous_clip)
@@ -2,9 +2,9 @@
 Manager de analíticas para la interfaz principal
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from core.analytics.game_analytics import GameAnalytics
 from .arduino_colors import ArduinoColors
 
 
@@ -14,11 +14,35 @@ class AnalyticsManager:
     def __init__(self, main_window_ref):
         self.main_window = main_window_ref
         self.colors = ArduinoColors()
+        self._loading_analytics = False
 
     def show_analytics(self):
-        """Mostrar análisis de logs con matplotlib"""
+        """Mostrar análisis de logs con matplotlib (logs se cargan en segundo plano)"""
+        if self._loading_analytics:
+            return
+
+        self._loading_analytics = True
+        threading.Thread(target=self._load_analytics, daemon=True).start()
+
+    def _load_analytics(self):
+        """Worker: parsear logs (en paralelo) sin bloquear el hilo de Tk"""
         try:
+            # Import diferido: pandas/matplotlib no se cargan al arrancar la app
+            from core.analytics.game_analytics import GameAnalytics
+
             analytics = GameAnalytics()
+            self.main_window.root.after(0, lambda: self._open_analytics_window(analytics))
+        except Exception as e:
+            error = e
+            self.main_window.root.after(
+                0, lambda: messagebox.showerror("Error", f"Error mostrando análisis: {error}")
+            )
+        finally:
+            self._loading_analytics = False
+
+    def _open_analytics_window(self, analytics):
+        """Construir ventana de análisis con los logs ya cargados"""
+        try:
             available_games = analytics.list_available_games()
 
             if not available_games:
@@ -167,14 +191,8 @@ class AnalyticsManager:
 🎯 JUEGOS REGISTRADOS:
 """
 
-        for (
-            game_id,
-            game_class,
-        ) in self.main_window.game_controller.available_games.items():
-            temp_game = game_class(
-                self.main_window.arduino_manager,
-            )
-            stats_info += f"   • {temp_game.name}\n"
+        for plugin in self.main_window.game_controller.available_games.values():
+            stats_info += f"   • {plugin.name}\n"
 
         stats_text = tk.Text(
             stats_window,
@@ -237,15 +255,30 @@ class AnalyticsManager:
             messagebox.showerror("Error", f"Error generando reporte: {e}")
 
     def _export_to_csv(self, analytics, game_name):
-        """Exportar datos a CSV"""
+        """Exportar datos a CSV (por trozos, en segundo plano)"""
         if not game_name:
             messagebox.showwarning("Advertencia", "Selecciona un juego")
             return
 
+        threading.Thread(
+            target=self._export_worker, args=(analytics, game_name), daemon=True
+        ).start()
+
+    def _export_worker(self, analytics, game_name):
+        """Worker: exportar sin bloquear el hilo de Tk"""
+        root = self.main_window.root
+
+        def progress(done, total):
+            print(f"💾 Exportando {game_name}: {done}/{total} trozos")
+
         try:
-            analytics.export_data_to_csv(game_name)
-            messagebox.showinfo(
-                "Exportación", f"Datos de {game_name} exportados exitosamente"
-            )
+            result = analytics.export_data_to_csv(game_name, progress=progress)
+            if result.startswith("✅"):
+                root.after(0, lambda: messagebox.showinfo("Exportación", result))
+            else:
+                root.after(0, lambda: messagebox.showerror("Error", result))
         except Exception as e:
-            messagebox.showerror("Error", f"Error exportando a CSV: {e}")
+            error = e
+            root.after(
+                0, lambda: messagebox.showerror("Error", f"Error exportando a CSV: {error}")
+            )
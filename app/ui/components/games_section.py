@@ -97,22 +97,45 @@ class GamesSection:
         self.frame = games_container
 
     def _open_cognitive_analysis(self):
-        """Abrir pantalla de análisis cognitivo"""
+        """Abrir pantalla de análisis cognitivo (sin bloquear el panel de control)"""
+        if (self.game_controller.current_game_is_running()
+                or self.game_controller.lifecycle.is_transition_in_progress()):
+            self._show_cognitive_busy("Detén el juego en curso antes de abrir el análisis.")
+            return
+
         try:
             # Importar la pantalla modular
             from ui.cognitive.cognitive_screen import CognitiveScreen
 
             print("🧠 Abriendo análisis cognitivo...")
 
-            # Crear y ejecutar pantalla con arduino (no arduino_manager)
+            # Crear pantalla con arduino (no arduino_manager); corre en el hilo pygame
             cognitive_screen = CognitiveScreen(self.game_controller.arduino)
-            cognitive_screen.run()
+            root = self.game_controller.root
+            cognitive_screen.start(
+                on_done=lambda result: root.after(0, self._on_cognitive_closed, result)
+            )
 
         except ImportError:
             self._show_cognitive_error("Módulos cognitivos no disponibles")
+        except RuntimeError as e:
+            self._show_cognitive_busy(str(e))
         except Exception as e:
             self._show_cognitive_error(f"Error: {e}")
 
+    def _on_cognitive_closed(self, result: bool):
+        """Pantalla cognitiva cerrada (en el hilo de Tk)"""
+        if not result:
+            self._show_cognitive_error("No se pudo abrir la pantalla de análisis")
+        else:
+            print("🧠 Análisis cognitivo cerrado")
+
+    def _show_cognitive_busy(self, message: str):
+        """Avisar de que la pantalla no puede abrirse ahora"""
+        from tkinter import messagebox
+
+        messagebox.showwarning("Análisis Cognitivo", f"⚠️ {message}")
+
     def _show_cognitive_error(self, message: str):
         """Mostrar error relacionado con análisis cognitivo"""
         from tkinter import messagebox
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import serial.tools.list_ports
 
+from core.arduino_connection import STATE_LOST, ArduinoConnectionService
 from core.arduino_manager import ArduinoManager
 from managers.game_controller import GameController
 
@@ -14,6 +14,12 @@ class ConnectionFrame:
     ):
         self.arduino = arduino
         self.game_controller = game_controller
+        # Conexión, búsqueda de puertos y reconexión fuera del hilo de Tk
+        self.connection = ArduinoConnectionService(
+            arduino,
+            post=lambda callback: parent.after(0, callback),
+            on_state=self._on_connection_state,
+        )
         conn_frame = tk.LabelFrame(
             parent,
             text="🔌 Conexión Arduino",
@@ -80,7 +86,7 @@ class ConnectionFrame:
 
         # Estado de conexión
         self.status_var = tk.StringVar(value="❌ Desconectado")
-        status_label = tk.Label(
+        self.status_label = status_label = tk.Label(
             conn_row1,
             textvariable=self.status_var,
             bg="#34495E",
@@ -112,23 +118,30 @@ class ConnectionFrame:
 
     def refresh_ports(self):
         """Refrescar lista de puertos"""
-        try:
-            ports = [port.device for port in serial.tools.list_ports.comports()]
-            self.port_combo["values"] = ports
-            if ports:
-                self.port_var.set(ports[0])
-                # Actualizar información
-                port_info = serial.tools.list_ports.comports()
-                if port_info:
-                    self.arduino_info_var.set(
-                        f"Puertos detectados: {len(ports)} | Ejemplo: {port_info[0].description}"
-                    )
-        except Exception as e:
-            self.arduino_info_var.set(f"Error detectando puertos: {str(e)}")
+        self.arduino_info_var.set("🔄 Buscando puertos...")
+        self.connection.list_ports_async(self._on_ports_listed)
+
+    def _on_ports_listed(self, ports):
+        if ports is None:
+            self.arduino_info_var.set("Error detectando puertos")
+            return
+
+        self.port_combo["values"] = [device for device, _ in ports]
+        if ports:
+            self.port_var.set(ports[0][0])
+            # Actualizar información
+            self.arduino_info_var.set(
+                f"Puertos detectados: {len(ports)} | Ejemplo: {ports[0][1]}"
+            )
+        else:
+            self.arduino_info_var.set("No se detectaron puertos serie")
 
     def auto_detect_port(self):
-        """Auto-detectar puerto del Arduino"""
-        arduino_port = self.arduino.find_arduino_port()
+        """Auto-detectar puerto del Arduino (descripción del puerto o handshake Firmata)"""
+        self.arduino_info_var.set("🔍 Buscando Arduino...")
+        self.connection.discover_async(self._on_port_detected)
+
+    def _on_port_detected(self, arduino_port):
         if arduino_port:
             self.port_var.set(arduino_port)
             self.arduino_info_var.set(
@@ -143,32 +156,62 @@ class ConnectionFrame:
             )
 
     def toggle_connection(self):
-        """Conectar/desconectar Arduino"""
-        if not self.arduino.connected:
-            port = self.port_var.get()
-            if not port:
-                messagebox.showerror("Error", "Selecciona un puerto")
-                return
-
-            if self.arduino.connect(port):
-                self.status_var.set("✅ Conectado")
-                self.connect_btn.config(text="Desconectar", bg="#E74C3C")
-                self.arduino_info_var.set(
-                    f"Conectado exitosamente a {port} | Firmata activo"
-                )
-                # Habilitar botones de juegos
-                self.game_controller.update_game_buttons_state(True)
-            else:
-                messagebox.showerror("Error", "No se pudo conectar al Arduino")
-                self.arduino_info_var.set("Error de conexión - verifica cable y puerto")
+        """Conectar/desconectar Arduino (en segundo plano)"""
+        if not self.arduino.should_reconnect:
+            # Sin puerto seleccionado se prueba en todos a la vez
+            port = self.port_var.get() or None
+            self.connect_btn.config(text="Conectando...", state=tk.DISABLED)
+            self.arduino_info_var.set(
+                f"⏳ Esperando respuesta Firmata en {port}..." if port
+                else "⏳ Probando todos los puertos..."
+            )
+            self.connection.connect_async(port, self._on_connected)
+        else:
+            self.connect_btn.config(text="Desconectando...", state=tk.DISABLED)
+            self.connection.disconnect_async(self._on_disconnected, before=self.stop_game)
+
+    def _on_connected(self, port):
+        self.connect_btn.config(state=tk.NORMAL)
+        if port:
+            self.port_var.set(port)
+            self._show_connected()
+            major, minor = self.arduino.board.firmata_version
+            self.arduino_info_var.set(
+                f"Conectado exitosamente a {port} | Firmata {major}.{minor} activo"
+            )
+            # Habilitar botones de juegos
+            self.game_controller.update_game_buttons_state(True)
         else:
-            self.stop_game()
-            self.arduino.disconnect()
-            self.status_var.set("❌ Desconectado")
             self.connect_btn.config(text="Conectar", bg="#27AE60")
-            self.arduino_info_var.set("Desconectado del Arduino")
-            # Deshabilitar botones de juegos
-            self.game_controller.update_game_buttons_state(False)
+            messagebox.showerror("Error", "No se pudo conectar al Arduino")
+            self.arduino_info_var.set("Error de conexión - verifica cable y puerto")
+
+    def _on_disconnected(self, _result):
+        self.connect_btn.config(text="Conectar", bg="#27AE60", state=tk.NORMAL)
+        self.status_var.set("❌ Desconectado")
+        self.status_label.config(fg="#E74C3C")
+        self.arduino_info_var.set("Desconectado del Arduino")
+        self.game_controller.restore_game_ui()
+        # Deshabilitar botones de juegos
+        self.game_controller.update_game_buttons_state(False)
+
+    def _show_connected(self):
+        self.status_var.set("✅ Conectado")
+        self.status_label.config(fg="#27AE60")
+        self.connect_btn.config(text="Desconectar", bg="#E74C3C")
+
+    def _on_connection_state(self, state: str, message: str):
+        """Pérdida / reconexión automática detectada por el servicio"""
+        if state == STATE_LOST:
+            self.status_var.set("🔄 Reconectando...")
+            self.status_label.config(fg="#F39C12")
+        else:
+            self._show_connected()
+        self.arduino_info_var.set(message)
+
+    def shutdown(self):
+        """Detener vigilancia de conexión (al cerrar la app)"""
+        self.connection.shutdown()
 
     def stop_game(self):
         # Detener juego actual antes de desconectar
@@ -1,9 +1,9 @@
 import time
-import pygame
 import tkinter as tk
 from tkinter import ttk, messagebox
 from ui.connection_frame import ConnectionFrame
 from core.arduino_manager import ArduinoManager
+from core.pygame_runtime import get_pygame_runtime
 from managers.game_controller import GameController
 from ui.components import (
     TitleSection, 
@@ -36,8 +36,8 @@ class MainWindow:
         # Inicializar componentes UI
         self._initialize_components()
         
-        # Inicialización final
-        self.connection_frame.refresh_ports()
+        # Inicialización final (la búsqueda de puertos responde ya con mainloop activo)
+        self.root.after(0, self.connection_frame.refresh_ports)
         self.game_controller.update_status()
 
     def _initialize_components(self):
@@ -78,6 +78,11 @@ class MainWindow:
         print("💻 Cerrando aplicación de forma segura...")
         
         try:
+            # Cancelar inicios/paradas en curso y esperar al worker de ciclo de vida
+            self.game_controller.shutdown()
+            # Dejar de vigilar/reconectar el Arduino
+            self.connection_frame.shutdown()
+
             # Detener juego actual usando el safe manager
             if (self.game_controller.current_game and 
                 self.game_controller.current_game_is_running()):
@@ -94,16 +99,8 @@ class MainWindow:
                 
             # Parada de emergencia final para limpiar todos los recursos
             print("🧹 Limpieza final de recursos...")
-            try:
-                import pygame
-                if pygame.get_init():
-                    pygame.mixer.stop()
-                    pygame.mixer.quit()
-                    pygame.display.quit()
-                    pygame.quit()
-                print("✅ Pygame cerrado completamente")
-            except Exception as e:
-                print(f"⚠️ Error cerrando Pygame: {e}")
+            get_pygame_runtime().shutdown()
+            print("✅ Pygame cerrado completamente")
                     
         except Exception as e:
             print(f"❌ Error durante el cierre: {e}")
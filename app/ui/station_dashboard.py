@@ -0,0 +1,183 @@
+"""
+Panel multi-estación: una fila por estación con juego, estado y controles
+
+Cada estación es un proceso aparte (StationSupervisor); el panel solo
+envía órdenes y muestra los eventos que llegan (en el hilo de Tk).
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Dict, List, Tuple
+
+from managers.components.game_registry import GameRegistry
+from managers.stations import StationHandle, StationSupervisor
+from managers.stations.station_protocol import (
+    EVENT_ERROR,
+    EVENT_RESULT,
+    STATE_BUSY,
+    STATE_DISCONNECTED,
+    STATE_FAILED,
+    STATE_PLAYING,
+    STATE_READY,
+    STATE_STOPPED,
+)
+from ui.components import ArduinoColors
+
+STATE_ICONS = {
+    STATE_READY: "🟢",
+    STATE_PLAYING: "🎮",
+    STATE_BUSY: "⏳",
+    STATE_DISCONNECTED: "🔌",
+    STATE_FAILED: "❌",
+    STATE_STOPPED: "⏹️",
+}
+
+
+class StationDashboard:
+    """Ventana de control de todas las estaciones del equipo"""
+
+    def __init__(self, stations: List[Tuple[str, str]]):
+        self.colors = ArduinoColors()
+        self.registry = GameRegistry()
+
+        self.root = tk.Tk()
+        self.root.title("Arduino Game Manager - Multi-Estación")
+        self.root.geometry("1100x650")
+        self.root.configure(bg=self.colors.BACKGROUND_PRIMARY)
+
+        self.supervisor = StationSupervisor(post=lambda callback: self.root.after(0, callback))
+        self.supervisor.add_listener(self._on_station_event)
+        self.rows: Dict[str, Dict[str, tk.Widget]] = {}
+
+        # Nombre visible -> game_id
+        self.game_choices = {plugin.name: game_id for game_id, plugin in self.registry.get_available_games().items()}
+
+        self._create_header(len(stations))
+        for station_id, port in stations:
+            self._create_station_row(station_id, port)
+            self.supervisor.add_station(station_id, port)
+            self._refresh_row(self.supervisor.stations[station_id])
+
+    def _create_header(self, count: int):
+        tk.Label(
+            self.root,
+            text=f"🏥 Estaciones de juego ({count})",
+            bg=self.colors.BACKGROUND_PRIMARY,
+            fg=self.colors.BLUE_DARK,
+            font=("Arial", 18, "bold"),
+        ).pack(pady=(15, 10))
+
+    def _create_station_row(self, station_id: str, port: str):
+        """Fila de una estación: estado, selector de juego, botones y estado en vivo"""
+        frame = tk.LabelFrame(
+            self.root,
+            text=f"Estación {station_id} - {port}",
+            bg=self.colors.BACKGROUND_SECONDARY,
+            fg=self.colors.TEXT_PRIMARY,
+            font=("Arial", 11, "bold"),
+            padx=10,
+            pady=8,
+        )
+        frame.pack(fill=tk.X, padx=15, pady=6)
+
+        state_label = tk.Label(frame, width=16, anchor="w", bg=self.colors.BACKGROUND_SECONDARY,
+                               fg=self.colors.TEXT_PRIMARY, font=("Arial", 10, "bold"))
+        state_label.pack(side=tk.LEFT)
+
+        game_var = tk.StringVar(value=next(iter(self.game_choices), ""))
+        game_combo = ttk.Combobox(frame, textvariable=game_var, values=list(self.game_choices),
+                                  width=22, state="readonly")
+        game_combo.pack(side=tk.LEFT, padx=5)
+
+        buttons = {}
+        for key, text, command, color in (
+            ("start", "🎮 JUGAR", lambda: self._start(station_id, game_var.get()), self.colors.SUCCESS),
+            ("test", "🔧 Test HW", lambda: self._test(station_id, game_var.get()), self.colors.INFO),
+            ("stop", "⏹️ Detener", lambda: self.supervisor.stop_game(station_id), self.colors.WARNING),
+            ("status", "📊 Estado", lambda: self.supervisor.request_status(station_id), self.colors.BACKGROUND_ACCENT),
+        ):
+            buttons[key] = tk.Button(frame, text=text, command=command, bg=color, fg=self.colors.BLUE_DARK,
+                                     relief=tk.FLAT, width=10, font=("Arial", 9, "bold"))
+            buttons[key].pack(side=tk.LEFT, padx=2)
+
+        info_label = tk.Label(frame, anchor="w", justify=tk.LEFT, bg=self.colors.BACKGROUND_SECONDARY,
+                              fg=self.colors.TEXT_SECONDARY, font=("Consolas", 9))
+        info_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+
+        self.rows[station_id] = {"state": state_label, "info": info_label, **buttons}
+
+    # ===== ÓRDENES =====
+
+    def _start(self, station_id: str, game_name: str):
+        game_id = self.game_choices.get(game_name)
+        if game_id:
+            self.supervisor.start_game(station_id, game_id)
+            self._refresh_row(self.supervisor.stations[station_id])
+
+    def _test(self, station_id: str, game_name: str):
+        game_id = self.game_choices.get(game_name)
+        if game_id not in self.registry.get_games_with_test_mode():
+            messagebox.showinfo("No disponible", f"El modo prueba no está disponible para {game_name}")
+            return
+        self.supervisor.start_test_mode(station_id, game_id)
+        self._refresh_row(self.supervisor.stations[station_id])
+
+    # ===== EVENTOS =====
+
+    def _on_station_event(self, handle: StationHandle, event: dict):
+        """Evento de una estación (hilo de Tk)"""
+        self._refresh_row(handle)
+        if event["event"] == EVENT_RESULT and not event["success"] and not event["cancelled"]:
+            messagebox.showwarning(f"Estación {handle.station_id}", event["message"])
+        elif event["event"] == EVENT_ERROR and handle.state == STATE_FAILED:
+            messagebox.showerror(f"Estación {handle.station_id}", event["message"])
+
+    def _refresh_row(self, handle: StationHandle):
+        row = self.rows.get(handle.station_id)
+        if row is None:
+            return
+
+        row["state"].config(text=f"{STATE_ICONS.get(handle.state, '•')} {handle.state}")
+
+        usable = handle.state in (STATE_READY, STATE_PLAYING)
+        row["start"].config(state=tk.NORMAL if usable else tk.DISABLED)
+        row["test"].config(state=tk.NORMAL if usable else tk.DISABLED)
+        row["stop"].config(state=tk.NORMAL if handle.state in (STATE_PLAYING, STATE_BUSY) else tk.DISABLED)
+        row["status"].config(state=tk.NORMAL if handle.is_alive() else tk.DISABLED)
+
+        row["info"].config(text=self._format_info(handle))
+
+    def _format_info(self, handle: StationHandle) -> str:
+        parts = []
+        if handle.game_id:
+            parts.append(self.registry.get_game_name(handle.game_id))
+        status = handle.live_status
+        if "score" in status:
+            parts.append(f"Puntos: {status['score']:,}")
+        level = status.get("level", status.get("difficulty_level"))
+        if level is not None:
+            parts.append(f"Nivel: {level}")
+        if "accuracy" in status:
+            parts.append(f"Precisión: {status['accuracy']:.1f}%")
+        if handle.message and not parts[1:]:
+            parts.append(handle.message)
+        return " | ".join(parts)
+
+    # ===== CICLO DE VIDA =====
+
+    def run(self):
+        """Ejecutar panel"""
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.mainloop()
+
+    def on_closing(self):
+        """Cerrar todas las estaciones (cada una detiene su juego y suelta su Arduino)"""
+        print("💻 Cerrando estaciones...")
+        try:
+            self.supervisor.shutdown()
+        except Exception as e:
+            print(f"❌ Error cerrando estaciones: {e}")
+        finally:
+            self.root.quit()
+            self.root.destroy()
+            print("✅ Panel multi-estación cerrado")